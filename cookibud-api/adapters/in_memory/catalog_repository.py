@@ -0,0 +1,59 @@
+"""In-memory implementation of CatalogRepository"""
+
+from adapters.in_memory.crud import CRUD, AsyncCRUD
+from adapters.in_memory.store import Table
+from adapters.ports.catalog_repository import (
+    AsyncCatalogRepository as IAsyncCatalogRepository,
+)
+from adapters.ports.catalog_repository import CatalogRepository as ICatalogRepository
+from entities.catalog import CatalogEntry
+
+CATALOG_INDEXES = ("kind", "name")
+# Upserts in `increment` rely on (kind, name) being unique
+CATALOG_UNIQUE = (("kind", "name"),)
+
+
+def _increment(table: Table, kind: str, deltas: dict[str, int]) -> None:
+    """Apply every delta, then forget the names that dropped to zero"""
+    with table.lock:
+        for name, delta in deltas.items():
+            if not delta:
+                continue
+
+            def apply(document: dict, delta=delta) -> None:
+                document["count"] = document.get("count", 0) + delta
+
+            table.update_one({"kind": kind, "name": name}, apply, upsert=True)
+        decremented = [name for name, delta in deltas.items() if delta < 0]
+        if decremented:
+            table.delete_many(
+                {"kind": kind, "name": {"$in": decremented}, "count": {"$lte": 0}}
+            )
+
+
+class CatalogRepository(CRUD, ICatalogRepository):
+    """Repository to handle recipe catalogs"""
+
+    indexes = CATALOG_INDEXES
+    unique = CATALOG_UNIQUE
+
+    def __init__(self):
+        super().__init__("Catalogs", class_type=CatalogEntry)
+
+    def increment(self, kind: str, deltas: dict[str, int]):
+        """Apply every delta atomically"""
+        _increment(self.table, kind, deltas)
+
+
+class AsyncCatalogRepository(AsyncCRUD, IAsyncCatalogRepository):
+    """Asyncio repository to handle recipe catalogs"""
+
+    indexes = CATALOG_INDEXES
+    unique = CATALOG_UNIQUE
+
+    def __init__(self):
+        super().__init__("Catalogs", class_type=CatalogEntry)
+
+    async def increment(self, kind: str, deltas: dict[str, int]):
+        """Apply every delta atomically"""
+        _increment(self.table, kind, deltas)
@@ -0,0 +1,128 @@
+"""Base classes for in-memory CRUD operations
+
+The repositories convert entities and filters exactly like the MongoDB ones (same
+documents, same queries) and evaluate the queries on in-memory tables, so that they
+can stand in for MongoDB in integration tests and benchmarks.
+"""
+
+from collections.abc import AsyncIterator, Iterator
+
+from adapters.in_memory.query import set_path
+from adapters.in_memory.store import get_table
+from adapters.mongodb.crud import DocumentMapper, id_filter, to_object_id
+from adapters.ports.crud import CRUD as ICRUD
+from adapters.ports.crud import AsyncCRUD as IAsyncCRUD
+
+
+class TableMapper(DocumentMapper):
+    """Operations on the table of a collection shared by sync and async CRUD"""
+
+    # Fields served by hash indexes, unique keys and text index weights
+    indexes: tuple[str, ...] = ()
+    unique: tuple[tuple[str, ...], ...] = ()
+    text_weights: dict[str, int] = {}
+
+    def __init__(self, collection: str, class_type=None):
+        super().__init__(None, collection, class_type)
+        self.table = get_table(collection, self.indexes, self.unique, self.text_weights)
+
+    def _read(self, filters: dict) -> list:
+        query, options = self._read_options(filters)
+        partial = bool(options["fields"])
+        documents = self.table.find(query, **options)
+        return [
+            self._document_to_entity(document, partial=partial)
+            for document in documents
+        ]
+
+    def _read_many(self, ids: list) -> list:
+        if not ids:
+            return []
+        documents = self.table.find({"_id": id_filter({"$in": list(ids)})})
+        return self._in_order(ids, documents)
+
+    def _count(self, filters: dict) -> int:
+        query, _ = self._read_options(filters)
+        return self.table.count(query)
+
+    def _create(self, element):
+        return self._document_to_entity(self.table.insert(self._to_document(element)))
+
+    def _update(self, item_id, modifications: dict) -> None:
+        normalized_mods = self._modifications(modifications)
+
+        def apply(document: dict) -> None:
+            for field, value in normalized_mods.items():
+                set_path(document, field, value)
+
+        self.table.update_one({"_id": to_object_id(item_id)}, apply)
+
+    def _delete(self, item) -> None:
+        oid = self._item_id(item)
+        if oid is not None:
+            self.table.delete_many({"_id": oid})
+
+
+class CRUD(TableMapper, ICRUD):
+    """Base class for in-memory CRUD operations"""
+
+    def read(self, **filters) -> list:
+        """Retrieve elements"""
+        return self._read(filters)
+
+    def iter_read(self, **filters) -> Iterator:
+        """Stream elements (read at once: they are in memory already)"""
+        yield from self._read(filters)
+
+    def read_many(self, ids: list) -> list:
+        """Retrieve elements by id"""
+        return self._read_many(ids)
+
+    def count(self, **filters) -> int:
+        """Count elements matching filters"""
+        return self._count(filters)
+
+    def create(self, element):
+        """Add new element"""
+        return self._create(element)
+
+    def update(self, item_id, **modifications):
+        """Modify element"""
+        self._update(item_id, modifications)
+
+    def delete(self, item):
+        """Delete element"""
+        self._delete(item)
+
+
+class AsyncCRUD(TableMapper, IAsyncCRUD):
+    """Base class for asyncio in-memory CRUD operations (they never wait)"""
+
+    async def read(self, **filters) -> list:
+        """Retrieve elements"""
+        return self._read(filters)
+
+    async def iter_read(self, **filters) -> AsyncIterator:
+        """Stream elements (read at once: they are in memory already)"""
+        for element in self._read(filters):
+            yield element
+
+    async def read_many(self, ids: list) -> list:
+        """Retrieve elements by id"""
+        return self._read_many(ids)
+
+    async def count(self, **filters) -> int:
+        """Count elements matching filters"""
+        return self._count(filters)
+
+    async def create(self, element):
+        """Add new element"""
+        return self._create(element)
+
+    async def update(self, item_id, **modifications):
+        """Modify element"""
+        self._update(item_id, modifications)
+
+    async def delete(self, item):
+        """Delete element"""
+        self._delete(item)
@@ -0,0 +1,75 @@
+"""In-memory implementation of GroceryListRepository"""
+
+from adapters.in_memory.crud import CRUD, AsyncCRUD
+from adapters.in_memory.store import Table
+from adapters.mongodb.crud import to_object_id
+from adapters.ports.grocery_list_repository import (
+    AsyncGroceryListRepository as IAsyncGroceryListRepository,
+)
+from adapters.ports.grocery_list_repository import (
+    GroceryListRepository as IGroceryListRepository,
+)
+from entities.grocery_list import GroceryList
+
+GROCERY_LIST_INDEXES = ("user_id",)
+
+
+def _set_items_bought(
+    table: Table,
+    grocery_id: str,
+    user_id: str,
+    bought: bool,
+    item_ids: list[str] | None,
+) -> dict | None:
+    """Set the bought flag of items of an owned list, None when it does not match"""
+    query = {"_id": to_object_id(grocery_id), "user_id": user_id}
+    if item_ids is not None:
+        # every requested item must be in the list, otherwise nothing matches
+        query["items.id"] = {"$all": list(item_ids)}
+
+    def apply(document: dict) -> None:
+        for item in document.get("items", []):
+            if item_ids is None or item.get("id") in item_ids:
+                item["bought"] = bool(bought)
+
+    return table.update_one(query, apply)
+
+
+class GroceryListRepository(CRUD, IGroceryListRepository):
+    """Repository to handle grocery lists"""
+
+    indexes = GROCERY_LIST_INDEXES
+
+    def __init__(self):
+        super().__init__("GroceryLists", class_type=GroceryList)
+
+    def set_items_bought(
+        self,
+        grocery_id: str,
+        user_id: str,
+        bought: bool,
+        item_ids: list[str] | None = None,
+    ) -> GroceryList | None:
+        """Set the bought flag of items in one update"""
+        document = _set_items_bought(self.table, grocery_id, user_id, bought, item_ids)
+        return self._document_to_entity(document)
+
+
+class AsyncGroceryListRepository(AsyncCRUD, IAsyncGroceryListRepository):
+    """Asyncio repository to handle grocery lists"""
+
+    indexes = GROCERY_LIST_INDEXES
+
+    def __init__(self):
+        super().__init__("GroceryLists", class_type=GroceryList)
+
+    async def set_items_bought(
+        self,
+        grocery_id: str,
+        user_id: str,
+        bought: bool,
+        item_ids: list[str] | None = None,
+    ) -> GroceryList | None:
+        """Set the bought flag of items in one update"""
+        document = _set_items_bought(self.table, grocery_id, user_id, bought, item_ids)
+        return self._document_to_entity(document)
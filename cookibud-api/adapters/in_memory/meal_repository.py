@@ -0,0 +1,104 @@
+"""In-memory implementation of MealRepository"""
+
+from datetime import date
+
+from adapters.in_memory.crud import CRUD, AsyncCRUD
+from adapters.mongodb.crud import normalize_value, to_object_id
+from adapters.ports.meal_repository import AsyncMealRepository as IAsyncMealRepository
+from adapters.ports.meal_repository import MealRepository as IMealRepository
+from entities.meal import Meal, RecipeEntry
+
+MEAL_INDEXES = ("user_id", "date")
+# One meal per user and date: planning upserts on this key
+MEAL_UNIQUE = (("user_id", "date"),)
+
+
+def _owned(meal_id: str, user_id: str) -> dict:
+    """Filter of a meal restricted to its owner"""
+    return {"_id": to_object_id(meal_id), "user_id": user_id}
+
+
+def _planned(user_id: str, day: date) -> dict:
+    """Filter of the meal of a user on a date"""
+    return {"user_id": user_id, "date": normalize_value(day)}
+
+
+def _push(entry: RecipeEntry):
+    """Modification appending an entry to the meal items"""
+
+    def apply(document: dict) -> None:
+        document["items"] = [*document.get("items", []), entry.model_dump()]
+
+    return apply
+
+
+def _pull(recipe_id: str):
+    """Modification removing every entry of a recipe from the meal items"""
+
+    def apply(document: dict) -> None:
+        items = document.get("items", [])
+        document["items"] = [
+            item for item in items if item.get("recipe_id") != recipe_id
+        ]
+
+    return apply
+
+
+class MealRepository(CRUD, IMealRepository):
+    """Repository to handle meals"""
+
+    indexes = MEAL_INDEXES
+    unique = MEAL_UNIQUE
+
+    def __init__(self):
+        super().__init__("Meals", class_type=Meal)
+
+    def append_item(
+        self, meal_id: str, user_id: str, entry: RecipeEntry
+    ) -> Meal | None:
+        """Append an entry to the meal"""
+        document = self.table.update_one(_owned(meal_id, user_id), _push(entry))
+        return self._document_to_entity(document)
+
+    def remove_recipe(self, meal_id: str, user_id: str, recipe_id: str) -> Meal | None:
+        """Remove the entries of a recipe from the meal"""
+        document = self.table.update_one(_owned(meal_id, user_id), _pull(recipe_id))
+        return self._document_to_entity(document)
+
+    def plan_item(self, user_id: str, day: date, entry: RecipeEntry) -> Meal:
+        """Append an entry to the meal of the date, created if needed"""
+        document = self.table.update_one(
+            _planned(user_id, day), _push(entry), upsert=True
+        )
+        return self._document_to_entity(document)
+
+
+class AsyncMealRepository(AsyncCRUD, IAsyncMealRepository):
+    """Asyncio repository to handle meals"""
+
+    indexes = MEAL_INDEXES
+    unique = MEAL_UNIQUE
+
+    def __init__(self):
+        super().__init__("Meals", class_type=Meal)
+
+    async def append_item(
+        self, meal_id: str, user_id: str, entry: RecipeEntry
+    ) -> Meal | None:
+        """Append an entry to the meal"""
+        document = self.table.update_one(_owned(meal_id, user_id), _push(entry))
+        return self._document_to_entity(document)
+
+    async def remove_recipe(
+        self, meal_id: str, user_id: str, recipe_id: str
+    ) -> Meal | None:
+        """Remove the entries of a recipe from the meal"""
+        document = self.table.update_one(_owned(meal_id, user_id), _pull(recipe_id))
+        return self._document_to_entity(document)
+
+    async def plan_item(self, user_id: str, day: date, entry: RecipeEntry) -> Meal:
+        """Append an entry to the meal of the date, created if needed"""
+        document = self.table.update_one(
+            _planned(user_id, day), _push(entry), upsert=True
+        )
+        return self._document_to_entity(document)
@@ -0,0 +1,354 @@
+"""MongoDB query semantics evaluated on in-memory documents
+
+Covers what the repositories send to MongoDB: equality and comparison operators,
+`$in`/`$nin`/`$all`/`$elemMatch`, `$regex`, `$exists`, `$not`, `$and`/`$or`/`$nor` and
+`$text`, on dotted paths that go through arrays. Comparisons, sorts and null handling
+follow the BSON type order, so that results (and keyset pages) match MongoDB's.
+"""
+
+import copy
+import re
+from datetime import datetime, timezone
+
+from bson import ObjectId
+
+MISSING = object()
+
+_REGEX_FLAGS = {"i": re.IGNORECASE, "m": re.MULTILINE, "s": re.DOTALL, "x": re.VERBOSE}
+_WORD = re.compile(r"\w+")
+_PHRASE = re.compile(r'"([^"]*)"')
+
+
+# BSON comparison order of the types after null (1), as (python types, rank)
+_TYPE_RANKS = (
+    (bool, 8),
+    ((int, float), 2),
+    (str, 3),
+    (dict, 4),
+    (list, 5),
+    (bytes, 6),
+    (ObjectId, 7),
+    (datetime, 9),
+)
+
+
+def type_rank(value) -> int:
+    """Rank of a value in the BSON comparison order (null first, dates last)"""
+    if value is None or value is MISSING:
+        return 1
+    for types, rank in _TYPE_RANKS:
+        if isinstance(value, types):
+            return rank
+    return 10
+
+
+def _comparable(value):
+    """Value compared within its type rank"""
+    if value is None or value is MISSING:
+        return 0
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        # MongoDB stores UTC datetimes without their time zone
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    if isinstance(value, (dict, list)):
+        return repr(value)
+    return value
+
+
+def _resolve(value, parts: list[str]) -> list:
+    """Values at a path, through arrays of subdocuments (MISSING when absent)"""
+    if not parts:
+        return [value]
+    if isinstance(value, dict):
+        return _resolve(value.get(parts[0], MISSING), parts[1:])
+    if isinstance(value, list):
+        if parts[0].isdigit():
+            index = int(parts[0])
+            return (
+                _resolve(value[index], parts[1:]) if index < len(value) else [MISSING]
+            )
+        found = [found for element in value for found in _resolve(element, parts)]
+        return found or [MISSING]
+    return [MISSING]
+
+
+def values_at(document: dict, path: str) -> list:
+    """Values of a dotted field of a document (MISSING when absent)"""
+    return _resolve(document, path.split("."))
+
+
+def _candidates(raw: list) -> list:
+    """Values a condition is tested against: those of the field, arrays and their elements"""
+    candidates = []
+    for value in raw:
+        candidates.append(value)
+        if isinstance(value, list):
+            candidates.extend(value)
+    return candidates
+
+
+def _equal(candidate, value) -> bool:
+    """MongoDB equality: null matches missing fields, numbers compare across types"""
+    if isinstance(value, re.Pattern):
+        return isinstance(candidate, str) and value.search(candidate) is not None
+    if value is None:
+        return candidate is None or candidate is MISSING
+    if candidate is MISSING or type_rank(candidate) != type_rank(value):
+        return False
+    return _comparable(candidate) == _comparable(value)
+
+
+def _compare(candidate, value, operator: str) -> bool:
+    """Range comparison, only between values of the same type rank"""
+    if candidate is MISSING or type_rank(candidate) != type_rank(value):
+        return False
+    if type_rank(value) == 1:
+        # null is only equal to null
+        return operator in ("$gte", "$lte")
+    left, right = _comparable(candidate), _comparable(value)
+    if operator == "$gt":
+        return left > right
+    if operator == "$gte":
+        return left >= right
+    if operator == "$lt":
+        return left < right
+    return left <= right
+
+
+def _regex(pattern, options: str = "") -> re.Pattern:
+    if isinstance(pattern, re.Pattern):
+        return pattern
+    flags = 0
+    for option in options:
+        flags |= _REGEX_FLAGS.get(option, 0)
+    return re.compile(pattern, flags)
+
+
+def _is_operators(condition) -> bool:
+    return (
+        isinstance(condition, dict)
+        and bool(condition)
+        and all(key.startswith("$") for key in condition)
+    )
+
+
+def _element_matches(element, condition: dict) -> bool:
+    """`$elemMatch` on one array element: operators on it, or a query on a subdocument"""
+    if _is_operators(condition):
+        return all(
+            _operator([element], op, arg, condition.get("$options", ""), [element])
+            for op, arg in condition.items()
+            if op != "$options"
+        )
+    return isinstance(element, dict) and matches(element, condition)
+
+
+def _regex_matches(candidates: list, pattern, options: str) -> bool:
+    pattern = _regex(pattern, options)
+    return any(isinstance(c, str) and pattern.search(c) is not None for c in candidates)
+
+
+# Operators on the values of a field: (candidates, argument, $options) -> bool
+_VALUE_OPERATORS = {
+    "$eq": lambda candidates, value, _: any(_equal(c, value) for c in candidates),
+    "$ne": lambda candidates, value, _: not any(_equal(c, value) for c in candidates),
+    "$in": lambda candidates, values, _: any(
+        _equal(c, v) for c in candidates for v in values
+    ),
+    "$nin": lambda candidates, values, _: not any(
+        _equal(c, v) for c in candidates for v in values
+    ),
+    "$all": lambda candidates, values, _: bool(values)
+    and all(any(_equal(c, v) for c in candidates) for v in values),
+    "$regex": _regex_matches,
+    **{
+        operator: lambda candidates, value, _, operator=operator: any(
+            _compare(c, value, operator) for c in candidates
+        )
+        for operator in ("$gt", "$gte", "$lt", "$lte")
+    },
+}
+
+
+def _operator(
+    candidates: list, operator: str, argument, options: str, raw: list
+) -> bool:
+    """Whether the values of a field satisfy one operator
+
+    raw: values of the field, candidates: the same with the elements of arrays
+    """
+    if operator in _VALUE_OPERATORS:
+        return _VALUE_OPERATORS[operator](candidates, argument, options)
+    if operator == "$exists":
+        return any(value is not MISSING for value in raw) == bool(argument)
+    if operator == "$elemMatch":
+        return any(
+            _element_matches(element, argument)
+            for value in raw
+            if isinstance(value, list)
+            for element in value
+        )
+    if operator == "$not":
+        return not _condition(candidates, raw, argument)
+    raise ValueError(f"Unsupported query operator: {operator}")
+
+
+def _condition(candidates: list, raw: list, condition) -> bool:
+    """Whether the values of a field satisfy a condition (operators or a value)"""
+    if _is_operators(condition):
+        options = condition.get("$options", "")
+        return all(
+            _operator(candidates, op, arg, options, raw)
+            for op, arg in condition.items()
+            if op != "$options"
+        )
+    if isinstance(condition, re.Pattern):
+        return _operator(candidates, "$regex", condition, "", raw)
+    return any(_equal(c, condition) for c in candidates)
+
+
+def matches(document: dict, query: dict, text_weights: dict | None = None) -> bool:
+    """Whether a document matches a MongoDB query"""
+    for key, condition in query.items():
+        if key == "$and":
+            matched = all(
+                matches(document, clause, text_weights) for clause in condition
+            )
+        elif key == "$or":
+            matched = any(
+                matches(document, clause, text_weights) for clause in condition
+            )
+        elif key == "$nor":
+            matched = not any(
+                matches(document, clause, text_weights) for clause in condition
+            )
+        elif key == "$text":
+            matched = text_score(document, condition["$search"], text_weights) > 0
+        elif key.startswith("$"):
+            raise ValueError(f"Unsupported query operator: {key}")
+        else:
+            raw = values_at(document, key)
+            matched = _condition(_candidates(raw), raw, condition)
+        if not matched:
+            return False
+    return True
+
+
+def text_search(query: dict) -> str | None:
+    """`$search` string of the `$text` clause of a query, if any"""
+    if "$text" in query:
+        return query["$text"]["$search"]
+    for clause in query.get("$and", []):
+        search = text_search(clause)
+        if search is not None:
+            return search
+    return None
+
+
+def _stem(word: str) -> str:
+    """Crude English stemming of plurals, standing in for the text index stemmer"""
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 4 and word.endswith(("oes", "shes", "ches", "xes", "sses")):
+        return word[:-2]
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def _terms(text: str) -> list[str]:
+    return [_stem(word) for word in _WORD.findall(text.lower())]
+
+
+def text_score(document: dict, search: str, text_weights: dict | None) -> float:
+    """Relevance of a document for a `$text` search, 0 when it does not match
+
+    Like MongoDB, terms are or-ed, quoted phrases are required and `-term` excludes
+    documents. The score is the weighted number of occurrences of the terms, an
+    approximation of the text index score that ranks documents the same way in
+    simple cases.
+    """
+    if not text_weights:
+        raise ValueError("$text requires a text index")
+    phrases = [phrase.lower() for phrase in _PHRASE.findall(search)]
+    words = _PHRASE.sub(" ", search).split()
+    excluded = {_stem(word[1:].lower()) for word in words if word.startswith("-")}
+    terms = set(_terms(" ".join(word for word in words if not word.startswith("-"))))
+    if not terms:
+        terms = set(_terms(" ".join(phrases)))
+
+    score = 0.0
+    texts = []
+    for field, weight in text_weights.items():
+        text = " ".join(
+            value for value in values_at(document, field) if isinstance(value, str)
+        )
+        texts.append(text.lower())
+        field_terms = _terms(text)
+        if excluded.intersection(field_terms):
+            return 0.0
+        score += weight * sum(1 for term in field_terms if term in terms)
+    if any(all(phrase not in text for text in texts) for phrase in phrases):
+        return 0.0
+    return score
+
+
+def sort_key(document: dict, field: str, direction: int):
+    """Sort key of a document on a field: arrays sort by their lowest (or highest) element"""
+    values = []
+    for value in values_at(document, field):
+        if isinstance(value, list) and value:
+            values.extend(value)
+        else:
+            values.append(value)
+    keys = [(type_rank(value), _comparable(value)) for value in values]
+    return max(keys) if direction == -1 else min(keys)
+
+
+def sort_documents(documents: list[dict], sort: list) -> list[dict]:
+    """Sort documents on several fields, each ascending (1) or descending (-1)"""
+    for field, direction in reversed(sort):
+        # stable sorts, from the least significant field to the most significant one
+        documents.sort(
+            key=lambda document, f=field, d=direction: sort_key(document, f, d),
+            reverse=direction == -1,
+        )
+    return documents
+
+
+def _project_path(source: dict, target: dict, parts: list[str]) -> None:
+    key = parts[0]
+    if key not in source:
+        return
+    value = source[key]
+    if len(parts) == 1:
+        target[key] = copy.deepcopy(value)
+    elif isinstance(value, dict):
+        _project_path(value, target.setdefault(key, {}), parts[1:])
+    elif isinstance(value, list):
+        # fields of subdocuments in arrays are projected element by element
+        elements = [element for element in value if isinstance(element, dict)]
+        projected = target.setdefault(key, [{} for _ in elements])
+        for element, projected_element in zip(elements, projected):
+            _project_path(element, projected_element, parts[1:])
+
+
+def project(document: dict, fields: list[str]) -> dict:
+    """Copy of a document holding only fields (dotted names allowed) and `_id`"""
+    projected = {"_id": document["_id"]} if "_id" in document else {}
+    for field in fields:
+        _project_path(document, projected, field.split("."))
+    return projected
+
+
+def set_path(document: dict, path: str, value) -> None:
+    """`$set` of a dotted field (array indexes allowed), creating missing subdocuments"""
+    *parents, last = path.split(".")
+    for part in parents:
+        if isinstance(document, list):
+            document = document[int(part)]
+        else:
+            document = document.setdefault(part, {})
+    if isinstance(document, list):
+        document[int(last)] = value
+    else:
+        document[last] = value
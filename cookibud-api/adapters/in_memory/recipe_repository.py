@@ -0,0 +1,58 @@
+"""In-memory implementation of RecipeRepository"""
+
+from adapters.in_memory.crud import CRUD, AsyncCRUD
+from adapters.in_memory.store import Table
+from adapters.mongodb.crud import to_object_id
+from adapters.mongodb.recipe_repository import (
+    LATEST_REVIEWS,
+    SEARCH_INDEX_WEIGHTS,
+    RecipeMapper,
+)
+from adapters.ports.recipe_repository import (
+    AsyncRecipeRepository as IAsyncRecipeRepository,
+)
+from adapters.ports.recipe_repository import RecipeRepository as IRecipeRepository
+from entities.recipe import Recipe, Review
+
+RECIPE_INDEXES = ("tags", "author_id")
+
+
+def _add_review(table: Table, recipe_id: str, review: Review) -> bool:
+    """Keep the latest reviews and update the rating aggregates of a recipe"""
+
+    def apply(document: dict) -> None:
+        reviews = [*(document.get("reviews") or []), review.model_dump()]
+        document["reviews"] = reviews[-LATEST_REVIEWS:]
+        document["rating_count"] = (document.get("rating_count") or 0) + 1
+        document["rating_sum"] = (document.get("rating_sum") or 0) + review.rating
+        document["rating_avg"] = document["rating_sum"] / document["rating_count"]
+
+    return table.update_one({"_id": to_object_id(recipe_id)}, apply) is not None
+
+
+class RecipeRepository(RecipeMapper, CRUD, IRecipeRepository):
+    """Repository to handle recipes"""
+
+    indexes = RECIPE_INDEXES
+    text_weights = SEARCH_INDEX_WEIGHTS
+
+    def __init__(self):
+        super().__init__("Recipes", class_type=Recipe)
+
+    def add_review(self, recipe_id: str, review: Review) -> bool:
+        """Update the latest reviews and the rating aggregates in one update"""
+        return _add_review(self.table, recipe_id, review)
+
+
+class AsyncRecipeRepository(RecipeMapper, AsyncCRUD, IAsyncRecipeRepository):
+    """Asyncio repository to handle recipes"""
+
+    indexes = RECIPE_INDEXES
+    text_weights = SEARCH_INDEX_WEIGHTS
+
+    def __init__(self):
+        super().__init__("Recipes", class_type=Recipe)
+
+    async def add_review(self, recipe_id: str, review: Review) -> bool:
+        """Update the latest reviews and the rating aggregates in one update"""
+        return _add_review(self.table, recipe_id, review)
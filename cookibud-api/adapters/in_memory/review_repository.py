@@ -0,0 +1,28 @@
+"""In-memory implementation of ReviewRepository"""
+
+from adapters.in_memory.crud import CRUD, AsyncCRUD
+from adapters.ports.review_repository import (
+    AsyncReviewRepository as IAsyncReviewRepository,
+)
+from adapters.ports.review_repository import ReviewRepository as IReviewRepository
+from entities.recipe import Review
+
+REVIEW_INDEXES = ("recipe_id",)
+
+
+class ReviewRepository(CRUD, IReviewRepository):
+    """Repository to handle recipe reviews"""
+
+    indexes = REVIEW_INDEXES
+
+    def __init__(self):
+        super().__init__("Reviews", class_type=Review)
+
+
+class AsyncReviewRepository(AsyncCRUD, IAsyncReviewRepository):
+    """Asyncio repository to handle recipe reviews"""
+
+    indexes = REVIEW_INDEXES
+
+    def __init__(self):
+        super().__init__("Reviews", class_type=Review)
@@ -0,0 +1,317 @@
+"""In-memory collections shared by the repositories of the process"""
+
+import copy
+import threading
+from collections import defaultdict
+from collections.abc import Callable
+
+from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
+
+from adapters.in_memory.query import (
+    MISSING,
+    matches,
+    project,
+    sort_documents,
+    text_score,
+    text_search,
+    values_at,
+)
+
+TEXT_SCORE = {"$meta": "textScore"}
+
+
+def _index_keys(document: dict, field: str) -> set:
+    """Hashable values of a field of a document: arrays are indexed by element"""
+    keys = set()
+    for value in values_at(document, field):
+        for element in value if isinstance(value, list) else [value]:
+            if (
+                element is MISSING
+                or element is None
+                or isinstance(element, (dict, list))
+            ):
+                continue
+            keys.add(element)
+    return keys
+
+
+def _lookup_values(condition) -> list | None:
+    """Values an index can look up for a condition, None when it cannot serve it
+
+    Plain values and `$eq`/`$in` are served. Null is not: it also matches documents
+    without the field, which are not indexed.
+    """
+    if isinstance(condition, dict):
+        if "$eq" in condition:
+            values = [condition["$eq"]]
+        elif "$in" in condition:
+            values = list(condition["$in"])
+        else:
+            return None
+    else:
+        values = [condition]
+    for value in values:
+        if value is None or isinstance(value, (dict, list)):
+            return None
+        try:
+            hash(value)
+        except TypeError:
+            return None
+    return values
+
+
+class Table:
+    """Documents of a collection, by `_id`, with hash indexes on some fields
+
+    Every operation holds the table lock and documents never leave the table: reads
+    return copies and writes replace stored documents with modified copies, so the
+    table can be shared by threads and by the sync and asyncio repositories.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        indexes: tuple[str, ...] = (),
+        unique: tuple[tuple[str, ...], ...] = (),
+        text_weights: dict | None = None,
+    ):
+        self.name = name
+        self.lock = threading.RLock()
+        self.documents: dict[ObjectId, dict] = {}
+        self.indexes: dict[str, defaultdict] = {
+            field: defaultdict(set) for field in indexes
+        }
+        self.unique = unique
+        self.text_weights = text_weights or {}
+
+    def _index(self, document: dict) -> None:
+        for field, index in self.indexes.items():
+            for key in _index_keys(document, field):
+                index[key].add(document["_id"])
+
+    def _unindex(self, document: dict) -> None:
+        for field, index in self.indexes.items():
+            for key in _index_keys(document, field):
+                ids = index[key]
+                ids.discard(document["_id"])
+                if not ids:
+                    del index[key]
+
+    def _candidate_ids(self, query: dict) -> set | None:
+        """Ids of the documents that may match, from the indexes (None: scan them all)"""
+        candidates = None
+        for field, condition in query.items():
+            if field == "$and":
+                ids_list = [self._candidate_ids(clause) for clause in condition]
+                ids_list = [ids for ids in ids_list if ids is not None]
+            elif field == "_id" or field in self.indexes:
+                values = _lookup_values(condition)
+                if values is None:
+                    continue
+                if field == "_id":
+                    ids_list = [{value for value in values if value in self.documents}]
+                else:
+                    index = self.indexes[field]
+                    ids_list = [
+                        set().union(*(index.get(value, ()) for value in values))
+                    ]
+            else:
+                continue
+            for ids in ids_list:
+                candidates = ids if candidates is None else candidates & ids
+        return candidates
+
+    def _scan(self, query: dict) -> list[dict]:
+        """Stored documents matching query, in insertion order"""
+        ids = self._candidate_ids(query)
+        if ids is None:
+            documents = self.documents.values()
+        else:
+            # ids are generated in increasing order, like the natural order of MongoDB
+            documents = [self.documents[_id] for _id in sorted(ids)]
+        return [
+            document
+            for document in documents
+            if matches(document, query, self.text_weights)
+        ]
+
+    def _check_unique(self, document: dict) -> None:
+        """Raise DuplicateKeyError when another document has the same unique key"""
+        for fields in self.unique:
+            query = {field: values_at(document, field)[0] for field in fields}
+            query = {f: None if v is MISSING else v for f, v in query.items()}
+            if any(other["_id"] != document["_id"] for other in self._scan(query)):
+                raise DuplicateKeyError(
+                    f"E11000 duplicate key error collection: {self.name} "
+                    f"index: {'_'.join(fields)} dup key: {query}"
+                )
+
+    def _store(self, document: dict) -> None:
+        """Replace or add a document, keeping the indexes up to date"""
+        self._check_unique(document)
+        previous = self.documents.get(document["_id"])
+        if previous is not None:
+            self._unindex(previous)
+        self.documents[document["_id"]] = document
+        self._index(document)
+
+    def _add_computed(
+        self, documents: list[dict], query: dict, computed: dict
+    ) -> list[dict]:
+        """Documents with the computed fields, only `{"$meta": "textScore"}` is supported"""
+        search = text_search(query)
+        for field, key in computed.items():
+            if key != TEXT_SCORE or search is None:
+                raise ValueError(f"Unsupported computed field: {key}")
+            documents = [
+                {**document, field: text_score(document, search, self.text_weights)}
+                for document in documents
+            ]
+        return documents
+
+    def find(
+        self,
+        query: dict,
+        *,
+        computed: dict | None = None,
+        after: dict | None = None,
+        fields: list[str] | None = None,
+        sort=None,
+        skip=None,
+        limit=None,
+    ) -> list[dict]:
+        """Copies of the matching documents, like a find or the aggregation of CRUD
+
+        computed: fields added to the documents before `after` is matched and the
+        documents are sorted, only `{"$meta": "textScore"}` is supported. Sorts on
+        `{"$meta": "textScore"}` rank documents by their score too, without returning it.
+        """
+        computed = computed or {}
+        # scores sorted on by a find, which MongoDB computes without projecting them
+        scored = {field: key for field, key in sort or [] if isinstance(key, dict)}
+        if scored:
+            sort = [(field, -1 if field in scored else key) for field, key in sort]
+        with self.lock:
+            documents = self._scan(query)
+            if computed or scored:
+                documents = self._add_computed(documents, query, {**scored, **computed})
+            if after:
+                documents = [
+                    d for d in documents if matches(d, after, self.text_weights)
+                ]
+            if sort:
+                documents = sort_documents(list(documents), sort)
+            if skip:
+                documents = documents[int(skip) :]
+            if limit:
+                documents = documents[: int(limit)]
+            if fields:
+                return [
+                    project(document, [*fields, *computed]) for document in documents
+                ]
+            hidden = scored.keys() - computed.keys()
+            if hidden:
+                documents = [
+                    {k: v for k, v in document.items() if k not in hidden}
+                    for document in documents
+                ]
+            return copy.deepcopy(documents)
+
+    def count(self, query: dict) -> int:
+        """Number of documents matching query"""
+        with self.lock:
+            return len(self._scan(query))
+
+    def insert(self, document: dict) -> dict:
+        """Store a copy of a document, with a new `_id` unless it has one"""
+        document = copy.deepcopy(document)
+        document.setdefault("_id", ObjectId())
+        with self.lock:
+            if document["_id"] in self.documents:
+                raise DuplicateKeyError(
+                    f"E11000 duplicate key error collection: {self.name}"
+                )
+            self._store(document)
+        return copy.deepcopy(document)
+
+    def insert_many(self, documents) -> int:
+        """Store copies of documents under a single lock, returns how many were stored"""
+        count = 0
+        with self.lock:
+            for document in documents:
+                document = copy.deepcopy(document)
+                document.setdefault("_id", ObjectId())
+                if document["_id"] in self.documents:
+                    raise DuplicateKeyError(
+                        f"E11000 duplicate key error collection: {self.name}"
+                    )
+                self._store(document)
+                count += 1
+        return count
+
+    def update_one(
+        self, query: dict, modify: Callable[[dict], None], upsert: bool = False
+    ) -> dict | None:
+        """Apply modify to a copy of the first matching document, store and return it
+
+        With upsert, a document made of the equality fields of query is created and
+        modified when none matches. None when nothing matched.
+        """
+        with self.lock:
+            documents = self._scan(query)
+            if documents:
+                document = copy.deepcopy(documents[0])
+            elif upsert:
+                document = {
+                    field: copy.deepcopy(value)
+                    for field, value in query.items()
+                    if not field.startswith("$") and not isinstance(value, dict)
+                }
+                document.setdefault("_id", ObjectId())
+            else:
+                return None
+            modify(document)
+            self._store(document)
+            return copy.deepcopy(document)
+
+    def clear(self) -> None:
+        """Remove every document"""
+        with self.lock:
+            self.documents.clear()
+            for index in self.indexes.values():
+                index.clear()
+
+    def delete_many(self, query: dict) -> int:
+        """Remove the matching documents, returns how many were removed"""
+        with self.lock:
+            documents = self._scan(query)
+            for document in documents:
+                self._unindex(document)
+                del self.documents[document["_id"]]
+            return len(documents)
+
+
+_tables: dict[str, Table] = {}
+_tables_lock = threading.Lock()
+
+
+def get_table(
+    name: str,
+    indexes: tuple[str, ...] = (),
+    unique: tuple[tuple[str, ...], ...] = (),
+    text_weights: dict | None = None,
+) -> Table:
+    """Table of a collection, created with its indexes on first use"""
+    with _tables_lock:
+        table = _tables.get(name)
+        if table is None:
+            table = _tables[name] = Table(name, indexes, unique, text_weights)
+        return table
+
+
+def clear_tables() -> None:
+    """Remove the documents of every table (between tests)"""
+    with _tables_lock:
+        for table in _tables.values():
+            table.clear()
@@ -0,0 +1,15 @@
+"""In-memory implementation of UserRepository"""
+
+from adapters.in_memory.crud import CRUD
+from adapters.ports.user_repository import UserRepository as IUserRepository
+from entities.user import User
+
+
+class UserRepository(CRUD, IUserRepository):
+    """Repository to handle users"""
+
+    indexes = ("username",)
+    unique = (("username",),)
+
+    def __init__(self):
+        super().__init__("Users", class_type=User)
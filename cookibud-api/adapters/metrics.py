@@ -0,0 +1,247 @@
+"""In-process metrics registry, exported in the Prometheus text format
+
+Metrics are plain counters, gauges and histograms kept in memory: they cost a lock
+and a few additions per observation, need no collector and can be read in tests.
+"""
+
+import math
+import threading
+from bisect import bisect_left
+from collections.abc import Callable
+
+# Latency buckets in seconds, from 1 ms to 10 s
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text format"""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(
+    names: tuple[str, ...], values: tuple[str, ...], extra: str = ""
+) -> str:
+    """`{name="value",...}` of a sample, empty without labels"""
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    """Sample value in the text format"""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Metric:
+    """Named metric with a fixed set of label names"""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+        self._values: dict[tuple[str, ...], object] = {}
+
+    def _key(self, labels: dict) -> tuple[str, ...]:
+        """Label values in the order of the label names"""
+        return tuple(str(labels[name]) for name in self.labels)
+
+    def clear(self) -> None:
+        """Forget every observation"""
+        with self._lock:
+            self._values.clear()
+
+    def samples(self) -> list[str]:
+        """Sample lines of the metric"""
+        with self._lock:
+            values = list(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}"
+            for key, value in values
+        ]
+
+    def render(self) -> str:
+        """HELP, TYPE and sample lines of the metric"""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        return "\n".join([*lines, *self.samples()])
+
+
+class Counter(Metric):
+    """Monotonic total"""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        """Add amount to the total of the labels"""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        """Current total of the labels"""
+        return self._values.get(self._key(labels), 0)
+
+
+class Gauge(Metric):
+    """Value going up and down, or read from `callback` when exported"""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        callback: Callable[[], float] | None = None,
+    ):
+        super().__init__(name, documentation, labels)
+        self.callback = callback
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        """Raise the value of the labels"""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        """Lower the value of the labels"""
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels) -> None:
+        """Replace the value of the labels"""
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def value(self, **labels) -> float:
+        """Current value of the labels"""
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> list[str]:
+        if self.callback is None:
+            return super().samples()
+        try:
+            value = self.callback()
+        except Exception:  # pylint: disable=broad-except
+            # the source is not available from this context: export no sample
+            return []
+        return [f"{self.name} {_format_value(value)}"]
+
+
+class Histogram(Metric):
+    """Distribution of observations in cumulative buckets, with their sum and count"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        """Count value in its bucket"""
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # per-bucket counts (the last one for +Inf), sum, count
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def count(self, **labels) -> int:
+        """Number of observations of the labels"""
+        state = self._values.get(self._key(labels))
+        return state[2] if state else 0
+
+    def sum(self, **labels) -> float:
+        """Sum of the observations of the labels"""
+        state = self._values.get(self._key(labels))
+        return state[1] if state else 0.0
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            values = [
+                (key, (list(state[0]), *state[1:]))
+                for key, state in self._values.items()
+            ]
+        lines = []
+        for key, (counts, total, count) in values:
+            cumulative = 0
+            for bound, bucket_count in zip([*self.buckets, math.inf], counts):
+                cumulative += bucket_count
+                labels = _format_labels(
+                    self.labels, key, f'le="{_format_value(bound)}"'
+                )
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labels, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class Registry:
+    """Set of metrics exported together"""
+
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        """Add a metric, or return the one already registered under its name"""
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(
+        self, name: str, documentation: str, labels: tuple[str, ...] = ()
+    ) -> Counter:
+        """Registered counter"""
+        return self.register(Counter(name, documentation, labels))
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        callback: Callable[[], float] | None = None,
+    ) -> Gauge:
+        """Registered gauge"""
+        return self.register(Gauge(name, documentation, labels, callback))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Registered histogram"""
+        return self.register(Histogram(name, documentation, labels, buckets))
+
+    def clear(self) -> None:
+        """Forget the observations of every metric (metrics stay registered)"""
+        for metric in list(self._metrics.values()):
+            metric.clear()
+
+    def render(self) -> str:
+        """Every metric in the Prometheus text exposition format"""
+        return (
+            "\n".join(metric.render() for metric in list(self._metrics.values())) + "\n"
+        )
+
+
+REGISTRY = Registry()
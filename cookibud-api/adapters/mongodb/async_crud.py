@@ -0,0 +1,91 @@
+"""Base class for asyncio MongoDB CRUD operations"""
+
+from collections.abc import AsyncIterator
+
+from adapters.mongodb.crud import (
+    ITER_BATCH_SIZE,
+    DocumentMapper,
+    id_filter,
+    to_object_id,
+)
+from adapters.mongodb.db import AsyncCollection
+from adapters.mongodb.instrumentation import timed
+from adapters.ports.crud import AsyncCRUD as IAsyncCRUD
+
+
+class AsyncCRUD(DocumentMapper, IAsyncCRUD):
+    """Base class for asyncio MongoDB CRUD operations"""
+
+    async def _cursor(self, collection, filters: dict, batch_size: int | None = None):
+        """Cursor of the documents read with filters, and whether they are projections"""
+        cursor, pipeline, partial = self._find_or_pipeline(
+            collection, filters, batch_size
+        )
+        if pipeline is not None:
+            batching = {"batchSize": batch_size} if batch_size else {}
+            cursor = await collection.aggregate(pipeline, **batching)
+        return cursor, partial
+
+    @timed
+    async def read(self, **filters) -> list:
+        """Retrieve elements"""
+        async with AsyncCollection(self.uri, self.collection) as collection:
+            documents, partial = await self._cursor(collection, filters)
+            return [
+                self._document_to_entity(doc, partial=partial)
+                async for doc in documents
+            ]
+
+    @timed
+    async def iter_read(self, **filters) -> AsyncIterator:
+        """Stream elements from the cursor, fetched in batches of ITER_BATCH_SIZE"""
+        async with AsyncCollection(self.uri, self.collection) as collection:
+            documents, partial = await self._cursor(
+                collection, filters, ITER_BATCH_SIZE
+            )
+            async for document in documents:
+                yield self._document_to_entity(document, partial=partial)
+
+    @timed
+    async def read_many(self, ids: list) -> list:
+        """Retrieve elements by id with a single `$in` query"""
+        if not ids:
+            return []
+        async with AsyncCollection(self.uri, self.collection) as collection:
+            documents = collection.find({"_id": id_filter({"$in": list(ids)})})
+            return self._in_order(ids, await documents.to_list())
+
+    @timed
+    async def count(self, **filters) -> int:
+        """Count elements matching filters without fetching them"""
+        query, _ = self._read_options(filters)
+        async with AsyncCollection(self.uri, self.collection) as collection:
+            return await collection.count_documents(query)
+
+    @timed
+    async def create(self, element):
+        """Add new element"""
+        doc = self._to_document(element)
+        async with AsyncCollection(self.uri, self.collection) as collection:
+            res = await collection.insert_one(doc)
+            doc["_id"] = res.inserted_id
+            return self._document_to_entity(doc)
+
+    @timed
+    async def update(self, item_id, **modifications):
+        """Modify element"""
+        normalized_mods = self._modifications(modifications)
+        async with AsyncCollection(self.uri, self.collection) as collection:
+            await collection.update_one(
+                {"_id": to_object_id(item_id)}, {"$set": normalized_mods}
+            )
+
+    @timed
+    async def delete(self, item):
+        """Delete element"""
+        oid = self._item_id(item)
+        if oid is None:
+            return
+
+        async with AsyncCollection(self.uri, self.collection) as collection:
+            await collection.delete_one({"_id": oid})
@@ -0,0 +1,70 @@
+"""MongoDB implementation of CatalogRepository"""
+
+from pymongo import ASCENDING, IndexModel, UpdateOne
+
+from adapters.mongodb.async_crud import AsyncCRUD
+from adapters.mongodb.crud import CRUD
+from adapters.mongodb.db import AsyncCollection, Collection
+from adapters.mongodb.instrumentation import timed
+from adapters.ports.catalog_repository import (
+    AsyncCatalogRepository as IAsyncCatalogRepository,
+)
+from adapters.ports.catalog_repository import CatalogRepository as ICatalogRepository
+from entities.catalog import CatalogEntry
+
+
+def _increments(
+    kind: str, deltas: dict[str, int]
+) -> tuple[list[UpdateOne], dict | None]:
+    """Bulk upserts applying deltas, and the filter of entries that may have dropped to zero"""
+    updates = [
+        UpdateOne({"kind": kind, "name": name}, {"$inc": {"count": delta}}, upsert=True)
+        for name, delta in deltas.items()
+        if delta
+    ]
+    decremented = [name for name, delta in deltas.items() if delta < 0]
+    unused = {"kind": kind, "name": {"$in": decremented}, "count": {"$lte": 0}}
+    return updates, unused if decremented else None
+
+
+class CatalogRepository(CRUD, ICatalogRepository):
+    """Repository to handle recipe catalogs"""
+
+    # Upserts in `increment` rely on (kind, name) being unique
+    indexes = [
+        IndexModel(
+            [("kind", ASCENDING), ("name", ASCENDING)], name="kind_name", unique=True
+        )
+    ]
+
+    def __init__(self, uri: str):
+        super().__init__(uri, "Catalogs", class_type=CatalogEntry)
+
+    @timed
+    def increment(self, kind: str, deltas: dict[str, int]):
+        """Apply every delta with one bulk write"""
+        updates, unused = _increments(kind, deltas)
+        if not updates:
+            return
+        with Collection(self.uri, self.collection) as collection:
+            collection.bulk_write(updates, ordered=False)
+            if unused:
+                collection.delete_many(unused)
+
+
+class AsyncCatalogRepository(AsyncCRUD, IAsyncCatalogRepository):
+    """Asyncio repository to handle recipe catalogs"""
+
+    def __init__(self, uri: str):
+        super().__init__(uri, "Catalogs", class_type=CatalogEntry)
+
+    @timed
+    async def increment(self, kind: str, deltas: dict[str, int]):
+        """Apply every delta with one bulk write"""
+        updates, unused = _increments(kind, deltas)
+        if not updates:
+            return
+        async with AsyncCollection(self.uri, self.collection) as collection:
+            await collection.bulk_write(updates, ordered=False)
+            if unused:
+                await collection.delete_many(unused)
@@ -1,107 +1,226 @@
 """Base class for MongoDB CRUD operations"""
 
+from collections.abc import Iterator
+from datetime import date, datetime, time
+
 from bson import ObjectId
 from pydantic import BaseModel
+from pymongo import IndexModel
 
 from adapters.mongodb.db import Collection
+from adapters.mongodb.instrumentation import timed
 from adapters.ports.crud import CRUD as ICRUD
 
+# Documents fetched per round trip when streaming with `iter_read`
+ITER_BATCH_SIZE = 100
+
+
+def to_object_id(value):
+    """Convert value to an ObjectId when it is a valid one, keep it as-is otherwise"""
+    # Use ObjectId.is_valid to avoid raising exceptions during conversion
+    if ObjectId.is_valid(value):
+        return ObjectId(value)
+    return value
+
+
+def id_filter(value):
+    """Convert an `id` filter (raw value or operator such as `$in`) to an `_id` filter"""
+    if isinstance(value, dict):
+        return {
+            op: (
+                [to_object_id(v) for v in val]
+                if isinstance(val, list)
+                else to_object_id(val)
+            )
+            for op, val in value.items()
+        }
+    return to_object_id(value)
 
-class CRUD(ICRUD):
-    """Base class for MongoDB CRUD operations"""
+
+def normalize_value(v):
+    """Normalize values for BSON (BaseModels to dicts, recursively, dates to datetimes)"""
+    if isinstance(v, BaseModel):
+        return normalize_value(v.model_dump())
+    # BSON has no date-only type: dates are stored as midnight UTC datetimes
+    if isinstance(v, date) and not isinstance(v, datetime):
+        return datetime.combine(v, time())
+    if isinstance(v, dict):
+        return {kk: normalize_value(vv) for kk, vv in v.items()}
+    if isinstance(v, list):
+        return [normalize_value(e) for e in v]
+    return v
+
+
+class DocumentMapper:
+    """Conversions between entities and MongoDB documents shared by sync and async CRUD"""
 
     def __init__(self, uri: str, collection: str, class_type=None):
         self.uri = uri
         self.collection = collection
         self.class_type = class_type
 
-    def read(self, **filters) -> list:
-        """Retrieve elements"""
+    def _read_options(self, filters: dict) -> tuple[dict, dict]:
+        """Split read filters into a MongoDB query and projection/pagination/sort helpers"""
+        filters = dict(filters)
         # If caller filters by 'id', convert to MongoDB's '_id' with ObjectId
         if "id" in filters:
-            val = filters.pop("id")
-            # Use ObjectId.is_valid to avoid raising exceptions during conversion
-            if ObjectId.is_valid(val):
-                filters["_id"] = ObjectId(val)
-            else:
-                filters["_id"] = val
+            filters["_id"] = id_filter(filters.pop("id"))
+        filters = {
+            k: v if k.startswith("_") else normalize_value(v)
+            for k, v in filters.items()
+        }
         # extract pagination/sort helpers if provided by callers
-        limit = None
-        skip = None
-        sort = None
-        if "_limit" in filters:
-            limit = filters.pop("_limit")
-        if "_skip" in filters:
-            skip = filters.pop("_skip")
-        if "_sort" in filters:
-            sort = filters.pop("_sort")
-        with Collection(self.uri, self.collection) as collection:
-            documents = collection.find(filters)
-            # apply sort/skip/limit if provided
-            if sort:
-                # sort should be a list of tuples [(field, direction)]
-                documents = documents.sort(sort)
-            if skip:
-                documents = documents.skip(int(skip))
-            if limit:
-                documents = documents.limit(int(limit))
-            return [self._document_to_entity(doc) for doc in documents]
+        options = {
+            "limit": filters.pop("_limit", None),
+            "skip": filters.pop("_skip", None),
+            # sort should be a list of tuples [(field, direction)]
+            "sort": filters.pop("_sort", None),
+            # fields should be a list of (dotted) field names to return
+            "fields": filters.pop("_fields", None),
+        }
+        # keyset pagination: `_after` (None for the first page) switches to a stable sort
+        options["computed"], options["after"] = None, None
+        if "_after" in filters:
+            after = filters.pop("_after")
+            options["sort"], computed, keyset = self._keyset(options["sort"], after)
+            if computed:
+                # computed sort keys only exist in an aggregation, filtered after $addFields
+                options["computed"], options["after"] = computed, keyset
+            elif keyset:
+                filters = {"$and": [filters, keyset]} if filters else keyset
+        return filters, options
 
-    def create(self, element):
-        """Add new element"""
-        # Ensure we insert a plain dict/document into MongoDB.
-        doc = self._to_document(element)
-        with Collection(self.uri, self.collection) as collection:
-            res = collection.insert_one(doc)
-            # Return the created entity with id normalized
-            doc["_id"] = res.inserted_id
-            return self._document_to_entity(doc)
+    @staticmethod
+    def _keyset(
+        sort: list | None, after: list | None
+    ) -> tuple[list, dict, dict | None]:
+        """Sort with an _id tie-breaker, its computed keys and the filter of following documents
 
-    def update(self, item_id, **modifications):
-        """Modify element"""
+        after: sort values of the last element of the previous page, followed by its id.
+        Computed keys (such as `{"$meta": "textScore"}`) are added as fields sorted in
+        decreasing order, so that they can be compared like any other field.
+        """
+        computed = {field: key for field, key in sort or [] if isinstance(key, dict)}
+        sort = [
+            (field, -1 if field in computed else direction)
+            for field, direction in sort or []
+        ]
+        sort.append(("_id", sort[-1][1] if sort else 1))
+        if not after:
+            return sort, computed, None
+        values = [*after[:-1], to_object_id(after[-1])]
+        clauses = []
+        for i, (field, direction) in enumerate(sort):
+            following = DocumentMapper._following(field, values[i], direction)
+            if following is None:
+                continue
+            clause = {f: v for (f, _), v in zip(sort[:i], values[:i])}
+            clause.update(following)
+            clauses.append(clause)
+        return sort, computed, {"$or": clauses}
 
-        # Normalize modifications (e.g., BaseModel to dicts, lists of BaseModels to list of dicts)
-        def _normalize_value(v):
-            if isinstance(v, BaseModel):
-                return v.dict()
-            if isinstance(v, dict):
-                return {kk: _normalize_value(vv) for kk, vv in v.items()}
-            if isinstance(v, list):
-                return [_normalize_value(e) for e in v]
-            return v
+    @staticmethod
+    def _following(field: str, value, direction: int) -> dict | None:
+        """Filter of the values of field sorted after value (None when there are none)
 
-        normalized_mods = {k: _normalize_value(v) for k, v in modifications.items()}
+        MongoDB sorts null and missing values first, and range operators never match them.
+        """
+        if value is None:
+            return {field: {"$ne": None}} if direction == 1 else None
+        if direction == 1:
+            return {field: {"$gt": value}}
+        if field == "_id":
+            return {field: {"$lt": value}}
+        return {"$or": [{field: {"$lt": value}}, {field: None}]}
 
-        with Collection(self.uri, self.collection) as collection:
-            oid = ObjectId(item_id) if ObjectId.is_valid(item_id) else item_id
-            collection.update_one({"_id": oid}, {"$set": normalized_mods})
+    @staticmethod
+    def _pipeline(query: dict, options: dict) -> list:
+        """Aggregation reading documents sorted on computed keys, the counterpart of find
 
-    def delete(self, item):
-        """Delete element"""
+        options: the read options of `_read_options`, with computed keys
+        """
+        computed, fields = options["computed"], options["fields"]
+        pipeline = [{"$match": query}, {"$addFields": computed}]
+        if options["after"]:
+            pipeline.append({"$match": options["after"]})
+        if options["sort"]:
+            pipeline.append({"$sort": dict(options["sort"])})
+        if options["skip"]:
+            pipeline.append({"$skip": int(options["skip"])})
+        if options["limit"]:
+            pipeline.append({"$limit": int(options["limit"])})
+        if fields:
+            pipeline.append({"$project": {field: 1 for field in [*fields, *computed]}})
+        return pipeline
+
+    def _find_or_pipeline(
+        self, collection, filters: dict, batch_size: int | None = None
+    ):
+        """Find cursor of the documents read with filters, whether they are projections
+
+        Returns `(cursor, None, partial)`, or `(None, pipeline, partial)` when the
+        documents are sorted on computed keys and must be aggregated instead. find is
+        lazy and alike on sync and asyncio collections, aggregate is left to the CRUD.
+        """
+        query, options = self._read_options(filters)
+        partial = bool(options["fields"])
+        if options["computed"]:
+            return None, self._pipeline(query, options), partial
+        batching = {"batch_size": batch_size} if batch_size else {}
+        cursor = collection.find(query, self._projection(options["fields"]), **batching)
+        cursor = self._apply_options(
+            cursor, sort=options["sort"], skip=options["skip"], limit=options["limit"]
+        )
+        return cursor, None, partial
+
+    @staticmethod
+    def _projection(fields: list[str] | None) -> dict | None:
+        """MongoDB projection returning only fields (and _id), None for whole documents"""
+        if not fields:
+            return None
+        return {field: 1 for field in fields}
+
+    @staticmethod
+    def _apply_options(documents, sort=None, skip=None, limit=None):
+        """Apply sort/skip/limit to a cursor if provided"""
+        if sort:
+            documents = documents.sort(sort)
+        if skip:
+            documents = documents.skip(int(skip))
+        if limit:
+            documents = documents.limit(int(limit))
+        return documents
+
+    def _in_order(self, ids: list, documents) -> list:
+        """Convert documents to entities aligned with the requested ids"""
+        found = {str(doc["_id"]): self._document_to_entity(doc) for doc in documents}
+        return [found.get(str(item_id)) for item_id in ids]
+
+    @staticmethod
+    def _modifications(modifications: dict) -> dict:
+        """Normalize modifications into a `$set` document"""
+        return {k: normalize_value(v) for k, v in modifications.items()}
+
+    @staticmethod
+    def _item_id(item):
+        """Extract the MongoDB _id of an item to delete (None when missing)"""
         # Accept either an object with attribute `id`, a dict with key `id`, or a raw id value.
-        _id_val = None
         if isinstance(item, dict):
             _id_val = item.get("id") or item.get("_id")
-        elif isinstance(item, BaseModel):
-            _id_val = getattr(item, "id", None)
         else:
-            # fallback: try attribute access
+            # BaseModel or fallback: try attribute access
             _id_val = getattr(item, "id", None)
 
         if _id_val is None:
-            # nothing to delete
-            return
-
-        if ObjectId.is_valid(_id_val):
-            oid = ObjectId(_id_val)
-        else:
-            oid = _id_val
+            return None
+        return to_object_id(_id_val)
 
-        with Collection(self.uri, self.collection) as collection:
-            collection.delete_one({"_id": oid})
+    def _document_to_entity(self, document, partial: bool = False):
+        """Convert a MongoDB document to an entity (dictionary)
 
-    def _document_to_entity(self, document):
-        """Convert a MongoDB document to an entity (dictionary)"""
+        partial: the document is a projection, returned as a dictionary since it
+        may not hold every field required by the entity class
+        """
         if not document:
             return None
 
@@ -109,7 +228,7 @@ class CRUD(ICRUD):
             document["id"] = str(document["_id"])
             del document["_id"]
 
-        if self.class_type:
+        if self.class_type and not partial:
             return self.class_type(**document)
         return document
 
@@ -118,7 +237,7 @@ class CRUD(ICRUD):
 
         Rules:
         - If element is a dict, return a shallow copy with 'id' removed.
-        - If element is a Pydantic BaseModel, call .dict() and remove 'id'.
+        - If element is a Pydantic BaseModel, call .model_dump() and remove 'id'.
         - If element is an object with __dict__, use vars(element) and remove 'id'.
         - Otherwise return element as-is (caller may pass an already-valid document).
         """
@@ -128,7 +247,7 @@ class CRUD(ICRUD):
         if isinstance(element, dict):
             doc = dict(element)
         elif isinstance(element, BaseModel):
-            doc = element.dict()
+            doc = element.model_dump()
         elif hasattr(element, "__dict__"):
             doc = dict(vars(element))
         else:
@@ -138,4 +257,95 @@ class CRUD(ICRUD):
         if "id" in doc:
             doc.pop("id", None)
 
-        return doc
+        return normalize_value(doc)
+
+
+class CRUD(DocumentMapper, ICRUD):
+    """Base class for MongoDB CRUD operations"""
+
+    # Named indexes of the collection, managed by `adapters.mongodb.indexes`
+    indexes: list[IndexModel] = []
+
+    def ensure_indexes(self) -> list[str]:
+        """Create the declared indexes (no-op for those that already exist)"""
+        if not self.indexes:
+            return []
+        with Collection(self.uri, self.collection) as collection:
+            return collection.create_indexes(self.indexes)
+
+    def index_information(self) -> dict:
+        """Indexes that exist on the collection"""
+        with Collection(self.uri, self.collection) as collection:
+            return collection.index_information()
+
+    def _cursor(self, collection, filters: dict, batch_size: int | None = None):
+        """Cursor of the documents read with filters, and whether they are projections"""
+        cursor, pipeline, partial = self._find_or_pipeline(
+            collection, filters, batch_size
+        )
+        if pipeline is not None:
+            batching = {"batchSize": batch_size} if batch_size else {}
+            cursor = collection.aggregate(pipeline, **batching)
+        return cursor, partial
+
+    @timed
+    def read(self, **filters) -> list:
+        """Retrieve elements"""
+        with Collection(self.uri, self.collection) as collection:
+            documents, partial = self._cursor(collection, filters)
+            return [self._document_to_entity(doc, partial=partial) for doc in documents]
+
+    @timed
+    def iter_read(self, **filters) -> Iterator:
+        """Stream elements from the cursor, fetched in batches of ITER_BATCH_SIZE"""
+        with Collection(self.uri, self.collection) as collection:
+            documents, partial = self._cursor(collection, filters, ITER_BATCH_SIZE)
+            for document in documents:
+                yield self._document_to_entity(document, partial=partial)
+
+    @timed
+    def read_many(self, ids: list) -> list:
+        """Retrieve elements by id with a single `$in` query"""
+        if not ids:
+            return []
+        with Collection(self.uri, self.collection) as collection:
+            documents = collection.find({"_id": id_filter({"$in": list(ids)})})
+            return self._in_order(ids, documents)
+
+    @timed
+    def count(self, **filters) -> int:
+        """Count elements matching filters without fetching them"""
+        query, _ = self._read_options(filters)
+        with Collection(self.uri, self.collection) as collection:
+            return collection.count_documents(query)
+
+    @timed
+    def create(self, element):
+        """Add new element"""
+        # Ensure we insert a plain dict/document into MongoDB.
+        doc = self._to_document(element)
+        with Collection(self.uri, self.collection) as collection:
+            res = collection.insert_one(doc)
+            # Return the created entity with id normalized
+            doc["_id"] = res.inserted_id
+            return self._document_to_entity(doc)
+
+    @timed
+    def update(self, item_id, **modifications):
+        """Modify element"""
+        normalized_mods = self._modifications(modifications)
+        with Collection(self.uri, self.collection) as collection:
+            collection.update_one(
+                {"_id": to_object_id(item_id)}, {"$set": normalized_mods}
+            )
+
+    @timed
+    def delete(self, item):
+        """Delete element"""
+        oid = self._item_id(item)
+        if oid is None:
+            # nothing to delete
+            return
+
+        with Collection(self.uri, self.collection) as collection:
+            collection.delete_one({"_id": oid})
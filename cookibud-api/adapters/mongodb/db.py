@@ -1,17 +1,81 @@
 """MongoDB connection module"""
 
-from contextlib import AbstractContextManager
+import threading
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
 
-from pymongo import MongoClient
+from pymongo import AsyncMongoClient, MongoClient
+
+DATABASE_NAME = "Cookibud"
+
+# One pooled client per URI, shared by every repository of the process.
+_clients: dict[str, MongoClient] = {}
+_clients_lock = threading.Lock()
+# Asyncio clients are bound to the event loop that runs the application.
+_async_clients: dict[str, AsyncMongoClient] = {}
+
+
+def connect(uri: str, **options) -> MongoClient:
+    """Create the shared client for `uri` (or return the existing one).
+
+    `options` are forwarded to MongoClient (maxPoolSize, maxIdleTimeMS, ...) and
+    only apply when the client is created.
+    """
+    with _clients_lock:
+        client = _clients.get(uri)
+        if client is None:
+            client = MongoClient(uri, **options)
+            _clients[uri] = client
+        return client
+
+
+def get_client(uri: str) -> MongoClient:
+    """Return the shared client for `uri`, creating it with defaults if needed"""
+    client = _clients.get(uri)
+    if client is None:
+        client = connect(uri)
+    return client
+
+
+def close_clients() -> None:
+    """Close every shared client (called on application shutdown)"""
+    with _clients_lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
+
+
+def connect_async(uri: str, **options) -> AsyncMongoClient:
+    """Create the shared asyncio client for `uri` (or return the existing one)"""
+    client = _async_clients.get(uri)
+    if client is None:
+        client = AsyncMongoClient(uri, **options)
+        _async_clients[uri] = client
+    return client
+
+
+def get_async_client(uri: str) -> AsyncMongoClient:
+    """Return the shared asyncio client for `uri`, creating it with defaults if needed"""
+    client = _async_clients.get(uri)
+    if client is None:
+        client = connect_async(uri)
+    return client
+
+
+async def close_async_clients() -> None:
+    """Close every shared asyncio client (called on application shutdown)"""
+    clients = list(_async_clients.values())
+    _async_clients.clear()
+    for client in clients:
+        await client.close()
 
 
 class Collection(AbstractContextManager):
-    """Base class for MongoDB connection"""
+    """Access a MongoDB collection through the shared connection pool"""
 
     def __init__(self, uri: str, collection: str):
-        """Initialize MongoDB client"""
-        self.client = MongoClient(uri)
-        self.database = self.client["Cookibud"]
+        """Retrieve the pooled client for the given uri"""
+        self.client = get_client(uri)
+        self.database = self.client[DATABASE_NAME]
         self.collection = self.database[collection]
 
     def __enter__(self):
@@ -19,5 +83,21 @@ class Collection(AbstractContextManager):
         return self.collection
 
     def __exit__(self, exc_type, exc_value, traceback) -> None:
-        """Close the MongoDB client connection"""
-        self.client.close()
+        """Keep the pooled client open: sockets are returned to the pool"""
+
+
+class AsyncCollection(AbstractAsyncContextManager):
+    """Access a MongoDB collection through the shared asyncio connection pool"""
+
+    def __init__(self, uri: str, collection: str):
+        """Retrieve the pooled asyncio client for the given uri"""
+        self.client = get_async_client(uri)
+        self.database = self.client[DATABASE_NAME]
+        self.collection = self.database[collection]
+
+    async def __aenter__(self):
+        """Return the collection for use in an async context manager"""
+        return self.collection
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """Keep the pooled client open: sockets are returned to the pool"""
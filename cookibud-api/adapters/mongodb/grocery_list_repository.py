@@ -1,14 +1,83 @@
 """MongoDB implementation of GroceryListRepository"""
 
-from adapters.mongodb.crud import CRUD
+from pymongo import ASCENDING, DESCENDING, IndexModel, ReturnDocument
+
+from adapters.mongodb.async_crud import AsyncCRUD
+from adapters.mongodb.crud import CRUD, to_object_id
+from adapters.mongodb.db import AsyncCollection, Collection
+from adapters.mongodb.instrumentation import timed
+from adapters.ports.grocery_list_repository import (
+    AsyncGroceryListRepository as IAsyncGroceryListRepository,
+)
 from adapters.ports.grocery_list_repository import (
     GroceryListRepository as IGroceryListRepository,
 )
 from entities.grocery_list import GroceryList
 
 
+def _items_bought_update(
+    grocery_id: str, user_id: str, bought: bool, item_ids: list[str] | None
+) -> dict:
+    """find_one_and_update arguments setting the bought flag of items of an owned list"""
+    query = {"_id": to_object_id(grocery_id), "user_id": user_id}
+    if item_ids is None:
+        return {"filter": query, "update": {"$set": {"items.$[].bought": bool(bought)}}}
+    # every requested item must be in the list, otherwise nothing matches
+    query["items.id"] = {"$all": list(item_ids)}
+    return {
+        "filter": query,
+        "update": {"$set": {"items.$[item].bought": bool(bought)}},
+        "array_filters": [{"item.id": {"$in": list(item_ids)}}],
+    }
+
+
 class GroceryListRepository(CRUD, IGroceryListRepository):
     """Repository to handle grocery lists"""
 
+    indexes = [
+        IndexModel(
+            [("user_id", ASCENDING), ("created_at", DESCENDING)], name="user_created_at"
+        )
+    ]
+
     def __init__(self, uri: str):
         super().__init__(uri, "GroceryLists", class_type=GroceryList)
+
+    @timed
+    def set_items_bought(
+        self,
+        grocery_id: str,
+        user_id: str,
+        bought: bool,
+        item_ids: list[str] | None = None,
+    ) -> GroceryList | None:
+        """Set the bought flag of items with a single find_one_and_update"""
+        update = _items_bought_update(grocery_id, user_id, bought, item_ids)
+        with Collection(self.uri, self.collection) as collection:
+            document = collection.find_one_and_update(
+                **update, return_document=ReturnDocument.AFTER
+            )
+            return self._document_to_entity(document)
+
+
+class AsyncGroceryListRepository(AsyncCRUD, IAsyncGroceryListRepository):
+    """Asyncio repository to handle grocery lists"""
+
+    def __init__(self, uri: str):
+        super().__init__(uri, "GroceryLists", class_type=GroceryList)
+
+    @timed
+    async def set_items_bought(
+        self,
+        grocery_id: str,
+        user_id: str,
+        bought: bool,
+        item_ids: list[str] | None = None,
+    ) -> GroceryList | None:
+        """Set the bought flag of items with a single find_one_and_update"""
+        update = _items_bought_update(grocery_id, user_id, bought, item_ids)
+        async with AsyncCollection(self.uri, self.collection) as collection:
+            document = await collection.find_one_and_update(
+                **update, return_document=ReturnDocument.AFTER
+            )
+            return self._document_to_entity(document)
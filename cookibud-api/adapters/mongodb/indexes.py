@@ -0,0 +1,110 @@
+"""Declarative index management for the MongoDB repositories
+
+Repositories declare their indexes as named pymongo `IndexModel` in `indexes`.
+`ensure_indexes` creates them idempotently and `index_report` compares them with
+the indexes that actually exist, to detect drift.
+"""
+
+import logging
+from collections.abc import Mapping
+
+from pymongo import IndexModel
+from pymongo.errors import OperationFailure
+
+from adapters.mongodb.catalog_repository import CatalogRepository
+from adapters.mongodb.crud import CRUD
+from adapters.mongodb.grocery_list_repository import GroceryListRepository
+from adapters.mongodb.meal_repository import MealRepository
+from adapters.mongodb.recipe_repository import RecipeRepository
+from adapters.mongodb.review_repository import ReviewRepository
+from adapters.mongodb.user_repository import UserRepository
+
+# Options that must match for an existing index to be up to date
+COMPARED_OPTIONS = (
+    "unique",
+    "sparse",
+    "partialFilterExpression",
+    "expireAfterSeconds",
+    "weights",
+    "default_language",
+)
+TEXT_KEYS = ("_fts", "_ftsx")
+
+logger = logging.getLogger(__name__)
+
+
+def mongo_repositories(uri: str, search_language: str = "english") -> list[CRUD]:
+    """Every MongoDB repository owning a collection"""
+    return [
+        UserRepository(uri),
+        RecipeRepository(uri, search_language=search_language),
+        MealRepository(uri),
+        GroceryListRepository(uri),
+        CatalogRepository(uri),
+        ReviewRepository(uri),
+    ]
+
+
+def _signature(document: Mapping) -> dict:
+    """Comparable form of a declared index document or an `index_information` entry"""
+    keys = document["key"]
+    keys = keys.items() if isinstance(keys, Mapping) else keys
+    # Text fields are stored as _fts/_ftsx keys: they are compared through `weights`
+    signature = {
+        "key": [
+            (field, d) for field, d in keys if d != "text" and field not in TEXT_KEYS
+        ]
+    }
+    for option in COMPARED_OPTIONS:
+        value = document.get(option)
+        if value:
+            signature[option] = dict(value) if isinstance(value, Mapping) else value
+    return signature
+
+
+def compare_indexes(declared: list[IndexModel], existing: dict) -> dict[str, list[str]]:
+    """Names of declared indexes missing or changed, and of undeclared (extra) indexes"""
+    declared = {model.document["name"]: model.document for model in declared}
+    existing = {
+        name: {"name": name, **info}
+        for name, info in existing.items()
+        if name != "_id_"
+    }
+    return {
+        "missing": sorted(declared.keys() - existing.keys()),
+        "extra": sorted(existing.keys() - declared.keys()),
+        "changed": sorted(
+            name
+            for name in declared.keys() & existing.keys()
+            if _signature(declared[name]) != _signature(existing[name])
+        ),
+    }
+
+
+def ensure_indexes(repositories: list[CRUD]) -> dict[str, list[str]]:
+    """Create the declared indexes of every repository
+
+    A collection whose indexes cannot be built (conflicting definition, duplicate keys
+    for a unique index...) is logged and skipped: its migration must be run first.
+    """
+    created = {}
+    for repo in repositories:
+        try:
+            created[repo.collection] = repo.ensure_indexes()
+        except OperationFailure as exc:
+            logger.warning("Could not ensure %s indexes: %s", repo.collection, exc)
+            created[repo.collection] = []
+    return created
+
+
+def index_report(repositories: list[CRUD]) -> dict[str, dict[str, list[str]]]:
+    """Drift between declared and existing indexes, per collection"""
+    return {
+        repo.collection: compare_indexes(repo.indexes, repo.index_information())
+        for repo in repositories
+    }
+
+
+def has_drift(report: dict[str, dict[str, list[str]]]) -> bool:
+    """Whether an index report shows any missing, extra or changed index"""
+    return any(names for diff in report.values() for names in diff.values())
@@ -0,0 +1,236 @@
+"""Timings and document counts of the repository operations
+
+Operations are exported as metrics per collection and, while a `QueryAccount` is
+active (see `account_queries`), also accounted to the current request.
+"""
+
+import functools
+import inspect
+import logging
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from adapters.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+OPERATION_DURATION = REGISTRY.histogram(
+    "cookibud_mongo_operation_duration_seconds",
+    "Duration of the MongoDB repository operations, conversions to entities included",
+    ("collection", "operation"),
+)
+OPERATION_DOCUMENTS = REGISTRY.counter(
+    "cookibud_mongo_documents_total",
+    "Documents returned by the MongoDB repository operations",
+    ("collection", "operation"),
+)
+
+
+def _documents(result) -> int:
+    """Number of documents returned by an operation"""
+    if isinstance(result, list):
+        return sum(1 for element in result if element is not None)
+    if result is None or isinstance(result, (bool, int, str)):
+        # counts, acknowledgements and ids are not documents
+        return 0
+    return 1
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised by strict accounts when the queries are over budget or repeated"""
+
+
+def _shape(value):
+    """Structure of a query argument: keys and operators are kept, values are not"""
+    if isinstance(value, dict):
+        return tuple(
+            sorted((str(key), _shape(element)) for key, element in value.items())
+        )
+    return "?"
+
+
+class QueryAccount:
+    """Repository operations of one unit of work (usually a request)
+
+    Every operation is one query; documents are those returned. Their size is not
+    accounted: it would mean encoding every returned document to BSON again.
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.documents = 0
+        self.duration = 0.0
+        self.shapes: Counter = Counter()
+
+    def record(self, shape: tuple, duration: float, documents: int) -> None:
+        """Account an operation"""
+        self.queries += 1
+        self.documents += documents
+        self.duration += duration
+        self.shapes[shape] += 1
+
+    def repeated(self, max_repeats: int) -> dict[tuple, int]:
+        """Query shapes issued more than max_repeats times, a sign of N+1 queries"""
+        return {
+            shape: count for shape, count in self.shapes.items() if count > max_repeats
+        }
+
+    def problems(
+        self, budget: int | None = None, max_repeats: int | None = None
+    ) -> list[str]:
+        """Descriptions of the budget overruns and the repeated query shapes"""
+        problems = []
+        if budget is not None and self.queries > budget:
+            problems.append(f"{self.queries} queries, over the budget of {budget}")
+        if max_repeats is not None:
+            for (collection, operation, *_), count in self.repeated(
+                max_repeats
+            ).items():
+                problems.append(
+                    f"{collection}.{operation} repeated {count} times with one shape"
+                )
+        return problems
+
+    def server_timing(self) -> str:
+        """`Server-Timing` entry summing up the account"""
+        return (
+            f'mongo;dur={self.duration * 1000:.1f};desc="{self.queries} queries, '
+            f'{self.documents} documents"'
+        )
+
+
+_ACCOUNT: ContextVar[QueryAccount | None] = ContextVar("query_account", default=None)
+
+
+def current_account() -> QueryAccount | None:
+    """Account of the current context, None when queries are not accounted"""
+    return _ACCOUNT.get()
+
+
+@contextmanager
+def account_queries(
+    budget: int | None = None, max_repeats: int | None = None, strict: bool = False
+) -> Iterator[QueryAccount]:
+    """Account the repository operations run in the block
+
+    On exit, going over `budget` queries or repeating a query shape more than
+    `max_repeats` times is logged as a warning, or raises QueryBudgetExceeded if
+    `strict` (for unit tests).
+    """
+    account = QueryAccount()
+    token = _ACCOUNT.set(account)
+    try:
+        yield account
+    finally:
+        _ACCOUNT.reset(token)
+    problems = account.problems(budget, max_repeats)
+    if problems and strict:
+        raise QueryBudgetExceeded("; ".join(problems))
+    for problem in problems:
+        logger.warning("Query budget: %s", problem)
+
+
+def _observe(
+    collection: str, operation: str, duration: float, documents: int, arguments: tuple
+) -> None:
+    OPERATION_DURATION.observe(duration, collection=collection, operation=operation)
+    if documents:
+        OPERATION_DOCUMENTS.inc(documents, collection=collection, operation=operation)
+    account = _ACCOUNT.get()
+    if account is not None:
+        args, kwargs = arguments
+        shape = (collection, operation, tuple("?" for _ in args), _shape(kwargs))
+        account.record(shape, duration, documents)
+
+
+def timed(function):
+    """Record the duration and documents of a repository method, named after it
+
+    Works on sync and async methods and generators (`self.collection` is the
+    collection name). Generators are timed while producing elements only, not while
+    their consumer handles them.
+    """
+    operation = function.__name__
+
+    if inspect.isasyncgenfunction(function):
+
+        @functools.wraps(function)
+        async def async_generator_wrapper(self, *args, **kwargs):
+            elements = function(self, *args, **kwargs)
+            duration, documents = 0.0, 0
+            try:
+                while True:
+                    start = time.perf_counter()
+                    try:
+                        element = await anext(elements)
+                    except StopAsyncIteration:
+                        break
+                    finally:
+                        duration += time.perf_counter() - start
+                    documents += 1
+                    yield element
+            finally:
+                await elements.aclose()
+                _observe(
+                    self.collection, operation, duration, documents, (args, kwargs)
+                )
+
+        return async_generator_wrapper
+
+    if inspect.isgeneratorfunction(function):
+
+        @functools.wraps(function)
+        def generator_wrapper(self, *args, **kwargs):
+            elements = function(self, *args, **kwargs)
+            duration, documents = 0.0, 0
+            try:
+                while True:
+                    start = time.perf_counter()
+                    try:
+                        element = next(elements)
+                    except StopIteration:
+                        break
+                    finally:
+                        duration += time.perf_counter() - start
+                    documents += 1
+                    yield element
+            finally:
+                elements.close()
+                _observe(
+                    self.collection, operation, duration, documents, (args, kwargs)
+                )
+
+        return generator_wrapper
+
+    if inspect.iscoroutinefunction(function):
+
+        @functools.wraps(function)
+        async def async_wrapper(self, *args, **kwargs):
+            start = time.perf_counter()
+            result = None
+            try:
+                result = await function(self, *args, **kwargs)
+                return result
+            finally:
+                duration, documents = time.perf_counter() - start, _documents(result)
+                _observe(
+                    self.collection, operation, duration, documents, (args, kwargs)
+                )
+
+        return async_wrapper
+
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        start = time.perf_counter()
+        result = None
+        try:
+            result = function(self, *args, **kwargs)
+            return result
+        finally:
+            duration, documents = time.perf_counter() - start, _documents(result)
+            _observe(self.collection, operation, duration, documents, (args, kwargs))
+
+    return wrapper
@@ -1,12 +1,123 @@
 """MongoDB implementation of MealRepository"""
 
-from adapters.mongodb.crud import CRUD
+from datetime import date
+
+from pymongo import ASCENDING, IndexModel, ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from adapters.mongodb.async_crud import AsyncCRUD
+from adapters.mongodb.crud import CRUD, normalize_value, to_object_id
+from adapters.mongodb.db import AsyncCollection, Collection
+from adapters.mongodb.instrumentation import timed
+from adapters.ports.meal_repository import AsyncMealRepository as IAsyncMealRepository
 from adapters.ports.meal_repository import MealRepository as IMealRepository
-from entities.meal import Meal
+from entities.meal import Meal, RecipeEntry
+
+# One meal per user and date: planning upserts on this key
+MEAL_INDEXES = [
+    IndexModel(
+        [("user_id", ASCENDING), ("date", ASCENDING)], name="user_date", unique=True
+    )
+]
+
+
+def _owned(meal_id: str, user_id: str) -> dict:
+    """Filter of a meal restricted to its owner"""
+    return {"_id": to_object_id(meal_id), "user_id": user_id}
+
+
+def _planned(user_id: str, day: date) -> dict:
+    """Filter of the meal of a user on a date"""
+    return {"user_id": user_id, "date": normalize_value(day)}
+
+
+def _push(entry: RecipeEntry) -> dict:
+    """Update appending an entry to the meal items"""
+    return {"$push": {"items": entry.model_dump()}}
+
+
+def _pull(recipe_id: str) -> dict:
+    """Update removing every entry of a recipe from the meal items"""
+    return {"$pull": {"items": {"recipe_id": recipe_id}}}
 
 
 class MealRepository(CRUD, IMealRepository):
     """Repository to handle meals"""
 
+    indexes = MEAL_INDEXES
+
     def __init__(self, uri: str):
         super().__init__(uri, "Meals", class_type=Meal)
+
+    def _find_one_and_update(self, query: dict, update: dict, upsert: bool = False):
+        """Apply update to the matching meal and return it as modified"""
+        with Collection(self.uri, self.collection) as collection:
+            document = collection.find_one_and_update(
+                query, update, upsert=upsert, return_document=ReturnDocument.AFTER
+            )
+            return self._document_to_entity(document)
+
+    @timed
+    def append_item(
+        self, meal_id: str, user_id: str, entry: RecipeEntry
+    ) -> Meal | None:
+        """Append an entry with a single `$push`"""
+        return self._find_one_and_update(_owned(meal_id, user_id), _push(entry))
+
+    @timed
+    def remove_recipe(self, meal_id: str, user_id: str, recipe_id: str) -> Meal | None:
+        """Remove the entries of a recipe with a single `$pull`"""
+        return self._find_one_and_update(_owned(meal_id, user_id), _pull(recipe_id))
+
+    @timed
+    def plan_item(self, user_id: str, day: date, entry: RecipeEntry) -> Meal:
+        """Upsert the meal of the date, keyed on the unique (user_id, date) index"""
+        query = _planned(user_id, day)
+        try:
+            return self._find_one_and_update(query, _push(entry), upsert=True)
+        except DuplicateKeyError:
+            # a concurrent plan created the meal first: append to it
+            return self._find_one_and_update(query, _push(entry))
+
+
+class AsyncMealRepository(AsyncCRUD, IAsyncMealRepository):
+    """Asyncio repository to handle meals"""
+
+    def __init__(self, uri: str):
+        super().__init__(uri, "Meals", class_type=Meal)
+
+    async def _find_one_and_update(
+        self, query: dict, update: dict, upsert: bool = False
+    ):
+        """Apply update to the matching meal and return it as modified"""
+        async with AsyncCollection(self.uri, self.collection) as collection:
+            document = await collection.find_one_and_update(
+                query, update, upsert=upsert, return_document=ReturnDocument.AFTER
+            )
+            return self._document_to_entity(document)
+
+    @timed
+    async def append_item(
+        self, meal_id: str, user_id: str, entry: RecipeEntry
+    ) -> Meal | None:
+        """Append an entry with a single `$push`"""
+        return await self._find_one_and_update(_owned(meal_id, user_id), _push(entry))
+
+    @timed
+    async def remove_recipe(
+        self, meal_id: str, user_id: str, recipe_id: str
+    ) -> Meal | None:
+        """Remove the entries of a recipe with a single `$pull`"""
+        return await self._find_one_and_update(
+            _owned(meal_id, user_id), _pull(recipe_id)
+        )
+
+    @timed
+    async def plan_item(self, user_id: str, day: date, entry: RecipeEntry) -> Meal:
+        """Upsert the meal of the date, keyed on the unique (user_id, date) index"""
+        query = _planned(user_id, day)
+        try:
+            return await self._find_one_and_update(query, _push(entry), upsert=True)
+        except DuplicateKeyError:
+            # a concurrent plan created the meal first: append to it
+            return await self._find_one_and_update(query, _push(entry))
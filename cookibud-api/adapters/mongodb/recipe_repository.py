@@ -1,12 +1,128 @@
 """MongoDB implementation of RecipeRepository"""
 
-from adapters.mongodb.crud import CRUD
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
+
+from adapters.mongodb.async_crud import AsyncCRUD
+from adapters.mongodb.crud import CRUD, DocumentMapper, to_object_id
+from adapters.mongodb.db import AsyncCollection, Collection
+from adapters.mongodb.instrumentation import timed
+from adapters.ports.recipe_repository import (
+    AsyncRecipeRepository as IAsyncRecipeRepository,
+)
 from adapters.ports.recipe_repository import RecipeRepository as IRecipeRepository
-from entities.recipe import Recipe
+from entities.recipe import Recipe, Review
+
+# Weighted text index serving recipe search: title matches rank above ingredients,
+# which rank above the description.
+SEARCH_INDEX_NAME = "recipe_search"
+SEARCH_INDEX_KEYS = [("title", TEXT), ("ingredients.name", TEXT), ("description", TEXT)]
+SEARCH_INDEX_WEIGHTS = {"title": 10, "ingredients.name": 5, "description": 1}
+# Reviews embedded in the recipe document (all of them are in the Reviews collection)
+LATEST_REVIEWS = 5
+# Lowercased copy of the title, matched by typeahead prefixes: a case-insensitive
+# regex can't be bounded by an index, a case-sensitive anchored one can
+TITLE_KEY = "title_lower"
+
+RECIPE_INDEXES = [
+    IndexModel([("tags", ASCENDING)], name="tags"),
+    IndexModel([("ingredients.name", ASCENDING)], name="ingredient_names"),
+    # Recipes imported without an author are left out of the index
+    IndexModel(
+        [("author_id", ASCENDING)],
+        name="author_id",
+        partialFilterExpression={"author_id": {"$type": "string"}},
+    ),
+    # Best rated sort and minimum rating filter
+    IndexModel([("rating_avg", DESCENDING)], name="rating_avg"),
+    # Sort by title
+    IndexModel([("title", ASCENDING)], name="title"),
+    # Title prefix matches of typeaheads
+    IndexModel([(TITLE_KEY, ASCENDING)], name=TITLE_KEY),
+]
+
+
+def search_index(language: str = "english") -> IndexModel:
+    """Text index serving recipe search, with the given stemming language"""
+    return IndexModel(
+        SEARCH_INDEX_KEYS,
+        name=SEARCH_INDEX_NAME,
+        weights=SEARCH_INDEX_WEIGHTS,
+        default_language=language,
+    )
+
+
+def with_title_key(document: dict) -> dict:
+    """Add the lowercased title to a recipe document or `$set` carrying its title"""
+    if isinstance(document, dict) and isinstance(document.get("title"), str):
+        document[TITLE_KEY] = document["title"].lower()
+    return document
+
+
+class RecipeMapper(DocumentMapper):
+    """Recipe documents, storing the lowercased title whenever the title is written"""
+
+    def _to_document(self, element):
+        return with_title_key(super()._to_document(element))
 
+    @staticmethod
+    def _modifications(modifications: dict) -> dict:
+        return with_title_key(DocumentMapper._modifications(modifications))
 
-class RecipeRepository(CRUD, IRecipeRepository):
+
+def _review_update(review: Review) -> list[dict]:
+    """Pipeline update keeping the latest reviews and maintaining the rating aggregates
+
+    A pipeline is used so the average is computed from the incremented counters
+    within the same atomic update.
+    """
+    latest = {
+        "$concatArrays": [
+            {"$ifNull": ["$reviews", []]},
+            [{"$literal": review.model_dump()}],
+        ]
+    }
+    return [
+        {
+            "$set": {
+                "reviews": {"$slice": [latest, -LATEST_REVIEWS]},
+                "rating_count": {"$add": [{"$ifNull": ["$rating_count", 0]}, 1]},
+                "rating_sum": {
+                    "$add": [{"$ifNull": ["$rating_sum", 0]}, review.rating]
+                },
+            }
+        },
+        {"$set": {"rating_avg": {"$divide": ["$rating_sum", "$rating_count"]}}},
+    ]
+
+
+class RecipeRepository(RecipeMapper, CRUD, IRecipeRepository):
     """Repository to handle recipes"""
 
+    def __init__(self, uri: str, search_language: str = "english"):
+        super().__init__(uri, "Recipes", class_type=Recipe)
+        self.indexes = [*RECIPE_INDEXES, search_index(search_language)]
+
+    @timed
+    def add_review(self, recipe_id: str, review: Review) -> bool:
+        """Update the latest reviews and the rating aggregates in one update"""
+        with Collection(self.uri, self.collection) as collection:
+            result = collection.update_one(
+                {"_id": to_object_id(recipe_id)}, _review_update(review)
+            )
+            return result.matched_count > 0
+
+
+class AsyncRecipeRepository(RecipeMapper, AsyncCRUD, IAsyncRecipeRepository):
+    """Asyncio repository to handle recipes"""
+
     def __init__(self, uri: str):
         super().__init__(uri, "Recipes", class_type=Recipe)
+
+    @timed
+    async def add_review(self, recipe_id: str, review: Review) -> bool:
+        """Update the latest reviews and the rating aggregates in one update"""
+        async with AsyncCollection(self.uri, self.collection) as collection:
+            result = await collection.update_one(
+                {"_id": to_object_id(recipe_id)}, _review_update(review)
+            )
+            return result.matched_count > 0
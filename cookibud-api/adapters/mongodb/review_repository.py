@@ -0,0 +1,33 @@
+"""MongoDB implementation of ReviewRepository"""
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from adapters.mongodb.async_crud import AsyncCRUD
+from adapters.mongodb.crud import CRUD
+from adapters.ports.review_repository import (
+    AsyncReviewRepository as IAsyncReviewRepository,
+)
+from adapters.ports.review_repository import ReviewRepository as IReviewRepository
+from entities.recipe import Review
+
+
+class ReviewRepository(CRUD, IReviewRepository):
+    """Repository to handle recipe reviews"""
+
+    # Reviews of a recipe, newest first (with the _id tie-breaker of cursor pagination)
+    indexes = [
+        IndexModel(
+            [("recipe_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+            name="recipe_created_at",
+        )
+    ]
+
+    def __init__(self, uri: str):
+        super().__init__(uri, "Reviews", class_type=Review)
+
+
+class AsyncReviewRepository(AsyncCRUD, IAsyncReviewRepository):
+    """Asyncio repository to handle recipe reviews"""
+
+    def __init__(self, uri: str):
+        super().__init__(uri, "Reviews", class_type=Review)
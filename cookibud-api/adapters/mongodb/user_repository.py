@@ -1,5 +1,7 @@
 """MongoDB implementation of UserRepository"""
 
+from pymongo import ASCENDING, IndexModel
+
 from adapters.mongodb.crud import CRUD
 from adapters.ports.user_repository import UserRepository as IUserRepository
 from entities.user import User
@@ -8,5 +10,7 @@ from entities.user import User
 class UserRepository(CRUD, IUserRepository):
     """Repository to handle users"""
 
+    indexes = [IndexModel([("username", ASCENDING)], name="username", unique=True)]
+
     def __init__(self, uri: str):
         super().__init__(uri, "Users", class_type=User)
@@ -0,0 +1,21 @@
+"""Repository interface for recipe catalogs"""
+
+from abc import ABC, abstractmethod
+
+from adapters.ports.crud import CRUD, AsyncCRUD
+
+
+class CatalogRepository(CRUD, ABC):
+    """Repository to handle tag and ingredient name catalogs"""
+
+    @abstractmethod
+    def increment(self, kind: str, deltas: dict[str, int]):
+        """Add deltas to the usage count of names, forgetting names no longer used"""
+
+
+class AsyncCatalogRepository(AsyncCRUD, ABC):
+    """Repository to handle tag and ingredient name catalogs from the event loop"""
+
+    @abstractmethod
+    async def increment(self, kind: str, deltas: dict[str, int]):
+        """Add deltas to the usage count of names, forgetting names no longer used"""
@@ -1,6 +1,7 @@
 """CRUD repository interface"""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterator
 
 
 class CRUD(ABC):
@@ -8,7 +9,30 @@ class CRUD(ABC):
 
     @abstractmethod
     def read(self, **filters) -> list:
-        """Retrieve elements"""
+        """Retrieve elements
+
+        Besides field filters, accepts `_sort`, `_skip`, `_limit` and `_fields`: with
+        `_fields` (list of field names) only those fields and `id` are returned, as dicts.
+        `_after` switches to keyset pagination: `id` breaks ties of `_sort`, and only
+        elements after the given values (sort values then id of the last element of the
+        previous page, None for the first page) are returned. Computed sort keys such as
+        `{"$meta": "textScore"}` are returned as fields so that they can be paginated too.
+        """
+
+    @abstractmethod
+    def iter_read(self, **filters) -> Iterator:
+        """Stream the elements of `read` (same filters) without loading them all at once
+
+        Implemented as a generator.
+        """
+
+    @abstractmethod
+    def read_many(self, ids: list) -> list:
+        """Retrieve elements by id in one call, in the order of ids (None when missing)"""
+
+    @abstractmethod
+    def count(self, **filters) -> int:
+        """Count elements matching filters"""
 
     @abstractmethod
     def create(self, element):
@@ -21,3 +45,38 @@ class CRUD(ABC):
     @abstractmethod
     def delete(self, item):
         """Delete element"""
+
+
+class AsyncCRUD(ABC):
+    """Repository to handle crud from the event loop"""
+
+    @abstractmethod
+    async def read(self, **filters) -> list:
+        """Retrieve elements (same filters and `_` options as `CRUD.read`)"""
+
+    @abstractmethod
+    async def iter_read(self, **filters) -> AsyncIterator:
+        """Stream the elements of `read` (same filters) without loading them all at once
+
+        Implemented as an async generator, iterated with `async for` (not awaited).
+        """
+
+    @abstractmethod
+    async def read_many(self, ids: list) -> list:
+        """Retrieve elements by id in one call, in the order of ids (None when missing)"""
+
+    @abstractmethod
+    async def count(self, **filters) -> int:
+        """Count elements matching filters"""
+
+    @abstractmethod
+    async def create(self, element):
+        """Add new element"""
+
+    @abstractmethod
+    async def update(self, item_id, **modifications):
+        """Modify element"""
+
+    @abstractmethod
+    async def delete(self, item):
+        """Delete element"""
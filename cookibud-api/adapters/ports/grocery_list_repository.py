@@ -1,9 +1,38 @@
 """Repository interface for grocery lists"""
 
-from abc import ABC
+from abc import ABC, abstractmethod
 
-from adapters.ports.crud import CRUD
+from adapters.ports.crud import CRUD, AsyncCRUD
+from entities.grocery_list import GroceryList
 
 
 class GroceryListRepository(CRUD, ABC):
     """Repository to handle grocery lists"""
+
+    @abstractmethod
+    def set_items_bought(
+        self,
+        grocery_id: str,
+        user_id: str,
+        bought: bool,
+        item_ids: list[str] | None = None,
+    ) -> GroceryList | None:
+        """Atomically set the bought flag of items (all items when item_ids is None)
+
+        Returns the updated list, or None when no list with this id is owned by user_id
+        or one of item_ids is not in it (nothing is modified then).
+        """
+
+
+class AsyncGroceryListRepository(AsyncCRUD, ABC):
+    """Repository to handle grocery lists from the event loop"""
+
+    @abstractmethod
+    async def set_items_bought(
+        self,
+        grocery_id: str,
+        user_id: str,
+        bought: bool,
+        item_ids: list[str] | None = None,
+    ) -> GroceryList | None:
+        """Atomically set the bought flag of items (see GroceryListRepository)"""
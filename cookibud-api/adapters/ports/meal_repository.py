@@ -1,9 +1,45 @@
 """Repository interface for user operations"""
 
-from abc import ABC
+from abc import ABC, abstractmethod
+from datetime import date
 
-from adapters.ports.crud import CRUD
+from adapters.ports.crud import CRUD, AsyncCRUD
+from entities.meal import Meal, RecipeEntry
 
 
 class MealRepository(CRUD, ABC):
     """Repository to handle meals"""
+
+    @abstractmethod
+    def append_item(
+        self, meal_id: str, user_id: str, entry: RecipeEntry
+    ) -> Meal | None:
+        """Atomically append an entry to a meal owned by user_id (None when not found)"""
+
+    @abstractmethod
+    def remove_recipe(self, meal_id: str, user_id: str, recipe_id: str) -> Meal | None:
+        """Atomically remove the entries of a recipe from a meal owned by user_id"""
+
+    @abstractmethod
+    def plan_item(self, user_id: str, day: date, entry: RecipeEntry) -> Meal:
+        """Atomically append an entry to the meal of user_id on day, creating it if needed"""
+
+
+class AsyncMealRepository(AsyncCRUD, ABC):
+    """Repository to handle meals from the event loop"""
+
+    @abstractmethod
+    async def append_item(
+        self, meal_id: str, user_id: str, entry: RecipeEntry
+    ) -> Meal | None:
+        """Atomically append an entry to a meal owned by user_id (None when not found)"""
+
+    @abstractmethod
+    async def remove_recipe(
+        self, meal_id: str, user_id: str, recipe_id: str
+    ) -> Meal | None:
+        """Atomically remove the entries of a recipe from a meal owned by user_id"""
+
+    @abstractmethod
+    async def plan_item(self, user_id: str, day: date, entry: RecipeEntry) -> Meal:
+        """Atomically append an entry to the meal of user_id on day, creating it if needed"""
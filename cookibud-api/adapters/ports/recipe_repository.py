@@ -1,9 +1,25 @@
 """Repository interface for user operations"""
 
-from abc import ABC
+from abc import ABC, abstractmethod
 
-from adapters.ports.crud import CRUD
+from adapters.ports.crud import CRUD, AsyncCRUD
+from entities.recipe import Review
 
 
 class RecipeRepository(CRUD, ABC):
     """Repository to handle recipes"""
+
+    @abstractmethod
+    def add_review(self, recipe_id: str, review: Review) -> bool:
+        """Atomically update the rating aggregates and the latest reviews kept on the recipe
+
+        Returns False when the recipe does not exist.
+        """
+
+
+class AsyncRecipeRepository(AsyncCRUD, ABC):
+    """Repository to handle recipes from the event loop"""
+
+    @abstractmethod
+    async def add_review(self, recipe_id: str, review: Review) -> bool:
+        """Atomically update the rating aggregates and the latest reviews of the recipe"""
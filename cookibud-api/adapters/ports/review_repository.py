@@ -0,0 +1,13 @@
+"""Repository interface for recipe reviews"""
+
+from abc import ABC
+
+from adapters.ports.crud import CRUD, AsyncCRUD
+
+
+class ReviewRepository(CRUD, ABC):
+    """Repository to handle recipe reviews"""
+
+
+class AsyncReviewRepository(AsyncCRUD, ABC):
+    """Repository to handle recipe reviews from the event loop"""
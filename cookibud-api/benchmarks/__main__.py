@@ -0,0 +1,251 @@
+"""Benchmark the use cases and the endpoints over a synthetic dataset.
+
+Run with:
+  python -m benchmarks run --scale small --output results.json
+  python -m benchmarks run --adapter mongodb --mongo-uri mongodb://localhost:27017/ \
+      --scale medium --output results.json
+  python -m benchmarks compare baseline.json results.json --threshold 0.1
+  python -m benchmarks load --stages 1:30,10:30,50:30 --threadpool 40
+  python -m benchmarks load --adapter mongodb --mongo-uri mongodb://localhost:27017/ \
+      --base-url http://localhost:8000 --stages 10:60,100:60
+
+`run` seeds a dataset (small: 1k recipes, medium: 100k, large: 1M) into the in-memory
+adapter or into a local mongod, times the use cases and then the application through
+an in-process HTTP client, and saves the statistics of each benchmark as JSON. The
+MongoDB collections are dropped first: give the URI of a server dedicated to
+benchmarks. `compare` lists the benchmarks whose median changed by more than the
+threshold and exits with status 1 when one of them regressed.
+
+`load` seeds a dataset the same way and ramps up virtual users through the stages
+(`users:seconds`), each repeating a journey: login, search recipes, plan a week,
+generate its grocery list and tick items off. Every stage reports its throughput and
+the p50/p95/p99 latency and error rate of each route. The application runs in-process
+(--threadpool sets its size), or is the server at --base-url: start it with uvicorn
+against the same MongoDB, e.g. `ADAPTER=mongodb MONGO_URI=... THREADPOOL_SIZE=40
+uvicorn drivers.main:app --workers 4`, to size its threadpool and workers.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+
+from adapters.mongodb.db import close_async_clients
+from benchmarks.cases import (
+    app_benchmarks,
+    app_client,
+    app_container,
+    mutation_benchmarks,
+    recipe_benchmarks,
+)
+from benchmarks.datasets import SCALES, Dataset, seed
+from benchmarks.load import Stage, load_client, ramp
+from benchmarks.runner import compare, read_results, run, write_results
+from drivers.config import settings
+from drivers.main import app
+
+
+def _seed(args) -> Dataset:
+    settings.adapter = args.adapter
+    if args.adapter == "mongodb":
+        settings.mongo_uri = args.mongo_uri
+    started = time.perf_counter()
+    dataset = seed(SCALES[args.scale], args.adapter, args.seed, args.skew, args.workers)
+    print(f"Seeded {args.scale} dataset in {time.perf_counter() - started:.1f}s")
+    return dataset
+
+
+def _metadata(args) -> dict:
+    return {
+        "scale": args.scale,
+        "adapter": args.adapter,
+        "seed": args.seed,
+        "skew": args.skew,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def _run(args) -> int:
+    dataset = _seed(args)
+    client = app_client(dataset)
+
+    async def teardown():
+        await client.aclose()
+        await close_async_clients()
+
+    benchmarks = [
+        *recipe_benchmarks(dataset, args.adapter),
+        *mutation_benchmarks(dataset, args.adapter),
+        *app_benchmarks(dataset, client),
+    ]
+    benchmarks = [b for b in benchmarks if not args.only or args.only in b.name]
+    with app_container(args.adapter):
+        results = run(benchmarks, args.iterations, teardown=teardown)
+
+    write_results(args.output, _metadata(args), results)
+    print(f"Results saved to {args.output}")
+    return 0
+
+
+def _compare(args) -> int:
+    baseline, current = read_results(args.baseline), read_results(args.results)
+    for key in ("scale", "adapter", "skew"):
+        if baseline["metadata"].get(key) != current["metadata"].get(key):
+            print(
+                f"Warning: {key} differs from the baseline, results are not comparable"
+            )
+    rows = compare(baseline, current, args.threshold)
+    for row in rows:
+        before = f"{row['baseline'] * 1000:.3f}" if row["baseline"] is not None else "-"
+        after = f"{row['current'] * 1000:.3f}" if row["current"] is not None else "-"
+        change = f"{(row['ratio'] - 1) * 100:+.1f}%" if row["ratio"] is not None else ""
+        print(
+            f"{row['name']:<40} {before:>10} {after:>10} ms {change:>8}  {row['status']}"
+        )
+    regressions = [row["name"] for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+def _report_stage(summary: dict) -> None:
+    print(
+        f"{summary['users']} users: {summary['throughput']:.1f} requests/s, "
+        f"{summary['journeys']} journeys, {summary['error_rate']:.2%} errors"
+    )
+    for route, stats in summary["routes"].items():
+        latencies = " ".join(f"{stats[p] * 1000:>9.1f}" for p in ("p50", "p95", "p99"))
+        print(
+            f"  {route:<48} {stats['requests']:>8} {stats['throughput']:>8.1f}/s "
+            f"{latencies} ms {stats['error_rate']:>7.2%}"
+        )
+
+
+def _load(args) -> int:
+    dataset = _seed(args)
+    if args.threadpool:
+        settings.threadpool_size = args.threadpool
+    client = load_client(args.base_url, max(stage.users for stage in args.stages))
+
+    async def load_test():
+        async with client:
+            if args.base_url:
+                return await ramp(
+                    client, dataset, args.stages, args.think_time, _report_stage
+                )
+            # in-process, the lifespan resolves the use cases of settings.adapter, sizes
+            # the threadpool and opens the MongoDB pools
+            async with app.router.lifespan_context(app):
+                return await ramp(
+                    client, dataset, args.stages, args.think_time, _report_stage
+                )
+
+    print(
+        f"  {'route':<48} {'requests':>8} {'rate':>10} {'p50':>9} {'p95':>9} {'p99':>9}"
+    )
+    stages = asyncio.run(load_test())
+
+    metadata = {
+        **_metadata(args),
+        "base_url": args.base_url,
+        "threadpool": args.threadpool,
+        "think_time": args.think_time,
+    }
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(
+            {"metadata": metadata, "stages": stages}, file, indent=2, sort_keys=True
+        )
+    print(f"Results saved to {args.output}")
+    return 0
+
+
+def _stages(text: str) -> list[Stage]:
+    try:
+        return [Stage.parse(stage) for stage in text.split(",")]
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from e
+
+
+def _add_dataset_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--scale", choices=SCALES, default="small")
+    parser.add_argument(
+        "--adapter", choices=["in_memory", "mongodb"], default="in_memory"
+    )
+    parser.add_argument("--mongo-uri", help="server whose data is replaced (mongodb)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--skew", type=float, default=1.0, help="power-law exponent")
+    parser.add_argument("--workers", type=int, help="loading processes (mongodb)")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser(
+        "run", help="seed a dataset and run the benchmarks"
+    )
+    _add_dataset_arguments(run_parser)
+    run_parser.add_argument("--iterations", type=int, help="override the iterations")
+    run_parser.add_argument(
+        "--only", help="run the benchmarks whose name contains this"
+    )
+    run_parser.add_argument("--output", default="benchmark-results.json")
+
+    compare_parser = commands.add_parser(
+        "compare", help="compare results with a baseline"
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("results")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative change flagged (0.1: 10%%)",
+    )
+
+    load_parser = commands.add_parser("load", help="seed a dataset and run a load test")
+    _add_dataset_arguments(load_parser)
+    load_parser.add_argument(
+        "--stages",
+        type=_stages,
+        default=_stages("1:10,10:10,50:10"),
+        help="virtual users and seconds of each stage (default: 1:10,10:10,50:10)",
+    )
+    load_parser.add_argument(
+        "--think-time",
+        type=float,
+        default=0.0,
+        help="mean pause before each request (s)",
+    )
+    load_parser.add_argument(
+        "--base-url", help="load test this server instead (mongodb)"
+    )
+    load_parser.add_argument(
+        "--threadpool", type=int, help="threads of the application"
+    )
+    load_parser.add_argument("--output", default="load-results.json")
+
+    args = parser.parse_args()
+    if args.command == "compare":
+        return _compare(args)
+    if args.adapter == "mongodb" and not args.mongo_uri:
+        parser.error(
+            "--mongo-uri is required with --adapter mongodb: its data is replaced"
+        )
+    if args.command == "load":
+        if args.base_url and args.adapter != "mongodb":
+            parser.error(
+                "--base-url requires --adapter mongodb: the server reads the dataset"
+            )
+        return _load(args)
+    return _run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+"""Benchmarks of the use cases and of the endpoints of the application"""
+
+import itertools
+from contextlib import contextmanager
+from datetime import timedelta
+
+import httpx
+
+from benchmarks.datasets import Dataset
+from benchmarks.runner import Benchmark
+from benchmarks.synthetic import PASSWORD
+from drivers.dependencies import get_adapter_repository
+from drivers.main import app, build_container
+from drivers.routers.auth import create_access_token
+from use_cases.auth import AuthUseCase
+from use_cases.grocery_lists import (
+    GenerateGroceryListUseCase,
+    UpdateAllGroceryListItemsStatusUseCase,
+    UpdateGroceryListItemsStatusUseCase,
+)
+from use_cases.meals import PlanRecipeUseCase
+from use_cases.recipes import GetTagsUseCase, ReadRecipesUseCase
+
+PAGE_SIZE = 20
+# Pages read one after the other by the pagination benchmarks
+PAGES = 5
+# Items ticked at once in a grocery list
+TICKED_ITEMS = 10
+# Password hashing is deliberately slow: logins run fewer iterations
+LOGIN_ITERATIONS = 10
+
+
+def _weeks(dataset: Dataset):
+    """Endless (start, end) weeks over the period of the planned meals"""
+    weeks = (dataset.meal_end - dataset.meal_start).days // 7
+    for week in itertools.cycle(range(max(1, weeks))):
+        start = dataset.meal_start + timedelta(days=7 * week)
+        yield start, start + timedelta(days=6)
+
+
+def _days(dataset: Dataset):
+    """Endless days of the period of the planned meals"""
+    days = (dataset.meal_end - dataset.meal_start).days
+    for offset in itertools.cycle(range(max(1, days))):
+        yield dataset.meal_start + timedelta(days=offset)
+
+
+def _toggles():
+    """Alternating bought status, so that every update changes the list"""
+    return itertools.cycle([True, False])
+
+
+def recipe_benchmarks(dataset: Dataset, adapter: str) -> list[Benchmark]:
+    """Searches, filters and pagination of ReadRecipesUseCase, and GetTagsUseCase"""
+    read = ReadRecipesUseCase(get_adapter_repository("recipe", adapter))
+    get_tags = GetTagsUseCase(get_adapter_repository("catalog", adapter))
+    searches = itertools.cycle(dataset.searches)
+    tags = itertools.cycle(dataset.tags)
+    ingredients = itertools.cycle(dataset.ingredients)
+
+    def cursor_pages():
+        cursor = None
+        for _ in range(PAGES):
+            page = read(
+                sort_by="rating_avg", sort_dir="desc", cursor=cursor, limit=PAGE_SIZE
+            )
+            cursor = page["next_cursor"]
+
+    def offset_pages():
+        for page in range(1, PAGES + 1):
+            read(sort_by="rating_avg", sort_dir="desc", page=page, page_size=PAGE_SIZE)
+
+    # deep enough to show the cost of skipping, within the smallest dataset
+    deep_page = max(1, dataset.scale.recipes // PAGE_SIZE // 2)
+    return [
+        Benchmark(
+            "recipes.search", lambda: read(search=next(searches), limit=PAGE_SIZE)
+        ),
+        Benchmark(
+            "recipes.search_counted",
+            lambda: read(search=next(searches), page=1, page_size=PAGE_SIZE),
+        ),
+        Benchmark(
+            "recipes.tag_filter", lambda: read(tags=[next(tags)], limit=PAGE_SIZE)
+        ),
+        Benchmark(
+            "recipes.ingredient_filter",
+            lambda: read(ingredient=next(ingredients), limit=PAGE_SIZE),
+        ),
+        Benchmark("recipes.cursor_pages", cursor_pages),
+        Benchmark("recipes.offset_pages", offset_pages),
+        Benchmark(
+            "recipes.deep_offset_page",
+            lambda: read(page=deep_page, page_size=PAGE_SIZE, sort_by="title"),
+        ),
+        Benchmark("recipes.tags", get_tags),
+    ]
+
+
+def mutation_benchmarks(dataset: Dataset, adapter: str) -> list[Benchmark]:
+    """Grocery list mutations, meal planning and login"""
+    grocery_repository = get_adapter_repository("grocery_list", adapter)
+    meal_repository = get_adapter_repository("meal", adapter)
+    tick_items = UpdateGroceryListItemsStatusUseCase(grocery_repository)
+    tick_all = UpdateAllGroceryListItemsStatusUseCase(grocery_repository)
+    generate = GenerateGroceryListUseCase(
+        grocery_repository, meal_repository, get_adapter_repository("recipe", adapter)
+    )
+    plan = PlanRecipeUseCase(meal_repository)
+    login = AuthUseCase(get_adapter_repository("user", adapter))
+    item_ids = dataset.item_ids[:TICKED_ITEMS]
+    toggles, weeks, days = _toggles(), _weeks(dataset), _days(dataset)
+    entries = itertools.cycle(dataset.recipes)
+
+    return [
+        Benchmark(
+            "groceries.tick_items",
+            lambda: tick_items(
+                dataset.grocery_id, item_ids, next(toggles), dataset.user_id
+            ),
+        ),
+        Benchmark(
+            "groceries.tick_all",
+            lambda: tick_all(dataset.grocery_id, next(toggles), dataset.user_id),
+        ),
+        Benchmark(
+            "groceries.generate", lambda: generate(*next(weeks), dataset.user_id)
+        ),
+        Benchmark(
+            "meals.plan",
+            lambda: plan(next(days), {**next(entries), "servings": 2}, dataset.user_id),
+        ),
+        Benchmark(
+            "auth.login",
+            lambda: login(dataset.username, PASSWORD),
+            iterations=LOGIN_ITERATIONS,
+            warmup=1,
+        ),
+    ]
+
+
+def _checked(response: httpx.Response) -> httpx.Response:
+    """Fail the benchmark on error responses: timing them would be meaningless"""
+    response.raise_for_status()
+    return response
+
+
+def app_benchmarks(dataset: Dataset, client: httpx.AsyncClient) -> list[Benchmark]:
+    """Requests to the application, middlewares, validation and serialization included
+
+    client: authenticated as the benchmark user (see `app_client`)
+    """
+    searches = itertools.cycle(dataset.searches)
+    toggles, weeks, days = _toggles(), _weeks(dataset), _days(dataset)
+    entries = itertools.cycle(dataset.recipes)
+    items = ",".join(dataset.item_ids[:TICKED_ITEMS])
+
+    async def login():
+        _checked(await client.post("/token", data=_credentials(dataset)))
+
+    async def search():
+        params = {"search": next(searches), "limit": PAGE_SIZE}
+        _checked(await client.get("/recipes", params=params))
+
+    async def page():
+        params = {
+            "page": 1,
+            "page_size": PAGE_SIZE,
+            "sort_by": "rating_avg",
+            "sort_dir": "desc",
+        }
+        _checked(await client.get("/recipes", params=params))
+
+    async def tags():
+        _checked(await client.get("/recipes/tags"))
+
+    async def plan():
+        body = {
+            "date": next(days).isoformat(),
+            "entry": {**next(entries), "servings": 2},
+        }
+        _checked(await client.post("/meals/plan", json=body))
+
+    async def generate():
+        start, end = next(weeks)
+        params = {"start": start.isoformat(), "end": end.isoformat()}
+        _checked(await client.post("/groceries/generate", params=params))
+
+    async def tick():
+        params = {"bought": str(next(toggles)).lower(), "ids": items}
+        _checked(
+            await client.patch(f"/groceries/{dataset.grocery_id}/items", params=params)
+        )
+
+    return [
+        Benchmark("app.login", login, iterations=LOGIN_ITERATIONS, warmup=1),
+        Benchmark("app.recipes.search", search),
+        Benchmark("app.recipes.page", page),
+        Benchmark("app.recipes.tags", tags),
+        Benchmark("app.meals.plan", plan),
+        Benchmark("app.groceries.generate", generate),
+        Benchmark("app.groceries.tick_items", tick),
+    ]
+
+
+def _credentials(dataset: Dataset) -> dict:
+    return {"username": dataset.username, "password": PASSWORD}
+
+
+@contextmanager
+def app_container(adapter: str):
+    """Resolve the use cases of the application with the repositories of adapter
+
+    The in-process client does not run the lifespan of the application, which
+    builds them from `settings.adapter`: benchmarks must read the dataset they seeded.
+    """
+    previous = getattr(app.state, "container", None)
+    app.state.container = build_container(adapter)
+    try:
+        yield
+    finally:
+        app.state.container = previous
+
+
+def app_client(dataset: Dataset) -> httpx.AsyncClient:
+    """In-process client of the application, authenticated as the benchmark user"""
+    token = create_access_token(
+        {"username": dataset.username, "user_id": dataset.user_id}
+    )
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://benchmark",
+        headers={"Authorization": f"Bearer {token}"},
+    )
@@ -0,0 +1,158 @@
+"""Deterministic synthetic datasets the benchmarks run against
+
+A dataset of a given scale is generated from a seed by `benchmarks.synthetic` and
+loaded into the tables of the in-memory adapter or into the collections of a MongoDB
+server, with a large grocery list for the user the benchmarks act as.
+"""
+
+import random
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+
+from adapters.in_memory.store import clear_tables
+from adapters.mongodb.db import Collection
+from benchmarks.loader import load_in_memory, load_mongodb
+from benchmarks.synthetic import (
+    ADJECTIVES,
+    DISHES,
+    INGREDIENTS,
+    PASSWORD,
+    TAGS,
+    GeneratorConfig,
+    SyntheticData,
+    object_id,
+    power_law_index,
+)
+from drivers.config import settings
+from drivers.dependencies import get_adapter_repository, pwd_context
+
+# Recipes kept to plan meals and generate grocery lists
+SAMPLE_SIZE = 500
+
+
+@dataclass(frozen=True)
+class Scale:
+    """Size of a dataset"""
+
+    recipes: int
+    users: int
+    meal_years: int  # years of planned meals
+    grocery_items: int  # items of the large grocery list of the benchmark user
+
+
+SCALES = {
+    "small": Scale(recipes=1_000, users=50, meal_years=1, grocery_items=200),
+    "medium": Scale(recipes=100_000, users=1_000, meal_years=3, grocery_items=1_000),
+    "large": Scale(recipes=1_000_000, users=10_000, meal_years=5, grocery_items=5_000),
+}
+
+
+@dataclass
+class Dataset:
+    """What the benchmarks need to know about a generated dataset"""
+
+    scale: Scale
+    username: str  # benchmark user, with meals and a large grocery list
+    user_id: str
+    grocery_id: str
+    item_ids: list[str]
+    meal_start: date
+    meal_end: date
+    recipes: list[dict] = field(default_factory=list)  # sample of meal recipe entries
+    searches: list[str] = field(default_factory=list)
+    tags: list[str] = field(default_factory=list)
+    ingredients: list[str] = field(default_factory=list)
+    usernames: list[str] = field(default_factory=list)  # every user, for load tests
+
+
+def _grocery_list(rng: random.Random, user_id: str, size: int, created: date) -> dict:
+    """Grocery list of size items, larger than the generated weekly ones"""
+    items = [
+        {
+            "id": f"item-{i}",
+            "name": f"{name} {i}",
+            "qty": float(rng.randint(1, 1000)),
+            "unit": unit,
+            "entries": [],
+            "bought": rng.random() < 0.3,
+        }
+        for i, (name, unit, _) in enumerate(rng.choices(INGREDIENTS, k=size))
+    ]
+    return {
+        # beyond the ids of the generated lists
+        "_id": object_id("grocery_list", (1 << 56) - 1),
+        "user_id": user_id,
+        "created_at": datetime.combine(created, time()),
+        "title": "Benchmark list",
+        "period_start": None,
+        "period_end": None,
+        "items": items,
+    }
+
+
+def _insert(adapter: str, name: str, document: dict) -> None:
+    """Add a document to the table or collection of a repository"""
+    repository = get_adapter_repository(name, adapter)
+    if adapter == "in_memory":
+        repository.table.insert(document)
+        return
+    with Collection(settings.mongo_uri, repository.collection) as collection:
+        collection.insert_one(document)
+
+
+def seed(
+    scale: Scale,
+    adapter: str = "in_memory",
+    seed_value: int = 0,
+    skew: float = 1.0,
+    workers: int | None = None,
+) -> Dataset:
+    """Replace the data of adapter with a dataset of scale generated from seed_value
+
+    With MongoDB, the collections of the database of `settings.mongo_uri` are dropped.
+    The benchmark user is the most active planner.
+    """
+    config = GeneratorConfig(
+        users=scale.users,
+        recipes=scale.recipes,
+        seed=seed_value,
+        skew=skew,
+        days=365 * scale.meal_years,
+        # hashing is slow on purpose: every user shares the same password hash
+        password_hash=pwd_context.hash(PASSWORD),
+    )
+    data = SyntheticData(config)
+    if adapter == "in_memory":
+        clear_tables()
+        load_in_memory(data)
+    else:
+        load_mongodb(data, settings.mongo_uri, workers)
+
+    rng = random.Random(seed_value)
+    user = data.user(0)
+    meal_end = config.start + timedelta(days=config.days - 1)
+    grocery = _grocery_list(rng, str(user["_id"]), scale.grocery_items, meal_end)
+    _insert(adapter, "grocery_list", grocery)
+    sample = {
+        power_law_index(rng, scale.recipes, skew)
+        for _ in range(min(scale.recipes, SAMPLE_SIZE))
+    }
+    recipes = [data.recipe(index) for index in sorted(sample)]
+
+    return Dataset(
+        scale=scale,
+        username=user["username"],
+        user_id=str(user["_id"]),
+        grocery_id=str(grocery["_id"]),
+        item_ids=[item["id"] for item in grocery["items"]],
+        meal_start=config.start,
+        meal_end=meal_end,
+        recipes=[{"recipe_id": str(r["_id"]), "title": r["title"]} for r in recipes],
+        searches=[
+            f"{rng.choice(ADJECTIVES).lower()} {rng.choice(DISHES).lower()}"
+            for _ in range(20)
+        ],
+        tags=TAGS,
+        ingredients=[name for name, _, _ in INGREDIENTS],
+        usernames=[data.user(index)["username"] for index in range(scale.users)],
+    )
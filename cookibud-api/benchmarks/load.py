@@ -0,0 +1,261 @@
+"""Load tests of the application: concurrent virtual users running scripted journeys
+
+Each virtual user repeats the journey of a user of the application: login, browse
+recipes with a search, plan a week of meals, generate the grocery list of the week
+and tick its items off. Concurrency ramps up through stages, each reporting its
+throughput and the latency percentiles and error rate of every route.
+"""
+
+import asyncio
+import random
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+import httpx
+
+from benchmarks.cases import PAGE_SIZE
+from benchmarks.datasets import Dataset
+from benchmarks.synthetic import PASSWORD
+from drivers.main import app
+
+# Days planned by a journey
+PLANNED_DAYS = 7
+# Items of the generated grocery list ticked off one by one
+TICKED_ITEMS = 5
+PERCENTILES = {"p50": 0.5, "p95": 0.95, "p99": 0.99}
+# Latency of a request beyond which it fails (seconds)
+REQUEST_TIMEOUT = 30.0
+
+
+@dataclass(frozen=True)
+class Stage:
+    """Number of virtual users kept running for duration seconds"""
+
+    users: int
+    duration: float
+
+    @classmethod
+    def parse(cls, text: str) -> "Stage":
+        """Stage written as `users:seconds`, e.g. `50:30`"""
+        users, _, duration = text.partition(":")
+        try:
+            stage = cls(int(users), float(duration))
+        except ValueError as e:
+            raise ValueError(f"invalid stage {text!r}, expected users:seconds") from e
+        if stage.users < 1 or stage.duration <= 0:
+            raise ValueError(
+                f"invalid stage {text!r}, users and seconds must be positive"
+            )
+        return stage
+
+
+def percentile(ordered: list[float], fraction: float) -> float:
+    """Value below which fraction of the sorted values fall (nearest rank)"""
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+@dataclass
+class LoadStats:
+    """Latencies and errors of the requests of a stage, by route"""
+
+    durations: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: dict[str, Counter] = field(default_factory=lambda: defaultdict(Counter))
+    journeys: int = 0
+
+    def record(self, route: str, duration: float, error: str | None = None) -> None:
+        """Add a request of route, and the status or exception it failed with"""
+        self.durations[route].append(duration)
+        if error is not None:
+            self.errors[route][error] += 1
+
+    def summary(self, elapsed: float) -> dict:
+        """Throughput, latency percentiles and error rates over elapsed seconds"""
+        routes = {}
+        for route, durations in sorted(self.durations.items()):
+            ordered = sorted(durations)
+            errors = sum(self.errors[route].values())
+            routes[route] = {
+                "requests": len(ordered),
+                "throughput": len(ordered) / elapsed,
+                **{name: percentile(ordered, q) for name, q in PERCENTILES.items()},
+                "max": ordered[-1],
+                "errors": errors,
+                "error_rate": errors / len(ordered),
+                "error_kinds": dict(self.errors[route]),
+            }
+        requests = sum(route["requests"] for route in routes.values())
+        errors = sum(route["errors"] for route in routes.values())
+        return {
+            "elapsed": elapsed,
+            "journeys": self.journeys,
+            "requests": requests,
+            "throughput": requests / elapsed if elapsed else 0.0,
+            "errors": errors,
+            "error_rate": errors / requests if requests else 0.0,
+            "routes": routes,
+        }
+
+
+class JourneyAborted(Exception):
+    """A request of the journey failed, or the stage ended"""
+
+
+class VirtualUser:
+    """User of the application running journeys until the end of a stage"""
+
+    def __init__(
+        self, client: httpx.AsyncClient, dataset: Dataset, index: int, stats: LoadStats
+    ):
+        self.client = client
+        self.dataset = dataset
+        self.username = dataset.usernames[index % len(dataset.usernames)]
+        self.rng = random.Random(f"{index}:{self.username}")
+        self.stats = stats
+        self.think_time = 0.0
+        self.headers: dict[str, str] = {}
+        self.deadline = 0.0
+
+    async def run(self, deadline: float, think_time: float = 0.0) -> None:
+        """Repeat the journey until deadline (time.monotonic)
+
+        think_time: mean of the exponentially distributed pauses before each request
+        """
+        self.deadline, self.think_time = deadline, think_time
+        while time.monotonic() < deadline:
+            try:
+                await self.journey()
+            except JourneyAborted:
+                continue
+            self.stats.journeys += 1
+
+    async def request(
+        self, route: str, method: str, url: str, **kwargs
+    ) -> httpx.Response:
+        """Send a request and record its latency under route (its path template)
+
+        Raises JourneyAborted when it fails: like a real user, the journey stops there.
+        """
+        if time.monotonic() >= self.deadline:
+            raise JourneyAborted("stage ended")
+        if self.think_time:
+            await asyncio.sleep(self.rng.expovariate(1 / self.think_time))
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(
+                method, url, headers=self.headers, **kwargs
+            )
+        except httpx.HTTPError as e:
+            self.stats.record(route, time.perf_counter() - start, type(e).__name__)
+            raise JourneyAborted(route) from e
+        duration = time.perf_counter() - start
+        if response.is_error:
+            self.stats.record(route, duration, str(response.status_code))
+            raise JourneyAborted(route)
+        self.stats.record(route, duration)
+        return response
+
+    async def journey(self) -> None:
+        """Login, browse recipes, plan a week, generate its grocery list, tick items"""
+        await self.login()
+        await self.browse()
+        start = await self.plan_week()
+        grocery = await self.generate(start)
+        await self.tick(grocery)
+
+    async def login(self) -> None:
+        """Get a token for the next requests"""
+        self.headers = {}
+        credentials = {"username": self.username, "password": PASSWORD}
+        response = await self.request("POST /token", "POST", "/token", data=credentials)
+        self.headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    async def browse(self) -> None:
+        """Search recipes, read the next page, the tags and one of the recipes"""
+        params = {"search": self.rng.choice(self.dataset.searches), "limit": PAGE_SIZE}
+        page = (
+            await self.request("GET /recipes", "GET", "/recipes", params=params)
+        ).json()
+        if page["next_cursor"]:
+            params = {**params, "cursor": page["next_cursor"]}
+            page = (
+                await self.request("GET /recipes", "GET", "/recipes", params=params)
+            ).json()
+        await self.request("GET /recipes/tags", "GET", "/recipes/tags")
+        if page["items"]:
+            recipe_id = self.rng.choice(page["items"])["id"]
+            await self.request("GET /recipes/{item_id}", "GET", f"/recipes/{recipe_id}")
+
+    async def plan_week(self) -> date:
+        """Plan one recipe a day over a week of the meal period, its first day"""
+        weeks = max(1, (self.dataset.meal_end - self.dataset.meal_start).days // 7)
+        start = self.dataset.meal_start + timedelta(days=7 * self.rng.randrange(weeks))
+        for offset in range(PLANNED_DAYS):
+            body = {
+                "date": (start + timedelta(days=offset)).isoformat(),
+                "entry": {**self.rng.choice(self.dataset.recipes), "servings": 2},
+            }
+            await self.request("POST /meals/plan", "POST", "/meals/plan", json=body)
+        return start
+
+    async def generate(self, start: date) -> dict:
+        """Generate the grocery list of the planned week"""
+        end = start + timedelta(days=PLANNED_DAYS - 1)
+        params = {"start": start.isoformat(), "end": end.isoformat()}
+        route = "POST /groceries/generate"
+        return (
+            await self.request(route, "POST", "/groceries/generate", params=params)
+        ).json()
+
+    async def tick(self, grocery: dict) -> None:
+        """Tick items of the grocery list off one by one, as they are bought"""
+        route = "PATCH /groceries/{grocery_id}/items/{item_id}"
+        for item in grocery["items"][:TICKED_ITEMS]:
+            url = f"/groceries/{grocery['id']}/items/{item['id']}"
+            await self.request(route, "PATCH", url, params={"bought": "true"})
+
+
+async def run_stage(
+    client: httpx.AsyncClient, dataset: Dataset, stage: Stage, think_time: float = 0.0
+) -> dict:
+    """Summary of stage.users virtual users running journeys for stage.duration"""
+    stats = LoadStats()
+    users = [VirtualUser(client, dataset, index, stats) for index in range(stage.users)]
+    deadline = time.monotonic() + stage.duration
+    started = time.perf_counter()
+    await asyncio.gather(*(user.run(deadline, think_time) for user in users))
+    return {"users": stage.users, **stats.summary(time.perf_counter() - started)}
+
+
+async def ramp(
+    client: httpx.AsyncClient,
+    dataset: Dataset,
+    stages: list[Stage],
+    think_time: float = 0.0,
+    report=print,
+) -> list[dict]:
+    """Summaries of the stages, run one after the other"""
+    summaries = []
+    for stage in stages:
+        summary = await run_stage(client, dataset, stage, think_time)
+        report(summary)
+        summaries.append(summary)
+    return summaries
+
+
+def load_client(base_url: str | None = None, max_connections: int | None = None):
+    """Client of a running server at base_url, or of the application in-process"""
+    if base_url is None:
+        return httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://load-test",
+            timeout=REQUEST_TIMEOUT,
+        )
+    return httpx.AsyncClient(
+        base_url=base_url,
+        timeout=REQUEST_TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=max_connections, max_keepalive_connections=None
+        ),
+    )
@@ -0,0 +1,162 @@
+"""Output of synthetic datasets: NDJSON files, in-memory tables or MongoDB collections
+
+MongoDB is bulk-loaded by worker processes, each generating chunks of documents and
+inserting them with unordered `insert_many` batches. Collections are dropped first
+and their indexes are built once the documents are loaded, which is faster than
+maintaining them during the load.
+"""
+
+import multiprocessing
+import os
+from collections import Counter
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from bson import json_util
+
+from adapters.mongodb.db import Collection
+from adapters.mongodb.indexes import ensure_indexes, mongo_repositories
+from benchmarks.synthetic import GeneratorConfig, SyntheticData
+from drivers.config import settings
+from drivers.dependencies import get_adapter_repository
+
+# Repositories of the generated documents
+REPOSITORIES = ("user", "recipe", "review", "meal", "grocery_list", "catalog")
+# Chunked kinds of documents, the catalogs are built from the recipes once loaded
+KINDS = ("user", "recipe", "meal")
+# Documents sent to MongoDB per insert_many
+BATCH_SIZE = 1_000
+
+# Generator of the worker process, built once per configuration
+_data: dict[GeneratorConfig, SyntheticData] = {}
+
+
+def collection_names(adapter: str = "mongodb") -> dict[str, str]:
+    """Collection of each repository of the generated documents"""
+    return {
+        name: get_adapter_repository(name, adapter).collection for name in REPOSITORIES
+    }
+
+
+def _chunks(data: SyntheticData) -> Iterator[tuple[dict[str, list[dict]], Counter]]:
+    for kind in KINDS:
+        for index in data.chunks(kind):
+            yield data.chunk(kind, index)
+
+
+def _load(data: SyntheticData, insert: Callable[[str, list[dict]], None]) -> Counter:
+    """Generate every document in order and pass them to insert, by repository name"""
+    counts, names = Counter(), Counter()
+    for documents, chunk_names in _chunks(data):
+        names.update(chunk_names)
+        for name, chunk in documents.items():
+            insert(name, chunk)
+            counts[name] += len(chunk)
+    catalogs = data.catalogs(names)
+    insert("catalog", catalogs)
+    counts["catalog"] += len(catalogs)
+    return counts
+
+
+def write_ndjson(data: SyntheticData, directory: str) -> Counter:
+    """Write one `<collection>.ndjson` file of extended JSON per collection
+
+    The files can be loaded with `mongoimport --file <collection>.ndjson`.
+    """
+    os.makedirs(directory, exist_ok=True)
+    collections = collection_names()
+    files = {
+        name: open(  # pylint: disable=consider-using-with
+            os.path.join(directory, f"{collection}.ndjson"), "w", encoding="utf-8"
+        )
+        for name, collection in collections.items()
+    }
+
+    def insert(name: str, documents: list[dict]) -> None:
+        files[name].writelines(
+            json_util.dumps(document, json_options=json_util.RELAXED_JSON_OPTIONS)
+            + "\n"
+            for document in documents
+        )
+
+    try:
+        return _load(data, insert)
+    finally:
+        for file in files.values():
+            file.close()
+
+
+def load_in_memory(data: SyntheticData) -> Counter:
+    """Add the documents to the tables of the in-memory adapter"""
+    tables = {
+        name: get_adapter_repository(name, "in_memory").table for name in REPOSITORIES
+    }
+    return _load(data, lambda name, documents: tables[name].insert_many(documents))
+
+
+def _insert_many(
+    uri: str, collection: str, documents: list[dict], batch_size: int
+) -> None:
+    with Collection(uri, collection) as target:
+        for start in range(0, len(documents), batch_size):
+            target.insert_many(documents[start : start + batch_size], ordered=False)
+
+
+def _load_chunk(
+    config: GeneratorConfig,
+    uri: str,
+    collections: dict[str, str],
+    chunk: tuple[str, int],
+    batch_size: int,
+) -> tuple[Counter, Counter]:
+    """Generate and insert a chunk (in a worker process), counts and catalog names"""
+    data = _data.get(config)
+    if data is None:
+        data = _data[config] = SyntheticData(config)
+    documents, names = data.chunk(*chunk)
+    counts = Counter()
+    for name, chunk_documents in documents.items():
+        if chunk_documents:
+            _insert_many(uri, collections[name], chunk_documents, batch_size)
+        counts[name] += len(chunk_documents)
+    return counts, names
+
+
+def load_mongodb(
+    data: SyntheticData,
+    uri: str,
+    workers: int | None = None,
+    batch_size: int = BATCH_SIZE,
+    progress: Callable[[Counter], None] | None = None,
+) -> Counter:
+    """Replace the generated collections of the database of uri with the dataset
+
+    workers: processes generating and inserting chunks (default: one per CPU)
+    progress: called with the documents inserted so far after each chunk
+    """
+    collections = collection_names()
+    for collection in collections.values():
+        with Collection(uri, collection) as target:
+            target.drop()
+
+    chunks = [(kind, index) for kind in KINDS for index in data.chunks(kind)]
+    counts, names = Counter(), Counter()
+    # spawned workers open their own connection pools, which must not be forked
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(workers or os.cpu_count(), mp_context=context) as pool:
+        futures = [
+            pool.submit(_load_chunk, data.config, uri, collections, chunk, batch_size)
+            for chunk in chunks
+        ]
+        for future in as_completed(futures):
+            for total, chunk_total in zip((counts, names), future.result()):
+                total.update(chunk_total)
+            if progress is not None:
+                progress(counts)
+
+    catalogs = data.catalogs(names)
+    if catalogs:
+        _insert_many(uri, collections["catalog"], catalogs, batch_size)
+    counts["catalog"] += len(catalogs)
+    ensure_indexes(mongo_repositories(uri, settings.recipe_search_language))
+    return counts
@@ -0,0 +1,158 @@
+"""Timing of benchmarks and comparison of their results with a baseline"""
+
+import asyncio
+import inspect
+import json
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+# Version of the layout of results files
+RESULTS_VERSION = 1
+# Statistic compared between runs: the median resists outliers (GC, noisy neighbours)
+COMPARED_STATISTIC = "median"
+
+
+@dataclass
+class Benchmark:
+    """Operation timed on each iteration, a function or a coroutine function"""
+
+    name: str
+    function: Callable
+    iterations: int = 50
+    warmup: int = 3
+
+    @property
+    def is_async(self) -> bool:
+        """Whether function is a coroutine function, timed in the event loop"""
+        return inspect.iscoroutinefunction(self.function)
+
+
+def summarize(durations: list[float]) -> dict:
+    """Statistics, in seconds, of the durations of the iterations of a benchmark"""
+    ordered = sorted(durations)
+    mean = statistics.fmean(ordered)
+    return {
+        "iterations": len(ordered),
+        "min": ordered[0],
+        "median": statistics.median(ordered),
+        "mean": mean,
+        "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        "max": ordered[-1],
+        "stdev": statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+        "ops_per_second": 1 / mean if mean else None,
+    }
+
+
+def measure(benchmark: Benchmark, iterations: int | None = None) -> dict:
+    """Run a sync benchmark and summarize the durations of its iterations"""
+    for _ in range(benchmark.warmup):
+        benchmark.function()
+    durations = []
+    for _ in range(iterations or benchmark.iterations):
+        start = time.perf_counter()
+        benchmark.function()
+        durations.append(time.perf_counter() - start)
+    return summarize(durations)
+
+
+async def measure_async(benchmark: Benchmark, iterations: int | None = None) -> dict:
+    """Run an asyncio benchmark and summarize the durations of its iterations"""
+    for _ in range(benchmark.warmup):
+        await benchmark.function()
+    durations = []
+    for _ in range(iterations or benchmark.iterations):
+        start = time.perf_counter()
+        await benchmark.function()
+        durations.append(time.perf_counter() - start)
+    return summarize(durations)
+
+
+def run(
+    benchmarks: list[Benchmark],
+    iterations: int | None = None,
+    report: Callable = print,
+    teardown: Callable | None = None,
+) -> dict[str, dict]:
+    """Statistics of every benchmark, by name
+
+    Asyncio benchmarks share one event loop, like the requests of the application,
+    and teardown (a coroutine function) runs in it once they are done.
+    """
+    results = {}
+
+    def done(name: str, statistics_: dict) -> None:
+        results[name] = statistics_
+        report(f"{name:<40} {statistics_['median'] * 1000:>10.3f} ms (median)")
+
+    for benchmark in benchmarks:
+        if not benchmark.is_async:
+            done(benchmark.name, measure(benchmark, iterations))
+
+    async def run_async():
+        for benchmark in benchmarks:
+            if benchmark.is_async:
+                done(benchmark.name, await measure_async(benchmark, iterations))
+        if teardown is not None:
+            await teardown()
+
+    asyncio.run(run_async())
+    return results
+
+
+def write_results(path: str, metadata: dict, results: dict[str, dict]) -> None:
+    """Save results with the metadata of the run (scale, adapter, platform...)"""
+    document = {"version": RESULTS_VERSION, "metadata": metadata, "benchmarks": results}
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(document, file, indent=2, sort_keys=True)
+
+
+def read_results(path: str) -> dict:
+    """Load results saved by write_results"""
+    with open(path, encoding="utf-8") as file:
+        document = json.load(file)
+    if document.get("version") != RESULTS_VERSION:
+        raise ValueError(
+            f"{path}: unsupported results version {document.get('version')}"
+        )
+    return document
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.1) -> list[dict]:
+    """Change of each benchmark between two results documents
+
+    A benchmark regressed when its median grew by more than threshold (0.1: 10%), and
+    improved when it shrank by as much. Benchmarks found in one document only are
+    reported as new or missing.
+    """
+    before, after = baseline["benchmarks"], current["benchmarks"]
+    rows = []
+    for name in sorted(before.keys() | after.keys()):
+        row = {"name": name, "baseline": None, "current": None, "ratio": None}
+        if name not in after:
+            rows.append(
+                {
+                    **row,
+                    "baseline": before[name][COMPARED_STATISTIC],
+                    "status": "missing",
+                }
+            )
+            continue
+        if name not in before:
+            rows.append(
+                {**row, "current": after[name][COMPARED_STATISTIC], "status": "new"}
+            )
+            continue
+        old, new = before[name][COMPARED_STATISTIC], after[name][COMPARED_STATISTIC]
+        ratio = new / old if old else float("inf")
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 - threshold:
+            status = "improvement"
+        else:
+            status = "unchanged"
+        rows.append(
+            {**row, "baseline": old, "current": new, "ratio": ratio, "status": status}
+        )
+    return rows
@@ -0,0 +1,535 @@
+"""Deterministic synthetic data shaped like the documents of the repositories
+
+Every document is generated from the seed and its own index, with its own random
+generator: any chunk of any collection can be generated alone, in any process and in
+any order, and ids (ObjectIds built from the collection and the index) always refer
+to the same documents. Popularity follows a power law of exponent `skew` (0: uniform):
+a few prolific authors, active planners and popular recipes (planned and reviewed
+often), and ingredients and tags ranked by how common they are.
+
+Documents have the fields the entities dump to (`entities/*`), as stored by the
+repositories: `_id` instead of `id`, dates as midnight datetimes.
+"""
+
+import random
+import struct
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+
+from bson import ObjectId
+
+from adapters.mongodb.recipe_repository import LATEST_REVIEWS
+
+# Most common first: popularity ranks follow the order of the vocabularies
+INGREDIENTS = [
+    ("salt", "g", 5),
+    ("olive oil", "ml", 30),
+    ("onion", "", 1),
+    ("garlic", "", 2),
+    ("butter", "g", 50),
+    ("egg", "", 2),
+    ("flour", "g", 200),
+    ("sugar", "g", 100),
+    ("black pepper", "g", 2),
+    ("milk", "ml", 250),
+    ("tomato", "", 3),
+    ("lemon", "", 1),
+    ("carrot", "", 2),
+    ("potato", "g", 500),
+    ("rice", "g", 300),
+    ("pasta", "g", 400),
+    ("chicken breast", "g", 400),
+    ("parmesan", "g", 50),
+    ("cream", "ml", 200),
+    ("bell pepper", "", 2),
+    ("ground beef", "g", 500),
+    ("basil", "g", 10),
+    ("mushroom", "g", 250),
+    ("spinach", "g", 200),
+    ("honey", "g", 30),
+    ("ginger", "g", 15),
+    ("cumin", "g", 5),
+    ("paprika", "g", 5),
+    ("zucchini", "", 2),
+    ("chickpeas", "g", 400),
+    ("lentils", "g", 250),
+    ("coconut milk", "ml", 400),
+    ("yogurt", "g", 150),
+    ("mozzarella", "g", 125),
+    ("salmon", "g", 300),
+    ("cilantro", "g", 10),
+    ("bread", "g", 250),
+    ("chocolate", "g", 100),
+    ("tofu", "g", 300),
+    ("apple", "", 3),
+    ("shrimp", "g", 250),
+    ("vanilla", "ml", 5),
+    ("soy sauce", "ml", 30),
+    ("leek", "", 1),
+    ("almonds", "g", 50),
+    ("feta", "g", 100),
+    ("eggplant", "", 1),
+    ("oats", "g", 100),
+    ("cinnamon", "g", 3),
+    ("maple syrup", "ml", 30),
+    ("lime", "", 1),
+    ("pork belly", "g", 500),
+    ("quinoa", "g", 200),
+    ("avocado", "", 2),
+    ("pumpkin", "g", 800),
+    ("saffron", "g", 1),
+    ("miso", "g", 30),
+]
+TAGS = [
+    "quick",
+    "vegetarian",
+    "dessert",
+    "healthy",
+    "comfort",
+    "italian",
+    "breakfast",
+    "soup",
+    "salad",
+    "vegan",
+    "baking",
+    "spicy",
+    "kids",
+    "one-pot",
+    "budget",
+    "french",
+    "summer",
+    "winter",
+    "party",
+    "gluten-free",
+    "indian",
+    "mexican",
+    "grill",
+    "brunch",
+    "snack",
+    "seafood",
+    "japanese",
+    "thai",
+    "holiday",
+    "low-carb",
+]
+ADJECTIVES = [
+    "Smoky",
+    "Creamy",
+    "Crispy",
+    "Spicy",
+    "Lemony",
+    "Rustic",
+    "Quick",
+    "Roasted",
+    "Grilled",
+    "Golden",
+    "Herby",
+    "Sweet",
+    "Tangy",
+    "Hearty",
+    "Fresh",
+    "Garlicky",
+]
+DISHES = [
+    "Soup",
+    "Salad",
+    "Curry",
+    "Stew",
+    "Pie",
+    "Tart",
+    "Risotto",
+    "Pasta",
+    "Bowl",
+    "Tacos",
+    "Gratin",
+    "Omelette",
+    "Pancakes",
+    "Cake",
+    "Stir-fry",
+    "Burger",
+    "Bake",
+]
+CHILD_DISHES = ["Sauce", "Dough", "Dressing", "Marinade", "Topping", "Stock"]
+COMMENTS = [
+    None,
+    None,
+    "Delicious!",
+    "Too salty for me.",
+    "My kids loved it.",
+    "Easy and quick.",
+    "I added more garlic.",
+    "Will cook it again.",
+    "A bit bland.",
+]
+# Ratings from 1 to 5: reviews lean positive
+RATING_WEIGHTS = [5, 7, 15, 33, 40]
+
+# Password of every generated user
+PASSWORD = "synthetic"
+# Documents generated per chunk: the unit of work of parallel loaders
+CHUNK_SIZES = {"user": 10_000, "recipe": 1_000, "meal": 100}
+
+# Popularity rank of each ingredient
+_RANKS = {name: rank for rank, (name, _, _) in enumerate(INGREDIENTS)}
+# Collection codes in generated ObjectIds
+_KINDS = {
+    "user": 1,
+    "recipe": 2,
+    "review": 3,
+    "meal": 4,
+    "grocery_list": 5,
+    "catalog": 6,
+}
+# Bits of the index of a document within its parent (reviews of a recipe, meals of a user)
+_CHILD_BITS = 20
+
+
+@dataclass(frozen=True)
+class GeneratorConfig:
+    """Size, skew and seed of a synthetic dataset"""
+
+    users: int = 1_000
+    recipes: int = 10_000
+    seed: int = 0
+    skew: float = 1.0  # power-law exponent of popularity, 0 for uniform
+    start: date = date(2025, 1, 1)  # first day of the planned meals
+    days: int = 365  # days of planned meals
+    reviews_per_recipe: float = 2.0  # on average
+    plan_rate: float = 0.1  # fraction of days a user plans a meal, on average
+    children_rate: float = 0.1  # fraction of recipes with sub-recipes
+    password_hash: str = ""  # hash of PASSWORD stored for every user
+
+
+def object_id(kind: str, index: int, timestamp: int = 0) -> ObjectId:
+    """Deterministic ObjectId of the document of a collection at index"""
+    return ObjectId(
+        struct.pack(">IB", timestamp, _KINDS[kind]) + index.to_bytes(7, "big")
+    )
+
+
+def power_law_index(rng: random.Random, count: int, skew: float) -> int:
+    """Index in [0, count) drawn with a probability decreasing like (index + 1) ** -skew
+
+    Inverse transform of the continuous power law, an approximation of Zipf's law.
+    """
+    if count <= 1:
+        return 0
+    u = rng.random()
+    if skew == 0:
+        return int(u * count)
+    if skew == 1:
+        x = (count + 1) ** u
+    else:
+        exponent = 1 - skew
+        x = (1 + u * ((count + 1) ** exponent - 1)) ** (1 / exponent)
+    return min(count - 1, int(x) - 1)
+
+
+def _distinct(rng: random.Random, values: list, count: int, skew: float) -> list:
+    """count distinct values drawn with power-law popularity"""
+    count = min(count, len(values))
+    chosen: dict[int, None] = {}
+    while len(chosen) < count:
+        chosen[power_law_index(rng, len(values), skew)] = None
+    return [values[i] for i in chosen]
+
+
+def _quantity(rng: random.Random, unit: str, typical: float) -> float:
+    """Quantity around the typical one: whole pieces, rounded grams and milliliters"""
+    if not unit:
+        return float(max(1, round(typical * rng.uniform(0.5, 2))))
+    return float(max(1, round(typical * rng.uniform(0.5, 2) / 5) * 5))
+
+
+def _recipe_fields(title: str, ingredients: list[dict], author_id: str) -> dict:
+    """Fields of a recipe document besides its id, as dumped by the Recipe entity"""
+    return {
+        "title": title,
+        "description": f"A {title.lower()} with {', '.join(i['name'] for i in ingredients)}.",
+        "ingredients": ingredients,
+        "prep_time": None,
+        "cook_time": None,
+        "author_id": author_id,
+        "children": [],
+        "tags": [],
+        "image_url": None,
+        "reviews": [],
+        "rating_count": 0,
+        "rating_sum": 0,
+        "rating_avg": None,
+    }
+
+
+def _week_start(day: date) -> date:
+    return day - timedelta(days=day.weekday())
+
+
+class SyntheticData:
+    """Documents of a synthetic dataset, by repository name and chunk"""
+
+    def __init__(self, config: GeneratorConfig):
+        self.config = config
+        self.timestamp = int(
+            datetime.combine(config.start, time(), timezone.utc).timestamp()
+        )
+        # normalization of the power law, for expected counts per recipe and per user
+        self._recipe_norm = sum((i + 1) ** -config.skew for i in range(config.recipes))
+        self._user_norm = sum((i + 1) ** -config.skew for i in range(config.users))
+        self.recipe = lru_cache(maxsize=4096)(self._recipe)
+
+    def _rng(self, kind: str, index: int) -> random.Random:
+        """Generator of the document of a collection at index"""
+        return random.Random((self.config.seed << 64) | (_KINDS[kind] << 56) | index)
+
+    def _id(self, kind: str, index: int) -> ObjectId:
+        return object_id(kind, index, self.timestamp)
+
+    def chunks(self, kind: str) -> range:
+        """Chunks of a kind of documents: users, recipes (and reviews), meals (and lists)"""
+        total = self.config.users if kind in ("user", "meal") else self.config.recipes
+        return range((total + CHUNK_SIZES[kind] - 1) // CHUNK_SIZES[kind])
+
+    def chunk(self, kind: str, index: int) -> tuple[dict[str, list[dict]], Counter]:
+        """Documents of a chunk by repository name, and the catalog names they use"""
+        size = CHUNK_SIZES[kind]
+        total = self.config.users if kind in ("user", "meal") else self.config.recipes
+        indexes = range(index * size, min(total, (index + 1) * size))
+        if kind == "user":
+            return {"user": [self.user(i) for i in indexes]}, Counter()
+        if kind == "meal":
+            meals, lists = [], []
+            for i in indexes:
+                user_meals = self.meals(i)
+                meals.extend(user_meals)
+                lists.extend(self.grocery_lists(i, user_meals))
+            return {"meal": meals, "grocery_list": lists}, Counter()
+        return self._recipe_chunk(indexes)
+
+    def _recipe_chunk(self, indexes: range) -> tuple[dict[str, list[dict]], Counter]:
+        recipes, reviews, names = [], [], Counter()
+        for i in indexes:
+            recipe, recipe_reviews = self.reviewed_recipe(i)
+            recipes.append(recipe)
+            reviews.extend(recipe_reviews)
+            names.update(("tag", tag) for tag in recipe["tags"])
+            ingredients = {ingredient["name"] for ingredient in recipe["ingredients"]}
+            names.update(("ingredient", name) for name in ingredients)
+        return {"recipe": recipes, "review": reviews}, names
+
+    def catalogs(self, names: Counter) -> list[dict]:
+        """Catalog entries counting the recipes using each tag and ingredient name"""
+        return [
+            {
+                "_id": self._id("catalog", i),
+                "kind": kind,
+                "name": name,
+                "count": names[kind, name],
+            }
+            for i, (kind, name) in enumerate(sorted(names))
+        ]
+
+    def user(self, index: int) -> dict:
+        """User document"""
+        return {
+            "_id": self._id("user", index),
+            "username": f"user{index}",
+            "password": self.config.password_hash,
+        }
+
+    def _author(self, rng: random.Random) -> str:
+        return str(
+            self._id("user", power_law_index(rng, self.config.users, self.config.skew))
+        )
+
+    def _ingredients(self, rng: random.Random, count: int) -> list[dict]:
+        return [
+            {"name": name, "quantity": _quantity(rng, unit, typical), "unit": unit}
+            for name, unit, typical in _distinct(
+                rng, INGREDIENTS, count, self.config.skew
+            )
+        ]
+
+    def _recipe(self, index: int) -> dict:
+        """Recipe document without its reviews (cached: popular recipes are planned often)"""
+        rng = self._rng("recipe", index)
+        ingredients = self._ingredients(
+            rng, min(12, max(2, round(rng.triangular(2, 14, 7))))
+        )
+        # named after its least common ingredient, the others are pantry staples
+        main = max(ingredients, key=lambda ingredient: _RANKS[ingredient["name"]])[
+            "name"
+        ]
+        title = f"{rng.choice(ADJECTIVES)} {main.title()} {rng.choice(DISHES)}"
+        author_id = self._author(rng)
+        recipe = {
+            "_id": self._id("recipe", index),
+            **_recipe_fields(title, ingredients, author_id),
+            "title_lower": title.lower(),
+        }
+        recipe["prep_time"] = rng.randint(5, 60)
+        recipe["cook_time"] = rng.choice([0, 10, 20, 30, 45, 60, 90, 120])
+        recipe["tags"] = _distinct(rng, TAGS, rng.randint(1, 4), self.config.skew)
+        if rng.random() < 0.3:
+            recipe["image_url"] = f"/static/uploads/recipe-{index}.jpg"
+        if rng.random() < self.config.children_rate:
+            recipe["children"] = [
+                {
+                    "id": None,
+                    **_recipe_fields(
+                        f"{title} {rng.choice(CHILD_DISHES)}",
+                        self._ingredients(rng, rng.randint(2, 5)),
+                        author_id,
+                    ),
+                }
+                for _ in range(rng.randint(1, 2))
+            ]
+        return recipe
+
+    def _review_count(self, rng: random.Random, index: int) -> int:
+        """Reviews of a recipe, proportional to its popularity on average"""
+        config = self.config
+        expected = (
+            config.reviews_per_recipe * config.recipes * (index + 1) ** -config.skew
+        )
+        expected /= self._recipe_norm
+        count = int(expected) + (rng.random() < expected % 1)
+        return min(count, (1 << _CHILD_BITS) - 1)
+
+    def reviewed_recipe(self, index: int) -> tuple[dict, list[dict]]:
+        """Recipe document with its latest reviews and rating aggregates, and its reviews"""
+        recipe = dict(self.recipe(index))
+        rng = self._rng("review", index)
+        reviews = []
+        for i in range(self._review_count(rng, index)):
+            user = power_law_index(rng, self.config.users, self.config.skew)
+            created = datetime.combine(
+                self.config.start, time(), timezone.utc
+            ) + timedelta(seconds=rng.randrange(self.config.days * 86_400))
+            reviews.append(
+                {
+                    "_id": self._id("review", (index << _CHILD_BITS) | i),
+                    "recipe_id": str(recipe["_id"]),
+                    "user_id": str(self._id("user", user)),
+                    "username": f"user{user}",
+                    "rating": rng.choices(range(1, 6), RATING_WEIGHTS)[0],
+                    "comment": rng.choice(COMMENTS),
+                    "created_at": created.isoformat(),
+                }
+            )
+        reviews.sort(key=lambda review: review["created_at"])
+        if reviews:
+            rating_sum = sum(review["rating"] for review in reviews)
+            recipe["reviews"] = [
+                {
+                    "id": str(review["_id"]),
+                    **{k: v for k, v in review.items() if k != "_id"},
+                }
+                for review in reviews[-LATEST_REVIEWS:]
+            ]
+            recipe["rating_count"] = len(reviews)
+            recipe["rating_sum"] = rating_sum
+            recipe["rating_avg"] = rating_sum / len(reviews)
+        return recipe, reviews
+
+    def _plan_rate(self, user: int) -> float:
+        """Fraction of the days a user plans a meal, proportional to their activity"""
+        config = self.config
+        rate = (
+            config.plan_rate
+            * config.users
+            * (user + 1) ** -config.skew
+            / self._user_norm
+        )
+        return min(0.95, rate)
+
+    def meals(self, user: int) -> list[dict]:
+        """Meal documents of a user: 1 to 3 popular recipes on the days they plan"""
+        rng = self._rng("meal", user)
+        rate = self._plan_rate(user)
+        meals = []
+        for day in range(self.config.days):
+            if rng.random() >= rate:
+                continue
+            items = []
+            for _ in range(rng.randint(1, 3)):
+                recipe = self.recipe(
+                    power_law_index(rng, self.config.recipes, self.config.skew)
+                )
+                items.append(
+                    {
+                        "recipe_id": str(recipe["_id"]),
+                        "title": recipe["title"],
+                        "servings": rng.randint(1, 6),
+                    }
+                )
+            meals.append(
+                {
+                    "_id": self._id("meal", (user << _CHILD_BITS) | day),
+                    "date": datetime.combine(
+                        self.config.start + timedelta(days=day), time()
+                    ),
+                    "items": items,
+                    "user_id": str(self._id("user", user)),
+                }
+            )
+        return meals
+
+    def grocery_lists(self, user: int, meals: list[dict]) -> list[dict]:
+        """Grocery lists of half the weeks a user planned meals for, merging ingredients"""
+        rng = self._rng("grocery_list", user)
+        weeks: dict[date, list[dict]] = {}
+        for meal in meals:
+            weeks.setdefault(_week_start(meal["date"].date()), []).append(meal)
+        lists = []
+        for number, (start, week_meals) in enumerate(sorted(weeks.items())):
+            if rng.random() < 0.5:
+                continue
+            end = start + timedelta(days=6)
+            lists.append(
+                {
+                    "_id": self._id("grocery_list", (user << _CHILD_BITS) | number),
+                    "user_id": str(self._id("user", user)),
+                    "created_at": datetime.combine(start, time()),
+                    "title": f"Grocery {start} — {end}",
+                    "period_start": start.isoformat(),
+                    "period_end": end.isoformat(),
+                    "items": self._grocery_items(rng, week_meals),
+                }
+            )
+        return lists
+
+    def _grocery_items(self, rng: random.Random, meals: list[dict]) -> list[dict]:
+        """Ingredients of the planned recipes scaled by servings, merged by name and unit"""
+        merged: dict[tuple[str, str], dict] = {}
+        for meal in meals:
+            for entry in meal["items"]:
+                recipe = self.recipe(
+                    int.from_bytes(ObjectId(entry["recipe_id"]).binary[5:])
+                )
+                for ing in recipe["ingredients"]:
+                    item = merged.setdefault(
+                        (ing["name"], ing["unit"]),
+                        {
+                            "id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+                            "name": ing["name"],
+                            "qty": 0.0,
+                            "unit": ing["unit"],
+                            "entries": [],
+                            "bought": False,
+                        },
+                    )
+                    item["qty"] += ing["quantity"] * entry["servings"]
+                    item["entries"].append(
+                        f"{recipe['title']} ×{entry['servings']}: "
+                        f"{ing['quantity']:g} {ing['unit']}".strip()
+                    )
+        bought = rng.random()
+        items = sorted(
+            merged.values(), key=lambda item: (item["name"].lower(), item["unit"])
+        )
+        for item in items:
+            item["bought"] = rng.random() < bought
+        return items
@@ -1,5 +1,7 @@
 """Configuration settings for the Cookibud API."""
 
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -8,12 +10,49 @@ class Settings(BaseSettings):
 
     secret_key: str = "secret"  # Used to decode and encode JWT
     algorithm: str = "HS256"
-    adapter: str = "in_memory"
+    adapter: Literal["in_memory", "mongodb"] = (
+        "in_memory"  # repositories of the application
+    )
     mongo_uri: str = "mongodb://localhost:27017/"
+    # Connection pool of the shared MongoDB client
+    mongo_max_pool_size: int = 100
+    mongo_min_pool_size: int = 0
+    mongo_max_idle_time_ms: int | None = None  # close idle sockets after this delay
+    mongo_wait_queue_timeout_ms: int | None = None  # max wait for a free socket
+    # Stemming/stop words language of the recipe search text index
+    recipe_search_language: str = "english"
+    mongo_ensure_indexes: bool = True  # create declared indexes at startup
+    # Debug logging of requests: fraction of requests logged, JSON body bytes kept
+    log_sample_rate: float = 1.0
+    log_body_max_bytes: int = 2048
+    metrics_enabled: bool = True  # collect metrics and export them at /metrics
+    # Bearer token of the /metrics scrapers, open without one (internal ports only)
+    metrics_token: str | None = None
+    # Users allowed to profile their requests (X-Profile header), pstats files location
+    profiling_admins: list[str] = []
+    profiles_dir: str = "profiles"
+    # Per-request query accounting (Server-Timing header) and its warning thresholds,
+    # for development: it adds a context lookup and a query shape to every operation
+    query_accounting: bool = False
+    query_budget: int | None = 20
+    query_max_repeats: int | None = 5
+    # Threads running the sync routes and dependencies (anyio default: 40)
+    threadpool_size: int | None = None
     frontend_url: str = "http://localhost:5173"
     uploads_dir: str = "static/uploads"
 
     model_config = SettingsConfigDict(env_file=".env")
 
+    @property
+    def mongo_client_options(self) -> dict:
+        """Pool options forwarded to the MongoDB client"""
+        options = {
+            "maxPoolSize": self.mongo_max_pool_size,
+            "minPoolSize": self.mongo_min_pool_size,
+            "maxIdleTimeMS": self.mongo_max_idle_time_ms,
+            "waitQueueTimeoutMS": self.mongo_wait_queue_timeout_ms,
+        }
+        return {k: v for k, v in options.items() if v is not None}
+
 
 settings = Settings()
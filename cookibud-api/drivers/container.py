@@ -0,0 +1,58 @@
+"""Repositories and use cases of the application, resolved once at startup"""
+
+from collections.abc import Callable
+from typing import Any
+
+from fastapi import Request
+
+from drivers.dependencies import get_adapter_repository
+
+# Repositories of every adapter, with the names of those having an asyncio flavour
+REPOSITORIES = ("user", "recipe", "meal", "grocery_list", "catalog", "review")
+ASYNC_REPOSITORIES = ("recipe", "meal", "grocery_list", "catalog", "review")
+
+
+class Container:
+    """Repositories of an adapter and the use cases built on them
+
+    Repositories and use cases hold no request state: one instance of each is shared
+    by every request. Every repository is resolved on creation, so that a
+    misconfigured adapter fails at startup rather than on the first request.
+    """
+
+    def __init__(self, adapter: str):
+        self.adapter = adapter
+        self.repositories = {
+            (name, False): get_adapter_repository(name, adapter)
+            for name in REPOSITORIES
+        }
+        self.repositories.update(
+            {
+                (name, True): get_adapter_repository(name, adapter, is_async=True)
+                for name in ASYNC_REPOSITORIES
+            }
+        )
+        self.use_cases: dict[str, Any] = {}
+
+    def repository(self, name: str, is_async: bool = False):
+        """Repository of name, its asyncio flavour with is_async"""
+        return self.repositories[name, is_async]
+
+    def register(self, use_cases: dict[str, Any]) -> None:
+        """Add use cases by the name the routes request them with"""
+        duplicates = self.use_cases.keys() & use_cases.keys()
+        if duplicates:
+            raise ValueError(
+                f"Use cases registered twice: {', '.join(sorted(duplicates))}"
+            )
+        self.use_cases.update(use_cases)
+
+
+def use_case(name: str) -> Callable:
+    """Dependency injecting the use case registered under name in the container"""
+
+    # a coroutine function: resolving it does not go through the threadpool
+    async def dependency(request: Request):
+        return request.app.state.container.use_cases[name]
+
+    return dependency
@@ -32,32 +32,39 @@ def get_token_header(token: Annotated[str, Depends(oauth2_scheme)]) -> TokenData
         ) from exc
 
 
+# Module and class of each repository, in the package of every adapter
+REPOSITORY_CLASSES = {
+    "user": ("user_repository", "UserRepository"),
+    "recipe": ("recipe_repository", "RecipeRepository"),
+    "meal": ("meal_repository", "MealRepository"),
+    "grocery_list": ("grocery_list_repository", "GroceryListRepository"),
+    "catalog": ("catalog_repository", "CatalogRepository"),
+    "review": ("review_repository", "ReviewRepository"),
+}
+
+
 def get_adapter_repository(
-    name: Literal["user", "recipe", "meal", "grocery_list"],
+    name: Literal["user", "recipe", "meal", "grocery_list", "catalog", "review"],
     adapter: str = settings.adapter,
+    is_async: bool = False,
 ):
     """Retrieve correct adapter class based on name
 
     name possible values : user
+    is_async: retrieve the asyncio flavour of the repository (`Async<Class>`)
+
+    The application resolves its repositories once at startup (see `drivers.container`).
     """
-    table_mapping = {
-        "user": {"module": "user_repository", "class": "UserRepository"},
-        "recipe": {"module": "recipe_repository", "class": "RecipeRepository"},
-        "meal": {"module": "meal_repository", "class": "MealRepository"},
-        "grocery_list": {
-            "module": "grocery_list_repository",
-            "class": "GroceryListRepository",
-        },
-    }
+    module_name, class_name = REPOSITORY_CLASSES[name]
+    if is_async:
+        class_name = f"Async{class_name}"
     try:
-        module_name = table_mapping.get(name).get("module")
-        class_name = table_mapping.get(name).get("class")
         module = importlib.import_module(f"adapters.{adapter}.{module_name}")
-        class_element = getattr(module, class_name)
-        if adapter == "mongodb":
-            return class_element(settings.mongo_uri)
-        return class_element()
     except ModuleNotFoundError as exc:
         raise NameError(
             f"Repository for '{name}' not found. Searched 'adapters.{adapter}.{module_name}'"
         ) from exc
+    class_element = getattr(module, class_name)
+    if adapter == "mongodb":
+        return class_element(settings.mongo_uri)
+    return class_element()
@@ -1,20 +1,62 @@
 """Main application entry point for Cookibud API."""
 
-import logging
-import time
+from contextlib import asynccontextmanager
 
-from fastapi import Depends, FastAPI, Request
+import anyio.to_thread
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from starlette.concurrency import iterate_in_threadpool
 
+from adapters.mongodb.db import (
+    close_async_clients,
+    close_clients,
+    connect,
+    connect_async,
+)
+from adapters.mongodb.indexes import ensure_indexes, mongo_repositories
 from drivers.config import settings
+from drivers.container import Container
 from drivers.dependencies import get_token_header
-from drivers.routers import auth, groceries, meals, recipes, uploads
+from drivers.metrics import MetricsMiddleware
+from drivers.profiling import ProfilingMiddleware
+from drivers.query_accounting import QueryAccountingMiddleware
+from drivers.request_logging import RequestLoggingMiddleware
+from drivers.routers import auth, groceries, meals, metrics, recipes, uploads
+
+# Routers whose routes inject use cases from the container
+USE_CASE_ROUTERS = (auth, groceries, meals, recipes)
+
+
+def build_container(adapter: str) -> Container:
+    """Repositories of adapter and the use cases of every router"""
+    container = Container(adapter)
+    for router in USE_CASE_ROUTERS:
+        container.register(router.build_use_cases(container))
+    return container
+
 
-logger = logging.getLogger("uvicorn.trace")
+@asynccontextmanager
+async def lifespan(fastapi_app: FastAPI):
+    """Resolve the use cases, size the threadpool and open the shared MongoDB pools"""
+    # before connecting: a misconfigured adapter stops the application at startup
+    fastapi_app.state.container = build_container(settings.adapter)
+    if settings.threadpool_size:
+        anyio.to_thread.current_default_thread_limiter().total_tokens = (
+            settings.threadpool_size
+        )
+    if settings.adapter == "mongodb":
+        connect(settings.mongo_uri, **settings.mongo_client_options)
+        connect_async(settings.mongo_uri, **settings.mongo_client_options)
+        if settings.mongo_ensure_indexes:
+            ensure_indexes(
+                mongo_repositories(settings.mongo_uri, settings.recipe_search_language)
+            )
+    yield
+    await close_async_clients()
+    close_clients()
 
-app = FastAPI(title="Cookibud API")
+
+app = FastAPI(title="Cookibud API", lifespan=lifespan)
 
 origins = [
     "http://localhost:5173",
@@ -29,6 +71,30 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(
+    RequestLoggingMiddleware,
+    sample_rate=settings.log_sample_rate,
+    max_body_size=settings.log_body_max_bytes,
+)
+
+if settings.query_accounting:
+    app.add_middleware(
+        QueryAccountingMiddleware,
+        budget=settings.query_budget,
+        max_repeats=settings.query_max_repeats,
+    )
+
+if settings.profiling_admins:
+    app.add_middleware(
+        ProfilingMiddleware,
+        admins=settings.profiling_admins,
+        directory=settings.profiles_dir,
+    )
+
+if settings.metrics_enabled:
+    # added last so that it is the outermost middleware and times the others too
+    app.add_middleware(MetricsMiddleware)
+
 app.mount(
     f"/{settings.uploads_dir}",
     StaticFiles(directory=settings.uploads_dir),
@@ -36,40 +102,9 @@ app.mount(
 )
 
 
-@app.middleware("http")
-async def middleware(request: Request, call_next):
-    """Middleware to log request and response details along with processing time."""
-    try:
-        req_body = await request.json()
-    except Exception:  # pylint: disable=broad-except
-        req_body = None
-
-    start_time = time.perf_counter()
-    response = await call_next(request)
-    process_time = time.perf_counter() - start_time
-
-    res_body = [section async for section in response.body_iterator]
-    response.body_iterator = iterate_in_threadpool(iter(res_body))
-    try:
-        res_body = [section.decode() for section in res_body]
-    except Exception:  # pylint: disable=broad-except
-        res_body = ["<non-decodable content>"]
-
-    # Add the background task to the response object to queue the job
-    logger.debug(
-        "GET /",
-        extras={
-            "request": request,
-            "request_body": req_body,
-            "response": response,
-            "response_body": res_body,
-            "process_time": process_time,
-        },
-    )
-    return response
-
-
 app.include_router(auth.router, tags=["auth"])
+if settings.metrics_enabled:
+    app.include_router(metrics.router, tags=["metrics"])
 app.include_router(
     recipes.router,
     prefix="/recipes",
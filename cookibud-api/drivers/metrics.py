@@ -0,0 +1,85 @@
+"""HTTP and threadpool metrics of the application"""
+
+import time
+
+import anyio.to_thread
+
+from adapters.metrics import REGISTRY
+
+# Label of the requests that matched no route (404, static files)
+UNMATCHED_ROUTE = "other"
+
+REQUEST_DURATION = REGISTRY.histogram(
+    "cookibud_http_request_duration_seconds",
+    "Duration of the HTTP requests by route template and status code",
+    ("method", "route", "status"),
+)
+REQUESTS_IN_FLIGHT = REGISTRY.gauge(
+    "cookibud_http_requests_in_flight", "HTTP requests being processed", ("method",)
+)
+
+
+def _limiter_statistics():
+    """Statistics of the threadpool running sync dependencies and use cases"""
+    return anyio.to_thread.current_default_thread_limiter().statistics()
+
+
+REGISTRY.gauge(
+    "cookibud_threadpool_threads_in_use",
+    "Worker threads busy running sync code",
+    callback=lambda: _limiter_statistics().borrowed_tokens,
+)
+REGISTRY.gauge(
+    "cookibud_threadpool_threads_total",
+    "Maximum number of worker threads",
+    callback=lambda: _limiter_statistics().total_tokens,
+)
+REGISTRY.gauge(
+    "cookibud_threadpool_tasks_waiting",
+    "Sync calls waiting for a free worker thread",
+    callback=lambda: _limiter_statistics().tasks_waiting,
+)
+
+
+def route_template(scope) -> str:
+    """Path template of the route that handled a request, not its raw path
+
+    Raw paths would create one series per recipe id.
+    """
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """ASGI middleware counting in-flight requests and timing them by route and status"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        # unhandled errors end up as 500 responses from the server error middleware
+        status_code = 500
+
+        async def measured_send(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.inc(method=method)
+        start_time = time.perf_counter()
+        try:
+            await self.app(scope, receive, measured_send)
+        finally:
+            REQUEST_DURATION.observe(
+                time.perf_counter() - start_time,
+                method=method,
+                route=route_template(scope),
+                status=status_code,
+            )
+            REQUESTS_IN_FLIGHT.dec(method=method)
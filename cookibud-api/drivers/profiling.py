@@ -0,0 +1,153 @@
+"""On-demand profiling of single requests, for admins
+
+An admin sends `X-Profile: 1` (or `?profile=1`) with a request to run it under
+cProfile. The profile is saved as a pstats file in the profiles directory, to be
+opened with `python -m pstats` or snakeviz, and the response tells where it went
+(`X-Profile`) and how the time splits (`Server-Timing`):
+
+- pydantic: validation and serialization of the entities
+- mongo: the driver and BSON encoding/decoding
+- wait: the event loop waiting for I/O (MongoDB replies, mostly)
+- logic: everything else, use cases and routing included
+"""
+
+import cProfile
+import logging
+import os
+import pstats
+import time
+from urllib.parse import parse_qs
+from uuid import uuid4
+
+from fastapi import HTTPException
+
+from drivers.dependencies import get_token_header
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_PARAMETER = "profile"
+CATEGORIES = ("pydantic", "mongo", "wait", "logic")
+
+_PACKAGES = {
+    "pydantic": ("pydantic", "pydantic_core"),
+    "mongo": ("pymongo", "bson", "gridfs"),
+}
+
+
+def category(filename: str, function: str) -> str:
+    """Category of a profiled function, from the package that defines it"""
+    if filename == "~":
+        # built-in functions only name their class or module
+        if "select." in function:
+            return "wait"
+        path = function
+    else:
+        if os.path.basename(filename) == "selectors.py":
+            return "wait"
+        path = filename.replace(os.sep, "/")
+    for name, packages in _PACKAGES.items():
+        if any(
+            f"/{package}/" in path or f"'{package}." in path for package in packages
+        ):
+            return name
+    return "logic"
+
+
+def breakdown(profile: cProfile.Profile) -> dict[str, float]:
+    """Seconds spent in each category, from the own time of the profiled functions"""
+    durations = dict.fromkeys(CATEGORIES, 0.0)
+    for (filename, _, function), (_, _, own_time, _, _) in pstats.Stats(
+        profile
+    ).stats.items():
+        durations[category(filename, function)] += own_time
+    return durations
+
+
+def _requested(scope) -> bool:
+    """Whether the request asks to be profiled"""
+    for key, value in scope.get("headers", []):
+        if key == PROFILE_HEADER:
+            return value not in (b"", b"0")
+    query_string = scope.get("query_string", b"")
+    if PROFILE_PARAMETER.encode() not in query_string:
+        return False
+    values = parse_qs(query_string.decode("latin-1")).get(PROFILE_PARAMETER, [])
+    return any(value not in ("", "0") for value in values)
+
+
+def _username(scope) -> str | None:
+    """User of the bearer token of the request, None if it has no valid one"""
+    for key, value in scope.get("headers", []):
+        if key == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() != "bearer":
+                return None
+            try:
+                return get_token_header(token).username
+            except HTTPException:
+                return None
+    return None
+
+
+class ProfilingMiddleware:
+    """ASGI middleware profiling the requests of admins that ask for it
+
+    Requests that do not ask for a profile only go through a header lookup. The
+    profile covers the request until the response starts (the first item of streamed
+    responses included) and, cProfile being per thread, the event loop thread only:
+    other requests running meanwhile show up in it too. Only one request is profiled
+    at a time; the others run normally.
+    """
+
+    def __init__(self, app, admins: list[str], directory: str = "profiles"):
+        self.app = app
+        self.admins = set(admins)
+        self.directory = directory
+        self._profiling = False
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or not _requested(scope)
+            or self._profiling
+            or _username(scope) not in self.admins
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        profile = cProfile.Profile()
+        running = True
+
+        def stop() -> list[tuple[bytes, bytes]]:
+            """Stop profiling and save the profile, headers describing it"""
+            nonlocal running
+            profile.disable()
+            running = False
+            self._profiling = False
+            name = f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid4().hex[:8]}.pstats"
+            os.makedirs(self.directory, exist_ok=True)
+            profile.dump_stats(os.path.join(self.directory, name))
+            logger.info("Profiled %s %s in %s", scope["method"], scope["path"], name)
+            timings = ", ".join(
+                f"profile-{part};dur={seconds * 1000:.1f}"
+                for part, seconds in breakdown(profile).items()
+            )
+            return [
+                (PROFILE_HEADER, name.encode()),
+                (b"server-timing", timings.encode()),
+            ]
+
+        async def profiled_send(message):
+            if message["type"] == "http.response.start" and running:
+                message = {**message, "headers": [*message.get("headers", []), *stop()]}
+            await send(message)
+
+        self._profiling = True
+        profile.enable()
+        try:
+            await self.app(scope, receive, profiled_send)
+        finally:
+            if running:
+                profile.disable()
+                self._profiling = False
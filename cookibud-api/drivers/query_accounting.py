@@ -0,0 +1,44 @@
+"""Per-request accounting of the repository queries"""
+
+import logging
+
+from adapters.mongodb.instrumentation import account_queries
+from drivers.metrics import route_template
+
+logger = logging.getLogger(__name__)
+
+
+class QueryAccountingMiddleware:
+    """ASGI middleware accounting the repository queries of each request
+
+    The queries made until the response starts are summed up in a `Server-Timing`
+    header. Once the response is sent (streamed bodies included), requests making more
+    than `budget` queries or repeating a query shape more than `max_repeats` times, a
+    sign of N+1 queries, are logged as warnings.
+    """
+
+    def __init__(self, app, budget: int | None = None, max_repeats: int | None = None):
+        self.app = app
+        self.budget = budget
+        self.max_repeats = max_repeats
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with account_queries() as account:
+
+            async def accounted_send(message):
+                if message["type"] == "http.response.start":
+                    timing = (b"server-timing", account.server_timing().encode())
+                    message = {
+                        **message,
+                        "headers": [*message.get("headers", []), timing],
+                    }
+                await send(message)
+
+            await self.app(scope, receive, accounted_send)
+
+        for problem in account.problems(self.budget, self.max_repeats):
+            logger.warning("%s %s: %s", scope["method"], route_template(scope), problem)
@@ -0,0 +1,116 @@
+"""Sampled request/response logging that never buffers bodies"""
+
+import logging
+import random
+import time
+
+logger = logging.getLogger("uvicorn.trace")
+
+
+def _is_json(content_type: str | None) -> bool:
+    """Whether a content type holds JSON (application/json, application/*+json)"""
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    return media_type == "application/json" or media_type.endswith("+json")
+
+
+def _header(headers: list[tuple[bytes, bytes]], name: bytes) -> str | None:
+    """Value of an ASGI header"""
+    for key, value in headers:
+        if key.lower() == name:
+            return value.decode("latin-1")
+    return None
+
+
+class _BodyCapture:
+    """First bytes of a JSON body, the rest only counted"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.enabled = False
+        self.data = bytearray()
+        self.size = 0
+
+    def feed(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self.enabled and len(self.data) < self.max_size:
+            self.data += chunk[: self.max_size - len(self.data)]
+
+    def text(self) -> str | None:
+        if not self.enabled:
+            return None
+        text = self.data.decode("utf-8", errors="replace")
+        return text + "…" if self.size > len(self.data) else text
+
+
+class RequestLoggingMiddleware:
+    """ASGI middleware logging a sample of requests at debug level
+
+    Nothing is done unless `logger` is enabled for debug and the request is sampled
+    (`sample_rate` between 0 and 1). Messages are passed through as they come, so
+    uploads and streamed responses are never buffered. Only the first `max_body_size`
+    bytes of JSON bodies are kept for the log.
+    """
+
+    def __init__(
+        self, app, sample_rate: float = 1.0, max_body_size: int = 2048, log=logger
+    ):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.max_body_size = max_body_size
+        self.logger = log
+
+    def _sampled(self) -> bool:
+        return (
+            self.logger.isEnabledFor(logging.DEBUG)
+            and random.random() < self.sample_rate
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._sampled():
+            await self.app(scope, receive, send)
+            return
+
+        request_body = _BodyCapture(self.max_body_size)
+        request_body.enabled = _is_json(
+            _header(scope.get("headers", []), b"content-type")
+        )
+        response_body = _BodyCapture(self.max_body_size)
+        status_code = None
+
+        async def logged_receive():
+            message = await receive()
+            if message["type"] == "http.request":
+                request_body.feed(message.get("body", b""))
+            return message
+
+        async def logged_send(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                content_type = _header(message.get("headers", []), b"content-type")
+                response_body.enabled = _is_json(content_type)
+            elif message["type"] == "http.response.body":
+                response_body.feed(message.get("body", b""))
+            await send(message)
+
+        start_time = time.perf_counter()
+        try:
+            await self.app(scope, logged_receive, logged_send)
+        finally:
+            process_time = time.perf_counter() - start_time
+            self.logger.debug(
+                "%s %s %s %.1fms",
+                scope["method"],
+                scope["path"],
+                status_code,
+                process_time * 1000,
+                extra={
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status_code": status_code,
+                    "request_body": request_body.text(),
+                    "response_body": response_body.text(),
+                    "response_size": response_body.size,
+                    "process_time": process_time,
+                },
+            )
@@ -9,7 +9,8 @@ from fastapi.security import OAuth2PasswordRequestForm
 
 from adapters.ports.user_repository import UserRepository
 from drivers.config import settings
-from drivers.dependencies import get_adapter_repository, get_token_header
+from drivers.container import Container, use_case
+from drivers.dependencies import get_token_header
 from entities.user import Token, User
 from use_cases.auth import AuthUseCase, RegisterUseCase, RevokeUseCase
 from use_cases.exceptions import (
@@ -23,6 +24,16 @@ router = APIRouter()
 ACCESS_TOKEN_EXPIRE_MINUTES = 720
 
 
+def build_use_cases(container: Container) -> dict:
+    """Use cases of the authentication routes, built once at startup"""
+    user_repo: UserRepository = container.repository("user")
+    return {
+        "authenticate": AuthUseCase(user_repo),
+        "register": RegisterUseCase(user_repo),
+        "revoke": RevokeUseCase(user_repo),
+    }
+
+
 def create_access_token(data: dict, expires_delta: timedelta | None = None):
     """Encode data into JWT"""
     to_encode = data.copy()
@@ -40,11 +51,11 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None):
 @router.post("/token")
 def login_for_access_token(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
+    usecase: AuthUseCase = Depends(use_case("authenticate")),
 ) -> Token:
     """Connect user via form data and retrieve JWT"""
-    user_repo: UserRepository = get_adapter_repository("user")
     try:
-        user: User = AuthUseCase(user_repo)(form_data.username, form_data.password)
+        user: User = usecase(form_data.username, form_data.password)
     except (UserNotFoundError, InvalidPasswordError) as exc:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -59,11 +70,10 @@ def login_for_access_token(
 
 
 @router.post("/auth/register", status_code=201)
-def register(item: User):
+def register(item: User, usecase: RegisterUseCase = Depends(use_case("register"))):
     """Register a new user"""
-    user_repo: UserRepository = get_adapter_repository("user")
     try:
-        return RegisterUseCase(user_repo)(item)
+        return usecase(item)
     except AlreadyExistingUser as e:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -75,12 +85,15 @@ def register(item: User):
 @router.delete(
     "/auth/revoke", status_code=200, dependencies=[Depends(get_token_header)]
 )
-def revoke(item: User, token_header=Depends(get_token_header)):
+def revoke(
+    item: User,
+    token_header=Depends(get_token_header),
+    usecase: RevokeUseCase = Depends(use_case("revoke")),
+):
     """Revoke an existing user"""
-    user_repo: UserRepository = get_adapter_repository("user")
     try:
         if token_header.user.username == item.username:
-            return RevokeUseCase(user_repo)(item)
+            return usecase(item)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Operation not permitted",
@@ -1,106 +1,165 @@
 """Grocery lists API Router"""
 
+from datetime import date
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from adapters.ports.grocery_list_repository import GroceryListRepository
-from drivers.dependencies import get_adapter_repository, get_token_header
+from adapters.ports.grocery_list_repository import AsyncGroceryListRepository
+from adapters.ports.meal_repository import AsyncMealRepository
+from adapters.ports.recipe_repository import AsyncRecipeRepository
+from drivers.container import Container, use_case
+from drivers.dependencies import get_token_header
+from drivers.streaming import stream_response
 from entities.grocery_list import GroceryList
 from entities.user import TokenData
 from use_cases.exceptions import AccessDeniedError
 from use_cases.grocery_lists import (
-    CreateGroceryListUseCase,
-    DeleteGroceryListUseCase,
-    ReadGroceryListByIdUseCase,
-    ReadUserGroceryListsUseCase,
-    UpdateAllGroceryListItemsStatusUseCase,
-    UpdateGroceryListItemStatusUseCase,
+    AsyncCreateGroceryListUseCase,
+    AsyncDeleteGroceryListUseCase,
+    AsyncGenerateGroceryListUseCase,
+    AsyncIterUserGroceryListsUseCase,
+    AsyncReadGroceryListByIdUseCase,
+    AsyncReadUserGroceryListsUseCase,
+    AsyncUpdateAllGroceryListItemsStatusUseCase,
+    AsyncUpdateGroceryListItemsStatusUseCase,
+    AsyncUpdateGroceryListItemStatusUseCase,
 )
 
 router = APIRouter()
 
 
-def get_grocery_usecases(token: Annotated[TokenData, Depends(get_token_header)]):
-    """Dependency to inject grocery list use cases with user context"""
-    repo: GroceryListRepository = get_adapter_repository("grocery_list", "mongodb")
-    return (
-        {
-            "read_user_groceries": ReadUserGroceryListsUseCase(repo),
-            "read_grocery_by_id": ReadGroceryListByIdUseCase(repo),
-            "create_grocery": CreateGroceryListUseCase(repo),
-            "update_item_status": UpdateGroceryListItemStatusUseCase(repo),
-            "update_all_items_status": UpdateAllGroceryListItemsStatusUseCase(repo),
-            "delete_grocery": DeleteGroceryListUseCase(repo),
-        },
-        token.user_id,
+def build_use_cases(container: Container) -> dict:
+    """Use cases of the grocery list routes, built once at startup"""
+    repo: AsyncGroceryListRepository = container.repository(
+        "grocery_list", is_async=True
     )
+    meal_repo: AsyncMealRepository = container.repository("meal", is_async=True)
+    recipe_repo: AsyncRecipeRepository = container.repository("recipe", is_async=True)
+    return {
+        "read_user_groceries": AsyncReadUserGroceryListsUseCase(repo),
+        "iter_user_groceries": AsyncIterUserGroceryListsUseCase(repo),
+        "read_grocery_by_id": AsyncReadGroceryListByIdUseCase(repo),
+        "create_grocery": AsyncCreateGroceryListUseCase(repo),
+        "generate_grocery": AsyncGenerateGroceryListUseCase(
+            repo, meal_repo, recipe_repo
+        ),
+        "update_item_status": AsyncUpdateGroceryListItemStatusUseCase(repo),
+        "update_items_status": AsyncUpdateGroceryListItemsStatusUseCase(repo),
+        "update_all_items_status": AsyncUpdateAllGroceryListItemsStatusUseCase(repo),
+        "delete_grocery": AsyncDeleteGroceryListUseCase(repo),
+    }
 
 
 @router.get("")
-def read_groceries(usecases_and_user: tuple = Depends(get_grocery_usecases)):
-    """Retrieve grocery lists for the authenticated user"""
-    usecases, user_id = usecases_and_user
-    return usecases["read_user_groceries"](user_id)
+async def read_groceries(
+    request: Request,
+    token: Annotated[TokenData, Depends(get_token_header)],
+    usecase: AsyncIterUserGroceryListsUseCase = Depends(
+        use_case("iter_user_groceries")
+    ),
+):
+    """Retrieve grocery lists for the authenticated user.
+
+    Lists are streamed, as NDJSON with `Accept: application/x-ndjson`.
+    """
+    return await stream_response(usecase(token.user_id), request)
 
 
 @router.post("", status_code=201)
-def create_grocery(
-    list_in: GroceryList, usecases_and_user: tuple = Depends(get_grocery_usecases)
+async def create_grocery(
+    list_in: GroceryList,
+    token: Annotated[TokenData, Depends(get_token_header)],
+    usecase: AsyncCreateGroceryListUseCase = Depends(use_case("create_grocery")),
 ):
     """Create a new grocery list for the authenticated user"""
-    usecases, user_id = usecases_and_user
-    return usecases["create_grocery"](list_in, user_id)
+    return await usecase(list_in, token.user_id)
+
+
+@router.post("/generate", status_code=201)
+async def generate_grocery(
+    start: date,
+    end: date,
+    token: Annotated[TokenData, Depends(get_token_header)],
+    usecase: AsyncGenerateGroceryListUseCase = Depends(use_case("generate_grocery")),
+):
+    """Generate and save the grocery list of the meals planned between start and end"""
+    try:
+        return await usecase(start, end, token.user_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
 
 
 @router.get("/{grocery_id}")
-def read_grocery(
-    grocery_id: str, usecases_and_user: tuple = Depends(get_grocery_usecases)
+async def read_grocery(
+    grocery_id: str,
+    token: Annotated[TokenData, Depends(get_token_header)],
+    usecase: AsyncReadGroceryListByIdUseCase = Depends(use_case("read_grocery_by_id")),
 ):
     """Retrieve a grocery list by ID (only if owned by user)"""
-    usecases, user_id = usecases_and_user
     try:
-        return usecases["read_grocery_by_id"](grocery_id, user_id)
+        return await usecase(grocery_id, token.user_id)
     except AccessDeniedError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e)) from e
 
 
 @router.patch("/{grocery_id}/items/{item_id}")
-def update_item_status(
+async def update_item_status(
     grocery_id: str,
     item_id: str,
     bought: bool,
-    usecases_and_user: tuple = Depends(get_grocery_usecases),
+    token: Annotated[TokenData, Depends(get_token_header)],
+    usecase: AsyncUpdateGroceryListItemStatusUseCase = Depends(
+        use_case("update_item_status")
+    ),
 ):
     """Update the 'bought' status of a specific item in a grocery list"""
-    usecases, user_id = usecases_and_user
     try:
-        return usecases["update_item_status"](grocery_id, item_id, bought, user_id)
+        return await usecase(grocery_id, item_id, bought, token.user_id)
     except AccessDeniedError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e)) from e
 
 
 @router.patch("/{grocery_id}/items")
-def update_all_items_status(
+async def update_all_items_status(
     grocery_id: str,
     bought: bool,
-    usecases_and_user: tuple = Depends(get_grocery_usecases),
+    token: Annotated[TokenData, Depends(get_token_header)],
+    ids: str | None = None,
+    items_usecase: AsyncUpdateGroceryListItemsStatusUseCase = Depends(
+        use_case("update_items_status")
+    ),
+    all_usecase: AsyncUpdateAllGroceryListItemsStatusUseCase = Depends(
+        use_case("update_all_items_status")
+    ),
 ):
-    """Update the 'bought' status of all items in a grocery list"""
-    usecases, user_id = usecases_and_user
+    """Update the 'bought' status of all items in a grocery list.
+
+    `ids` (comma separated item IDs) restricts the update to those items.
+    """
     try:
-        return usecases["update_all_items_status"](grocery_id, bought, user_id)
+        if ids is not None:
+            item_ids = [i.strip() for i in ids.split(",") if i.strip()]
+            return await items_usecase(grocery_id, item_ids, bought, token.user_id)
+        return await all_usecase(grocery_id, bought, token.user_id)
     except AccessDeniedError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e)) from e
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
 
 
 @router.delete("/{grocery_id}", status_code=204)
-def delete_grocery(
-    grocery_id: str, usecases_and_user: tuple = Depends(get_grocery_usecases)
+async def delete_grocery(
+    grocery_id: str,
+    token: Annotated[TokenData, Depends(get_token_header)],
+    usecase: AsyncDeleteGroceryListUseCase = Depends(use_case("delete_grocery")),
 ):
     """Delete a grocery list by ID (only if owned by user)"""
-    usecases, user_id = usecases_and_user
     try:
-        usecases["delete_grocery"](grocery_id, user_id)
+        await usecase(grocery_id, token.user_id)
     except AccessDeniedError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e)) from e
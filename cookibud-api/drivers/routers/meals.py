@@ -1,118 +1,187 @@
 """Meal API Router: defines HTTP endpoints for meal operations"""
 
+from datetime import date
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 
-from adapters.ports.meal_repository import MealRepository
-from drivers.dependencies import get_adapter_repository, get_token_header
+from adapters.ports.meal_repository import AsyncMealRepository
+from drivers.container import Container, use_case
+from drivers.dependencies import get_token_header
+from drivers.streaming import stream_response
 from entities.meal import Meal
 from entities.user import TokenData
 from use_cases.exceptions import AccessDeniedError
 from use_cases.meals import (
-    CreateMealUseCase,
-    DeleteMealUseCase,
-    ReadMealByIdUseCase,
-    ReadUserMealsUseCase,
-    UpdateMealUseCase,
-    AddRecipeToMealUseCase,
-    RemoveRecipeFromMealUseCase,
-    PlanRecipeUseCase,
+    AsyncAddRecipeToMealUseCase,
+    AsyncCreateMealUseCase,
+    AsyncDeleteMealUseCase,
+    AsyncIterUserMealsUseCase,
+    AsyncPlanRecipeUseCase,
+    AsyncReadMealByIdUseCase,
+    AsyncReadUserMealsUseCase,
+    AsyncRemoveRecipeFromMealUseCase,
+    AsyncSummarizeMonthMealsUseCase,
+    AsyncUpdateMealUseCase,
 )
 
 router = APIRouter()
 
 
-def get_meal_usecases(token: Annotated[TokenData, Depends(get_token_header)]):
-    """Dependency to inject meal use cases with user context"""
-    repo: MealRepository = get_adapter_repository("meal", "mongodb")
+def build_use_cases(container: Container) -> dict:
+    """Use cases of the meal routes, built once at startup"""
+    repo: AsyncMealRepository = container.repository("meal", is_async=True)
     return {
-        "read_user_meals": ReadUserMealsUseCase(repo),
-        "read_meal_by_id": ReadMealByIdUseCase(repo),
-        "create_meal": CreateMealUseCase(repo),
-        "update_meal": UpdateMealUseCase(repo),
-        "delete_meal": DeleteMealUseCase(repo),
-        "add_item": AddRecipeToMealUseCase(repo),
-        "remove_item": RemoveRecipeFromMealUseCase(repo),
-        "plan_recipe": PlanRecipeUseCase(repo),
-    }, token.user_id
+        "read_user_meals": AsyncReadUserMealsUseCase(repo),
+        "iter_user_meals": AsyncIterUserMealsUseCase(repo),
+        "summarize_month": AsyncSummarizeMonthMealsUseCase(repo),
+        "read_meal_by_id": AsyncReadMealByIdUseCase(repo),
+        "create_meal": AsyncCreateMealUseCase(repo),
+        "update_meal": AsyncUpdateMealUseCase(repo),
+        "delete_meal": AsyncDeleteMealUseCase(repo),
+        "add_meal_item": AsyncAddRecipeToMealUseCase(repo),
+        "remove_meal_item": AsyncRemoveRecipeFromMealUseCase(repo),
+        "plan_recipe": AsyncPlanRecipeUseCase(repo),
+    }
 
 
 @router.get("")
-def read_meals(usecases_and_user: tuple = Depends(get_meal_usecases)):
-    """Retrieve meals for the authenticated user"""
-    usecases, user_id = usecases_and_user
-    return usecases["read_user_meals"](user_id)
+async def read_meals(
+    request: Request,
+    token: Annotated[TokenData, Depends(get_token_header)],
+    start: Annotated[date | None, Query(alias="from")] = None,
+    end: Annotated[date | None, Query(alias="to")] = None,
+    usecase: AsyncIterUserMealsUseCase = Depends(use_case("iter_user_meals")),
+):
+    """Retrieve meals for the authenticated user, between `from` and `to` when given.
+
+    Meals are streamed, as NDJSON with `Accept: application/x-ndjson`.
+    """
+    try:
+        return await stream_response(usecase(token.user_id, start, end), request)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
+
+
+@router.get("/summary")
+async def summarize_meals(
+    month: Annotated[str, Query(pattern=r"^\d{4}-\d{2}$")],
+    token: Annotated[TokenData, Depends(get_token_header)],
+    usecase: AsyncSummarizeMonthMealsUseCase = Depends(use_case("summarize_month")),
+):
+    """Recipe counts and titles per planned day of a month (YYYY-MM)"""
+    year, month_number = (int(part) for part in month.split("-"))
+    try:
+        return await usecase(token.user_id, year, month_number)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
 
 
 @router.post("", status_code=201)
-def create_meal(item: Meal, usecases_and_user: tuple = Depends(get_meal_usecases)):
-    """Create a new meal for the authenticated user"""
-    usecases, user_id = usecases_and_user
-    return usecases["create_meal"](item, user_id)
+async def create_meal(
+    item: Meal,
+    token: Annotated[TokenData, Depends(get_token_header)],
+    usecase: AsyncCreateMealUseCase = Depends(use_case("create_meal")),
+):
+    """Create a new meal for the authenticated user (409 when the date already has one)"""
+    try:
+        return await usecase(item, token.user_id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
 
 
 @router.get("/{item_id}")
-def read_meal(item_id: str, usecases_and_user: tuple = Depends(get_meal_usecases)):
+async def read_meal(
+    item_id: str,
+    token: Annotated[TokenData, Depends(get_token_header)],
+    usecase: AsyncReadMealByIdUseCase = Depends(use_case("read_meal_by_id")),
+):
     """Retrieve a meal by ID (only if owned by user)"""
-    usecases, user_id = usecases_and_user
     try:
-        return usecases["read_meal_by_id"](item_id, user_id)
+        return await usecase(item_id, token.user_id)
     except AccessDeniedError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e)) from e
 
 
 @router.put("/{item_id}")
-def update_meal(
-    item_id: str, item: Meal, usecases_and_user: tuple = Depends(get_meal_usecases)
+async def update_meal(
+    item_id: str,
+    item: Meal,
+    token: Annotated[TokenData, Depends(get_token_header)],
+    usecase: AsyncUpdateMealUseCase = Depends(use_case("update_meal")),
 ):
-    """Update a meal by ID (only if owned by user)"""
-    usecases, user_id = usecases_and_user
+    """Update a meal by ID (only if owned by user, 409 when moved to a date that has one)"""
     try:
-        return usecases["update_meal"](item_id, item, user_id)
+        return await usecase(item_id, item, token.user_id)
     except AccessDeniedError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e)) from e
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
 
 
 @router.delete("/{item_id}", status_code=204)
-def delete_meal(item_id: str, usecases_and_user: tuple = Depends(get_meal_usecases)):
+async def delete_meal(
+    item_id: str,
+    token: Annotated[TokenData, Depends(get_token_header)],
+    usecase: AsyncDeleteMealUseCase = Depends(use_case("delete_meal")),
+):
     """Delete a meal by ID (only if owned by user)"""
-    usecases, user_id = usecases_and_user
     try:
-        usecases["delete_meal"](item_id, user_id)
+        await usecase(item_id, token.user_id)
     except AccessDeniedError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e)) from e
 
 
 @router.post("/{meal_id}/items", status_code=201)
-def add_meal_item(meal_id: str, item: dict, usecases_and_user: tuple = Depends(get_meal_usecases)):
+async def add_meal_item(
+    meal_id: str,
+    item: dict,
+    token: Annotated[TokenData, Depends(get_token_header)],
+    usecase: AsyncAddRecipeToMealUseCase = Depends(use_case("add_meal_item")),
+):
     """Add a recipe entry to an existing meal (ownership verified)"""
-    usecases, user_id = usecases_and_user
     try:
-        return usecases["add_item"](meal_id, item, user_id)
+        return await usecase(meal_id, item, token.user_id)
     except AccessDeniedError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e)) from e
 
 
 @router.delete("/{meal_id}/items/{recipe_id}", status_code=204)
-def remove_meal_item(meal_id: str, recipe_id: str, usecases_and_user: tuple = Depends(get_meal_usecases)):
+async def remove_meal_item(
+    meal_id: str,
+    recipe_id: str,
+    token: Annotated[TokenData, Depends(get_token_header)],
+    usecase: AsyncRemoveRecipeFromMealUseCase = Depends(use_case("remove_meal_item")),
+):
     """Remove a recipe entry from a meal"""
-    usecases, user_id = usecases_and_user
     try:
-        usecases["remove_item"](meal_id, recipe_id, user_id)
+        await usecase(meal_id, recipe_id, token.user_id)
     except AccessDeniedError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e)) from e
 
 
 @router.post("/plan", status_code=201)
-def plan_recipe(req: dict, usecases_and_user: tuple = Depends(get_meal_usecases)):
+async def plan_recipe(
+    req: dict,
+    token: Annotated[TokenData, Depends(get_token_header)],
+    usecase: AsyncPlanRecipeUseCase = Depends(use_case("plan_recipe")),
+):
     """Plan a recipe for a date; creates or appends to a meal for that date"""
-    usecases, user_id = usecases_and_user
-    date = req.get("date")
+    day = req.get("date")
     entry = req.get("entry")
-    if not date or not entry:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="date and entry required")
+    if not day or not entry:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="date and entry required"
+        )
     try:
-        return usecases["plan_recipe"](date, entry, user_id)
+        return await usecase(day, entry, token.user_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
     except AccessDeniedError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e)) from e
@@ -0,0 +1,41 @@
+"""Prometheus endpoint of the in-process metrics"""
+
+import secrets
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import PlainTextResponse
+
+from adapters.metrics import REGISTRY
+from drivers.config import settings
+
+# Version of the Prometheus text exposition format
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+router = APIRouter()
+
+
+def check_metrics_token(authorization: Annotated[str | None, Header()] = None) -> None:
+    """Require `settings.metrics_token` as bearer token, when one is configured"""
+    if settings.metrics_token is None:
+        return
+    expected = f"Bearer {settings.metrics_token}"
+    if authorization is None or not secrets.compare_digest(
+        authorization.encode(), expected.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+@router.get(
+    "/metrics", include_in_schema=False, dependencies=[Depends(check_metrics_token)]
+)
+async def metrics():
+    """Every metric of the process in the Prometheus text format
+
+    Without a METRICS_TOKEN, the endpoint is open: only expose it on an internal port.
+    """
+    return PlainTextResponse(REGISTRY.render(), media_type=PROMETHEUS_MEDIA_TYPE)
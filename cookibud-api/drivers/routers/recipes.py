@@ -2,44 +2,59 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-
-from adapters.ports.recipe_repository import RecipeRepository
-from drivers.dependencies import get_adapter_repository, get_token_header
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+
+from adapters.ports.catalog_repository import AsyncCatalogRepository
+from adapters.ports.recipe_repository import AsyncRecipeRepository
+from adapters.ports.review_repository import AsyncReviewRepository
+from drivers.container import Container, use_case
+from drivers.dependencies import get_token_header
+from drivers.streaming import stream_response
 from entities.recipe import Recipe
 from entities.user import TokenData
 from use_cases.exceptions import AccessDeniedError
 from use_cases.recipes import (
-    AddReviewUseCase,
-    CreateRecipeUseCase,
-    DeleteRecipeUseCase,
-    GetIngredientNamesUseCase,
-    ReadRecipeByIdUseCase,
-    ReadRecipesUseCase,
-    GetTagsUseCase,
-    UpdateRecipeUseCase,
+    AsyncAddReviewUseCase,
+    AsyncCreateRecipeUseCase,
+    AsyncDeleteRecipeUseCase,
+    AsyncGetIngredientNamesUseCase,
+    AsyncGetTagsUseCase,
+    AsyncIterRecipesUseCase,
+    AsyncReadRecipeByIdUseCase,
+    AsyncReadRecipeReviewsUseCase,
+    AsyncReadRecipesByIdsUseCase,
+    AsyncReadRecipesUseCase,
+    AsyncUpdateRecipeUseCase,
 )
 
 router = APIRouter()
 
+MAX_BATCH_SIZE = 100
+
 
-def get_recipe_usecases():
-    """Dependency to inject recipe use cases"""
-    repo: RecipeRepository = get_adapter_repository("recipe", "mongodb")
+def build_use_cases(container: Container) -> dict:
+    """Use cases of the recipe routes, built once at startup"""
+    repo: AsyncRecipeRepository = container.repository("recipe", is_async=True)
+    catalog: AsyncCatalogRepository = container.repository("catalog", is_async=True)
+    reviews: AsyncReviewRepository = container.repository("review", is_async=True)
     return {
-        "read_recipes": ReadRecipesUseCase(repo),
-        "read_recipe_by_id": ReadRecipeByIdUseCase(repo),
-        "create_recipe": CreateRecipeUseCase(repo),
-        "update_recipe": UpdateRecipeUseCase(repo),
-        "delete_recipe": DeleteRecipeUseCase(repo),
-        "add_review": AddReviewUseCase(repo),
-        "get_ingredient_names": GetIngredientNamesUseCase(repo),
-        "get_tags": GetTagsUseCase(repo),
+        "read_recipes": AsyncReadRecipesUseCase(repo),
+        "iter_recipes": AsyncIterRecipesUseCase(repo),
+        "read_recipe_by_id": AsyncReadRecipeByIdUseCase(repo),
+        "read_recipes_by_ids": AsyncReadRecipesByIdsUseCase(repo),
+        "create_recipe": AsyncCreateRecipeUseCase(repo, catalog),
+        "update_recipe": AsyncUpdateRecipeUseCase(repo, catalog),
+        "delete_recipe": AsyncDeleteRecipeUseCase(repo, catalog),
+        "add_review": AsyncAddReviewUseCase(repo, reviews),
+        "read_reviews": AsyncReadRecipeReviewsUseCase(reviews),
+        "get_ingredient_names": AsyncGetIngredientNamesUseCase(catalog),
+        "get_tags": AsyncGetTagsUseCase(catalog),
     }
 
 
 @router.get("")
-def read_recipes(
+async def read_recipes(
+    request: Request,
     search: str | None = None,
     tags: str | None = None,
     ingredient: str | None = None,
@@ -47,61 +62,142 @@ def read_recipes(
     page_size: int | None = None,
     sort_by: str | None = None,
     sort_dir: str = "asc",
-    usecases: dict = Depends(get_recipe_usecases),
+    min_rating: float | None = None,
+    cursor: str | None = None,
+    limit: Annotated[int | None, Query(ge=1, le=100)] = None,
+    prefix: str | None = None,
+    usecase: AsyncReadRecipesUseCase = Depends(use_case("read_recipes")),
+    iter_usecase: AsyncIterRecipesUseCase = Depends(use_case("iter_recipes")),
 ):
-    """Retrieve recipes. Optional filters: `search`, `tags`, `ingredient`. Optional pagination: `page`, `page_size`. Optional sorting: `sort_by`, `sort_dir` (asc|desc)."""
+    """Retrieve recipes, filtered by `search`, `prefix`, `tags`, `ingredient`, `min_rating`.
+
+    `search` matches whole words, `prefix` the start of the title (typeaheads).
+    Paginated with `limit` and the returned `next_cursor` as `cursor` (constant cost
+    per page), or with `page` and `page_size`; sorted by `sort_by` and `sort_dir`.
+    Without pagination, recipes are streamed (as NDJSON with `Accept: application/x-ndjson`).
+    """
     tag_list = [t.strip() for t in tags.split(",")] if tags else None
-    return usecases["read_recipes"](search, tag_list, ingredient, page, page_size, sort_by, sort_dir)
+    try:
+        if page is None and limit is None:
+            recipes = iter_usecase(
+                search,
+                tag_list,
+                ingredient,
+                sort_by,
+                sort_dir,
+                min_rating=min_rating,
+                prefix=prefix,
+            )
+            return await stream_response(recipes, request)
+        return await usecase(
+            search,
+            tag_list,
+            ingredient,
+            page,
+            page_size,
+            sort_by,
+            sort_dir,
+            min_rating=min_rating,
+            cursor=cursor,
+            limit=limit,
+            prefix=prefix,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
 
 
 @router.get("/tags")
-def read_tags(usecases: dict = Depends(get_recipe_usecases)):
+async def read_tags(usecase: AsyncGetTagsUseCase = Depends(use_case("get_tags"))):
     """Return all tags used in recipes"""
-    return usecases["get_tags"]()
+    return await usecase()
+
+
+@router.get("/ingredient-names")
+async def get_ingredient_names(
+    usecase: AsyncGetIngredientNamesUseCase = Depends(use_case("get_ingredient_names")),
+):
+    """Return a deduplicated sorted list of ingredient names"""
+    return await usecase()
+
+
+@router.get("/batch")
+async def read_recipes_batch(
+    ids: str,
+    usecase: AsyncReadRecipesByIdsUseCase = Depends(use_case("read_recipes_by_ids")),
+):
+    """Retrieve several recipes at once: `ids` is a comma separated list of recipe IDs.
+
+    Recipes are returned in the requested order; unknown ids are listed in `missing`.
+    """
+    recipe_ids = list(dict.fromkeys(i.strip() for i in ids.split(",") if i.strip()))
+    if len(recipe_ids) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_BATCH_SIZE} ids can be requested at once",
+        )
+    return await usecase(recipe_ids)
 
 
 @router.post("", status_code=201)
-def create_recipe(
+async def create_recipe(
     item: Recipe,
     token: Annotated[TokenData, Depends(get_token_header)],
-    usecases: dict = Depends(get_recipe_usecases),
+    usecase: AsyncCreateRecipeUseCase = Depends(use_case("create_recipe")),
 ):
     """Create a new recipe (owned by authenticated user)"""
-    return usecases["create_recipe"](item, token.user_id)
+    return await usecase(item, token.user_id)
 
 
 @router.get("/{item_id}")
-def read_recipe(item_id: str, usecases: dict = Depends(get_recipe_usecases)):
+async def read_recipe(
+    item_id: str,
+    usecase: AsyncReadRecipeByIdUseCase = Depends(use_case("read_recipe_by_id")),
+):
     """Retrieve a recipe by ID"""
-    return usecases["read_recipe_by_id"](item_id)
-
-
-@router.get("/ingredient-names")
-def get_ingredient_names(usecases: dict = Depends(get_recipe_usecases)):
-    """Return a deduplicated sorted list of ingredient names"""
-    return usecases["get_ingredient_names"]()
+    return await usecase(item_id)
 
 
 @router.put("/{item_id}")
-def update_recipe(
+async def update_recipe(
     item_id: str,
     item: Recipe,
     token: Annotated[TokenData, Depends(get_token_header)],
-    usecases: dict = Depends(get_recipe_usecases),
+    usecase: AsyncUpdateRecipeUseCase = Depends(use_case("update_recipe")),
 ):
     """Update a recipe by ID (only if authored by user)"""
     try:
-        return usecases["update_recipe"](item_id, item, token.user_id)
+        return await usecase(item_id, item, token.user_id)
     except AccessDeniedError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e)) from e
 
 
+@router.get("/{item_id}/reviews")
+async def read_reviews(
+    item_id: str,
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    usecase: AsyncReadRecipeReviewsUseCase = Depends(use_case("read_reviews")),
+):
+    """List the reviews of a recipe, newest first.
+
+    Pass the returned `next_cursor` as `cursor` to get the next page (null on the last page).
+    """
+    try:
+        return await usecase(item_id, cursor, limit)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
+
+
 @router.post("/{item_id}/reviews", status_code=201)
-def add_review(
+async def add_review(
     item_id: str,
     payload: dict,
     token: Annotated[TokenData, Depends(get_token_header)],
-    usecases: dict = Depends(get_recipe_usecases),
+    usecase: AsyncAddReviewUseCase = Depends(use_case("add_review")),
 ):
     """Add a review to a recipe (authenticated users)"""
     rating = int(payload.get("rating", 0))
@@ -112,7 +208,7 @@ def add_review(
             detail="Rating must be between 1 and 5",
         )
     try:
-        return usecases["add_review"](
+        return await usecase(
             item_id, token.user_id, token.username or token.user_id, rating, comment
         )
     except ValueError as e:
@@ -120,13 +216,13 @@ def add_review(
 
 
 @router.delete("/{item_id}", status_code=204)
-def delete_recipe(
+async def delete_recipe(
     item_id: str,
     token: Annotated[TokenData, Depends(get_token_header)],
-    usecases: dict = Depends(get_recipe_usecases),
+    usecase: AsyncDeleteRecipeUseCase = Depends(use_case("delete_recipe")),
 ):
     """Delete a recipe by ID (only if authored by user)"""
     try:
-        usecases["delete_recipe"](item_id, token.user_id)
+        await usecase(item_id, token.user_id)
     except AccessDeniedError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e)) from e
@@ -0,0 +1,78 @@
+"""Streamed list responses: NDJSON or JSON array, selected by the Accept header"""
+
+import json
+from collections.abc import AsyncIterator
+
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+JSON_MEDIA_TYPE = "application/json"
+# Serialized items are sent in chunks of about this size
+CHUNK_SIZE = 64 * 1024
+
+_EMPTY = object()
+
+
+def wants_ndjson(request: Request) -> bool:
+    """Whether the client asks for newline delimited JSON"""
+    accept = request.headers.get("accept", "")
+    return NDJSON_MEDIA_TYPE in (
+        part.split(";")[0].strip() for part in accept.split(",")
+    )
+
+
+def _dumps(item) -> bytes:
+    """Serialize one item like FastAPI serializes response bodies"""
+    if isinstance(item, BaseModel):
+        return item.model_dump_json().encode()
+    return json.dumps(
+        jsonable_encoder(item), ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+async def _parts(first, items: AsyncIterator, ndjson: bool) -> AsyncIterator[bytes]:
+    """Serialized items with their NDJSON or JSON array delimiters"""
+    if ndjson:
+        if first is not _EMPTY:
+            yield _dumps(first) + b"\n"
+            async for item in items:
+                yield _dumps(item) + b"\n"
+        return
+    yield b"["
+    if first is not _EMPTY:
+        yield _dumps(first)
+        async for item in items:
+            yield b"," + _dumps(item)
+    yield b"]"
+
+
+async def _chunks(parts: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Group small parts into chunks of about CHUNK_SIZE bytes"""
+    buffer = bytearray()
+    async for part in parts:
+        buffer += part
+        if len(buffer) >= CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+async def stream_response(items: AsyncIterator, request: Request) -> StreamingResponse:
+    """Stream items as NDJSON when accepted, as a JSON array otherwise
+
+    The first item is read before the response starts, so that errors raised by the
+    query (invalid filters, unreachable database) are still reported with a status code.
+    """
+    try:
+        first = await anext(items)
+    except StopAsyncIteration:
+        first = _EMPTY
+    ndjson = wants_ndjson(request)
+    return StreamingResponse(
+        _chunks(_parts(first, items, ndjson)),
+        media_type=NDJSON_MEDIA_TYPE if ndjson else JSON_MEDIA_TYPE,
+    )
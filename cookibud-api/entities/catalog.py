@@ -0,0 +1,17 @@
+"""Catalog entity definitions"""
+
+from typing import Literal
+
+from pydantic import BaseModel
+
+CatalogKind = Literal["tag", "ingredient"]
+CATALOG_KINDS: tuple[CatalogKind, ...] = ("tag", "ingredient")
+
+
+class CatalogEntry(BaseModel):
+    """Name used by recipes (tag or ingredient name) with the number of recipes using it"""
+
+    id: str | None = None
+    kind: CatalogKind
+    name: str
+    count: int = 0
@@ -1,5 +1,6 @@
 """Meal entity definition."""
 
+import datetime
 from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict
@@ -17,7 +18,7 @@ class Meal(BaseModel):
     """Meal definition: a date with one or more recipe entries and servings"""
 
     id: Optional[str] = None
-    date: str  # ISO format date string
+    date: datetime.date
     items: List[RecipeEntry]
     user_id: str | None = None  # owner of this meal
 
@@ -31,3 +32,12 @@ class Meal(BaseModel):
             }
         }
     )
+
+
+class MealDaySummary(BaseModel):
+    """Compact calendar view of a planned day: recipe count and titles only"""
+
+    date: datetime.date
+    meal_id: str
+    count: int
+    titles: List[str]
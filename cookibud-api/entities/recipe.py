@@ -24,12 +24,32 @@ class Recipe(BaseModel):
     children: list["Recipe"] = []
     tags: list[str] = []
     image_url: str | None = None  # URL to an image of the recipe
-    # Reviews provided by users (rating 1-5 and optional comment)
+    # Latest reviews provided by users, all reviews are kept in the review repository
     reviews: list["Review"] = []
+    # Rating aggregates, maintained when reviews are added
+    rating_count: int = 0
+    rating_sum: int = 0
+    rating_avg: float | None = None
+
+
+class RecipeSummary(BaseModel):
+    """Lightweight view of a recipe returned by list endpoints"""
+
+    id: str | None = None
+    title: str
+    tags: list[str] = []
+    image_url: str | None = None
+    prep_time: int | None = None  # in minutes
+    cook_time: int | None = None  # in minutes
+    rating: float | None = None  # average review rating, None when not reviewed
+    rating_count: int = 0
 
 
 class Review(BaseModel):
+    """Review of a recipe: rating 1-5 and optional comment"""
+
     id: str | None = None
+    recipe_id: str | None = None
     user_id: str | None = None
     username: str | None = None
     rating: int
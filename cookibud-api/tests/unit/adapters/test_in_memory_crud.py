@@ -0,0 +1,243 @@
+"""Unit tests for the in-memory CRUD: MongoDB filter, sort and pagination semantics."""
+
+import threading
+import unittest
+from datetime import date
+
+from pymongo.errors import DuplicateKeyError
+
+from adapters.in_memory.meal_repository import AsyncMealRepository, MealRepository
+from adapters.in_memory.query import matches
+from adapters.in_memory.recipe_repository import RecipeRepository
+from adapters.in_memory.store import clear_tables
+from adapters.in_memory.user_repository import UserRepository
+from entities.meal import Meal, RecipeEntry
+from entities.recipe import Ingredient, Recipe
+from entities.user import User
+from use_cases.meals import date_range
+from use_cases.recipes import ReadRecipesUseCase
+
+
+def _recipe(
+    title: str, rating=None, tags=(), ingredients=(), description=None
+) -> Recipe:
+    return Recipe(
+        title=title,
+        description=description,
+        ingredients=[Ingredient(name=name) for name in ingredients],
+        tags=list(tags),
+        rating_avg=rating,
+    )
+
+
+class TestInMemoryCRUD(unittest.TestCase):
+    """Filters, sorts, projections and writes evaluated like MongoDB"""
+
+    def setUp(self):
+        clear_tables()
+        self.addCleanup(clear_tables)
+        self.repo = RecipeRepository()
+        self.soup = self.repo.create(
+            _recipe("Tomato soup", 4.5, ["soup", "veggie"], ["Tomatoes", "Onion"])
+        )
+        self.pancakes = self.repo.create(
+            _recipe(
+                "Pancakes", None, ["sweet"], ["Flour", "Milk"], "Serve with tomato jam"
+            )
+        )
+        self.salad = self.repo.create(_recipe("Salad", 3.0, ["veggie"], ["Lettuce"]))
+
+    def _titles(self, recipes) -> list[str]:
+        return [r["title"] if isinstance(r, dict) else r.title for r in recipes]
+
+    def test_filters(self):
+        """Test array, operator, regex and null filters"""
+        self.assertEqual(
+            self._titles(self.repo.read(tags="veggie")), ["Tomato soup", "Salad"]
+        )
+        self.assertEqual(
+            self._titles(self.repo.read(tags={"$in": ["sweet", "soup"]})),
+            ["Tomato soup", "Pancakes"],
+        )
+        ingredient = {"ingredients.name": {"$regex": "mil", "$options": "i"}}
+        self.assertEqual(self._titles(self.repo.read(**ingredient)), ["Pancakes"])
+        self.assertEqual(
+            self._titles(self.repo.read(rating_avg={"$gte": 3})),
+            ["Tomato soup", "Salad"],
+        )
+        self.assertEqual(self._titles(self.repo.read(rating_avg=None)), ["Pancakes"])
+        self.assertEqual(self.repo.count(id=self.salad.id, tags="veggie"), 1)
+        self.assertEqual(self.repo.read(id="not-an-id"), [])
+
+    def test_sort_puts_nulls_first_ascending(self):
+        """Test null ratings sort first ascending and last descending, like MongoDB"""
+        ascending = self.repo.read(_sort=[("rating_avg", 1)])
+        descending = self.repo.read(_sort=[("rating_avg", -1)], _skip=1, _limit=1)
+
+        self.assertEqual(self._titles(ascending), ["Pancakes", "Salad", "Tomato soup"])
+        self.assertEqual(self._titles(descending), ["Salad"])
+
+    def test_projection_and_read_many(self):
+        """Test _fields returns dicts and read_many keeps the order of ids"""
+        summary = self.repo.read(
+            id=self.soup.id, _fields=["title", "ingredients.name"]
+        )[0]
+
+        self.assertEqual(
+            summary,
+            {
+                "id": self.soup.id,
+                "title": "Tomato soup",
+                "ingredients": [{"name": "Tomatoes"}, {"name": "Onion"}],
+            },
+        )
+        found = self.repo.read_many([self.salad.id, "missing", self.soup.id])
+        self.assertEqual(
+            [r.title if r else None for r in found], ["Salad", None, "Tomato soup"]
+        )
+
+    def test_cursor_pages_with_null_sort_values(self):
+        """Test keyset pages sorted on a nullable field cover every recipe once"""
+        read_recipes = ReadRecipesUseCase(self.repo)
+        titles, cursor = [], None
+        while True:
+            page = read_recipes(
+                sort_by="rating_avg", sort_dir="desc", cursor=cursor, limit=1
+            )
+            titles += [item.title for item in page["items"]]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        self.assertEqual(titles, ["Tomato soup", "Salad", "Pancakes"])
+
+    def test_text_search_by_relevance(self):
+        """Test $text matches stemmed words and pages by relevance"""
+        read_recipes = ReadRecipesUseCase(self.repo)
+
+        first = read_recipes(search="tomato", limit=1)
+        second = read_recipes(search="tomato", cursor=first["next_cursor"], limit=1)
+
+        self.assertEqual(self._titles(first["items"]), ["Tomato soup"])
+        self.assertEqual(self._titles(second["items"]), ["Pancakes"])
+        self.assertIsNone(second["next_cursor"])
+
+    def test_text_search_ranked_without_cursor(self):
+        """Test searches without a cursor are sorted by relevance too, scores not returned"""
+        self.repo.create(_recipe("Soup", description="A cake of croutons"))
+        self.repo.create(_recipe("Cake cake"))
+        read_recipes = ReadRecipesUseCase(self.repo)
+
+        listed = read_recipes(search="cake")
+        paged = read_recipes(search="cake", page=1, page_size=10)
+
+        self.assertEqual(self._titles(listed), ["Cake cake", "Soup"])
+        self.assertEqual(self._titles(paged["items"]), ["Cake cake", "Soup"])
+        self.assertNotIn("score", listed[0])
+
+    def test_writes_return_copies(self):
+        """Test update sets dotted fields, delete removes and reads never share state"""
+        self.repo.update(
+            self.salad.id, title="Green salad", **{"ingredients.0.name": "Kale"}
+        )
+        salad = self.repo.read(id=self.salad.id)[0]
+        salad.tags.append("changed")
+
+        self.assertEqual(salad.title, "Green salad")
+        self.assertEqual(salad.ingredients[0].name, "Kale")
+        self.assertEqual(self.repo.read(id=self.salad.id)[0].tags, ["veggie"])
+        self.repo.delete(salad)
+        self.assertEqual(self.repo.count(tags="veggie"), 1)
+        self.assertEqual(self.repo.count(tags="changed"), 0)
+
+    def test_unique_keys(self):
+        """Test unique keys are enforced like unique indexes"""
+        users = UserRepository()
+        users.create(User(username="alice", password="x"))
+
+        with self.assertRaises(DuplicateKeyError):
+            users.create(User(username="alice", password="y"))
+
+
+class TestInMemoryMeals(unittest.IsolatedAsyncioTestCase):
+    """Dates, upserts and concurrent writes on meals"""
+
+    def setUp(self):
+        clear_tables()
+        self.addCleanup(clear_tables)
+        self.repo = MealRepository()
+
+    def test_date_range(self):
+        """Test dates are stored as datetimes and ranges compare them"""
+        for day in (1, 15, 30):
+            self.repo.create(Meal(date=date(2025, 11, day), items=[], user_id="user-1"))
+
+        meals = self.repo.read(
+            user_id="user-1",
+            date=date_range(date(2025, 11, 10), date(2025, 11, 30)),
+            _sort=[("date", -1)],
+        )
+
+        self.assertEqual(
+            [meal.date for meal in meals], [date(2025, 11, 30), date(2025, 11, 15)]
+        )
+
+    def test_concurrent_plans_share_one_meal(self):
+        """Test planning from many threads upserts a single meal per day"""
+        day = date(2025, 11, 15)
+
+        def plan(i):
+            self.repo.plan_item("user-1", day, RecipeEntry(recipe_id=f"r{i}"))
+
+        threads = [threading.Thread(target=plan, args=(i,)) for i in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        meals = self.repo.read(user_id="user-1", date=day)
+        self.assertEqual(len(meals), 1)
+        self.assertEqual(len(meals[0].items), 20)
+
+    async def test_async_repository_shares_the_table(self):
+        """Test the asyncio repository reads what the sync one wrote"""
+        meal = self.repo.plan_item(
+            "user-1", date(2025, 11, 15), RecipeEntry(recipe_id="r1")
+        )
+
+        repo = AsyncMealRepository()
+        updated = await repo.remove_recipe(meal.id, "user-1", "r1")
+        streamed = [m async for m in repo.iter_read(user_id="user-1")]
+
+        self.assertEqual(updated.items, [])
+        self.assertEqual([m.id for m in streamed], [meal.id])
+        self.assertIsNone(
+            await repo.append_item(meal.id, "user-2", RecipeEntry(recipe_id="r2"))
+        )
+
+
+class TestMatches(unittest.TestCase):
+    """Query operators on documents"""
+
+    def test_operators(self):
+        """Test operators through arrays of subdocuments"""
+        document = {
+            "items": [{"id": "a", "bought": True}, {"id": "b"}],
+            "tags": ["x", "y"],
+        }
+
+        self.assertTrue(matches(document, {"items.id": {"$all": ["a", "b"]}}))
+        self.assertFalse(matches(document, {"items.id": {"$all": ["a", "c"]}}))
+        self.assertTrue(
+            matches(document, {"items": {"$elemMatch": {"id": "b", "bought": None}}})
+        )
+        self.assertTrue(
+            matches(document, {"tags": {"$nin": ["z"]}, "title": {"$exists": False}})
+        )
+        self.assertTrue(matches(document, {"tags": {"$not": {"$regex": "^z"}}}))
+        self.assertTrue(
+            matches(document, {"$or": [{"tags": "z"}, {"items.bought": True}]})
+        )
+        self.assertFalse(matches(document, {"$nor": [{"tags": "x"}]}))
+        with self.assertRaises(ValueError):
+            matches(document, {"$where": "true"})
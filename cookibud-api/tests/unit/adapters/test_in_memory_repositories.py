@@ -0,0 +1,84 @@
+"""Unit tests for the in-memory repositories and use cases running on them."""
+
+import unittest
+from datetime import date
+
+from adapters.in_memory.catalog_repository import (
+    AsyncCatalogRepository,
+    CatalogRepository,
+)
+from adapters.in_memory.grocery_list_repository import GroceryListRepository
+from adapters.in_memory.meal_repository import MealRepository
+from adapters.in_memory.recipe_repository import AsyncRecipeRepository, RecipeRepository
+from adapters.in_memory.store import clear_tables
+from entities.meal import RecipeEntry
+from entities.recipe import Ingredient, Recipe, Review
+from use_cases.grocery_lists import (
+    GenerateGroceryListUseCase,
+    UpdateGroceryListItemsStatusUseCase,
+)
+
+
+class TestInMemoryRepositories(unittest.IsolatedAsyncioTestCase):
+    """Repository-specific updates and a use case running end to end"""
+
+    def setUp(self):
+        clear_tables()
+        self.addCleanup(clear_tables)
+
+    async def test_add_review_keeps_latest_and_aggregates(self):
+        """Test reviews update the rating aggregates and keep the latest five"""
+        recipe = RecipeRepository().create(Recipe(title="Soup", ingredients=[]))
+        repo = AsyncRecipeRepository()
+
+        for rating in (1, 2, 3, 4, 5, 5):
+            self.assertTrue(await repo.add_review(recipe.id, Review(rating=rating)))
+
+        updated = (await repo.read(id=recipe.id))[0]
+        self.assertEqual([r.rating for r in updated.reviews], [2, 3, 4, 5, 5])
+        self.assertEqual((updated.rating_count, updated.rating_sum), (6, 20))
+        self.assertAlmostEqual(updated.rating_avg, 20 / 6)
+        self.assertFalse(await repo.add_review("missing", Review(rating=3)))
+
+    async def test_increment_forgets_unused_names(self):
+        """Test catalog counts are upserted and dropped at zero"""
+        CatalogRepository().increment("tag", {"soup": 2, "sweet": 1})
+        repo = AsyncCatalogRepository()
+
+        await repo.increment("tag", {"soup": -1, "sweet": -1, "veggie": 0})
+
+        entries = await repo.read(kind="tag")
+        self.assertEqual([(e.name, e.count) for e in entries], [("soup", 1)])
+
+    def test_generate_then_check_items(self):
+        """Test generating a grocery list from planned meals, then checking items"""
+        recipes, meals, groceries = (
+            RecipeRepository(),
+            MealRepository(),
+            GroceryListRepository(),
+        )
+        soup = recipes.create(
+            Recipe(
+                title="Soup",
+                ingredients=[Ingredient(name="Carrot", quantity=2, unit="")],
+            )
+        )
+        meals.plan_item(
+            "user-1", date(2025, 11, 3), RecipeEntry(recipe_id=soup.id, servings=2)
+        )
+        meals.plan_item("user-1", date(2025, 12, 1), RecipeEntry(recipe_id=soup.id))
+
+        grocery = GenerateGroceryListUseCase(groceries, meals, recipes)(
+            date(2025, 11, 1), date(2025, 11, 30), "user-1"
+        )
+        item_ids = [item.id for item in grocery.items]
+        updated = UpdateGroceryListItemsStatusUseCase(groceries)(
+            grocery.id, item_ids, True, "user-1"
+        )
+
+        self.assertEqual(len(item_ids), 1)
+        self.assertTrue(all(item.bought for item in updated.items))
+        self.assertIsNone(groceries.set_items_bought(grocery.id, "user-2", True))
+        self.assertIsNone(
+            groceries.set_items_bought(grocery.id, "user-1", True, ["missing"])
+        )
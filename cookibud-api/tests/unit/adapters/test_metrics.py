@@ -0,0 +1,125 @@
+"""Unit tests for the metrics registry and the MongoDB operation instrumentation."""
+
+import unittest
+
+from adapters.metrics import Registry
+from adapters.mongodb.instrumentation import (
+    OPERATION_DOCUMENTS,
+    OPERATION_DURATION,
+    timed,
+)
+
+
+class TestRegistry(unittest.TestCase):
+    """Prometheus text rendering of the metrics"""
+
+    def setUp(self):
+        self.registry = Registry()
+
+    def test_renders_counters_with_labels(self):
+        """Test counters are rendered with their help, type and escaped labels"""
+        counter = self.registry.counter("lookups_total", "Lookups", ("cache",))
+        counter.inc(cache='tags "all"')
+        counter.inc(2, cache='tags "all"')
+
+        self.assertEqual(
+            self.registry.render(),
+            "# HELP lookups_total Lookups\n# TYPE lookups_total counter\n"
+            'lookups_total{cache="tags \\"all\\""} 3\n',
+        )
+
+    def test_renders_cumulative_histogram_buckets(self):
+        """Test histogram buckets are cumulative and end with +Inf"""
+        histogram = self.registry.histogram("latency", "Latency", buckets=(0.1, 1.0))
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(3)
+
+        lines = self.registry.render().splitlines()
+        self.assertIn('latency_bucket{le="0.1"} 1', lines)
+        self.assertIn('latency_bucket{le="1"} 2', lines)
+        self.assertIn('latency_bucket{le="+Inf"} 3', lines)
+        self.assertIn("latency_sum 3.55", lines)
+        self.assertIn("latency_count 3", lines)
+
+    def test_registers_metrics_once(self):
+        """Test registering a name twice returns the existing metric"""
+        first = self.registry.gauge("in_flight", "In flight")
+
+        self.assertIs(self.registry.gauge("in_flight", "In flight"), first)
+
+    def test_skips_unavailable_callback_gauges(self):
+        """Test a gauge whose source raises exports no sample"""
+        self.registry.gauge("threads", "Threads", callback=lambda: 1 / 0)
+
+        self.assertEqual(
+            self.registry.render(), "# HELP threads Threads\n# TYPE threads gauge\n"
+        )
+
+
+class _Repository:
+    """Stand-in repository with instrumented operations"""
+
+    collection = "Tests"
+
+    @timed
+    def read(self):
+        return ["a", "b"]
+
+    @timed
+    def count(self):
+        return 2
+
+    @timed
+    def iter_read(self):
+        yield from ["a", "b", "c"]
+
+    @timed
+    async def create(self):
+        return {"id": "a"}
+
+
+class TestTimed(unittest.IsolatedAsyncioTestCase):
+    """Operation timings and document counts of the repositories"""
+
+    def setUp(self):
+        OPERATION_DURATION.clear()
+        OPERATION_DOCUMENTS.clear()
+
+    def _documents(self, operation: str) -> float:
+        return OPERATION_DOCUMENTS.value(collection="Tests", operation=operation)
+
+    def test_counts_returned_documents(self):
+        """Test lists count their elements and counts are not documents"""
+        _Repository().read()
+        _Repository().count()
+
+        self.assertEqual(
+            OPERATION_DURATION.count(collection="Tests", operation="read"), 1
+        )
+        self.assertEqual(self._documents("read"), 2)
+        self.assertEqual(
+            OPERATION_DURATION.count(collection="Tests", operation="count"), 1
+        )
+        self.assertEqual(self._documents("count"), 0)
+
+    def test_counts_streamed_documents(self):
+        """Test generators are observed once, when closed, with the documents consumed"""
+        elements = _Repository().iter_read()
+        next(elements)
+        next(elements)
+        elements.close()
+
+        self.assertEqual(
+            OPERATION_DURATION.count(collection="Tests", operation="iter_read"), 1
+        )
+        self.assertEqual(self._documents("iter_read"), 2)
+
+    async def test_times_coroutines(self):
+        """Test async operations are timed once awaited"""
+        self.assertEqual(await _Repository().create(), {"id": "a"})
+
+        self.assertEqual(
+            OPERATION_DURATION.count(collection="Tests", operation="create"), 1
+        )
+        self.assertEqual(self._documents("create"), 1)
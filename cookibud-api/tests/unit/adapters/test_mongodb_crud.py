@@ -0,0 +1,221 @@
+"""Unit tests for the MongoDB CRUD base class."""
+
+import unittest
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+from bson import ObjectId
+
+from adapters.mongodb import crud
+from entities.meal import Meal
+from entities.recipe import Recipe
+
+
+class TestCRUD(unittest.TestCase):
+    """Queries sent to the collection by the MongoDB CRUD"""
+
+    def setUp(self):
+        self.collection = MagicMock()
+        patcher = patch.object(crud, "Collection")
+        collection_cls = patcher.start()
+        collection_cls.return_value.__enter__.return_value = self.collection
+        self.addCleanup(patcher.stop)
+        self.repo = crud.CRUD("mongodb://test", "Recipes", class_type=Recipe)
+
+    def test_read_converts_id_operators(self):
+        """Test operator filters on id are converted to ObjectIds"""
+        oid = ObjectId()
+        self.collection.find.return_value = []
+
+        self.repo.read(id={"$in": [str(oid), "not-an-oid"]})
+
+        self.collection.find.assert_called_once_with(
+            {"_id": {"$in": [oid, "not-an-oid"]}}, None
+        )
+
+    def test_read_converts_date_filters(self):
+        """Test dates in filters are compared as the midnight datetimes stored"""
+        self.collection.find.return_value = []
+
+        self.repo.read(date={"$gte": date(2024, 1, 1), "$lte": date(2024, 1, 31)})
+
+        self.collection.find.assert_called_once_with(
+            {"date": {"$gte": datetime(2024, 1, 1), "$lte": datetime(2024, 1, 31)}},
+            None,
+        )
+
+    def test_create_stores_dates_as_datetimes(self):
+        """Test date fields are converted for BSON and read back as dates"""
+        repo = crud.CRUD("mongodb://test", "Meals", class_type=Meal)
+        self.collection.insert_one.return_value.inserted_id = ObjectId()
+
+        meal = repo.create(Meal(date="2024-01-01", items=[], user_id="user123"))
+
+        document = self.collection.insert_one.call_args.args[0]
+        self.assertEqual(document["date"], datetime(2024, 1, 1))
+        self.assertEqual(meal.date, date(2024, 1, 1))
+
+    def test_read_after_keyset(self):
+        """Test `_after` adds the id tie-breaker and filters elements after the cursor"""
+        oid = ObjectId()
+        cursor = MagicMock()
+        self.collection.find.return_value = cursor
+        cursor.sort.return_value = cursor
+        cursor.limit.return_value = cursor
+        cursor.__iter__.return_value = iter([])
+
+        self.repo.read(
+            tags="quick",
+            _sort=[("created_at", -1)],
+            _after=["2025-01-01", str(oid)],
+            _limit=2,
+        )
+
+        self.collection.find.assert_called_once_with(
+            {
+                "$and": [
+                    {"tags": "quick"},
+                    {
+                        "$or": [
+                            # null values are sorted last in decreasing order
+                            {
+                                "$or": [
+                                    {"created_at": {"$lt": "2025-01-01"}},
+                                    {"created_at": None},
+                                ]
+                            },
+                            {"created_at": "2025-01-01", "_id": {"$lt": oid}},
+                        ]
+                    },
+                ]
+            },
+            None,
+        )
+        cursor.sort.assert_called_once_with([("created_at", -1), ("_id", -1)])
+
+    def test_read_first_keyset_page(self):
+        """Test a first keyset page only adds the tie-breaker"""
+        cursor = MagicMock()
+        self.collection.find.return_value = cursor
+        cursor.sort.return_value = cursor
+        cursor.__iter__.return_value = iter([])
+
+        self.repo.read(_sort=[("title", 1)], _after=None)
+
+        self.collection.find.assert_called_once_with({}, None)
+        cursor.sort.assert_called_once_with([("title", 1), ("_id", 1)])
+
+    def test_read_after_null_sort_value(self):
+        """Test a cursor on a null value continues with the other nulls, then stops"""
+        oid = ObjectId()
+        cursor = MagicMock()
+        self.collection.find.return_value = cursor
+        cursor.sort.return_value = cursor
+        cursor.__iter__.return_value = iter([])
+
+        self.repo.read(_sort=[("prep_time", 1)], _after=[None, str(oid)])
+
+        # nulls are sorted first: every non-null value follows
+        self.collection.find.assert_called_once_with(
+            {
+                "$or": [
+                    {"prep_time": {"$ne": None}},
+                    {"prep_time": None, "_id": {"$gt": oid}},
+                ]
+            },
+            None,
+        )
+
+    def test_read_after_text_score(self):
+        """Test relevance pages are read with an aggregation filtering on the score"""
+        oid = ObjectId()
+        self.collection.aggregate.return_value = [
+            {"_id": oid, "title": "Cake", "score": 1.5}
+        ]
+
+        res = self.repo.read(
+            **{"$text": {"$search": "cake"}},
+            _sort=[("score", {"$meta": "textScore"})],
+            _after=[2.0, str(oid)],
+            _limit=3,
+            _fields=["title"],
+        )
+
+        self.collection.find.assert_not_called()
+        self.collection.aggregate.assert_called_once_with(
+            [
+                {"$match": {"$text": {"$search": "cake"}}},
+                {"$addFields": {"score": {"$meta": "textScore"}}},
+                {
+                    "$match": {
+                        "$or": [
+                            {"$or": [{"score": {"$lt": 2.0}}, {"score": None}]},
+                            {"score": 2.0, "_id": {"$lt": oid}},
+                        ]
+                    }
+                },
+                {"$sort": {"score": -1, "_id": -1}},
+                {"$limit": 3},
+                {"$project": {"title": 1, "score": 1}},
+            ]
+        )
+        self.assertEqual(res, [{"id": str(oid), "title": "Cake", "score": 1.5}])
+
+    def test_read_fields_projection(self):
+        """Test `_fields` projects the query and returns partial documents as dicts"""
+        oid = ObjectId()
+        self.collection.find.return_value = [{"_id": oid, "title": "Cake"}]
+
+        res = self.repo.read(tags="quick", _fields=["title", "reviews.rating"])
+
+        self.collection.find.assert_called_once_with(
+            {"tags": "quick"}, {"title": 1, "reviews.rating": 1}
+        )
+        self.assertEqual(res, [{"id": str(oid), "title": "Cake"}])
+
+    def test_iter_read_streams_in_batches(self):
+        """Test iter_read yields entities from a cursor fetching batches"""
+        oid = ObjectId()
+        self.collection.find.return_value = [
+            {"_id": oid, "title": "Cake", "ingredients": []}
+        ]
+
+        documents = self.repo.iter_read(tags="quick")
+
+        self.collection.find.assert_not_called()
+        self.assertEqual([r.id for r in documents], [str(oid)])
+        self.collection.find.assert_called_once_with(
+            {"tags": "quick"}, None, batch_size=crud.ITER_BATCH_SIZE
+        )
+
+    def test_read_many_single_query_in_order(self):
+        """Test read_many issues one $in query and aligns results with ids"""
+        first, second, missing = ObjectId(), ObjectId(), ObjectId()
+        self.collection.find.return_value = [
+            {"_id": second, "title": "Soup", "ingredients": []},
+            {"_id": first, "title": "Cake", "ingredients": []},
+        ]
+
+        res = self.repo.read_many([str(first), str(missing), str(second)])
+
+        self.collection.find.assert_called_once_with(
+            {"_id": {"$in": [first, missing, second]}}
+        )
+        self.assertEqual([r and r.title for r in res], ["Cake", None, "Soup"])
+
+    def test_read_many_without_ids(self):
+        """Test read_many does not query MongoDB for an empty id list"""
+        self.assertEqual(self.repo.read_many([]), [])
+        self.collection.find.assert_not_called()
+
+    def test_count_uses_count_documents(self):
+        """Test count runs count_documents on the filters, ignoring pagination helpers"""
+        self.collection.count_documents.return_value = 42
+
+        res = self.repo.count(tags={"$in": ["quick"]}, _skip=10, _limit=5)
+
+        self.assertEqual(res, 42)
+        self.collection.count_documents.assert_called_once_with(
+            {"tags": {"$in": ["quick"]}}
+        )
+        self.collection.find.assert_not_called()
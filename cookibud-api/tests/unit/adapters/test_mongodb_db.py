@@ -0,0 +1,46 @@
+"""Unit tests for the shared MongoDB client pool."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from adapters.mongodb import db
+
+
+class TestSharedClient(unittest.TestCase):
+    """Clients are created once per URI and reused by every Collection"""
+
+    def setUp(self):
+        patcher = patch.object(
+            db, "MongoClient", side_effect=lambda *a, **k: MagicMock()
+        )
+        self.mongo_client = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(db.close_clients)
+
+    def test_connect_reuses_client_per_uri(self):
+        """Test connecting twice to the same uri creates a single client"""
+        first = db.connect("mongodb://a", maxPoolSize=10)
+        second = db.connect("mongodb://a", maxPoolSize=50)
+        other = db.connect("mongodb://b")
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.mongo_client.assert_any_call("mongodb://a", maxPoolSize=10)
+        self.assertEqual(self.mongo_client.call_count, 2)
+
+    def test_collection_does_not_close_client(self):
+        """Test leaving a Collection context keeps the pooled client open"""
+        client = db.connect("mongodb://a")
+        with db.Collection("mongodb://a", "Recipes"):
+            pass
+
+        client.close.assert_not_called()
+        self.assertEqual(self.mongo_client.call_count, 1)
+
+    def test_close_clients(self):
+        """Test closing clients releases them so the next call reconnects"""
+        client = db.connect("mongodb://a")
+        db.close_clients()
+
+        client.close.assert_called_once()
+        self.assertIsNot(db.get_client("mongodb://a"), client)
@@ -0,0 +1,59 @@
+"""Unit tests for the MongoDB grocery list repository."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from bson import ObjectId
+from pymongo import ReturnDocument
+
+from adapters.mongodb import grocery_list_repository
+from adapters.mongodb.grocery_list_repository import GroceryListRepository
+
+
+class TestSetItemsBought(unittest.TestCase):
+    """Atomic item status updates sent to the collection"""
+
+    def setUp(self):
+        self.collection = MagicMock()
+        patcher = patch.object(grocery_list_repository, "Collection")
+        collection_cls = patcher.start()
+        collection_cls.return_value.__enter__.return_value = self.collection
+        self.addCleanup(patcher.stop)
+        self.repo = GroceryListRepository("mongodb://test")
+        self.oid = ObjectId()
+
+    def test_selected_items_with_array_filters(self):
+        """Test selected items are updated in place, filtered on owner and item presence"""
+        self.collection.find_one_and_update.return_value = {
+            "_id": self.oid,
+            "user_id": "user-123",
+            "items": [{"id": "it-1", "name": "Carrot", "bought": True}],
+        }
+
+        updated = self.repo.set_items_bought(str(self.oid), "user-123", True, ["it-1"])
+
+        self.collection.find_one_and_update.assert_called_once_with(
+            filter={
+                "_id": self.oid,
+                "user_id": "user-123",
+                "items.id": {"$all": ["it-1"]},
+            },
+            update={"$set": {"items.$[item].bought": True}},
+            array_filters=[{"item.id": {"$in": ["it-1"]}}],
+            return_document=ReturnDocument.AFTER,
+        )
+        self.assertEqual(updated.id, str(self.oid))
+        self.assertTrue(updated.items[0].bought)
+
+    def test_all_items(self):
+        """Test every item is updated with the all-positional operator"""
+        self.collection.find_one_and_update.return_value = None
+
+        updated = self.repo.set_items_bought(str(self.oid), "user-123", False)
+
+        self.collection.find_one_and_update.assert_called_once_with(
+            filter={"_id": self.oid, "user_id": "user-123"},
+            update={"$set": {"items.$[].bought": False}},
+            return_document=ReturnDocument.AFTER,
+        )
+        self.assertIsNone(updated)
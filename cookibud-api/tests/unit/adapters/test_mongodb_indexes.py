@@ -0,0 +1,103 @@
+"""Unit tests for the declarative MongoDB index management."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from pymongo import ASCENDING, IndexModel
+
+from adapters.mongodb import crud
+from adapters.mongodb.indexes import compare_indexes, has_drift, index_report
+from adapters.mongodb.recipe_repository import RecipeRepository
+from adapters.mongodb.user_repository import UserRepository
+
+
+class TestCompareIndexes(unittest.TestCase):
+    """Drift between declared indexes and `index_information`"""
+
+    def test_up_to_date(self):
+        """Test existing indexes matching the declarations report no drift"""
+        declared = [IndexModel([("username", ASCENDING)], name="username", unique=True)]
+        existing = {
+            "_id_": {"key": [("_id", 1)], "v": 2},
+            "username": {"key": [("username", 1)], "unique": True, "v": 2},
+        }
+
+        report = compare_indexes(declared, existing)
+
+        self.assertEqual(report, {"missing": [], "extra": [], "changed": []})
+        self.assertFalse(has_drift({"Users": report}))
+
+    def test_missing_extra_and_changed(self):
+        """Test missing, undeclared and redefined indexes are all reported"""
+        declared = [
+            IndexModel([("username", ASCENDING)], name="username", unique=True),
+            IndexModel([("email", ASCENDING)], name="email"),
+        ]
+        existing = {
+            "username": {"key": [("username", 1)], "v": 2},
+            "legacy": {"key": [("name", 1)], "v": 2},
+        }
+
+        report = compare_indexes(declared, existing)
+
+        self.assertEqual(
+            report, {"missing": ["email"], "extra": ["legacy"], "changed": ["username"]}
+        )
+        self.assertTrue(has_drift({"Users": report}))
+
+    def test_text_index_compared_on_weights_and_language(self):
+        """Test the stored _fts/_ftsx keys of a text index do not count as drift"""
+        declared = RecipeRepository("mongodb://test").indexes
+        existing = {
+            "tags": {"key": [("tags", 1)]},
+            "ingredient_names": {"key": [("ingredients.name", 1)]},
+            "author_id": {
+                "key": [("author_id", 1)],
+                "partialFilterExpression": {"author_id": {"$type": "string"}},
+            },
+            "rating_avg": {"key": [("rating_avg", -1)]},
+            "title": {"key": [("title", 1)]},
+            "title_lower": {"key": [("title_lower", 1)]},
+            "recipe_search": {
+                "key": [("_fts", "text"), ("_ftsx", 1)],
+                "weights": {"title": 10, "ingredients.name": 5, "description": 1},
+                "default_language": "english",
+                "language_override": "language",
+            },
+        }
+
+        self.assertFalse(has_drift({"Recipes": compare_indexes(declared, existing)}))
+
+        french = RecipeRepository("mongodb://test", search_language="french").indexes
+        self.assertEqual(
+            compare_indexes(french, existing)["changed"], ["recipe_search"]
+        )
+
+
+class TestEnsureIndexes(unittest.TestCase):
+    """Index operations sent to the collection"""
+
+    def setUp(self):
+        self.collection = MagicMock()
+        patcher = patch.object(crud, "Collection")
+        collection_cls = patcher.start()
+        collection_cls.return_value.__enter__.return_value = self.collection
+        self.addCleanup(patcher.stop)
+
+    def test_ensure_creates_declared_indexes(self):
+        """Test declared indexes are created in a single call"""
+        repo = UserRepository("mongodb://test")
+        self.collection.create_indexes.return_value = ["username"]
+
+        self.assertEqual(repo.ensure_indexes(), ["username"])
+        self.collection.create_indexes.assert_called_once_with(repo.indexes)
+
+    def test_report_per_collection(self):
+        """Test the report is keyed by collection name"""
+        self.collection.index_information.return_value = {"_id_": {"key": [("_id", 1)]}}
+
+        report = index_report([UserRepository("mongodb://test")])
+
+        self.assertEqual(
+            report, {"Users": {"missing": ["username"], "extra": [], "changed": []}}
+        )
@@ -0,0 +1,95 @@
+"""Unit tests for the MongoDB meal repository."""
+
+import unittest
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from adapters.mongodb import meal_repository
+from adapters.mongodb.meal_repository import MealRepository
+from entities.meal import RecipeEntry
+
+
+class TestMealItems(unittest.TestCase):
+    """Atomic meal item updates sent to the collection"""
+
+    def setUp(self):
+        self.collection = MagicMock()
+        patcher = patch.object(meal_repository, "Collection")
+        collection_cls = patcher.start()
+        collection_cls.return_value.__enter__.return_value = self.collection
+        self.addCleanup(patcher.stop)
+        self.repo = MealRepository("mongodb://test")
+        self.oid = ObjectId()
+        self.entry = RecipeEntry(recipe_id="r1", title="Soup", servings=2)
+
+    def test_append_item_pushes_on_owned_meal(self):
+        """Test appending is a $push filtered on id and owner"""
+        self.collection.find_one_and_update.return_value = None
+
+        self.assertIsNone(self.repo.append_item(str(self.oid), "user123", self.entry))
+        self.collection.find_one_and_update.assert_called_once_with(
+            {"_id": self.oid, "user_id": "user123"},
+            {"$push": {"items": {"recipe_id": "r1", "title": "Soup", "servings": 2}}},
+            upsert=False,
+            return_document=ReturnDocument.AFTER,
+        )
+
+    def test_remove_recipe_pulls_entries(self):
+        """Test removing is a $pull of every entry of the recipe"""
+        self.collection.find_one_and_update.return_value = {
+            "_id": self.oid,
+            "date": datetime(2024, 1, 1),
+            "items": [],
+            "user_id": "user123",
+        }
+
+        meal = self.repo.remove_recipe(str(self.oid), "user123", "r1")
+
+        self.assertEqual(
+            self.collection.find_one_and_update.call_args.args[1],
+            {"$pull": {"items": {"recipe_id": "r1"}}},
+        )
+        self.assertEqual(meal.id, str(self.oid))
+
+    def test_plan_item_upserts_on_user_and_date(self):
+        """Test planning upserts the meal keyed on (user_id, date)"""
+        self.collection.find_one_and_update.return_value = {
+            "_id": self.oid,
+            "date": datetime(2024, 1, 1),
+            "items": [self.entry.model_dump()],
+            "user_id": "user123",
+        }
+
+        meal = self.repo.plan_item("user123", date(2024, 1, 1), self.entry)
+
+        # dates are stored as midnight datetimes, BSON has no date-only type
+        self.collection.find_one_and_update.assert_called_once_with(
+            {"user_id": "user123", "date": datetime(2024, 1, 1)},
+            {"$push": {"items": self.entry.model_dump()}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        self.assertEqual(meal.items, [self.entry])
+
+    def test_plan_item_concurrent_insert(self):
+        """Test a duplicate key on upsert appends to the meal created concurrently"""
+        document = {
+            "_id": self.oid,
+            "date": datetime(2024, 1, 1),
+            "items": [],
+            "user_id": "user123",
+        }
+        self.collection.find_one_and_update.side_effect = [
+            DuplicateKeyError("dup"),
+            document,
+        ]
+
+        meal = self.repo.plan_item("user123", date(2024, 1, 1), self.entry)
+
+        self.assertEqual(self.collection.find_one_and_update.call_count, 2)
+        self.assertFalse(self.collection.find_one_and_update.call_args.kwargs["upsert"])
+        self.assertEqual(meal.id, str(self.oid))
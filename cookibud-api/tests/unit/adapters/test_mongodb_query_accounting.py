@@ -0,0 +1,81 @@
+"""Unit tests for the per-request accounting of the repository queries."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from bson import ObjectId
+
+from adapters.mongodb import crud, grocery_list_repository
+from adapters.mongodb.grocery_list_repository import GroceryListRepository
+from adapters.mongodb.instrumentation import (
+    QueryBudgetExceeded,
+    account_queries,
+    current_account,
+)
+from use_cases.grocery_lists import UpdateGroceryListItemsStatusUseCase
+
+
+class TestQueryAccounting(unittest.TestCase):
+    """Queries, documents and repeated shapes accounted while an account is active"""
+
+    def setUp(self):
+        self.collection = MagicMock()
+        for module in (crud, grocery_list_repository):
+            patcher = patch.object(module, "Collection")
+            collection_cls = patcher.start()
+            collection_cls.return_value.__enter__.return_value = self.collection
+            self.addCleanup(patcher.stop)
+        self.repo = GroceryListRepository("mongodb://test")
+        self.oid = ObjectId()
+        self.document = {
+            "_id": self.oid,
+            "user_id": "user-123",
+            "items": [{"id": "it-1", "name": "Carrot", "bought": True}],
+        }
+
+    def test_status_update_is_one_query(self):
+        """Test updating item statuses stays within a budget of one query"""
+        self.collection.find_one_and_update.return_value = dict(self.document)
+
+        with account_queries(budget=1, max_repeats=1, strict=True) as account:
+            UpdateGroceryListItemsStatusUseCase(self.repo)(
+                str(self.oid), "user-123", True, ["it-1"]
+            )
+
+        self.assertEqual(account.queries, 1)
+        self.assertEqual(account.documents, 1)
+        self.assertIsNone(current_account())
+
+    def test_repeated_query_shapes_fail_strict_accounts(self):
+        """Test reading lists one by one is reported as N+1 queries"""
+        self.collection.find.return_value.limit.return_value = []
+
+        with self.assertRaisesRegex(
+            QueryBudgetExceeded, "GroceryLists.read repeated 3 times"
+        ):
+            with account_queries(max_repeats=2, strict=True):
+                for grocery_id in ("a", "b", "c"):
+                    self.repo.read(id=grocery_id, user_id="user-123")
+
+    def test_shapes_ignore_values(self):
+        """Test the same filters with other values share a shape, other filters do not"""
+        self.collection.find.return_value = []
+
+        with account_queries() as account:
+            self.repo.read(user_id="user-1")
+            self.repo.read(user_id="user-2")
+            self.repo.read(user_id={"$in": ["user-1"]})
+
+        self.assertEqual(sorted(account.shapes.values()), [1, 2])
+        self.assertEqual(
+            account.problems(budget=2), ["3 queries, over the budget of 2"]
+        )
+
+    def test_warns_without_strict(self):
+        """Test budget overruns are logged when the account is not strict"""
+        self.collection.count_documents.return_value = 0
+
+        with self.assertLogs("adapters.mongodb.instrumentation", "WARNING"):
+            with account_queries(budget=1):
+                self.repo.count(user_id="user-1")
+                self.repo.count(user_id="user-2")
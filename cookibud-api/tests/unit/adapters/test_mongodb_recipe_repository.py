@@ -0,0 +1,51 @@
+"""Unit tests for the MongoDB recipe repository."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from bson import ObjectId
+
+from adapters.mongodb import recipe_repository
+from adapters.mongodb.recipe_repository import RecipeRepository
+from entities.recipe import Review
+
+
+class TestAddReview(unittest.TestCase):
+    """Review appends sent to the collection"""
+
+    def setUp(self):
+        self.collection = MagicMock()
+        patcher = patch.object(recipe_repository, "Collection")
+        collection_cls = patcher.start()
+        collection_cls.return_value.__enter__.return_value = self.collection
+        self.addCleanup(patcher.stop)
+        self.repo = RecipeRepository("mongodb://test")
+
+    def test_add_review_single_update(self):
+        """Test the review and the rating aggregates are written by one update"""
+        oid = ObjectId()
+        review = Review(id="rev1", user_id="u1", rating=4)
+        self.collection.update_one.return_value.matched_count = 1
+
+        self.assertTrue(self.repo.add_review(str(oid), review))
+
+        self.collection.update_one.assert_called_once()
+        query, pipeline = self.collection.update_one.call_args.args
+        self.assertEqual(query, {"_id": oid})
+        counters = pipeline[0]["$set"]
+        self.assertEqual(
+            counters["rating_count"], {"$add": [{"$ifNull": ["$rating_count", 0]}, 1]}
+        )
+        self.assertEqual(
+            counters["rating_sum"], {"$add": [{"$ifNull": ["$rating_sum", 0]}, 4]}
+        )
+        self.assertEqual(
+            pipeline[1],
+            {"$set": {"rating_avg": {"$divide": ["$rating_sum", "$rating_count"]}}},
+        )
+
+    def test_add_review_unknown_recipe(self):
+        """Test an unmatched recipe is reported"""
+        self.collection.update_one.return_value.matched_count = 0
+
+        self.assertFalse(self.repo.add_review(str(ObjectId()), Review(rating=5)))
@@ -0,0 +1,90 @@
+"""Unit tests for the benchmark runner, results comparison and datasets."""
+
+import unittest
+
+from adapters.in_memory.recipe_repository import RecipeRepository
+from adapters.in_memory.store import clear_tables
+from benchmarks.datasets import Scale, seed
+from benchmarks.runner import Benchmark, compare, run, summarize
+
+
+def _results(**medians) -> dict:
+    return {
+        "benchmarks": {name: {"median": median} for name, median in medians.items()}
+    }
+
+
+class TestRunner(unittest.TestCase):
+    """Timing and comparison of benchmarks"""
+
+    def test_summarize_statistics(self):
+        """Test durations are summarized with their median and percentiles"""
+        stats = summarize([0.4, 0.1, 0.2, 0.3])
+        self.assertEqual(stats["iterations"], 4)
+        self.assertEqual((stats["min"], stats["max"]), (0.1, 0.4))
+        self.assertAlmostEqual(stats["median"], 0.25)
+        self.assertAlmostEqual(stats["ops_per_second"], 4.0)
+
+    def test_run_sync_and_async_benchmarks(self):
+        """Test sync and asyncio benchmarks run their warmup and iterations"""
+        calls = []
+
+        async def async_operation():
+            calls.append("async")
+
+        async def teardown():
+            calls.append("teardown")
+
+        results = run(
+            [
+                Benchmark("sync", lambda: calls.append("sync"), iterations=3, warmup=1),
+                Benchmark("async", async_operation, iterations=2, warmup=0),
+            ],
+            report=lambda _: None,
+            teardown=teardown,
+        )
+
+        self.assertEqual(calls, ["sync"] * 4 + ["async"] * 2 + ["teardown"])
+        self.assertEqual(results["sync"]["iterations"], 3)
+        self.assertEqual(results["async"]["iterations"], 2)
+
+    def test_compare_flags_changes_beyond_threshold(self):
+        """Test regressions, improvements, new and missing benchmarks are reported"""
+        baseline = _results(slower=1.0, faster=1.0, same=1.0, removed=1.0)
+        current = _results(slower=1.5, faster=0.5, same=1.05, added=1.0)
+
+        statuses = {
+            row["name"]: row["status"] for row in compare(baseline, current, 0.1)
+        }
+
+        self.assertEqual(
+            statuses,
+            {
+                "slower": "regression",
+                "faster": "improvement",
+                "same": "unchanged",
+                "removed": "missing",
+                "added": "new",
+            },
+        )
+
+
+class TestDatasets(unittest.TestCase):
+    """Seeding of the in-memory adapter"""
+
+    def setUp(self):
+        clear_tables()
+        self.addCleanup(clear_tables)
+
+    def test_seed_is_deterministic(self):
+        """Test the same seed generates the same recipes"""
+        scale = Scale(recipes=20, users=2, meal_years=1, grocery_items=5)
+
+        dataset = seed(scale, seed_value=3)
+        titles = [recipe.title for recipe in RecipeRepository().read()]
+        seed(scale, seed_value=3)
+
+        self.assertEqual(len(titles), 20)
+        self.assertEqual([recipe.title for recipe in RecipeRepository().read()], titles)
+        self.assertEqual(len(dataset.item_ids), 5)
+        self.assertTrue(dataset.recipes)
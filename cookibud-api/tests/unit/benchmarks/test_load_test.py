@@ -0,0 +1,64 @@
+"""Unit tests for the load-test harness."""
+
+import asyncio
+import unittest
+
+from adapters.in_memory.store import clear_tables
+from benchmarks.cases import app_container
+from benchmarks.datasets import Scale, seed
+from benchmarks.load import LoadStats, Stage, load_client, run_stage
+
+
+class TestLoadStats(unittest.TestCase):
+    """Stages and summaries of their requests"""
+
+    def test_parse_stage(self):
+        """Test stages are written users:seconds, with positive values"""
+        self.assertEqual(Stage.parse("50:30"), Stage(users=50, duration=30.0))
+        for text in ("50", "0:30", "ten:30"):
+            with self.assertRaises(ValueError):
+                Stage.parse(text)
+
+    def test_summary_per_route(self):
+        """Test percentiles, throughput and error rates are computed by route"""
+        stats = LoadStats()
+        for i in range(100):
+            stats.record("GET /recipes", (i + 1) / 1000)
+        stats.record("POST /token", 0.5, "401")
+        stats.record("POST /token", 0.3)
+
+        summary = stats.summary(elapsed=2.0)
+
+        recipes = summary["routes"]["GET /recipes"]
+        self.assertEqual(
+            (recipes["p50"], recipes["p95"], recipes["p99"]), (0.051, 0.096, 0.1)
+        )
+        self.assertEqual(recipes["throughput"], 50.0)
+        self.assertEqual(summary["routes"]["POST /token"]["error_rate"], 0.5)
+        self.assertEqual(summary["routes"]["POST /token"]["error_kinds"], {"401": 1})
+        self.assertEqual((summary["requests"], summary["errors"]), (102, 1))
+
+
+class TestVirtualUsers(unittest.TestCase):
+    """Journeys against the application in-process"""
+
+    def setUp(self):
+        clear_tables()
+        self.addCleanup(clear_tables)
+
+    def test_journeys_succeed(self):
+        """Test virtual users go through every step of their journey without errors"""
+        dataset = seed(Scale(recipes=50, users=3, meal_years=1, grocery_items=5))
+
+        async def load_test():
+            async with load_client() as client:
+                return await run_stage(client, dataset, Stage(users=2, duration=2.0))
+
+        with app_container("in_memory"):
+            summary = asyncio.run(load_test())
+
+        self.assertGreater(summary["journeys"], 0)
+        self.assertEqual(summary["errors"], 0)
+        self.assertIn(
+            "PATCH /groceries/{grocery_id}/items/{item_id}", summary["routes"]
+        )
@@ -0,0 +1,115 @@
+"""Unit tests for the synthetic data generator and its loaders."""
+
+import json
+import os
+import random
+import tempfile
+import unittest
+
+from adapters.in_memory.meal_repository import MealRepository
+from adapters.in_memory.recipe_repository import RecipeRepository
+from adapters.in_memory.store import clear_tables
+from adapters.mongodb.recipe_repository import with_title_key
+from benchmarks.loader import load_in_memory, write_ndjson
+from benchmarks.synthetic import GeneratorConfig, SyntheticData, power_law_index
+from entities.grocery_list import GroceryList
+from entities.meal import Meal
+from entities.recipe import Recipe, Review
+from entities.user import User
+
+CONFIG = GeneratorConfig(
+    users=20, recipes=300, days=60, plan_rate=0.3, children_rate=0.5
+)
+
+
+def _entity(document: dict) -> dict:
+    """Document as an entity dumps it"""
+    return {
+        "id": str(document["_id"]),
+        **{k: v for k, v in document.items() if k != "_id"},
+    }
+
+
+class TestSyntheticData(unittest.TestCase):
+    """Generated documents"""
+
+    def setUp(self):
+        self.data = SyntheticData(CONFIG)
+
+    def test_documents_match_entities(self):
+        """Test documents are what the repositories store of the entities"""
+        recipes, _ = self.data.chunk("recipe", 0)
+        meals, _ = self.data.chunk("meal", 0)
+        checked = [
+            (Recipe, with_title_key, recipes["recipe"]),
+            (Review, dict, recipes["review"]),
+            (GroceryList, dict, meals["grocery_list"]),
+        ]
+        for entity, stored, documents in checked:
+            self.assertTrue(documents)
+            for document in documents:
+                self.assertEqual(
+                    stored(entity(**_entity(document)).model_dump()),
+                    _entity(document),
+                )
+        self.assertTrue(any(recipe["children"] for recipe in recipes["recipe"]))
+        for meal in meals["meal"]:
+            Meal(**_entity(meal))
+        User(**_entity(self.data.user(0)))
+
+    def test_chunks_are_deterministic_and_independent(self):
+        """Test a chunk is the same whether generated alone or after others"""
+        other = SyntheticData(CONFIG)
+        other.chunk("recipe", 0)
+        self.assertEqual(other.chunk("meal", 0), self.data.chunk("meal", 0))
+        seeded = SyntheticData(GeneratorConfig(**{**CONFIG.__dict__, "seed": 1}))
+        self.assertNotEqual(seeded.chunk("recipe", 0), self.data.chunk("recipe", 0))
+
+    def test_rating_aggregates_match_reviews(self):
+        """Test recipes keep their latest reviews and aggregate all of them"""
+        recipe, reviews = self.data.reviewed_recipe(0)
+        self.assertGreater(len(reviews), 5)
+        self.assertEqual(recipe["rating_count"], len(reviews))
+        self.assertEqual(
+            recipe["rating_sum"], sum(review["rating"] for review in reviews)
+        )
+        latest = [str(review["_id"]) for review in reviews[-5:]]
+        self.assertEqual([review["id"] for review in recipe["reviews"]], latest)
+
+    def test_power_law_favors_low_indexes(self):
+        """Test skewed draws concentrate on the first indexes, uniform ones do not"""
+        rng = random.Random(0)
+        skewed = [power_law_index(rng, 1000, 1.2) for _ in range(2000)]
+        uniform = [power_law_index(rng, 1000, 0) for _ in range(2000)]
+        self.assertGreater(sum(index < 10 for index in skewed), 800)
+        self.assertLess(sum(index < 10 for index in uniform), 100)
+        self.assertTrue(all(0 <= index < 1000 for index in skewed + uniform))
+
+
+class TestLoaders(unittest.TestCase):
+    """NDJSON output and in-memory loading"""
+
+    def setUp(self):
+        clear_tables()
+        self.addCleanup(clear_tables)
+
+    def test_load_in_memory(self):
+        """Test loaded documents are read by the repositories"""
+        counts = load_in_memory(SyntheticData(CONFIG))
+
+        self.assertEqual(counts["recipe"], 300)
+        self.assertEqual(RecipeRepository().count(), 300)
+        self.assertEqual(MealRepository().count(), counts["meal"])
+        self.assertGreater(counts["catalog"], 0)
+
+    def test_write_ndjson(self):
+        """Test one extended JSON document is written per line and collection"""
+        with tempfile.TemporaryDirectory() as directory:
+            counts = write_ndjson(SyntheticData(CONFIG), directory)
+            with open(
+                os.path.join(directory, "Recipes.ndjson"), encoding="utf-8"
+            ) as file:
+                lines = file.readlines()
+
+        self.assertEqual(len(lines), counts["recipe"])
+        self.assertIn("$oid", json.loads(lines[0])["_id"])
@@ -0,0 +1,70 @@
+"""Unit tests for the repositories and use cases container."""
+
+import unittest
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from adapters.in_memory.recipe_repository import AsyncRecipeRepository
+from adapters.in_memory.store import clear_tables
+from drivers.container import Container
+from drivers.main import app, build_container
+from use_cases.recipes import AsyncReadRecipesUseCase
+
+
+class TestContainer(unittest.TestCase):
+    """Resolution of the repositories and use cases at startup"""
+
+    def setUp(self):
+        clear_tables()
+        self.addCleanup(clear_tables)
+
+    def test_use_cases_share_repositories(self):
+        """Test use cases are built once, on one repository instance per adapter class"""
+        container = build_container("in_memory")
+
+        read_recipes = container.use_cases["read_recipes"]
+        self.assertIsInstance(read_recipes, AsyncReadRecipesUseCase)
+        self.assertIsInstance(read_recipes.recipe_repository, AsyncRecipeRepository)
+        self.assertIs(
+            container.use_cases["generate_grocery"].recipe_repository,
+            read_recipes.recipe_repository,
+        )
+
+    def test_unknown_adapter_fails(self):
+        """Test a misconfigured adapter fails when the container is created"""
+        with self.assertRaises(NameError):
+            Container("postgres")
+
+    def test_use_case_names_are_unique(self):
+        """Test registering a use case name twice fails"""
+        container = Container("in_memory")
+        container.register({"read_recipes": None})
+        with self.assertRaises(ValueError):
+            container.register({"read_recipes": None})
+
+    def test_routes_inject_use_cases_from_the_lifespan(self):
+        """Test sync and asyncio routes use the container resolved at startup"""
+        user = {"username": "container", "password": "secret"}
+        with TestClient(app) as client:
+            self.assertEqual(client.post("/auth/register", json=user).status_code, 201)
+            token = client.post("/token", data=user).json()["access_token"]
+            response = client.get(
+                "/recipes",
+                params={"limit": 5},
+                headers={"Authorization": f"Bearer {token}"},
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["items"], [])
+
+    def test_in_memory_adapter_does_not_connect_to_mongodb(self):
+        """Test the MongoDB pools are only opened for the mongodb adapter"""
+        with patch("drivers.main.connect") as connect, patch(
+            "drivers.main.connect_async"
+        ) as connect_async:
+            with TestClient(app):
+                pass
+
+        connect.assert_not_called()
+        connect_async.assert_not_called()
@@ -0,0 +1,80 @@
+"""Unit tests for the HTTP metrics middleware and the /metrics route."""
+
+import unittest
+from unittest.mock import patch
+
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from drivers.config import settings
+from drivers.metrics import REQUEST_DURATION, REQUESTS_IN_FLIGHT, MetricsMiddleware
+from drivers.routers import metrics
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics.router)
+
+    @app.get("/recipes/{item_id}")
+    async def read_recipe(item_id: str):
+        if item_id == "missing":
+            raise HTTPException(status_code=404)
+        return {"id": item_id}
+
+    return app
+
+
+class TestMetricsMiddleware(unittest.TestCase):
+    """Request timings by route template and status, and their export"""
+
+    def setUp(self):
+        REQUEST_DURATION.clear()
+        REQUESTS_IN_FLIGHT.clear()
+        self.client = TestClient(_app())
+
+    def test_times_requests_by_route_template(self):
+        """Test requests are labelled with the route template, not the raw path"""
+        self.client.get("/recipes/1")
+        self.client.get("/recipes/2")
+        self.client.get("/recipes/missing")
+        self.client.get("/unknown")
+
+        def count(route, status):
+            return REQUEST_DURATION.count(method="GET", route=route, status=status)
+
+        self.assertEqual(count("/recipes/{item_id}", 200), 2)
+        self.assertEqual(count("/recipes/{item_id}", 404), 1)
+        self.assertEqual(count("other", 404), 1)
+        self.assertEqual(REQUESTS_IN_FLIGHT.value(method="GET"), 0)
+
+    def test_exports_prometheus_text(self):
+        """Test /metrics renders the registry, threadpool gauges included"""
+        self.client.get("/recipes/1")
+
+        response = self.client.get("/metrics")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(
+            response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        )
+        self.assertIn(
+            "cookibud_http_request_duration_seconds_count"
+            '{method="GET",route="/recipes/{item_id}",status="200"} 1',
+            response.text,
+        )
+        self.assertIn("cookibud_threadpool_threads_total 40", response.text)
+
+    def test_metrics_token(self):
+        """Test a configured METRICS_TOKEN is required as bearer token"""
+        with patch.object(settings, "metrics_token", "scrape-secret"):
+            anonymous = self.client.get("/metrics")
+            wrong = self.client.get(
+                "/metrics", headers={"Authorization": "Bearer nope"}
+            )
+            scraper = self.client.get(
+                "/metrics", headers={"Authorization": "Bearer scrape-secret"}
+            )
+
+        self.assertEqual((anonymous.status_code, wrong.status_code), (401, 401))
+        self.assertEqual(scraper.status_code, 200)
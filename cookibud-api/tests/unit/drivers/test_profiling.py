@@ -0,0 +1,96 @@
+"""Unit tests for the on-demand request profiling."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import jwt
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from drivers.config import settings
+from drivers.profiling import ProfilingMiddleware, category
+
+
+def _token(username: str) -> str:
+    return jwt.encode(
+        {"username": username}, settings.secret_key, algorithm=settings.algorithm
+    )
+
+
+class TestProfilingMiddleware(unittest.TestCase):
+    """Profiles are only taken for admins that ask for them"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        app = FastAPI()
+        app.add_middleware(
+            ProfilingMiddleware, admins=["admin"], directory=self.directory
+        )
+
+        @app.get("/recipes")
+        async def read_recipes():
+            return [{"title": "Pancakes"}]
+
+        self.client = TestClient(app)
+
+    def _get(self, username: str, **kwargs):
+        headers = {
+            "Authorization": f"Bearer {_token(username)}",
+            **kwargs.pop("headers", {}),
+        }
+        return self.client.get("/recipes", headers=headers, **kwargs)
+
+    def test_profiles_admin_requests(self):
+        """Test the profile is saved and its breakdown returned"""
+        response = self._get("admin", headers={"X-Profile": "1"})
+
+        self.assertEqual(response.json(), [{"title": "Pancakes"}])
+        self.assertEqual(os.listdir(self.directory), [response.headers["x-profile"]])
+        timings = response.headers["server-timing"]
+        for part in ("pydantic", "mongo", "wait", "logic"):
+            self.assertIn(f"profile-{part};dur=", timings)
+
+    def test_accepts_query_flag(self):
+        """Test ?profile=1 works like the header"""
+        response = self._get("admin", params={"profile": "1"})
+
+        self.assertIn("x-profile", response.headers)
+
+    def test_ignores_other_users_and_unflagged_requests(self):
+        """Test non-admins and requests without the flag are not profiled"""
+        responses = [
+            self._get("cook", headers={"X-Profile": "1"}),
+            self._get("admin"),
+            self._get("admin", headers={"X-Profile": "0"}),
+        ]
+
+        for response in responses:
+            self.assertNotIn("x-profile", response.headers)
+        self.assertEqual(os.listdir(self.directory), [])
+
+
+class TestCategory(unittest.TestCase):
+    """Attribution of profiled functions to pydantic, mongo, wait or logic"""
+
+    def test_categories(self):
+        """Test functions are classified by their package"""
+        site = "/usr/lib/python3/site-packages"
+        self.assertEqual(
+            category(f"{site}/pydantic/main.py", "model_validate"), "pydantic"
+        )
+        self.assertEqual(
+            category(
+                "~",
+                "<method 'validate_python' of 'pydantic_core._pydantic_core"
+                ".SchemaValidator' objects>",
+            ),
+            "pydantic",
+        )
+        self.assertEqual(category(f"{site}/pymongo/cursor.py", "next"), "mongo")
+        self.assertEqual(
+            category("~", "<method 'poll' of 'select.epoll' objects>"), "wait"
+        )
+        self.assertEqual(category("/app/use_cases/recipes.py", "__call__"), "logic")
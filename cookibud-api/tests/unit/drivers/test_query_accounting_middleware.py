@@ -0,0 +1,54 @@
+"""Unit tests for the query accounting middleware."""
+
+import unittest
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from adapters.mongodb.instrumentation import current_account
+from drivers.query_accounting import QueryAccountingMiddleware
+
+
+class TestQueryAccountingMiddleware(unittest.TestCase):
+    """Server-Timing header and budget warnings of each request"""
+
+    def setUp(self):
+        app = FastAPI()
+        app.add_middleware(QueryAccountingMiddleware, budget=2, max_repeats=1)
+
+        @app.get("/recipes/{item_id}")
+        async def read_recipe(item_id: str):
+            account = current_account()
+            for _ in range(int(item_id)):
+                account.record(("Recipes", "read", (), (("id", "?"),)), 0.002, 1)
+            return {"id": item_id}
+
+        self.client = TestClient(app)
+
+    def test_server_timing_header(self):
+        """Test the queries of the request are summed up in Server-Timing"""
+        response = self.client.get("/recipes/1")
+
+        self.assertEqual(
+            response.headers["server-timing"],
+            'mongo;dur=2.0;desc="1 queries, 1 documents"',
+        )
+
+    def test_warns_about_repeated_queries(self):
+        """Test requests over budget are logged with their route"""
+        with patch("drivers.query_accounting.logger") as logger:
+            self.client.get("/recipes/3")
+
+        messages = [call.args[1:] for call in logger.warning.call_args_list]
+        self.assertEqual(
+            messages,
+            [
+                ("GET", "/recipes/{item_id}", "3 queries, over the budget of 2"),
+                (
+                    "GET",
+                    "/recipes/{item_id}",
+                    "Recipes.read repeated 3 times with one shape",
+                ),
+            ],
+        )
@@ -0,0 +1,95 @@
+"""Unit tests for the request logging middleware."""
+
+import logging
+import unittest
+from unittest.mock import MagicMock, patch
+
+from drivers.request_logging import RequestLoggingMiddleware
+
+
+async def _echo_app(scope, receive, send):
+    """ASGI app answering with the request body, in two chunks"""
+    message = await receive()
+    content_type = scope["headers"][0][1] if scope["headers"] else b"text/plain"
+    headers = [(b"content-type", content_type)]
+    await send({"type": "http.response.start", "status": 201, "headers": headers})
+    await send(
+        {"type": "http.response.body", "body": message["body"], "more_body": True}
+    )
+    await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+class TestRequestLoggingMiddleware(unittest.IsolatedAsyncioTestCase):
+    """Sampling and body capture of the logging middleware"""
+
+    def setUp(self):
+        self.log = MagicMock(spec=logging.Logger)
+        self.log.isEnabledFor.return_value = True
+        self.sent = []
+
+    async def _call(
+        self, middleware, body: bytes, content_type: bytes = b"application/json"
+    ):
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/recipes",
+            "headers": [(b"content-type", content_type)],
+        }
+
+        async def receive():
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send(message):
+            self.sent.append(message)
+
+        await middleware(scope, receive, send)
+
+    async def test_logs_json_bodies_up_to_the_cap(self):
+        """Test JSON bodies are truncated to max_body_size and messages pass through"""
+        middleware = RequestLoggingMiddleware(_echo_app, max_body_size=8, log=self.log)
+
+        await self._call(middleware, b'{"title": "Pancakes"}')
+
+        self.assertEqual(self.sent[1]["body"], b'{"title": "Pancakes"}')
+        extra = self.log.debug.call_args.kwargs["extra"]
+        self.assertEqual(extra["status_code"], 201)
+        self.assertEqual(extra["request_body"], '{"title"…')
+        self.assertEqual(extra["response_body"], '{"title"…')
+        self.assertEqual(extra["response_size"], 21)
+
+    async def test_skips_non_json_bodies(self):
+        """Test uploads and other content types are not captured"""
+        middleware = RequestLoggingMiddleware(_echo_app, log=self.log)
+
+        await self._call(middleware, b"\x89PNG", content_type=b"image/png")
+
+        extra = self.log.debug.call_args.kwargs["extra"]
+        self.assertIsNone(extra["request_body"])
+        self.assertIsNone(extra["response_body"])
+
+    async def test_no_work_when_debug_disabled(self):
+        """Test the app is called untouched when debug logs are disabled"""
+        self.log.isEnabledFor.return_value = False
+        app = MagicMock()
+
+        async def call_app(scope, receive, send):
+            app(scope, receive, send)
+
+        middleware = RequestLoggingMiddleware(call_app, log=self.log)
+        receive, send = object(), object()
+
+        await middleware({"type": "http"}, receive, send)
+
+        app.assert_called_once_with({"type": "http"}, receive, send)
+        self.log.debug.assert_not_called()
+
+    async def test_sampling(self):
+        """Test requests out of the sample are not logged"""
+        middleware = RequestLoggingMiddleware(_echo_app, sample_rate=0.25, log=self.log)
+
+        with patch("drivers.request_logging.random.random", return_value=0.5):
+            await self._call(middleware, b"{}")
+
+        self.log.debug.assert_not_called()
+        self.assertEqual(len(self.sent), 3)
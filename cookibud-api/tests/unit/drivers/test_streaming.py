@@ -0,0 +1,67 @@
+"""Unit tests for streamed list responses."""
+
+import unittest
+from unittest.mock import MagicMock
+
+from drivers import streaming
+from entities.recipe import RecipeSummary
+
+
+async def _items(*items):
+    for item in items:
+        yield item
+
+
+async def _failing():
+    raise ValueError("Invalid period")
+    yield  # pylint: disable=unreachable
+
+
+def _request(accept: str = "") -> MagicMock:
+    request = MagicMock()
+    request.headers = {"accept": accept} if accept else {}
+    return request
+
+
+async def _body(response) -> bytes:
+    return b"".join([chunk async for chunk in response.body_iterator])
+
+
+class TestStreamResponse(unittest.IsolatedAsyncioTestCase):
+    """Serialization of streamed items"""
+
+    async def test_json_array_by_default(self):
+        """Test items are streamed as a JSON array unless NDJSON is accepted"""
+        response = await streaming.stream_response(
+            _items(RecipeSummary(id="r1", title="Cake"), {"id": "r2"}), _request("*/*")
+        )
+
+        self.assertEqual(response.media_type, "application/json")
+        body = await _body(response)
+        self.assertTrue(body.startswith(b'[{"id":"r1","title":"Cake"'))
+        self.assertTrue(body.endswith(b',{"id":"r2"}]'))
+
+    async def test_ndjson_when_accepted(self):
+        """Test one JSON document per line with Accept: application/x-ndjson"""
+        response = await streaming.stream_response(
+            _items({"id": "r1"}, {"id": "r2"}),
+            _request("application/x-ndjson, */*;q=0.1"),
+        )
+
+        self.assertEqual(response.media_type, "application/x-ndjson")
+        self.assertEqual(await _body(response), b'{"id":"r1"}\n{"id":"r2"}\n')
+
+    async def test_empty(self):
+        """Test an empty stream is an empty array, or no line at all"""
+        response = await streaming.stream_response(_items(), _request())
+        self.assertEqual(await _body(response), b"[]")
+
+        response = await streaming.stream_response(
+            _items(), _request("application/x-ndjson")
+        )
+        self.assertEqual(await _body(response), b"")
+
+    async def test_errors_before_first_item_are_raised(self):
+        """Test query errors surface before the response starts"""
+        with self.assertRaises(ValueError):
+            await streaming.stream_response(_failing(), _request())
@@ -1,13 +1,39 @@
 """Unit tests for grocery list use cases."""
 
 import unittest
-from unittest.mock import MagicMock
+from collections import defaultdict
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
 
-from adapters.ports.grocery_list_repository import GroceryListRepository
+from bson import ObjectId
+
+from adapters.mongodb import crud, grocery_list_repository
+from adapters.mongodb.grocery_list_repository import (
+    GroceryListRepository as MongoGroceryListRepository,
+)
+from adapters.mongodb.instrumentation import account_queries
+from adapters.mongodb.meal_repository import MealRepository as MongoMealRepository
+from adapters.mongodb.recipe_repository import RecipeRepository as MongoRecipeRepository
+from adapters.ports.grocery_list_repository import (
+    AsyncGroceryListRepository,
+    GroceryListRepository,
+)
+from adapters.ports.meal_repository import MealRepository
+from adapters.ports.recipe_repository import RecipeRepository
 from entities.grocery_list import GroceryItem, GroceryList
+from entities.meal import Meal, RecipeEntry
+from entities.recipe import Recipe
+from use_cases.exceptions import AccessDeniedError
 from use_cases.grocery_lists import (
+    GROCERY_NOT_FOUND_OR_DENIED,
+    ITEM_NOT_FOUND,
+    AsyncUpdateAllGroceryListItemsStatusUseCase,
+    AsyncUpdateGroceryListItemStatusUseCase,
     CreateGroceryListUseCase,
+    GenerateGroceryListUseCase,
+    ReadGroceryListByIdUseCase,
     UpdateAllGroceryListItemsStatusUseCase,
+    UpdateGroceryListItemsStatusUseCase,
     UpdateGroceryListItemStatusUseCase,
 )
 
@@ -39,25 +65,132 @@ class TestCreateGroceryList(unittest.TestCase):
         self.assertEqual(found[0].qty, 1000)
 
 
+class TestGenerateGroceryList(unittest.TestCase):
+    def setUp(self):
+        self.repo = MagicMock(spec=GroceryListRepository)
+        self.meal_repo = MagicMock(spec=MealRepository)
+        self.recipe_repo = MagicMock(spec=RecipeRepository)
+        self.repo.create.side_effect = lambda x: x
+        self.use_case = GenerateGroceryListUseCase(
+            self.repo, self.meal_repo, self.recipe_repo
+        )
+
+    def test_generate_scales_and_merges_ingredients(self):
+        self.meal_repo.read.return_value = [
+            Meal(date="2025-11-02", items=[RecipeEntry(recipe_id="r1", servings=2)]),
+            Meal(
+                date="2025-11-03",
+                items=[
+                    RecipeEntry(recipe_id="r1"),
+                    RecipeEntry(recipe_id="r2", servings=3),
+                ],
+            ),
+        ]
+        self.recipe_repo.read_many.return_value = [
+            Recipe(
+                id="r1",
+                title="Soup",
+                ingredients=[{"name": "Carrot", "quantity": 500, "unit": "g"}],
+            ),
+            Recipe(
+                id="r2",
+                title="Salad",
+                ingredients=[
+                    {"name": "Carrot", "quantity": 0.1, "unit": "kg"},
+                    {"name": "Salt"},
+                ],
+            ),
+        ]
+
+        saved = self.use_case(date(2025, 11, 1), date(2025, 11, 30), "user-123")
+
+        self.meal_repo.read.assert_called_once_with(
+            user_id="user-123",
+            date={"$gte": date(2025, 11, 1), "$lte": date(2025, 11, 30)},
+        )
+        # all recipes are loaded with a single query
+        self.recipe_repo.read_many.assert_called_once_with(["r1", "r2"])
+        self.assertEqual(saved.user_id, "user-123")
+        self.assertEqual(saved.period_start, "2025-11-01")
+        carrot, salt = saved.items
+        self.assertEqual((carrot.name, carrot.qty, carrot.unit), ("Carrot", 1800, "g"))
+        self.assertEqual(
+            carrot.entries, ["Soup ×2: 500 g", "Soup ×1: 500 g", "Salad ×3: 0.1 kg"]
+        )
+        self.assertIsNone(salt.qty)
+        self.assertTrue(all(item.id for item in saved.items))
+
+    def test_generate_without_meals(self):
+        self.meal_repo.read.return_value = []
+        self.recipe_repo.read_many.return_value = []
+
+        saved = self.use_case(date(2025, 11, 1), date(2025, 11, 30), "user-123")
+
+        self.assertEqual(saved.items, [])
+
+    def test_generate_invalid_period(self):
+        with self.assertRaises(ValueError):
+            self.use_case(date(2025, 12, 1), date(2025, 11, 30), "user-123")
+        self.meal_repo.read.assert_not_called()
+
+
 class TestUpdateGroceryItemStatus(unittest.TestCase):
     def setUp(self):
         self.repo = MagicMock(spec=GroceryListRepository)
         self.use_case = UpdateGroceryListItemStatusUseCase(self.repo)
 
     def test_update_item_status_success(self):
-        item = GroceryItem(id="it-1", name="Carrot", qty=3, unit="", bought=False)
+        item = GroceryItem(id="it-1", name="Carrot", qty=3, unit="", bought=True)
         gl = GroceryList(id="gl-1", user_id="user-123", items=[item])
-        self.repo.read.return_value = [gl]
-        self.repo.update.return_value = None
-        self.repo.read.return_value = [gl]
+        self.repo.set_items_bought.return_value = gl
 
         updated = self.use_case("gl-1", "it-1", True, "user-123")
 
-        # Check update called with new items
-        self.repo.update.assert_called()
-        # Verify the updated items have the bought flag true
-        updated_item = [i for i in updated.items if i.id == "it-1"][0]
-        self.assertTrue(updated_item.bought)
+        # one atomic update filtered on ownership, no read before or after
+        self.repo.set_items_bought.assert_called_once_with(
+            "gl-1", "user-123", True, ["it-1"]
+        )
+        self.repo.read.assert_not_called()
+        self.assertEqual(updated, gl)
+
+    def test_update_unknown_item(self):
+        self.repo.set_items_bought.return_value = None
+        self.repo.count.return_value = 1
+
+        with self.assertRaises(AccessDeniedError) as ctx:
+            self.use_case("gl-1", "missing", True, "user-123")
+        self.assertEqual(str(ctx.exception), ITEM_NOT_FOUND)
+        self.repo.count.assert_called_once_with(id="gl-1", user_id="user-123")
+
+    def test_update_list_not_owned(self):
+        self.repo.set_items_bought.return_value = None
+        self.repo.count.return_value = 0
+
+        with self.assertRaises(AccessDeniedError) as ctx:
+            self.use_case("gl-1", "it-1", True, "other-user")
+        self.assertEqual(str(ctx.exception), GROCERY_NOT_FOUND_OR_DENIED)
+
+
+class TestUpdateGroceryItemsStatus(unittest.TestCase):
+    def setUp(self):
+        self.repo = MagicMock(spec=GroceryListRepository)
+        self.use_case = UpdateGroceryListItemsStatusUseCase(self.repo)
+
+    def test_update_items_status_in_one_call(self):
+        gl = GroceryList(id="gl-1", user_id="user-123", items=[])
+        self.repo.set_items_bought.return_value = gl
+
+        updated = self.use_case("gl-1", ["it-1", "it-2"], False, "user-123")
+
+        self.repo.set_items_bought.assert_called_once_with(
+            "gl-1", "user-123", False, ["it-1", "it-2"]
+        )
+        self.assertEqual(updated, gl)
+
+    def test_update_items_requires_ids(self):
+        with self.assertRaises(ValueError):
+            self.use_case("gl-1", [], True, "user-123")
+        self.repo.set_items_bought.assert_not_called()
 
 
 class TestUpdateAllGroceryItemStatus(unittest.TestCase):
@@ -67,12 +200,156 @@ class TestUpdateAllGroceryItemStatus(unittest.TestCase):
 
     def test_update_all_items_status_success(self):
         items = [
-            GroceryItem(id="it-1", name="A", qty=1, bought=False),
-            GroceryItem(id="it-2", name="B", qty=2, bought=False),
+            GroceryItem(id="it-1", name="A", qty=1, bought=True),
+            GroceryItem(id="it-2", name="B", qty=2, bought=True),
         ]
         gl = GroceryList(id="gl-all-1", user_id="user-123", items=items)
-        self.repo.read.return_value = [gl]
+        self.repo.set_items_bought.return_value = gl
 
         updated = self.use_case("gl-all-1", True, "user-123")
-        self.repo.update.assert_called()
+
+        self.repo.set_items_bought.assert_called_once_with("gl-all-1", "user-123", True)
         self.assertTrue(all(i.bought for i in updated.items))
+
+    def test_update_all_items_access_denied(self):
+        self.repo.set_items_bought.return_value = None
+
+        with self.assertRaises(AccessDeniedError):
+            self.use_case("gl-all-1", True, "other-user")
+
+
+class TestAsyncUpdateGroceryItemStatus(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.repo = MagicMock(spec=AsyncGroceryListRepository)
+
+    async def test_update_item_status_success(self):
+        gl = GroceryList(
+            id="gl-1",
+            user_id="user-123",
+            items=[
+                GroceryItem(id="it-1", name="Carrot", bought=True),
+                GroceryItem(id="it-2", name="Leek"),
+            ],
+        )
+        self.repo.set_items_bought.return_value = gl
+
+        updated = await AsyncUpdateGroceryListItemStatusUseCase(self.repo)(
+            "gl-1", "it-1", True, "user-123"
+        )
+
+        self.repo.set_items_bought.assert_awaited_once_with(
+            "gl-1", "user-123", True, ["it-1"]
+        )
+        self.assertEqual([i.bought for i in updated.items], [True, False])
+
+    async def test_update_unknown_item(self):
+        self.repo.set_items_bought.return_value = None
+        self.repo.count.return_value = 1
+
+        with self.assertRaises(AccessDeniedError) as ctx:
+            await AsyncUpdateGroceryListItemStatusUseCase(self.repo)(
+                "gl-1", "missing", True, "user-123"
+            )
+        self.assertEqual(str(ctx.exception), ITEM_NOT_FOUND)
+
+    async def test_update_all_items_status_success(self):
+        items = [
+            GroceryItem(id="it-1", name="A", bought=True),
+            GroceryItem(id="it-2", name="B", bought=True),
+        ]
+        self.repo.set_items_bought.return_value = GroceryList(
+            id="gl-1", user_id="user-123", items=items
+        )
+
+        updated = await AsyncUpdateAllGroceryListItemsStatusUseCase(self.repo)(
+            "gl-1", True, "user-123"
+        )
+        self.repo.set_items_bought.assert_awaited_once_with("gl-1", "user-123", True)
+        self.assertTrue(all(i.bought for i in updated.items))
+
+
+class TestGroceryListQueryBudgets(unittest.TestCase):
+    """Queries of grocery list flows on the MongoDB repositories, budgeted strictly
+
+    The in-memory repositories run no queries and are not instrumented: the MongoDB
+    ones are used, on mocked collections.
+    """
+
+    def setUp(self):
+        self.collections = defaultdict(MagicMock)
+
+        def open_collection(_uri, name):
+            context = MagicMock()
+            context.__enter__.return_value = self.collections[name]
+            return context
+
+        for module in (crud, grocery_list_repository):
+            patcher = patch.object(module, "Collection", side_effect=open_collection)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.repo = MongoGroceryListRepository("mongodb://test")
+        self.grocery_id = ObjectId()
+        self.document = {
+            "_id": self.grocery_id,
+            "user_id": "user-123",
+            "period_start": "2025-11-01",
+            "period_end": "2025-11-30",
+            "items": [{"id": "it-1", "name": "Carrot", "bought": False}],
+        }
+
+    def test_read_update_read_queries(self):
+        """Test reading a list, ticking an item and reading it again takes 3 queries"""
+        lists = self.collections["GroceryLists"]
+        lists.find.return_value = [dict(self.document)]
+        bought = {
+            **self.document,
+            "items": [{**self.document["items"][0], "bought": True}],
+        }
+        lists.find_one_and_update.return_value = bought
+        read = ReadGroceryListByIdUseCase(self.repo)
+
+        with account_queries(budget=3, max_repeats=2, strict=True) as account:
+            read(str(self.grocery_id), "user-123")
+            UpdateGroceryListItemsStatusUseCase(self.repo)(
+                str(self.grocery_id), ["it-1"], True, "user-123"
+            )
+            lists.find.return_value = [bought]
+            grocery = read(str(self.grocery_id), "user-123")
+
+        self.assertTrue(grocery.items[0].bought)
+        self.assertEqual(account.queries, 3)
+
+    def test_generate_queries_do_not_grow_with_meals(self):
+        """Test generating a list reads meals and recipes once, whatever their number"""
+        recipe_ids = [ObjectId() for _ in range(3)]
+        self.collections["Meals"].find.return_value = [
+            {
+                "_id": ObjectId(),
+                "user_id": "user-123",
+                "date": datetime(2025, 11, day),
+                "items": [{"recipe_id": str(recipe_id)} for recipe_id in recipe_ids],
+            }
+            for day in range(1, 8)
+        ]
+        self.collections["Recipes"].find.return_value = [
+            {
+                "_id": recipe_id,
+                "title": f"Recipe {i}",
+                "ingredients": [{"name": "Salt"}],
+            }
+            for i, recipe_id in enumerate(recipe_ids)
+        ]
+        self.collections["GroceryLists"].insert_one.return_value.inserted_id = (
+            ObjectId()
+        )
+        generate = GenerateGroceryListUseCase(
+            self.repo,
+            MongoMealRepository("mongodb://test"),
+            MongoRecipeRepository("mongodb://test"),
+        )
+
+        with account_queries(budget=3, max_repeats=1, strict=True) as account:
+            grocery = generate(date(2025, 11, 1), date(2025, 11, 7), "user-123")
+
+        self.assertEqual([item.name for item in grocery.items], ["Salt"])
+        self.assertEqual(account.queries, 3)
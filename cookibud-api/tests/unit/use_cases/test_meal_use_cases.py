@@ -1,20 +1,35 @@
 """Unit tests for Meal use cases."""
 
 import unittest
+from datetime import date, datetime
 from unittest.mock import MagicMock
 
-from adapters.ports.meal_repository import MealRepository
+from pymongo.errors import DuplicateKeyError
+
+from adapters.in_memory.meal_repository import (
+    AsyncMealRepository as InMemoryAsyncMealRepository,
+)
+from adapters.in_memory.meal_repository import MealRepository as InMemoryMealRepository
+from adapters.in_memory.store import clear_tables
+from adapters.ports.meal_repository import AsyncMealRepository, MealRepository
 from entities.meal import Meal, RecipeEntry
 from use_cases.exceptions import AccessDeniedError
 from use_cases.meals import (
+    AddRecipeToMealUseCase,
+    AsyncCreateMealUseCase,
+    AsyncPlanRecipeUseCase,
+    AsyncReadMealByIdUseCase,
+    AsyncRemoveRecipeFromMealUseCase,
+    AsyncSummarizeMonthMealsUseCase,
+    AsyncUpdateMealUseCase,
     CreateMealUseCase,
     DeleteMealUseCase,
+    PlanRecipeUseCase,
     ReadMealByIdUseCase,
     ReadUserMealsUseCase,
-    UpdateMealUseCase,
-    AddRecipeToMealUseCase,
     RemoveRecipeFromMealUseCase,
-    PlanRecipeUseCase,
+    SummarizeMonthMealsUseCase,
+    UpdateMealUseCase,
 )
 
 
@@ -38,6 +53,75 @@ class TestReadMealsUseCase(unittest.TestCase):
         self.meal_repository.read.assert_called_once_with(user_id=user_id)
         self.assertEqual(meals, expected_meals)
 
+    def test_read_meals_over_period(self):
+        """Test a period is a date range query sorted by date"""
+        self.meal_repository.read.return_value = []
+
+        self.use_case("user123", date(2024, 1, 1), date(2024, 1, 31))
+
+        self.meal_repository.read.assert_called_once_with(
+            user_id="user123",
+            date={"$gte": date(2024, 1, 1), "$lte": date(2024, 1, 31)},
+            _sort=[("date", 1)],
+        )
+
+    def test_read_meals_from_date(self):
+        """Test a period may be open-ended"""
+        self.meal_repository.read.return_value = []
+
+        self.use_case("user123", start=date(2024, 1, 1))
+
+        self.assertEqual(
+            self.meal_repository.read.call_args.kwargs["date"],
+            {"$gte": date(2024, 1, 1)},
+        )
+
+    def test_read_meals_invalid_period(self):
+        """Test a period ending before it starts is rejected"""
+        with self.assertRaises(ValueError):
+            self.use_case("user123", date(2024, 2, 1), date(2024, 1, 1))
+        self.meal_repository.read.assert_not_called()
+
+
+class TestSummarizeMonthMealsUseCase(unittest.TestCase):
+    """Test the per-day calendar summary of a month"""
+
+    def setUp(self):
+        self.meal_repository = MagicMock(spec=MealRepository)
+        self.use_case = SummarizeMonthMealsUseCase(self.meal_repository)
+
+    def test_summary_projects_titles(self):
+        """Test only dates and titles are loaded, and counted per day"""
+        self.meal_repository.read.return_value = [
+            {
+                "id": "m1",
+                "date": datetime(2024, 2, 3),
+                "items": [{"title": "Soup"}, {"title": "Salad"}, {}],
+            },
+            {"id": "m2", "date": datetime(2024, 2, 29), "items": []},
+        ]
+
+        summary = self.use_case("user123", 2024, 2)
+
+        self.meal_repository.read.assert_called_once_with(
+            user_id="user123",
+            date={"$gte": date(2024, 2, 1), "$lte": date(2024, 2, 29)},
+            _sort=[("date", 1)],
+            _fields=["date", "items.title"],
+        )
+        self.assertEqual(
+            [(day.date, day.meal_id, day.count, day.titles) for day in summary],
+            [
+                (date(2024, 2, 3), "m1", 3, ["Soup", "Salad"]),
+                (date(2024, 2, 29), "m2", 0, []),
+            ],
+        )
+
+    def test_summary_invalid_month(self):
+        """Test months out of 1-12 are rejected"""
+        with self.assertRaises(ValueError):
+            self.use_case("user123", 2024, 13)
+
 
 class TestReadMealByIdUseCase(unittest.TestCase):
     """Test reading a meal by ID with ownership verification"""
@@ -86,9 +170,20 @@ class TestCreateMealUseCase(unittest.TestCase):
 
         meal = self.use_case(meal_data=meal_data, user_id=user_id)
 
-        self.meal_repository.create.assert_called_once()
+        self.meal_repository.count.assert_not_called()
+        self.meal_repository.create.assert_called_once_with(meal_data)
+        self.assertEqual(meal_data.user_id, user_id)
         self.assertEqual(meal, created_meal)
 
+    def test_create_meal_date_taken(self):
+        """Test a second meal on the same date, rejected by the unique index, is a ValueError"""
+        self.meal_repository.create.side_effect = DuplicateKeyError("E11000")
+
+        with self.assertRaisesRegex(ValueError, "already planned"):
+            self.use_case(
+                meal_data=Meal(date="2024-01-01", items=[]), user_id="user123"
+            )
+
 
 class TestUpdateMealUseCase(unittest.TestCase):
     """Test updating a meal with ownership verification"""
@@ -131,6 +226,44 @@ class TestUpdateMealUseCase(unittest.TestCase):
         self.meal_repository.read.assert_called_once_with(id=meal_id, user_id=user_id)
 
 
+class TestMealDatesTaken(unittest.IsolatedAsyncioTestCase):
+    """One meal per user and date, enforced by the unique index of the repositories"""
+
+    def setUp(self):
+        clear_tables()
+        self.addCleanup(clear_tables)
+        self.meal_repository = InMemoryMealRepository()
+        self.meal_repository.create(
+            Meal(date="2024-01-01", items=[], user_id="user123")
+        )
+
+    def test_create_on_taken_date(self):
+        """Test creating a meal on a taken date raises ValueError, other users are not affected"""
+        use_case = CreateMealUseCase(self.meal_repository)
+
+        with self.assertRaisesRegex(ValueError, "already planned"):
+            use_case(Meal(date="2024-01-01", items=[]), "user123")
+        use_case(Meal(date="2024-01-01", items=[]), "user456")
+
+    async def test_move_to_taken_date(self):
+        """Test moving a meal to a taken date raises ValueError and leaves it unchanged"""
+        meal = self.meal_repository.create(
+            Meal(date="2024-01-02", items=[], user_id="user123")
+        )
+        use_case = AsyncUpdateMealUseCase(InMemoryAsyncMealRepository())
+
+        with self.assertRaisesRegex(ValueError, "already planned"):
+            await use_case(meal.id, Meal(date="2024-01-01", items=[]), "user123")
+        with self.assertRaisesRegex(ValueError, "already planned"):
+            await AsyncCreateMealUseCase(InMemoryAsyncMealRepository())(
+                Meal(date="2024-01-02", items=[]), "user123"
+            )
+
+        self.assertEqual(
+            self.meal_repository.read(id=meal.id)[0].date, date(2024, 1, 2)
+        )
+
+
 class TestDeleteMealUseCase(unittest.TestCase):
     """Test deleting a meal with ownership verification"""
 
@@ -176,47 +309,138 @@ class TestAddRemovePlanRecipeUseCases(unittest.TestCase):
     def test_add_recipe_to_existing_meal(self):
         meal_id = "meal1"
         user_id = "user123"
-        existing_meal = Meal(id=meal_id, date="2024-01-01", items=[], user_id=user_id)
-        self.meal_repository.read.return_value = [existing_meal]
-        self.meal_repository.update.return_value = existing_meal
-
         entry = {"recipe_id": "r1", "title": "Pancakes", "servings": 2}
+        updated = Meal(
+            id=meal_id, date="2024-01-01", items=[RecipeEntry(**entry)], user_id=user_id
+        )
+        self.meal_repository.append_item.return_value = updated
+
         res = self.add_use_case(meal_id, entry, user_id)
 
-        self.meal_repository.read.assert_called_once_with(id=meal_id, user_id=user_id)
-        self.meal_repository.update.assert_called_once()
+        # one atomic append filtered on ownership, without reading the meal first
+        self.meal_repository.append_item.assert_called_once_with(
+            meal_id, user_id, RecipeEntry(**entry)
+        )
+        self.meal_repository.read.assert_not_called()
+        self.assertEqual(res, updated)
+
+    def test_add_recipe_access_denied(self):
+        self.meal_repository.append_item.return_value = None
+
+        with self.assertRaises(AccessDeniedError):
+            self.add_use_case("meal1", {"recipe_id": "r1"}, "other-user")
 
     def test_remove_recipe_from_meal(self):
         meal_id = "meal1"
         user_id = "user123"
-        existing_meal = Meal(id=meal_id, date="2024-01-01", items=[RecipeEntry(recipe_id="r1", servings=2)], user_id=user_id)
-        self.meal_repository.read.return_value = [existing_meal]
-        self.meal_repository.update.return_value = existing_meal
+        updated = Meal(id=meal_id, date="2024-01-01", items=[], user_id=user_id)
+        self.meal_repository.remove_recipe.return_value = updated
 
-        self.remove_use_case(meal_id, "r1", user_id)
+        res = self.remove_use_case(meal_id, "r1", user_id)
 
-        self.meal_repository.read.assert_called_once_with(id=meal_id, user_id=user_id)
-        self.meal_repository.update.assert_called_once()
+        self.meal_repository.remove_recipe.assert_called_once_with(
+            meal_id, user_id, "r1"
+        )
+        self.assertEqual(res, updated)
 
-    def test_plan_recipe_creates_or_updates(self):
-        date = "2024-02-01"
+    def test_plan_recipe_upserts(self):
         user_id = "user123"
         entry = {"recipe_id": "r1", "title": "Pancakes", "servings": 3}
+        planned = Meal(
+            id="m1", date="2024-02-01", items=[RecipeEntry(**entry)], user_id=user_id
+        )
+        self.meal_repository.plan_item.return_value = planned
+
+        res = self.plan_use_case("2024-02-01", entry, user_id)
+
+        # a single upsert on (user_id, date), whether the meal exists or not
+        self.meal_repository.plan_item.assert_called_once_with(
+            user_id, date(2024, 2, 1), RecipeEntry(**entry)
+        )
+        self.meal_repository.read.assert_not_called()
+        self.meal_repository.create.assert_not_called()
+        self.assertEqual(res, planned)
+
+    def test_plan_recipe_invalid_date(self):
+        with self.assertRaises(ValueError):
+            self.plan_use_case("01/02/2024", {"recipe_id": "r1"}, "user123")
+        self.meal_repository.plan_item.assert_not_called()
+
+
+class TestAsyncMealUseCases(unittest.IsolatedAsyncioTestCase):
+    """Tests for the asyncio meal use cases"""
+
+    def setUp(self):
+        self.meal_repository = MagicMock(spec=AsyncMealRepository)
 
-        # No existing meal -> create
+    async def test_read_meal_by_id_access_denied(self):
+        """Test retrieving a meal that is not owned raises AccessDeniedError"""
         self.meal_repository.read.return_value = []
-        created = Meal(id="mnew", date=date, items=[RecipeEntry(**entry)], user_id=user_id)
-        self.meal_repository.create.return_value = created
 
-        res = self.plan_use_case(date, entry, user_id)
-        self.meal_repository.read.assert_called_with(date=date, user_id=user_id)
-        self.meal_repository.create.assert_called_once()
+        with self.assertRaises(AccessDeniedError):
+            await AsyncReadMealByIdUseCase(self.meal_repository)("meal1", "user123")
+
+        self.meal_repository.read.assert_awaited_once_with(
+            id="meal1", user_id="user123"
+        )
 
-        # Existing meal -> update
-        existing = Meal(id="m1", date=date, items=[], user_id=user_id)
-        self.meal_repository.read.return_value = [existing]
-        self.meal_repository.update.return_value = existing
+    async def test_remove_recipe_from_meal(self):
+        """Test removing a recipe pulls its entries atomically"""
+        remaining = Meal(
+            id="meal1",
+            date="2024-01-01",
+            items=[RecipeEntry(recipe_id="r2")],
+            user_id="user123",
+        )
+        self.meal_repository.remove_recipe.return_value = remaining
+
+        meal = await AsyncRemoveRecipeFromMealUseCase(self.meal_repository)(
+            "meal1", "r1", "user123"
+        )
 
-        res2 = self.plan_use_case(date, entry, user_id)
-        self.meal_repository.read.assert_called_with(date=date, user_id=user_id)
-        self.meal_repository.update.assert_called_once()
+        self.meal_repository.remove_recipe.assert_awaited_once_with(
+            "meal1", "user123", "r1"
+        )
+        self.assertEqual([it.recipe_id for it in meal.items], ["r2"])
+
+    async def test_remove_recipe_access_denied(self):
+        """Test removing from a meal that is not owned raises AccessDeniedError"""
+        self.meal_repository.remove_recipe.return_value = None
+
+        with self.assertRaises(AccessDeniedError):
+            await AsyncRemoveRecipeFromMealUseCase(self.meal_repository)(
+                "meal1", "r1", "other-user"
+            )
+
+    async def test_plan_recipe_upserts_meal(self):
+        """Test planning delegates to the (user_id, date) upsert"""
+        entry = {"recipe_id": "r1", "servings": 3}
+        self.meal_repository.plan_item.side_effect = lambda user_id, day, item: Meal(
+            date=day, items=[item], user_id=user_id
+        )
+
+        meal = await AsyncPlanRecipeUseCase(self.meal_repository)(
+            "2024-02-01", entry, "user123"
+        )
+
+        self.meal_repository.plan_item.assert_awaited_once_with(
+            "user123", date(2024, 2, 1), RecipeEntry(**entry)
+        )
+        self.assertEqual(meal.items, [RecipeEntry(**entry)])
+        self.assertEqual(meal.user_id, "user123")
+
+    async def test_summary_of_month(self):
+        """Test the month summary reads the whole month only"""
+        self.meal_repository.read.return_value = [
+            {"id": "m1", "date": datetime(2023, 12, 31), "items": [{"title": "Roast"}]}
+        ]
+
+        summary = await AsyncSummarizeMonthMealsUseCase(self.meal_repository)(
+            "user123", 2023, 12
+        )
+
+        filters = self.meal_repository.read.call_args.kwargs
+        self.assertEqual(
+            filters["date"], {"$gte": date(2023, 12, 1), "$lte": date(2023, 12, 31)}
+        )
+        self.assertEqual(summary[0].titles, ["Roast"])
@@ -3,17 +3,37 @@
 import unittest
 from unittest.mock import MagicMock
 
-from adapters.ports.recipe_repository import RecipeRepository
-from entities.recipe import Recipe
+from adapters.in_memory.recipe_repository import (
+    RecipeRepository as InMemoryRecipeRepository,
+)
+from adapters.in_memory.review_repository import (
+    ReviewRepository as InMemoryReviewRepository,
+)
+from adapters.in_memory.store import clear_tables
+from adapters.ports.catalog_repository import AsyncCatalogRepository, CatalogRepository
+from adapters.ports.recipe_repository import AsyncRecipeRepository, RecipeRepository
+from adapters.ports.review_repository import ReviewRepository
+from entities.catalog import CatalogEntry
+from entities.recipe import Recipe, RecipeSummary, Review
 from use_cases.exceptions import AccessDeniedError
+from use_cases.pagination import decode_cursor, encode_cursor
 from use_cases.recipes import (
+    SUMMARY_FIELDS,
+    AddReviewUseCase,
+    AsyncCreateRecipeUseCase,
+    AsyncDeleteRecipeUseCase,
+    AsyncReadRecipesUseCase,
+    AsyncUpdateRecipeUseCase,
     CreateRecipeUseCase,
     DeleteRecipeUseCase,
     GetIngredientNamesUseCase,
+    GetTagsUseCase,
+    IterRecipesUseCase,
     ReadRecipeByIdUseCase,
+    ReadRecipeReviewsUseCase,
+    ReadRecipesByIdsUseCase,
     ReadRecipesUseCase,
     UpdateRecipeUseCase,
-    AddReviewUseCase,
 )
 
 
@@ -25,74 +45,211 @@ class TestReadRecipes(unittest.TestCase):
         self.use_case = ReadRecipesUseCase(self.recipe_repository)
 
     def test_read_recipes_no_search(self):
-        """Test reading recipes without search filter"""
-        expected_recipes = [
-            Recipe(title="Pancakes", ingredients=[], description="Delicious pancakes."),
-            Recipe(title="Omelette", ingredients=[], description="Fluffy omelette."),
+        """Test reading recipes without search filter returns summaries"""
+        self.recipe_repository.read.return_value = [
+            {"id": "r1", "title": "Pancakes", "rating_avg": 4.5, "rating_count": 2},
+            {"id": "r2", "title": "Omelette", "prep_time": 5},
         ]
-        self.recipe_repository.read.return_value = expected_recipes
 
         recipes = self.use_case()
 
-        self.recipe_repository.read.assert_called_once_with()
-        self.assertEqual(recipes, expected_recipes)
+        self.recipe_repository.read.assert_called_once_with(_fields=SUMMARY_FIELDS)
+        self.assertEqual(
+            recipes,
+            [
+                RecipeSummary(id="r1", title="Pancakes", rating=4.5, rating_count=2),
+                RecipeSummary(id="r2", title="Omelette", prep_time=5),
+            ],
+        )
 
     def test_read_recipes_with_search(self):
         """Test reading recipes with search filter"""
         search_term = "cake"
-        expected_recipes = [
-            Recipe(title="Pancakes", ingredients=[], description="Delicious pancakes.")
-        ]
-        self.recipe_repository.read.return_value = expected_recipes
+        self.recipe_repository.read.return_value = [{"id": "r1", "title": "Pancakes"}]
 
         recipes = self.use_case(search=search_term)
 
         self.recipe_repository.read.assert_called_once_with(
-            **{"$or": [
-                {"title": {"$regex": search_term, "$options": "i"}},
-                {"description": {"$regex": search_term, "$options": "i"}},
-                {"ingredients.name": {"$regex": search_term, "$options": "i"}},
-            ]}
+            **{"$text": {"$search": search_term}},
+            _sort=[("score", {"$meta": "textScore"})],
+            _fields=SUMMARY_FIELDS,
+        )
+        self.assertEqual(recipes, [RecipeSummary(id="r1", title="Pancakes")])
+
+    def test_read_recipes_with_search_and_sort(self):
+        """Test an explicit sort replaces relevance ordering"""
+        self.recipe_repository.read.return_value = []
+
+        self.use_case(search="cake", sort_by="title", sort_dir="desc")
+
+        self.recipe_repository.read.assert_called_once_with(
+            **{"$text": {"$search": "cake"}},
+            _sort=[("title", -1)],
+            _fields=SUMMARY_FIELDS,
         )
-        self.assertEqual(recipes, expected_recipes)
 
     def test_read_recipes_with_tags(self):
         """Test reading recipes filtered by tags"""
         tags = ["breakfast", "quick"]
-        expected_recipes = [Recipe(title="Pancakes", ingredients=[], description="Good", tags=tags)]
-        self.recipe_repository.read.return_value = expected_recipes
+        self.recipe_repository.read.return_value = [
+            {"id": "r1", "title": "Pancakes", "tags": tags}
+        ]
 
         res = self.use_case(search=None, tags=tags)
 
-        self.recipe_repository.read.assert_called_once_with(tags={"$in": tags})
-        self.assertEqual(res, expected_recipes)
+        self.recipe_repository.read.assert_called_once_with(
+            tags={"$in": tags}, _fields=SUMMARY_FIELDS
+        )
+        self.assertEqual(res, [RecipeSummary(id="r1", title="Pancakes", tags=tags)])
 
     def test_read_recipes_by_ingredient(self):
         """Test reading recipes filtered by ingredient name"""
         ingredient = "egg"
-        expected_recipes = [Recipe(title="Omelette", ingredients=[{"name": "eggs"}], description="...")]
-        self.recipe_repository.read.return_value = expected_recipes
+        self.recipe_repository.read.return_value = [{"id": "r1", "title": "Omelette"}]
 
         res = self.use_case(search=None, tags=None, ingredient=ingredient)
 
-        self.recipe_repository.read.assert_called_once_with(**{"ingredients.name": {"$regex": ingredient, "$options": "i"}})
-        self.assertEqual(res, expected_recipes)
+        self.recipe_repository.read.assert_called_once_with(
+            **{"ingredients.name": {"$regex": ingredient, "$options": "i"}},
+            _fields=SUMMARY_FIELDS,
+        )
+        self.assertEqual(res, [RecipeSummary(id="r1", title="Omelette")])
+
+    def test_read_recipes_by_ingredient_escapes_regex(self):
+        """Test user input is matched literally, not as a regular expression"""
+        self.recipe_repository.read.return_value = []
+
+        self.use_case(ingredient="sugar (brown)")
+
+        self.recipe_repository.read.assert_called_once_with(
+            **{"ingredients.name": {"$regex": r"sugar\ \(brown\)", "$options": "i"}},
+            _fields=SUMMARY_FIELDS,
+        )
+
+    def test_read_recipes_by_title_prefix(self):
+        """Test typeahead prefixes match the start of lowercased titles, escaped"""
+        self.recipe_repository.read.return_value = []
+
+        self.use_case(prefix="Cak(")
+
+        self.recipe_repository.read.assert_called_once_with(
+            title_lower={"$regex": r"^cak\("}, _fields=SUMMARY_FIELDS
+        )
+
+    def test_read_recipes_best_rated(self):
+        """Test minimum rating filter and sort on the average rating"""
+        self.recipe_repository.read.return_value = []
+
+        self.use_case(sort_by="rating_avg", sort_dir="desc", min_rating=4)
+
+        self.recipe_repository.read.assert_called_once_with(
+            rating_avg={"$gte": 4}, _sort=[("rating_avg", -1)], _fields=SUMMARY_FIELDS
+        )
+
+    def test_read_recipes_with_cursor(self):
+        """Test cursor pages read one more summary to know whether a next page exists"""
+        self.recipe_repository.read.return_value = [
+            {"id": "r1", "title": "Cake", "rating_avg": 4.5},
+            {"id": "r2", "title": "Soup", "rating_avg": 4.0},
+            {"id": "r3", "title": "Stew", "rating_avg": 3.0},
+        ]
+
+        page = self.use_case(sort_by="rating_avg", sort_dir="desc", limit=2)
+
+        # no count and no skip: the cost of a page does not depend on its depth
+        self.recipe_repository.count.assert_not_called()
+        self.recipe_repository.read.assert_called_once_with(
+            _sort=[("rating_avg", -1)], _after=None, _limit=3, _fields=SUMMARY_FIELDS
+        )
+        self.assertEqual([r.id for r in page["items"]], ["r1", "r2"])
+        self.assertEqual(page["items"][0].rating, 4.5)
+        self.assertEqual(decode_cursor(page["next_cursor"]), [4.0, "r2"])
+
+        self.recipe_repository.read.reset_mock()
+        self.recipe_repository.read.return_value = [{"id": "r3", "title": "Stew"}]
+
+        page = self.use_case(
+            sort_by="rating_avg", sort_dir="desc", cursor=page["next_cursor"], limit=2
+        )
+
+        self.assertEqual(
+            self.recipe_repository.read.call_args.kwargs["_after"], [4.0, "r2"]
+        )
+        self.assertIsNone(page["next_cursor"])
+
+    def test_search_with_cursor(self):
+        """Test search pages are sorted by relevance and resume after the last score"""
+        self.recipe_repository.read.return_value = [
+            {"id": "r1", "title": "Cake", "score": 2.5},
+            {"id": "r2", "title": "Cupcake", "score": 1.1},
+        ]
+
+        page = self.use_case(search="cake", limit=1)
+
+        self.recipe_repository.read.assert_called_once_with(
+            **{"$text": {"$search": "cake"}},
+            _sort=[("score", {"$meta": "textScore"})],
+            _after=None,
+            _limit=2,
+            _fields=SUMMARY_FIELDS,
+        )
+        self.assertEqual(decode_cursor(page["next_cursor"]), [2.5, "r1"])
+
+    def test_cursor_of_another_sort(self):
+        """Test cursors must match the sort of the page and sort on summary fields"""
+        with self.assertRaises(ValueError):
+            self.use_case(sort_by="title", cursor=encode_cursor(["r1"]), limit=2)
+        with self.assertRaises(ValueError):
+            self.use_case(sort_by="description", limit=2)
+        self.recipe_repository.read.assert_not_called()
 
     def test_read_recipes_with_pagination(self):
         """Test paginated read returns items and metadata"""
-        # prepare 50 recipes as total
-        total = [Recipe(title=f"R{i}", ingredients=[], description="x") for i in range(50)]
-        page_items = total[10:20]
-        # when called first time for total, return total; second time for paged, return page_items
-        self.recipe_repository.read.side_effect = [total, page_items]
+        # total is counted by the repository, only the page is read
+        self.recipe_repository.count.return_value = 50
+        self.recipe_repository.read.return_value = [
+            {"id": f"r{i}", "title": f"R{i}"} for i in range(10, 20)
+        ]
 
-        res = self.use_case(search=None, tags=None, ingredient=None, page=2, page_size=10)
+        res = self.use_case(
+            search=None, tags=None, ingredient=None, page=2, page_size=10
+        )
+
+        self.recipe_repository.count.assert_called_once_with()
+        self.recipe_repository.read.assert_called_once_with(
+            _skip=10, _limit=10, _fields=SUMMARY_FIELDS
+        )
 
         self.assertIsInstance(res, dict)
         self.assertEqual(res["total"], 50)
         self.assertEqual(res["page"], 2)
         self.assertEqual(res["page_size"], 10)
-        self.assertEqual(res["items"], page_items)
+        self.assertEqual(
+            res["items"],
+            [RecipeSummary(id=f"r{i}", title=f"R{i}") for i in range(10, 20)],
+        )
+
+
+class TestIterRecipes(unittest.TestCase):
+    """Unit tests for IterRecipesUseCase"""
+
+    def test_streams_summaries(self):
+        """Test summaries are built one by one from the repository stream"""
+        recipe_repository = MagicMock(spec=RecipeRepository)
+        recipe_repository.iter_read.return_value = iter(
+            [{"id": "r1", "title": "Cake", "rating_avg": 4.26}]
+        )
+
+        summaries = IterRecipesUseCase(recipe_repository)(
+            tags=["quick"], sort_by="title"
+        )
+
+        self.assertEqual(
+            list(summaries), [RecipeSummary(id="r1", title="Cake", rating=4.3)]
+        )
+        recipe_repository.iter_read.assert_called_once_with(
+            tags={"$in": ["quick"]}, _fields=SUMMARY_FIELDS, _sort=[("title", 1)]
+        )
 
 
 class TestReadRecipeById(unittest.TestCase):
@@ -126,6 +283,27 @@ class TestReadRecipeById(unittest.TestCase):
         self.assertIsNone(recipe)
 
 
+class TestReadRecipesByIds(unittest.TestCase):
+    """Unit tests for ReadRecipesByIdsUseCase"""
+
+    def setUp(self):
+        self.recipe_repository = MagicMock(spec=RecipeRepository)
+        self.use_case = ReadRecipesByIdsUseCase(self.recipe_repository)
+
+    def test_read_recipes_by_ids(self):
+        """Test found recipes keep the requested order and missing ids are reported"""
+        soup = Recipe(id="r2", title="Soup", ingredients=[])
+        cake = Recipe(id="r1", title="Cake", ingredients=[])
+        self.recipe_repository.read_many.return_value = [soup, None, cake]
+
+        res = self.use_case(["r2", "unknown", "r1"])
+
+        self.recipe_repository.read_many.assert_called_once_with(
+            ["r2", "unknown", "r1"]
+        )
+        self.assertEqual(res, {"items": [soup, cake], "missing": ["unknown"]})
+
+
 class TestRecipeCreateRecipe(unittest.TestCase):
     """Unit tests for CreateRecipeUseCase"""
 
@@ -198,7 +376,7 @@ class TestUpdateRecipe(unittest.TestCase):
         self.recipe_repository.read.assert_called_once_with(id=recipe_id)
         self.recipe_repository.update.assert_called_once_with(
             recipe_id,
-            **updated_data.model_dump(exclude_unset=True, exclude={"author_id", "id"})
+            **updated_data.model_dump(exclude_unset=True, exclude={"author_id", "id"}),
         )
 
         self.assertEqual(updated_recipe.title, updated_data.title)
@@ -313,44 +491,105 @@ class TestGetIngredientNames(unittest.TestCase):
     """Unit tests for GetIngredientNamesUseCase"""
 
     def setUp(self):
-        self.recipe_repository = MagicMock(spec=RecipeRepository)
-        self.use_case = GetIngredientNamesUseCase(self.recipe_repository)
+        self.catalog_repository = MagicMock(spec=CatalogRepository)
+        self.use_case = GetIngredientNamesUseCase(self.catalog_repository)
 
     def test_get_ingredient_names(self):
-        """Test retrieving deduplicated ingredient names from recipes"""
-        recipes = [
-            Recipe(
-                title="Recipe1",
-                ingredients=[{"name": "Sugar"}, {"name": "Flour"}],
-                description="",
-            ),
-            Recipe(
-                title="Recipe2",
-                ingredients=[{"name": "Flour"}, {"name": "Eggs"}],
-                description="",
-            ),
-            Recipe(title="Recipe3", ingredients=[], description=""),
+        """Test ingredient names are read from the catalog"""
+        self.catalog_repository.read.return_value = [
+            CatalogEntry(kind="ingredient", name="Eggs", count=1),
+            CatalogEntry(kind="ingredient", name="Flour", count=2),
+            CatalogEntry(kind="ingredient", name="Sugar", count=0),
         ]
-        self.recipe_repository.read.return_value = recipes
 
         ingredient_names = self.use_case()
 
-        self.recipe_repository.read.assert_called_once_with()
-        expected_names = {"Sugar", "Flour", "Eggs"}
-        self.assertEqual(set(ingredient_names), expected_names)
+        self.catalog_repository.read.assert_called_once_with(
+            kind="ingredient", _sort=[("name", 1)]
+        )
+        self.assertEqual(ingredient_names, ["Eggs", "Flour"])
 
     def test_get_ingredient_names_no_ingredients(self):
-        """Test retrieving ingredient names when no recipes have ingredients"""
-        recipes = [
-            Recipe(title="Recipe1", ingredients=[], description=""),
-            Recipe(title="Recipe2", ingredients=[], description=""),
+        """Test retrieving ingredient names when the catalog is empty"""
+        self.catalog_repository.read.return_value = []
+
+        self.assertEqual(self.use_case(), [])
+
+
+class TestGetTags(unittest.TestCase):
+    """Unit tests for GetTagsUseCase"""
+
+    def test_get_tags(self):
+        """Test tags are read from the catalog"""
+        catalog_repository = MagicMock(spec=CatalogRepository)
+        catalog_repository.read.return_value = [
+            CatalogEntry(kind="tag", name="quick", count=3)
         ]
-        self.recipe_repository.read.return_value = recipes
 
-        ingredient_names = self.use_case()
+        self.assertEqual(GetTagsUseCase(catalog_repository)(), ["quick"])
+        catalog_repository.read.assert_called_once_with(kind="tag", _sort=[("name", 1)])
+
 
-        self.recipe_repository.read.assert_called_once_with()
-        self.assertEqual(ingredient_names, [])
+class TestRecipeCatalogMaintenance(unittest.TestCase):
+    """Create/update/delete keep tag and ingredient catalogs in sync"""
+
+    def setUp(self):
+        self.recipe_repository = MagicMock(spec=RecipeRepository)
+        self.catalog_repository = MagicMock(spec=CatalogRepository)
+
+    def test_create_increments_catalogs(self):
+        """Test creating a recipe counts each of its tags and ingredient names once"""
+        recipe = Recipe(
+            title="Omelette",
+            ingredients=[{"name": "Eggs"}, {"name": "Eggs"}, {"name": "Salt"}],
+            tags=["quick"],
+        )
+
+        CreateRecipeUseCase(self.recipe_repository, self.catalog_repository)(
+            recipe, "user123"
+        )
+
+        self.catalog_repository.increment.assert_any_call("tag", {"quick": 1})
+        self.catalog_repository.increment.assert_any_call(
+            "ingredient", {"Eggs": 1, "Salt": 1}
+        )
+
+    def test_update_applies_differences(self):
+        """Test updating a recipe only sends the names that changed"""
+        existing = Recipe(
+            title="Omelette",
+            ingredients=[{"name": "Eggs"}],
+            tags=["quick", "breakfast"],
+            author_id="u1",
+        )
+        self.recipe_repository.read.return_value = [existing]
+        update = Recipe(
+            title="Omelette", ingredients=[{"name": "Eggs"}, {"name": "Ham"}]
+        )
+
+        UpdateRecipeUseCase(self.recipe_repository, self.catalog_repository)(
+            "r1", update, "u1"
+        )
+
+        # tags were not part of the update: unchanged
+        self.catalog_repository.increment.assert_called_once_with(
+            "ingredient", {"Ham": 1}
+        )
+
+    def test_delete_decrements_catalogs(self):
+        """Test deleting a recipe releases its names"""
+        existing = Recipe(
+            title="Soup",
+            ingredients=[{"name": "Leek"}],
+            tags=["winter"],
+            author_id="u1",
+        )
+        self.recipe_repository.read.return_value = [existing]
+
+        DeleteRecipeUseCase(self.recipe_repository, self.catalog_repository)("r1", "u1")
+
+        self.catalog_repository.increment.assert_any_call("tag", {"winter": -1})
+        self.catalog_repository.increment.assert_any_call("ingredient", {"Leek": -1})
 
 
 class TestAddReviewUseCase(unittest.TestCase):
@@ -358,33 +597,36 @@ class TestAddReviewUseCase(unittest.TestCase):
 
     def setUp(self):
         self.recipe_repository = MagicMock(spec=RecipeRepository)
-        self.use_case = AddReviewUseCase(self.recipe_repository)
+        self.review_repository = MagicMock(spec=ReviewRepository)
+        self.review_repository.create.side_effect = lambda rev: rev.model_copy(
+            update={"id": "rev1"}
+        )
+        self.use_case = AddReviewUseCase(self.recipe_repository, self.review_repository)
 
     def test_add_review_success(self):
         """Test adding a review to an existing recipe"""
         recipe_id = "r1"
-        existing_recipe = Recipe(
-            title="Pancakes", ingredients=[], description="Good", author_id="author1"
-        )
-        self.recipe_repository.read.return_value = [existing_recipe]
-        # simulate repository update returning the updated recipe
-        self.recipe_repository.update.return_value = existing_recipe
+        self.recipe_repository.add_review.return_value = True
 
         rev = self.use_case(
             recipe_id, user_id="user123", username="tester", rating=4, comment="Nice!"
         )
 
-        # repository should have been read and updated
-        self.recipe_repository.read.assert_called_once_with(id=recipe_id)
-        self.recipe_repository.update.assert_called_once()
+        # stored in the review repository, aggregates updated without rewriting the recipe
+        self.review_repository.create.assert_called_once()
+        self.recipe_repository.add_review.assert_called_once_with(recipe_id, rev)
+        self.recipe_repository.read.assert_not_called()
+        self.recipe_repository.update.assert_not_called()
+        self.assertEqual(rev.id, "rev1")
+        self.assertEqual(rev.recipe_id, recipe_id)
         self.assertEqual(rev.user_id, "user123")
         self.assertEqual(rev.username, "tester")
         self.assertEqual(rev.rating, 4)
 
     def test_add_review_not_found(self):
-        """Test adding a review to a non-existing recipe raises"""
+        """Test adding a review to a non-existing recipe raises and removes the review"""
         recipe_id = "missing"
-        self.recipe_repository.read.return_value = []
+        self.recipe_repository.add_review.return_value = False
 
         with self.assertRaises(ValueError) as ctx:
             self.use_case(
@@ -392,3 +634,201 @@ class TestAddReviewUseCase(unittest.TestCase):
             )
 
         self.assertEqual(str(ctx.exception), "Recipe not found")
+        self.review_repository.delete.assert_called_once()
+
+
+class TestReviewFieldsFromClients(unittest.TestCase):
+    """Reviews and ratings are only written by AddReviewUseCase"""
+
+    def setUp(self):
+        clear_tables()
+        self.addCleanup(clear_tables)
+        self.recipe_repository = InMemoryRecipeRepository()
+        self.add_review = AddReviewUseCase(
+            self.recipe_repository, InMemoryReviewRepository()
+        )
+
+    def test_create_ignores_forged_ratings(self):
+        """Test ratings and reviews sent with a new recipe are not stored"""
+        forged = Recipe(
+            title="Soup",
+            ingredients=[],
+            reviews=[Review(rating=5)],
+            rating_count=100,
+            rating_sum=500,
+            rating_avg=5.0,
+        )
+
+        created = CreateRecipeUseCase(self.recipe_repository)(forged, user_id="user1")
+
+        stored = self.recipe_repository.read(id=created.id)[0]
+        self.assertEqual(
+            (stored.reviews, stored.rating_count, stored.rating_avg), ([], 0, None)
+        )
+
+    def test_review_added_before_a_stale_update_survives(self):
+        """Test a PUT of the recipe read before a review keeps the review and ratings"""
+        created = CreateRecipeUseCase(self.recipe_repository)(
+            Recipe(title="Soup", ingredients=[]), user_id="user1"
+        )
+        loaded = Recipe(**self.recipe_repository.read(id=created.id)[0].model_dump())
+        self.add_review(created.id, "user2", "reviewer", 4, "Good")
+
+        loaded.title = "Leek soup"
+        UpdateRecipeUseCase(self.recipe_repository)(created.id, loaded, "user1")
+
+        stored = self.recipe_repository.read(id=created.id)[0]
+        self.assertEqual(stored.title, "Leek soup")
+        self.assertEqual((stored.rating_count, stored.rating_sum), (1, 4))
+        self.assertEqual([review.comment for review in stored.reviews], ["Good"])
+
+
+class TestTitlePrefixSearch(unittest.TestCase):
+    """Typeahead searches of partial words"""
+
+    def setUp(self):
+        clear_tables()
+        self.addCleanup(clear_tables)
+        repository = InMemoryRecipeRepository()
+        self.recipes = [
+            repository.create(Recipe(title=title, ingredients=[]))
+            for title in ("Cake", "Soup", "Cheesecake")
+        ]
+        self.repository = repository
+        self.use_case = ReadRecipesUseCase(repository)
+
+    def test_partial_word_matches_titles_by_prefix(self):
+        """Test a partial word finds titles starting with it, which search does not"""
+        self.assertEqual(self.use_case(search="cak"), [])
+
+        page = self.use_case(prefix="cak", sort_by="title", limit=10)
+
+        self.assertEqual([summary.title for summary in page["items"]], ["Cake"])
+
+    def test_renamed_titles_match_new_prefix(self):
+        """Test the lowercased title follows title updates"""
+        self.repository.update(self.recipes[1].id, title="Carrot soup")
+
+        page = self.use_case(prefix="CA", sort_by="title", limit=10)
+
+        titles = [summary.title for summary in page["items"]]
+        self.assertEqual(titles, ["Cake", "Carrot soup"])
+
+
+class TestReadRecipeReviews(unittest.TestCase):
+    """Unit tests for ReadRecipeReviewsUseCase"""
+
+    def setUp(self):
+        self.review_repository = MagicMock(spec=ReviewRepository)
+        self.use_case = ReadRecipeReviewsUseCase(self.review_repository)
+
+    def test_pages_with_cursor(self):
+        """Test the next cursor resumes after the last review of the page"""
+        reviews = [
+            Review(
+                id=f"rev{i}", recipe_id="r1", rating=5, created_at=f"2025-01-0{9 - i}"
+            )
+            for i in range(3)
+        ]
+        self.review_repository.read.return_value = reviews
+
+        page = self.use_case("r1", limit=2)
+
+        self.review_repository.read.assert_called_once_with(
+            recipe_id="r1", _sort=[("created_at", -1)], _after=None, _limit=3
+        )
+        self.assertEqual(page["items"], reviews[:2])
+        self.assertEqual(decode_cursor(page["next_cursor"]), ["2025-01-08", "rev1"])
+
+        self.review_repository.read.reset_mock()
+        self.review_repository.read.return_value = reviews[2:]
+
+        page = self.use_case(
+            "r1", cursor=encode_cursor(["2025-01-08", "rev1"]), limit=2
+        )
+
+        self.assertEqual(
+            self.review_repository.read.call_args.kwargs["_after"],
+            ["2025-01-08", "rev1"],
+        )
+        self.assertEqual(page, {"items": reviews[2:], "next_cursor": None})
+
+    def test_invalid_cursor(self):
+        """Test a malformed cursor is rejected"""
+        with self.assertRaises(ValueError):
+            self.use_case("r1", cursor="not a cursor!")
+        self.review_repository.read.assert_not_called()
+
+
+class TestAsyncRecipeUseCases(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for the asyncio recipe use cases"""
+
+    def setUp(self):
+        self.recipe_repository = MagicMock(spec=AsyncRecipeRepository)
+
+    async def test_read_recipes_with_pagination(self):
+        """Test paginated read returns items and metadata"""
+        self.recipe_repository.count.return_value = 50
+        self.recipe_repository.read.return_value = [
+            {"id": f"r{i}", "title": f"R{i}"} for i in range(10, 20)
+        ]
+
+        res = await AsyncReadRecipesUseCase(self.recipe_repository)(
+            tags=["quick"], page=2, page_size=10, sort_by="title", sort_dir="desc"
+        )
+
+        self.recipe_repository.count.assert_awaited_once_with(tags={"$in": ["quick"]})
+        self.recipe_repository.read.assert_awaited_once_with(
+            tags={"$in": ["quick"]},
+            _skip=10,
+            _limit=10,
+            _sort=[("title", -1)],
+            _fields=SUMMARY_FIELDS,
+        )
+        page_items = [RecipeSummary(id=f"r{i}", title=f"R{i}") for i in range(10, 20)]
+        self.assertEqual(
+            res, {"items": page_items, "total": 50, "page": 2, "page_size": 10}
+        )
+
+    async def test_create_recipe_normalizes_ingredients(self):
+        """Test creating a recipe normalizes quantities and sets the author"""
+        recipe = Recipe(
+            title="Bread", ingredients=[{"name": "Flour", "quantity": 1, "unit": "kg"}]
+        )
+        self.recipe_repository.create.side_effect = lambda r: r
+
+        created = await AsyncCreateRecipeUseCase(self.recipe_repository)(
+            recipe, "user123"
+        )
+
+        self.assertEqual(created.author_id, "user123")
+        self.assertEqual(
+            (created.ingredients[0].quantity, created.ingredients[0].unit), (1000, "g")
+        )
+
+    async def test_update_recipe_not_author(self):
+        """Test updating a recipe by a user who is not the author"""
+        self.recipe_repository.read.return_value = [
+            Recipe(title="Pancakes", ingredients=[], author_id="other_user")
+        ]
+
+        with self.assertRaises(AccessDeniedError):
+            await AsyncUpdateRecipeUseCase(self.recipe_repository)(
+                "r1", Recipe(title="x", ingredients=[]), "user123"
+            )
+        self.recipe_repository.update.assert_not_awaited()
+
+    async def test_delete_recipe_decrements_catalogs(self):
+        """Test deleting a recipe releases its names in the catalogs"""
+        catalog_repository = MagicMock(spec=AsyncCatalogRepository)
+        self.recipe_repository.read.return_value = [
+            Recipe(title="Soup", ingredients=[{"name": "Leek"}], author_id="user123")
+        ]
+
+        await AsyncDeleteRecipeUseCase(self.recipe_repository, catalog_repository)(
+            "r1", "user123"
+        )
+
+        catalog_repository.increment.assert_awaited_once_with(
+            "ingredient", {"Leek": -1}
+        )
@@ -1,15 +1,133 @@
 """Grocery list use cases with unit normalization and item status updates"""
 
 import uuid
+from collections.abc import AsyncIterator, Iterator
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
 
-from adapters.ports.grocery_list_repository import GroceryListRepository
+from adapters.ports.grocery_list_repository import (
+    AsyncGroceryListRepository,
+    GroceryListRepository,
+)
+from adapters.ports.meal_repository import AsyncMealRepository, MealRepository
+from adapters.ports.recipe_repository import AsyncRecipeRepository, RecipeRepository
 from entities.grocery_list import GroceryItem, GroceryList
+from entities.meal import Meal
+from entities.recipe import Recipe
 from use_cases.exceptions import AccessDeniedError
+from use_cases.meals import date_range
 from use_cases.units import normalize_unit_and_qty as _normalize_unit_and_qty
 
 GROCERY_NOT_FOUND_OR_DENIED = "Grocery list not found or access denied"
+ITEM_NOT_FOUND = "Item not found in grocery list"
+
+
+def _normalize_items(items: list[GroceryItem]) -> list[GroceryItem]:
+    """Give every item an id and normalize its quantity into base units"""
+    normalized_items: list[GroceryItem] = []
+    for item in items:
+        # Ensure an id for each item
+        if not item.id:
+            item.id = str(uuid.uuid4())
+        qty, unit = _normalize_unit_and_qty(item.qty, item.unit)
+        ni = GroceryItem(
+            id=item.id,
+            name=item.name,
+            qty=qty,
+            unit=unit,
+            entries=item.entries or [],
+            bought=bool(item.bought),
+        )
+        normalized_items.append(ni)
+    return normalized_items
+
+
+def _prepare_grocery_list(grocery_data: GroceryList, user_id: str) -> GroceryList:
+    """Attach owner and creation time, normalize items"""
+    # Attach user id and created_at
+    grocery_data.user_id = user_id
+    # Use timezone-aware current time
+    grocery_data.created_at = datetime.now().astimezone()
+    grocery_data.items = _normalize_items(grocery_data.items)
+    return grocery_data
+
+
+def _read_list(lists: list[GroceryList]) -> GroceryList:
+    """Grocery list read by id and owner, deny when none matched"""
+    if not lists:
+        raise AccessDeniedError(GROCERY_NOT_FOUND_OR_DENIED)
+    return lists[0]
+
+
+def _check_item_ids(item_ids: list[str]) -> None:
+    """Reject item status updates without any item"""
+    if not item_ids:
+        raise ValueError("At least one item id is required")
+
+
+def _status_error(list_found: bool) -> AccessDeniedError:
+    """Error of an item status update that matched nothing"""
+    return AccessDeniedError(
+        ITEM_NOT_FOUND if list_found else GROCERY_NOT_FOUND_OR_DENIED
+    )
+
+
+def _updated_list(updated: GroceryList | None) -> GroceryList:
+    """Grocery list whose items were all updated, deny when none matched"""
+    if updated is None:
+        raise AccessDeniedError(GROCERY_NOT_FOUND_OR_DENIED)
+    return updated
+
+
+def _planned_recipe_ids(meals: list[Meal]) -> list[str]:
+    """Deduplicated ids of the recipes planned in meals"""
+    return list(
+        dict.fromkeys(entry.recipe_id for meal in meals for entry in meal.items or [])
+    )
+
+
+def _format_qty(qty: float | None, unit: str | None) -> str:
+    """Human readable quantity used in grocery item entries"""
+    if qty is None:
+        return "—"
+    return f"{qty:g} {unit or ''}".strip()
+
+
+def _merge_ingredients(meals: list[Meal], recipes: list[Recipe]) -> list[GroceryItem]:
+    """Scale planned recipe ingredients by servings and merge them per name and base unit"""
+    recipes_by_id = {recipe.id: recipe for recipe in recipes}
+    merged: dict[tuple[str, str], GroceryItem] = {}
+    for meal in meals:
+        for entry in meal.items or []:
+            recipe = recipes_by_id.get(entry.recipe_id)
+            if recipe is None:
+                continue
+            for ing in recipe.ingredients or []:
+                scaled = (
+                    ing.quantity * entry.servings if ing.quantity is not None else None
+                )
+                qty, unit = _normalize_unit_and_qty(scaled, ing.unit)
+                item = merged.setdefault(
+                    (ing.name, unit), GroceryItem(name=ing.name, unit=unit)
+                )
+                if qty is not None:
+                    item.qty = (item.qty or 0) + qty
+                item.entries.append(
+                    f"{recipe.title} ×{entry.servings}: {_format_qty(ing.quantity, ing.unit)}"
+                )
+    return sorted(merged.values(), key=lambda item: (item.name.lower(), item.unit))
+
+
+def _generated_grocery_list(
+    start: date, end: date, meals: list[Meal], recipes: list[Recipe]
+) -> GroceryList:
+    """Grocery list of the meals planned over a period"""
+    return GroceryList(
+        title=f"Grocery {start} — {end}",
+        period_start=start.isoformat(),
+        period_end=end.isoformat(),
+        items=_merge_ingredients(meals, recipes),
+    )
 
 
 @dataclass
@@ -22,6 +140,16 @@ class ReadUserGroceryListsUseCase:
         return self.grocery_repository.read(user_id=user_id)
 
 
+@dataclass
+class IterUserGroceryListsUseCase:
+    """Stream the grocery lists of a specific user"""
+
+    grocery_repository: GroceryListRepository
+
+    def __call__(self, user_id: str) -> Iterator[GroceryList]:
+        yield from self.grocery_repository.iter_read(user_id=user_id)
+
+
 @dataclass
 class ReadGroceryListByIdUseCase:
     """Retrieve a grocery list by ID with ownership verification"""
@@ -29,10 +157,7 @@ class ReadGroceryListByIdUseCase:
     grocery_repository: GroceryListRepository
 
     def __call__(self, grocery_id: str, user_id: str) -> GroceryList | None:
-        lists = self.grocery_repository.read(id=grocery_id, user_id=user_id)
-        if not lists:
-            raise AccessDeniedError(GROCERY_NOT_FOUND_OR_DENIED)
-        return lists[0]
+        return _read_list(self.grocery_repository.read(id=grocery_id, user_id=user_id))
 
 
 @dataclass
@@ -42,32 +167,28 @@ class CreateGroceryListUseCase:
     grocery_repository: GroceryListRepository
 
     def __call__(self, grocery_data: GroceryList, user_id: str) -> GroceryList:
-        # Attach user id and created_at
-        grocery_data.user_id = user_id
-        # Use timezone-aware current time
-        grocery_data.created_at = datetime.now().astimezone()
-        # Normalize items
-        normalized_items: list[GroceryItem] = []
-        for item in grocery_data.items:
-            # Ensure an id for each item
-            if not item.id:
-                item.id = str(uuid.uuid4())
-            qty, unit = _normalize_unit_and_qty(item.qty, item.unit)
-            ni = GroceryItem(
-                id=item.id,
-                name=item.name,
-                qty=qty,
-                unit=unit,
-                entries=item.entries or [],
-                bought=bool(item.bought),
-            )
-            normalized_items.append(ni)
-
-        grocery_data.items = normalized_items
+        grocery_data = _prepare_grocery_list(grocery_data, user_id)
         saved = self.grocery_repository.create(grocery_data)
         return saved
 
 
+@dataclass
+class GenerateGroceryListUseCase:
+    """Generate and save the grocery list of the meals planned over a date range"""
+
+    grocery_repository: GroceryListRepository
+    meal_repository: MealRepository
+    recipe_repository: RecipeRepository
+
+    def __call__(self, start: date, end: date, user_id: str) -> GroceryList:
+        meals = self.meal_repository.read(user_id=user_id, date=date_range(start, end))
+        recipe_ids = _planned_recipe_ids(meals)
+        # a single batched query for every planned recipe
+        recipes = [r for r in self.recipe_repository.read_many(recipe_ids) if r]
+        grocery = _generated_grocery_list(start, end, meals, recipes)
+        return self.grocery_repository.create(_prepare_grocery_list(grocery, user_id))
+
+
 @dataclass
 class UpdateGroceryListItemStatusUseCase:
     """Update the 'bought' status of a specific item in a grocery list"""
@@ -77,24 +198,30 @@ class UpdateGroceryListItemStatusUseCase:
     def __call__(
         self, grocery_id: str, item_id: str, bought: bool, user_id: str
     ) -> GroceryList:
-        lists = self.grocery_repository.read(id=grocery_id, user_id=user_id)
-        if not lists:
-            raise AccessDeniedError(GROCERY_NOT_FOUND_OR_DENIED)
-        grocery: GroceryList = lists[0]
-        updated_items = []
-        found = False
-        for it in grocery.items or []:
-            if it.id == item_id:
-                it.bought = bool(bought)
-                found = True
-            updated_items.append(it)
-
-        if not found:
-            raise AccessDeniedError("Item not found in grocery list")
-
-        self.grocery_repository.update(grocery_id, items=updated_items)
-        # Return modified list
-        updated = self.grocery_repository.read(id=grocery_id, user_id=user_id)[0]
+        return UpdateGroceryListItemsStatusUseCase(self.grocery_repository)(
+            grocery_id, [item_id], bought, user_id
+        )
+
+
+@dataclass
+class UpdateGroceryListItemsStatusUseCase:
+    """Update the 'bought' status of several items of a grocery list at once"""
+
+    grocery_repository: GroceryListRepository
+
+    def __call__(
+        self, grocery_id: str, item_ids: list[str], bought: bool, user_id: str
+    ) -> GroceryList:
+        _check_item_ids(item_ids)
+        # single atomic update, the ownership check is part of its filter
+        updated = self.grocery_repository.set_items_bought(
+            grocery_id, user_id, bought, item_ids
+        )
+        if updated is None:
+            # only on failure: tell an unknown item from an unknown (or not owned) list
+            raise _status_error(
+                self.grocery_repository.count(id=grocery_id, user_id=user_id) > 0
+            )
         return updated
 
 
@@ -105,17 +232,8 @@ class UpdateAllGroceryListItemsStatusUseCase:
     grocery_repository: GroceryListRepository
 
     def __call__(self, grocery_id: str, bought: bool, user_id: str) -> GroceryList:
-        lists = self.grocery_repository.read(id=grocery_id, user_id=user_id)
-        if not lists:
-            raise AccessDeniedError(GROCERY_NOT_FOUND_OR_DENIED)
-        grocery: GroceryList = lists[0]
-        updated_items = []
-        for it in grocery.items or []:
-            it.bought = bool(bought)
-            updated_items.append(it)
-        self.grocery_repository.update(grocery_id, items=updated_items)
-        updated = self.grocery_repository.read(id=grocery_id, user_id=user_id)[0]
-        return updated
+        updated = self.grocery_repository.set_items_bought(grocery_id, user_id, bought)
+        return _updated_list(updated)
 
 
 @dataclass
@@ -125,7 +243,132 @@ class DeleteGroceryListUseCase:
     grocery_repository: GroceryListRepository
 
     def __call__(self, grocery_id: str, user_id: str) -> None:
-        lists = self.grocery_repository.read(id=grocery_id, user_id=user_id)
-        if not lists:
-            raise AccessDeniedError(GROCERY_NOT_FOUND_OR_DENIED)
-        self.grocery_repository.delete(lists[0])
+        grocery = _read_list(
+            self.grocery_repository.read(id=grocery_id, user_id=user_id)
+        )
+        self.grocery_repository.delete(grocery)
+
+
+@dataclass
+class AsyncReadUserGroceryListsUseCase:
+    """Retrieve all grocery lists for a specific user from the event loop"""
+
+    grocery_repository: AsyncGroceryListRepository
+
+    async def __call__(self, user_id: str) -> list[GroceryList]:
+        return await self.grocery_repository.read(user_id=user_id)
+
+
+@dataclass
+class AsyncIterUserGroceryListsUseCase:
+    """Stream the grocery lists of a specific user from the event loop"""
+
+    grocery_repository: AsyncGroceryListRepository
+
+    async def __call__(self, user_id: str) -> AsyncIterator[GroceryList]:
+        async for grocery_list in self.grocery_repository.iter_read(user_id=user_id):
+            yield grocery_list
+
+
+@dataclass
+class AsyncReadGroceryListByIdUseCase:
+    """Retrieve a grocery list by ID with ownership verification from the event loop"""
+
+    grocery_repository: AsyncGroceryListRepository
+
+    async def __call__(self, grocery_id: str, user_id: str) -> GroceryList | None:
+        return _read_list(
+            await self.grocery_repository.read(id=grocery_id, user_id=user_id)
+        )
+
+
+@dataclass
+class AsyncCreateGroceryListUseCase:
+    """Create a new grocery list for the authenticated user from the event loop"""
+
+    grocery_repository: AsyncGroceryListRepository
+
+    async def __call__(self, grocery_data: GroceryList, user_id: str) -> GroceryList:
+        grocery_data = _prepare_grocery_list(grocery_data, user_id)
+        return await self.grocery_repository.create(grocery_data)
+
+
+@dataclass
+class AsyncGenerateGroceryListUseCase:
+    """Generate and save the grocery list of a date range from the event loop"""
+
+    grocery_repository: AsyncGroceryListRepository
+    meal_repository: AsyncMealRepository
+    recipe_repository: AsyncRecipeRepository
+
+    async def __call__(self, start: date, end: date, user_id: str) -> GroceryList:
+        meals = await self.meal_repository.read(
+            user_id=user_id, date=date_range(start, end)
+        )
+        recipe_ids = _planned_recipe_ids(meals)
+        recipes = [r for r in await self.recipe_repository.read_many(recipe_ids) if r]
+        grocery = _generated_grocery_list(start, end, meals, recipes)
+        return await self.grocery_repository.create(
+            _prepare_grocery_list(grocery, user_id)
+        )
+
+
+@dataclass
+class AsyncUpdateGroceryListItemStatusUseCase:
+    """Update the 'bought' status of a specific item from the event loop"""
+
+    grocery_repository: AsyncGroceryListRepository
+
+    async def __call__(
+        self, grocery_id: str, item_id: str, bought: bool, user_id: str
+    ) -> GroceryList:
+        return await AsyncUpdateGroceryListItemsStatusUseCase(self.grocery_repository)(
+            grocery_id, [item_id], bought, user_id
+        )
+
+
+@dataclass
+class AsyncUpdateGroceryListItemsStatusUseCase:
+    """Update the 'bought' status of several items at once from the event loop"""
+
+    grocery_repository: AsyncGroceryListRepository
+
+    async def __call__(
+        self, grocery_id: str, item_ids: list[str], bought: bool, user_id: str
+    ) -> GroceryList:
+        _check_item_ids(item_ids)
+        updated = await self.grocery_repository.set_items_bought(
+            grocery_id, user_id, bought, item_ids
+        )
+        if updated is None:
+            found = await self.grocery_repository.count(id=grocery_id, user_id=user_id)
+            raise _status_error(found > 0)
+        return updated
+
+
+@dataclass
+class AsyncUpdateAllGroceryListItemsStatusUseCase:
+    """Update the 'bought' status of all items in a grocery list from the event loop"""
+
+    grocery_repository: AsyncGroceryListRepository
+
+    async def __call__(
+        self, grocery_id: str, bought: bool, user_id: str
+    ) -> GroceryList:
+        updated = await self.grocery_repository.set_items_bought(
+            grocery_id, user_id, bought
+        )
+        return _updated_list(updated)
+
+
+@dataclass
+class AsyncDeleteGroceryListUseCase:
+    """Delete a grocery list with ownership verification from the event loop"""
+
+    grocery_repository: AsyncGroceryListRepository
+
+    async def __call__(self, grocery_id: str, user_id: str) -> None:
+        grocery = _read_list(
+            await self.grocery_repository.read(id=grocery_id, user_id=user_id)
+        )
+        await self.grocery_repository.delete(grocery)
@@ -1,23 +1,149 @@
 """Meal management use cases"""
 
+import calendar
+from collections.abc import AsyncIterator, Iterator
 from dataclasses import dataclass
+from datetime import date
 
-from adapters.ports.meal_repository import MealRepository
-from entities.meal import Meal, RecipeEntry
+from pymongo.errors import DuplicateKeyError
+
+from adapters.ports.meal_repository import AsyncMealRepository, MealRepository
+from entities.meal import Meal, MealDaySummary, RecipeEntry
 from use_cases.exceptions import AccessDeniedError
 
 MEAL_NOT_FOUND_OR_DENIED = "Meal not found or access denied"
+MEAL_DATE_TAKEN = "A meal is already planned for this date"
+INVALID_PERIOD = "Period start must be before period end"
+DATE_SORT = [("date", 1)]
+# the month summary only loads what the calendar displays
+SUMMARY_FIELDS = ["date", "items.title"]
+
+
+def date_range(start: date | None, end: date | None) -> dict:
+    """Filter of the dates between start and end (inclusive, either bound optional)"""
+    if start and end and start > end:
+        raise ValueError(INVALID_PERIOD)
+    bounds = {"$gte": start, "$lte": end}
+    return {op: bound for op, bound in bounds.items() if bound is not None}
+
+
+def _period_filters(user_id: str, start: date | None, end: date | None) -> dict:
+    """Read filters of the meals of a user, sorted by date when restricted to a period"""
+    period = date_range(start, end)
+    if not period:
+        return {"user_id": user_id}
+    return {"user_id": user_id, "date": period, "_sort": DATE_SORT}
+
+
+def _month_filters(user_id: str, year: int, month: int) -> dict:
+    """Read filters of the calendar summary of a month"""
+    if not 1 <= month <= 12:
+        raise ValueError("Month must be between 1 and 12")
+    last_day = calendar.monthrange(year, month)[1]
+    return {
+        **_period_filters(user_id, date(year, month, 1), date(year, month, last_day)),
+        "_fields": SUMMARY_FIELDS,
+    }
+
+
+def _day_summaries(meals: list[dict]) -> list[MealDaySummary]:
+    """Convert projected meals into per-day recipe counts and titles"""
+    summaries = []
+    for meal in meals:
+        items = meal.get("items") or []
+        summaries.append(
+            MealDaySummary(
+                date=meal["date"],
+                meal_id=meal["id"],
+                count=len(items),
+                titles=[item["title"] for item in items if item.get("title")],
+            )
+        )
+    return summaries
+
+
+def _to_date(value: str | date) -> date:
+    """Parse an ISO date (YYYY-MM-DD)"""
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid date: {value}") from e
+
+
+def _to_recipe_entry(recipe_entry: dict | RecipeEntry) -> RecipeEntry:
+    """Ensure recipe_entry is a RecipeEntry instance"""
+    if isinstance(recipe_entry, dict):
+        return RecipeEntry(**recipe_entry)
+    if isinstance(recipe_entry, RecipeEntry):
+        return recipe_entry
+    raise ValueError("Invalid recipe entry")
+
+
+def _new_meal(meal_data: Meal, user_id: str) -> Meal:
+    """Meal to create for user_id"""
+    meal_data.user_id = user_id
+    return meal_data
+
+
+def _update_fields(meal_data: Meal) -> dict:
+    """Fields of an update, the owner is kept as stored"""
+    return meal_data.model_dump(exclude_unset=True, exclude={"user_id", "id"})
+
+
+def _read_meal(meals: list[Meal]) -> Meal:
+    """Meal read by id and owner, deny when none matched"""
+    if not meals:
+        raise AccessDeniedError(MEAL_NOT_FOUND_OR_DENIED)
+    return meals[0]
+
+
+def _owned_meal(meal: Meal | None) -> Meal:
+    """Return the meal modified by a repository operation, deny when none matched"""
+    if meal is None:
+        raise AccessDeniedError(MEAL_NOT_FOUND_OR_DENIED)
+    return meal
 
 
 @dataclass
 class ReadUserMealsUseCase:
-    """Retrieve all meals for a specific user"""
+    """Retrieve the meals of a specific user, optionally over a period"""
+
+    meal_repository: MealRepository
+
+    def __call__(
+        self, user_id: str, start: date | None = None, end: date | None = None
+    ) -> list[Meal]:
+        """Get meals filtered by user_id, between start and end when given"""
+        return self.meal_repository.read(**_period_filters(user_id, start, end))
+
+
+@dataclass
+class IterUserMealsUseCase:
+    """Stream the meals of a specific user, optionally over a period"""
+
+    meal_repository: MealRepository
+
+    def __call__(
+        self, user_id: str, start: date | None = None, end: date | None = None
+    ) -> Iterator[Meal]:
+        """Yield the meals of ReadUserMealsUseCase one by one"""
+        yield from self.meal_repository.iter_read(
+            **_period_filters(user_id, start, end)
+        )
+
+
+@dataclass
+class SummarizeMonthMealsUseCase:
+    """Per-day recipe counts and titles of the meals of a month"""
 
     meal_repository: MealRepository
 
-    def __call__(self, user_id: str) -> list[Meal]:
-        """Get meals filtered by user_id"""
-        return self.meal_repository.read(user_id=user_id)
+    def __call__(self, user_id: str, year: int, month: int) -> list[MealDaySummary]:
+        return _day_summaries(
+            self.meal_repository.read(**_month_filters(user_id, year, month))
+        )
 
 
 @dataclass
@@ -28,10 +154,7 @@ class ReadMealByIdUseCase:
 
     def __call__(self, meal_id: str, user_id: str) -> Meal:
         """Get meal if owned by user, raise AccessDeniedError otherwise"""
-        meals = self.meal_repository.read(id=meal_id, user_id=user_id)
-        if not meals:
-            raise AccessDeniedError(MEAL_NOT_FOUND_OR_DENIED)
-        return meals[0]
+        return _read_meal(self.meal_repository.read(id=meal_id, user_id=user_id))
 
 
 @dataclass
@@ -41,9 +164,12 @@ class CreateMealUseCase:
     meal_repository: MealRepository
 
     def __call__(self, meal_data: Meal, user_id: str) -> Meal:
-        """Create meal with automatic user_id association"""
-        meal_data.user_id = user_id
-        return self.meal_repository.create(meal_data)
+        """Create meal with automatic user_id association (one meal per date)"""
+        # the unique (user_id, date) index rejects taken dates, concurrent creations included
+        try:
+            return self.meal_repository.create(_new_meal(meal_data, user_id))
+        except DuplicateKeyError as e:
+            raise ValueError(MEAL_DATE_TAKEN) from e
 
 
 @dataclass
@@ -53,14 +179,15 @@ class UpdateMealUseCase:
     meal_repository: MealRepository
 
     def __call__(self, meal_id: str, meal_data: Meal, user_id: str) -> Meal:
-        """Update meal if owned by user, raise AccessDeniedError otherwise"""
-        existing_meals = self.meal_repository.read(id=meal_id, user_id=user_id)
-        if not existing_meals:
-            raise AccessDeniedError(MEAL_NOT_FOUND_OR_DENIED)
-        return self.meal_repository.update(
-            meal_id,
-            **meal_data.model_dump(exclude_unset=True, exclude={"user_id", "id"})
-        )
+        """Update meal if owned by user, raise AccessDeniedError otherwise
+
+        Moving the meal to a date that already has one raises ValueError.
+        """
+        _read_meal(self.meal_repository.read(id=meal_id, user_id=user_id))
+        try:
+            return self.meal_repository.update(meal_id, **_update_fields(meal_data))
+        except DuplicateKeyError as e:
+            raise ValueError(MEAL_DATE_TAKEN) from e
 
 
 @dataclass
@@ -71,10 +198,8 @@ class DeleteMealUseCase:
 
     def __call__(self, meal_id: str, user_id: str) -> None:
         """Delete meal if owned by user, raise AccessDeniedError otherwise"""
-        existing_meals = self.meal_repository.read(id=meal_id, user_id=user_id)
-        if not existing_meals:
-            raise AccessDeniedError(MEAL_NOT_FOUND_OR_DENIED)
-        self.meal_repository.delete(existing_meals[0])
+        meal = _read_meal(self.meal_repository.read(id=meal_id, user_id=user_id))
+        self.meal_repository.delete(meal)
 
 
 @dataclass
@@ -84,21 +209,8 @@ class AddRecipeToMealUseCase:
     meal_repository: MealRepository
 
     def __call__(self, meal_id: str, recipe_entry: dict, user_id: str):
-        existing = self.meal_repository.read(id=meal_id, user_id=user_id)
-        if not existing:
-            raise AccessDeniedError(MEAL_NOT_FOUND_OR_DENIED)
-        meal = existing[0]
-        items = list(meal.items or [])
-        # ensure recipe_entry is a RecipeEntry instance
-        if isinstance(recipe_entry, dict):
-            recipe_entry_obj = RecipeEntry(**recipe_entry)
-        elif isinstance(recipe_entry, RecipeEntry):
-            recipe_entry_obj = recipe_entry
-        else:
-            raise ValueError("Invalid recipe entry")
-        items.append(recipe_entry_obj)
-        meal.items = items
-        return self.meal_repository.update(meal_id, **meal.model_dump(exclude_unset=True, exclude={"id", "user_id"}))
+        entry = _to_recipe_entry(recipe_entry)
+        return _owned_meal(self.meal_repository.append_item(meal_id, user_id, entry))
 
 
 @dataclass
@@ -108,23 +220,9 @@ class RemoveRecipeFromMealUseCase:
     meal_repository: MealRepository
 
     def __call__(self, meal_id: str, recipe_id: str, user_id: str):
-        existing = self.meal_repository.read(id=meal_id, user_id=user_id)
-        if not existing:
-            raise AccessDeniedError(MEAL_NOT_FOUND_OR_DENIED)
-        meal = existing[0]
-        # normalize items into RecipeEntry objects for consistent handling
-        items_objs = []
-        for it in (meal.items or []):
-            if isinstance(it, dict):
-                items_objs.append(RecipeEntry(**it))
-            elif isinstance(it, RecipeEntry):
-                items_objs.append(it)
-            else:
-                # unexpected type, keep as-is
-                items_objs.append(it)
-        items = [it for it in items_objs if it.recipe_id != recipe_id]
-        meal.items = items
-        return self.meal_repository.update(meal_id, **meal.model_dump(exclude_unset=True, exclude={"id", "user_id"}))
+        return _owned_meal(
+            self.meal_repository.remove_recipe(meal_id, user_id, recipe_id)
+        )
 
 
 @dataclass
@@ -133,29 +231,145 @@ class PlanRecipeUseCase:
 
     meal_repository: MealRepository
 
-    def __call__(self, date_iso: str, recipe_entry: dict, user_id: str):
-        # find existing meal for date and user
-        meals = self.meal_repository.read(date=date_iso, user_id=user_id)
-        if meals:
-            meal = meals[0]
-            items = list(meal.items or [])
-            # ensure entry is RecipeEntry
-            if isinstance(recipe_entry, dict):
-                entry_obj = RecipeEntry(**recipe_entry)
-            elif isinstance(recipe_entry, RecipeEntry):
-                entry_obj = recipe_entry
-            else:
-                raise ValueError("Invalid recipe entry")
-            items.append(entry_obj)
-            meal.items = items
-            return self.meal_repository.update(meal.id, **meal.model_dump(exclude_unset=True, exclude={"id", "user_id"}))
-        # create a new meal for this date
-        # convert entry to RecipeEntry model
-        if isinstance(recipe_entry, dict):
-            entry_obj = RecipeEntry(**recipe_entry)
-        elif isinstance(recipe_entry, RecipeEntry):
-            entry_obj = recipe_entry
-        else:
-            raise ValueError("Invalid recipe entry")
-        meal = Meal(date=date_iso, items=[entry_obj], user_id=user_id)
-        return self.meal_repository.create(meal)
+    def __call__(self, date_iso: str | date, recipe_entry: dict, user_id: str):
+        day = _to_date(date_iso)
+        # single upsert: concurrent plans for the same date share one meal
+        return self.meal_repository.plan_item(
+            user_id, day, _to_recipe_entry(recipe_entry)
+        )
+
+
+@dataclass
+class AsyncReadUserMealsUseCase:
+    """Retrieve the meals of a specific user from the event loop"""
+
+    meal_repository: AsyncMealRepository
+
+    async def __call__(
+        self, user_id: str, start: date | None = None, end: date | None = None
+    ) -> list[Meal]:
+        """Get meals filtered by user_id, between start and end when given"""
+        return await self.meal_repository.read(**_period_filters(user_id, start, end))
+
+
+@dataclass
+class AsyncIterUserMealsUseCase:
+    """Stream the meals of a specific user from the event loop"""
+
+    meal_repository: AsyncMealRepository
+
+    async def __call__(
+        self, user_id: str, start: date | None = None, end: date | None = None
+    ) -> AsyncIterator[Meal]:
+        """Yield the meals of ReadUserMealsUseCase one by one"""
+        async for meal in self.meal_repository.iter_read(
+            **_period_filters(user_id, start, end)
+        ):
+            yield meal
+
+
+@dataclass
+class AsyncSummarizeMonthMealsUseCase:
+    """Per-day recipe counts and titles of the meals of a month from the event loop"""
+
+    meal_repository: AsyncMealRepository
+
+    async def __call__(
+        self, user_id: str, year: int, month: int
+    ) -> list[MealDaySummary]:
+        filters = _month_filters(user_id, year, month)
+        return _day_summaries(await self.meal_repository.read(**filters))
+
+
+@dataclass
+class AsyncReadMealByIdUseCase:
+    """Retrieve a meal by ID with ownership verification from the event loop"""
+
+    meal_repository: AsyncMealRepository
+
+    async def __call__(self, meal_id: str, user_id: str) -> Meal:
+        """Get meal if owned by user, raise AccessDeniedError otherwise"""
+        return _read_meal(await self.meal_repository.read(id=meal_id, user_id=user_id))
+
+
+@dataclass
+class AsyncCreateMealUseCase:
+    """Create a new meal for the authenticated user from the event loop"""
+
+    meal_repository: AsyncMealRepository
+
+    async def __call__(self, meal_data: Meal, user_id: str) -> Meal:
+        """Create meal with automatic user_id association (one meal per date)"""
+        try:
+            return await self.meal_repository.create(_new_meal(meal_data, user_id))
+        except DuplicateKeyError as e:
+            raise ValueError(MEAL_DATE_TAKEN) from e
+
+
+@dataclass
+class AsyncUpdateMealUseCase:
+    """Update a meal with ownership verification from the event loop"""
+
+    meal_repository: AsyncMealRepository
+
+    async def __call__(self, meal_id: str, meal_data: Meal, user_id: str) -> Meal:
+        """Update meal if owned by user, raise AccessDeniedError otherwise
+
+        Moving the meal to a date that already has one raises ValueError.
+        """
+        _read_meal(await self.meal_repository.read(id=meal_id, user_id=user_id))
+        try:
+            return await self.meal_repository.update(
+                meal_id, **_update_fields(meal_data)
+            )
+        except DuplicateKeyError as e:
+            raise ValueError(MEAL_DATE_TAKEN) from e
+
+
+@dataclass
+class AsyncDeleteMealUseCase:
+    """Delete a meal with ownership verification from the event loop"""
+
+    meal_repository: AsyncMealRepository
+
+    async def __call__(self, meal_id: str, user_id: str) -> None:
+        """Delete meal if owned by user, raise AccessDeniedError otherwise"""
+        meal = _read_meal(await self.meal_repository.read(id=meal_id, user_id=user_id))
+        await self.meal_repository.delete(meal)
+
+
+@dataclass
+class AsyncAddRecipeToMealUseCase:
+    """Append a recipe entry to an existing meal from the event loop"""
+
+    meal_repository: AsyncMealRepository
+
+    async def __call__(self, meal_id: str, recipe_entry: dict, user_id: str):
+        entry = _to_recipe_entry(recipe_entry)
+        return _owned_meal(
+            await self.meal_repository.append_item(meal_id, user_id, entry)
+        )
+
+
+@dataclass
+class AsyncRemoveRecipeFromMealUseCase:
+    """Remove a recipe entry (by recipe_id) from an existing meal from the event loop"""
+
+    meal_repository: AsyncMealRepository
+
+    async def __call__(self, meal_id: str, recipe_id: str, user_id: str):
+        return _owned_meal(
+            await self.meal_repository.remove_recipe(meal_id, user_id, recipe_id)
+        )
+
+
+@dataclass
+class AsyncPlanRecipeUseCase:
+    """Plan a recipe for a date from the event loop: create or append to a meal"""
+
+    meal_repository: AsyncMealRepository
+
+    async def __call__(self, date_iso: str | date, recipe_entry: dict, user_id: str):
+        day = _to_date(date_iso)
+        entry = _to_recipe_entry(recipe_entry)
+        return await self.meal_repository.plan_item(user_id, day, entry)
@@ -0,0 +1,53 @@
+"""Opaque cursors for keyset (cursor) pagination"""
+
+import base64
+import binascii
+import json
+
+INVALID_CURSOR = "Invalid cursor"
+
+
+def encode_cursor(values: list) -> str:
+    """Encode the sort values (then id) of the last element of a page"""
+    raw = json.dumps(values, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str | None, size: int | None = None) -> list | None:
+    """Decode a cursor returned by encode_cursor (None for the first page)
+
+    size: expected number of values, the sort fields of the page then the id
+    """
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError(INVALID_CURSOR) from exc
+    if not isinstance(values, list) or not values:
+        raise ValueError(INVALID_CURSOR)
+    if size is not None and len(values) != size:
+        # cursor of a page with another sort
+        raise ValueError(INVALID_CURSOR)
+    return values
+
+
+def _value(item, field: str):
+    """Value of a (dotted) field of an entity or a dict"""
+    for part in field.split("."):
+        item = item.get(part) if isinstance(item, dict) else getattr(item, part, None)
+    return item
+
+
+def page_of(items: list, limit: int, sort_fields: list[str]) -> dict:
+    """Page of items read with `_limit=limit + 1`, with the cursor of the next page"""
+    has_more = len(items) > limit
+    items = items[:limit]
+    next_cursor = None
+    if has_more and items:
+        last = items[-1]
+        next_cursor = encode_cursor(
+            [*(_value(last, f) for f in sort_fields), _value(last, "id")]
+        )
+    return {"items": items, "next_cursor": next_cursor}
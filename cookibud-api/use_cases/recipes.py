@@ -1,15 +1,289 @@
 """Recipe management use cases"""
 
+import re
+from collections.abc import AsyncIterator, Iterator
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from uuid import uuid4
 
-from adapters.ports.recipe_repository import RecipeRepository
-from entities.recipe import Recipe, Review
+from adapters.ports.catalog_repository import AsyncCatalogRepository, CatalogRepository
+from adapters.ports.recipe_repository import AsyncRecipeRepository, RecipeRepository
+from adapters.ports.review_repository import AsyncReviewRepository, ReviewRepository
+from entities.catalog import CATALOG_KINDS, CatalogEntry
+from entities.recipe import Recipe, RecipeSummary, Review
 from use_cases.exceptions import AccessDeniedError
+from use_cases.pagination import decode_cursor, page_of
 from use_cases.units import normalize_unit_and_qty
 
 NOT_FOUND = "Recipe not found"
+# Sort search results by relevance (text index score)
+RELEVANCE_SORT = [("score", {"$meta": "textScore"})]
+CATALOG_SORT = [("name", 1)]
+# Reviews are listed newest first
+REVIEW_SORT = [("created_at", -1)]
+# Maintained atomically when reviews are added: never written from a request body
+REVIEW_FIELDS = {"reviews", "rating_count", "rating_sum", "rating_avg"}
+# Fields read for list endpoints
+SUMMARY_FIELDS = [
+    "title",
+    "tags",
+    "image_url",
+    "prep_time",
+    "cook_time",
+    "rating_avg",
+    "rating_count",
+]
+
+
+def _build_query(
+    search: str | None,
+    tags: list[str] | None,
+    ingredient: str | None,
+    min_rating: float | None = None,
+    prefix: str | None = None,
+) -> dict:
+    """Build the repository filters of a recipe search"""
+    query: dict = {}
+    if search:
+        # served by the weighted text index on title, ingredient names and description
+        query["$text"] = {"$search": search}
+    if prefix:
+        # the text index only matches whole words: typeaheads match the start of the
+        # lowercased title, a case-sensitive anchored regex bounded by its index
+        query["title_lower"] = {"$regex": f"^{re.escape(prefix.lower())}"}
+    if tags:
+        query["tags"] = {"$in": tags}
+    if ingredient:
+        query["ingredients.name"] = {"$regex": re.escape(ingredient), "$options": "i"}
+    if min_rating is not None:
+        query["rating_avg"] = {"$gte": min_rating}
+    return query
+
+
+def _sort_param(
+    sort_by: str | None, sort_dir: str, search: str | None = None
+) -> list | None:
+    """Compute sort tuple if provided, searches default to relevance"""
+    if not sort_by:
+        return RELEVANCE_SORT if search else None
+    dir_flag = 1 if sort_dir == "asc" else -1
+    return [(sort_by, dir_flag)]
+
+
+def _cursor_sort(sort_by: str | None, sort_dir: str, search: str | None) -> list:
+    """Sort of a cursor page, on fields read with the summaries to build the next cursor"""
+    if sort_by and sort_by not in SUMMARY_FIELDS:
+        raise ValueError(f"Unsupported sort field: {sort_by}")
+    return _sort_param(sort_by, sort_dir, search) or []
+
+
+def _cursor_options(sort: list, cursor: str | None, limit: int) -> dict:
+    """Read options of the page of summaries following cursor"""
+    return {
+        "_sort": sort,
+        "_after": decode_cursor(cursor, len(sort) + 1),
+        "_limit": limit + 1,
+        "_fields": SUMMARY_FIELDS,
+    }
+
+
+def _summary_page(documents: list[dict], sort: list, limit: int) -> dict:
+    """Page of summaries with the cursor of the next page"""
+    page = page_of(documents, limit, [field for field, _ in sort])
+    return {**page, "items": _summaries(page["items"])}
+
+
+def _summary(document: dict) -> RecipeSummary:
+    """Build a list summary from a recipe read with SUMMARY_FIELDS"""
+    rating = document.pop("rating_avg", None)
+    rating = round(rating, 1) if rating is not None else None
+    return RecipeSummary(**document, rating=rating)
+
+
+def _summaries(documents: list[dict]) -> list[RecipeSummary]:
+    """Build list summaries from recipes read with SUMMARY_FIELDS"""
+    return [_summary(document) for document in documents]
+
+
+def _stream_filters(
+    search: str | None,
+    tags: list[str] | None,
+    ingredient: str | None,
+    sort_by: str | None,
+    sort_dir: str,
+    min_rating: float | None,
+    prefix: str | None = None,
+) -> dict:
+    """Read filters of a streamed (unpaginated) recipe listing"""
+    query = _build_query(search, tags, ingredient, min_rating, prefix)
+    filters = {**query, "_fields": SUMMARY_FIELDS}
+    sort_param = _sort_param(sort_by, sort_dir, search)
+    if sort_param:
+        filters["_sort"] = sort_param
+    return filters
+
+
+def _listing_options(
+    sort: list | None, page: int | None, page_size: int | None
+) -> dict:
+    """Read options of the summaries of a listing, paginated with page and page_size"""
+    options: dict = {"_fields": SUMMARY_FIELDS}
+    if sort:
+        options["_sort"] = sort
+    if page is not None and page_size is not None:
+        options.update(_skip=max(0, (page - 1) * page_size), _limit=page_size)
+    return options
+
+
+def _normalize_ingredients(ingredients) -> list:
+    """Normalize ingredient quantities into base units"""
+    normalized_ingredients = []
+    for ing in ingredients or []:
+        qty, unit = normalize_unit_and_qty(ing.quantity, getattr(ing, "unit", None))
+        new_ing = ing.model_copy()
+        new_ing.quantity = qty
+        new_ing.unit = unit
+        normalized_ingredients.append(new_ing)
+    return normalized_ingredients
+
+
+def _catalog_names(recipe: Recipe) -> dict[str, set[str]]:
+    """Tags and ingredient names used by a recipe, per catalog kind"""
+    return {
+        "tag": {t for t in recipe.tags or [] if t},
+        "ingredient": {ing.name for ing in recipe.ingredients or [] if ing.name},
+    }
+
+
+def _catalog_deltas(
+    before: Recipe | None, after: Recipe | None
+) -> dict[str, dict[str, int]]:
+    """Usage count changes of each catalog when a recipe goes from before to after"""
+    deltas: dict[str, dict[str, int]] = {kind: {} for kind in CATALOG_KINDS}
+    for recipe, sign in ((before, -1), (after, 1)):
+        if recipe is None:
+            continue
+        for kind, names in _catalog_names(recipe).items():
+            for name in names:
+                deltas[kind][name] = deltas[kind].get(name, 0) + sign
+    return {
+        kind: {n: d for n, d in changes.items() if d}
+        for kind, changes in deltas.items()
+    }
+
+
+def _update_catalogs(
+    catalog_repository: CatalogRepository | None,
+    before: Recipe | None,
+    after: Recipe | None,
+) -> None:
+    """Keep tag and ingredient catalogs in sync with a recipe change
+
+    before is read ahead of the write: concurrent writes of a recipe apply stale
+    changes, repaired by scripts/migrations/build_recipe_catalogs.py.
+    """
+    if catalog_repository is None:
+        return
+    for kind, deltas in _catalog_deltas(before, after).items():
+        if deltas:
+            catalog_repository.increment(kind, deltas)
+
+
+async def _update_catalogs_async(
+    catalog_repository: AsyncCatalogRepository | None,
+    before: Recipe | None,
+    after: Recipe | None,
+) -> None:
+    """Keep tag and ingredient catalogs in sync with a recipe change"""
+    if catalog_repository is None:
+        return
+    for kind, deltas in _catalog_deltas(before, after).items():
+        if deltas:
+            await catalog_repository.increment(kind, deltas)
+
+
+def _new_recipe(recipe_data: Recipe, user_id: str) -> Recipe:
+    """Recipe to create for user_id, without reviews or ratings whatever the client sent"""
+    if not recipe_data.title:
+        raise ValueError("Recipe title cannot be empty.")
+    recipe_data.ingredients = _normalize_ingredients(recipe_data.ingredients)
+    recipe_data.author_id = user_id
+    defaults = Recipe.model_construct()
+    for field in REVIEW_FIELDS:
+        setattr(recipe_data, field, getattr(defaults, field))
+    return recipe_data
+
+
+def _update_fields(recipe_data: Recipe) -> dict:
+    """Fields of an update, the author and review fields are kept as stored"""
+    if recipe_data.ingredients is not None:
+        recipe_data.ingredients = _normalize_ingredients(recipe_data.ingredients)
+    return recipe_data.model_dump(
+        exclude_unset=True, exclude={"author_id", "id", *REVIEW_FIELDS}
+    )
+
+
+def _updated_recipe(recipe: Recipe, recipe_data: Recipe) -> Recipe:
+    """Recipe as stored after applying the fields set in recipe_data"""
+    fields = ("tags", "ingredients")
+    return recipe.model_copy(
+        update={
+            f: getattr(recipe_data, f)
+            for f in fields
+            if f in recipe_data.model_fields_set
+        }
+    )
+
+
+def _authored_recipe(recipes: list[Recipe], user_id: str, action: str) -> Recipe:
+    """Recipe read before a change, if it was authored by user_id"""
+    if not recipes:
+        raise AccessDeniedError(NOT_FOUND)
+    if recipes[0].author_id != user_id:
+        raise AccessDeniedError(f"Only the author can {action} this recipe")
+    return recipes[0]
+
+
+def _names(entries: list[CatalogEntry]) -> list[str]:
+    """Names of catalog entries still used by at least one recipe"""
+    return [entry.name for entry in entries if entry.count > 0]
+
+
+def _batch_result(recipe_ids: list[str], recipes: list[Recipe | None]) -> dict:
+    """Split a multi-get result into found recipes and missing ids"""
+    return {
+        "items": [recipe for recipe in recipes if recipe is not None],
+        "missing": [rid for rid, recipe in zip(recipe_ids, recipes) if recipe is None],
+    }
+
+
+def _review_filters(recipe_id: str, cursor: str | None, limit: int) -> dict:
+    """Read filters of the page of reviews following cursor, newest first"""
+    return {
+        "recipe_id": recipe_id,
+        "_sort": REVIEW_SORT,
+        "_after": decode_cursor(cursor, len(REVIEW_SORT) + 1),
+        "_limit": limit + 1,
+    }
+
+
+def _review_page(reviews: list[Review], limit: int) -> dict:
+    """Page of reviews with the cursor of the next page"""
+    return page_of(reviews, limit, [field for field, _ in REVIEW_SORT])
+
+
+def _new_review(
+    recipe_id: str, user_id: str, username: str, rating: int, comment: str | None
+) -> Review:
+    """Create a review of recipe_id stamped with the current time"""
+    return Review(
+        recipe_id=recipe_id,
+        user_id=user_id,
+        username=username,
+        rating=int(rating),
+        comment=comment,
+        created_at=datetime.now(timezone.utc).isoformat(),
+    )
+
 
 @dataclass
 class ReadRecipesUseCase:
@@ -17,64 +291,91 @@ class ReadRecipesUseCase:
 
     recipe_repository: RecipeRepository
 
-    def __call__(self, search: str = None, tags: list[str] | None = None, ingredient: str | None = None, page: int | None = None, page_size: int | None = None, sort_by: str | None = None, sort_dir: str = "asc") -> list[Recipe] | dict:
+    def __call__(
+        self,
+        search: str = None,
+        tags: list[str] | None = None,
+        ingredient: str | None = None,
+        page: int | None = None,
+        page_size: int | None = None,
+        sort_by: str | None = None,
+        sort_dir: str = "asc",
+        min_rating: float | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
+        prefix: str | None = None,
+    ) -> list[RecipeSummary] | dict:
         """Get recipes with optional search, tag, or ingredient filters.
 
-        - search: performs case-insensitive substring match against title, description or ingredient name
+        - search: full-text search on title, ingredient names and description, by relevance
+        - prefix: case-insensitive match of the start of the title (typeaheads)
         - tags: list of tags to match (any match)
-        - ingredient: match against ingredient name only
+        - ingredient: case-insensitive substring match against ingredient name only
+        - min_rating: minimum average rating (sort on it with sort_by="rating_avg")
+        - limit: cursor pagination, pages of `limit` recipes with the `next_cursor` to
+          pass as `cursor` for the next page (preferred over `page`/`page_size`, whose
+          cost grows with the page number)
+
+        Recipes are returned as summaries, reading only the fields they need.
         """
-        query: dict = {}
-        if search:
-            query["$or"] = [
-                {"title": {"$regex": search, "$options": "i"}},
-                {"description": {"$regex": search, "$options": "i"}},
-                {"ingredients.name": {"$regex": search, "$options": "i"}},
-            ]
-        if tags:
-            query["tags"] = {"$in": tags}
-        if ingredient:
-            query["ingredients.name"] = {"$regex": ingredient, "$options": "i"}
+        query = _build_query(search, tags, ingredient, min_rating, prefix)
+
+        if limit is not None:
+            sort = _cursor_sort(sort_by, sort_dir, search)
+            documents = self.recipe_repository.read(
+                **query, **_cursor_options(sort, cursor, limit)
+            )
+            return _summary_page(documents, sort, limit)
 
         if not (query or page):
-            return self.recipe_repository.read()
-        # when pagination is requested, perform paginated read and return metadata
-        if page is not None and page_size is not None:
-            # compute skip/limit
-            skip = max(0, (page - 1) * page_size)
-            # compute sort tuple if provided
-            sort_param = None
-            if sort_by:
-                dir_flag = 1 if sort_dir == "asc" else -1
-                sort_param = [(sort_by, dir_flag)]
+            return _summaries(self.recipe_repository.read(_fields=SUMMARY_FIELDS))
+        sort_param = _sort_param(sort_by, sort_dir, search)
+        options = _listing_options(sort_param, page, page_size)
+        items = _summaries(self.recipe_repository.read(**query, **options))
+        if page is None or page_size is None:
+            return items
+        # count on the database side instead of hydrating every match
+        total_items = self.recipe_repository.count(**query)
+        return {
+            "items": items,
+            "total": total_items,
+            "page": page,
+            "page_size": page_size,
+        }
+
 
-            # compute total count by reading without pagination
-            total_items = len(self.recipe_repository.read(**query))
+@dataclass
+class IterRecipesUseCase:
+    """Stream recipe summaries (public read), for listings too large to build at once"""
 
-            items = self.recipe_repository.read(**{**query, "_skip": skip, "_limit": page_size, "_sort": sort_param} if sort_param else {**query, "_skip": skip, "_limit": page_size})
-            return {"items": items, "total": total_items, "page": page, "page_size": page_size}
+    recipe_repository: RecipeRepository
 
-        # no pagination requested: simple read (with optional sort)
-        if sort_by:
-            dir_flag = 1 if sort_dir == "asc" else -1
-            return self.recipe_repository.read(**{**query, "_sort": [(sort_by, dir_flag)]})
-        return self.recipe_repository.read(**query)
+    def __call__(
+        self,
+        search: str = None,
+        tags: list[str] | None = None,
+        ingredient: str | None = None,
+        sort_by: str | None = None,
+        sort_dir: str = "asc",
+        min_rating: float | None = None,
+        prefix: str | None = None,
+    ) -> Iterator[RecipeSummary]:
+        """Yield the summaries of ReadRecipesUseCase (same filters and sort) one by one"""
+        filters = _stream_filters(
+            search, tags, ingredient, sort_by, sort_dir, min_rating, prefix
+        )
+        for document in self.recipe_repository.iter_read(**filters):
+            yield _summary(document)
 
 
 @dataclass
 class GetTagsUseCase:
-    """Return a deduplicated sorted list of tags used across recipes"""
+    """Return the sorted list of tags used across recipes (from the tag catalog)"""
 
-    recipe_repository: RecipeRepository
+    catalog_repository: CatalogRepository
 
     def __call__(self) -> list[str]:
-        recipes: list[Recipe] = self.recipe_repository.read()
-        tags = set()
-        for r in recipes:
-            for t in getattr(r, "tags", []) or []:
-                if t:
-                    tags.add(t)
-        return sorted(tags)
+        return _names(self.catalog_repository.read(kind="tag", _sort=CATALOG_SORT))
 
 
 @dataclass
@@ -86,9 +387,19 @@ class ReadRecipeByIdUseCase:
     def __call__(self, recipe_id: str) -> Recipe | None:
         """Get recipe by ID"""
         recipes = self.recipe_repository.read(id=recipe_id)
-        if not recipes:
-            return None
-        return recipes[0]
+        return recipes[0] if recipes else None
+
+
+@dataclass
+class ReadRecipesByIdsUseCase:
+    """Retrieve several recipes by ID at once (public read)"""
+
+    recipe_repository: RecipeRepository
+
+    def __call__(self, recipe_ids: list[str]) -> dict:
+        """Get recipes in the order of recipe_ids and report the missing ones"""
+        recipes = self.recipe_repository.read_many(recipe_ids)
+        return _batch_result(recipe_ids, recipes)
 
 
 @dataclass
@@ -96,22 +407,14 @@ class CreateRecipeUseCase:
     """Create a new recipe owned by the authenticated user"""
 
     recipe_repository: RecipeRepository
+    catalog_repository: CatalogRepository | None = None
 
     def __call__(self, recipe_data: Recipe, user_id: str) -> Recipe:
         """Create recipe with automatic author_id association"""
-        if not recipe_data.title:
-            raise ValueError("Recipe title cannot be empty.")
-        # normalize ingredient quantities if the recipe includes unit information
-        normalized_ingredients = []
-        for ing in recipe_data.ingredients or []:
-            qty, unit = normalize_unit_and_qty(ing.quantity, getattr(ing, "unit", None))
-            new_ing = ing.model_copy()
-            new_ing.quantity = qty
-            new_ing.unit = unit
-            normalized_ingredients.append(new_ing)
-        recipe_data.ingredients = normalized_ingredients
-        recipe_data.author_id = user_id
-        return self.recipe_repository.create(recipe_data)
+        recipe_data = _new_recipe(recipe_data, user_id)
+        created = self.recipe_repository.create(recipe_data)
+        _update_catalogs(self.catalog_repository, None, recipe_data)
+        return created
 
 
 @dataclass
@@ -119,34 +422,19 @@ class UpdateRecipeUseCase:
     """Update a recipe with author ownership verification"""
 
     recipe_repository: RecipeRepository
+    catalog_repository: CatalogRepository | None = None
 
     def __call__(self, recipe_id: str, recipe_data: Recipe, user_id: str) -> Recipe:
         """Update recipe if authored by user, raise AccessDeniedError otherwise"""
         existing_recipes = self.recipe_repository.read(id=recipe_id)
-        if not existing_recipes:
-            raise AccessDeniedError(NOT_FOUND)
-
-        recipe: Recipe = existing_recipes[0]
-        if recipe.author_id != user_id:
-            raise AccessDeniedError("Only the author can update this recipe")
-
-        # Normalize ingredients if present in the update payload
-        if recipe_data.ingredients is not None:
-            normalized_ingredients = []
-            for ing in recipe_data.ingredients:
-                qty, unit = normalize_unit_and_qty(
-                    ing.quantity, getattr(ing, "unit", None)
-                )
-                new_ing = ing.model_copy()
-                new_ing.quantity = qty
-                new_ing.unit = unit
-                normalized_ingredients.append(new_ing)
-            recipe_data.ingredients = normalized_ingredients
-
-        return self.recipe_repository.update(
-            recipe_id,
-            **recipe_data.model_dump(exclude_unset=True, exclude={"author_id", "id"})
+        recipe = _authored_recipe(existing_recipes, user_id, "update")
+        updated = self.recipe_repository.update(
+            recipe_id, **_update_fields(recipe_data)
         )
+        _update_catalogs(
+            self.catalog_repository, recipe, _updated_recipe(recipe, recipe_data)
+        )
+        return updated
 
 
 @dataclass
@@ -154,44 +442,34 @@ class DeleteRecipeUseCase:
     """Delete a recipe with author ownership verification"""
 
     recipe_repository: RecipeRepository
+    catalog_repository: CatalogRepository | None = None
 
     def __call__(self, recipe_id: str, user_id: str) -> None:
         """Delete recipe if authored by user, raise AccessDeniedError otherwise"""
         existing_recipes = self.recipe_repository.read(id=recipe_id)
-        if not existing_recipes:
-            raise AccessDeniedError(NOT_FOUND)
-
-        recipe: Recipe = existing_recipes[0]
-        if recipe.author_id != user_id:
-            raise AccessDeniedError("Only the author can delete this recipe")
-
+        recipe = _authored_recipe(existing_recipes, user_id, "delete")
         self.recipe_repository.delete(recipe)
+        _update_catalogs(self.catalog_repository, recipe, None)
 
 
 @dataclass
 class GetIngredientNamesUseCase:
-    """Return a deduplicated list of ingredient names from all recipes"""
+    """Return the sorted list of ingredient names used across recipes (from the catalog)"""
 
-    recipe_repository: RecipeRepository
+    catalog_repository: CatalogRepository
 
     def __call__(self) -> list[str]:
-        recipes: list[Recipe] = self.recipe_repository.read()
-        names = set()
-        for r in recipes:
-            ingredients = r.ingredients
-            if not ingredients:
-                continue
-            for ing in ingredients:
-                name = ing.name
-                if name:
-                    names.add(name)
-        return sorted(names)
+        return _names(
+            self.catalog_repository.read(kind="ingredient", _sort=CATALOG_SORT)
+        )
 
 
 @dataclass
 class AddReviewUseCase:
     """Add a review to a recipe"""
+
     recipe_repository: RecipeRepository
+    review_repository: ReviewRepository
 
     def __call__(
         self,
@@ -201,26 +479,237 @@ class AddReviewUseCase:
         rating: int,
         comment: str | None,
     ) -> Review:
-        # fetch recipe
-        recipes = self.recipe_repository.read(id=recipe_id)
-        if not recipes:
+        rev = self.review_repository.create(
+            _new_review(recipe_id, user_id, username, rating, comment)
+        )
+        # rating aggregates and latest reviews are updated atomically on the recipe
+        if not self.recipe_repository.add_review(recipe_id, rev):
+            self.review_repository.delete(rev)
             raise ValueError(NOT_FOUND)
-        recipe = recipes[0]
-        # create review
-        rev = Review(
-            id=str(uuid4()),
-            user_id=user_id,
-            username=username,
-            rating=int(rating),
-            comment=comment,
-            created_at=datetime.now(timezone.utc).isoformat(),
+        return rev
+
+
+@dataclass
+class ReadRecipeReviewsUseCase:
+    """List the reviews of a recipe, newest first, one page at a time"""
+
+    review_repository: ReviewRepository
+
+    def __call__(
+        self, recipe_id: str, cursor: str | None = None, limit: int = 20
+    ) -> dict:
+        """Return a page of reviews and the `next_cursor` to pass for the next page"""
+        reviews = self.review_repository.read(
+            **_review_filters(recipe_id, cursor, limit)
+        )
+        return _review_page(reviews, limit)
+
+
+@dataclass
+class AsyncReadRecipesUseCase:
+    """Retrieve recipes from the event loop (public read - anyone can see)"""
+
+    recipe_repository: AsyncRecipeRepository
+
+    async def __call__(
+        self,
+        search: str = None,
+        tags: list[str] | None = None,
+        ingredient: str | None = None,
+        page: int | None = None,
+        page_size: int | None = None,
+        sort_by: str | None = None,
+        sort_dir: str = "asc",
+        min_rating: float | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
+        prefix: str | None = None,
+    ) -> list[RecipeSummary] | dict:
+        """Get recipes with optional search, tag, or ingredient filters (see ReadRecipesUseCase)"""
+        query = _build_query(search, tags, ingredient, min_rating, prefix)
+
+        if limit is not None:
+            sort = _cursor_sort(sort_by, sort_dir, search)
+            options = _cursor_options(sort, cursor, limit)
+            return _summary_page(
+                await self.recipe_repository.read(**query, **options), sort, limit
+            )
+
+        if not (query or page):
+            return _summaries(await self.recipe_repository.read(_fields=SUMMARY_FIELDS))
+        sort_param = _sort_param(sort_by, sort_dir, search)
+        options = _listing_options(sort_param, page, page_size)
+        items = _summaries(await self.recipe_repository.read(**query, **options))
+        if page is None or page_size is None:
+            return items
+        total_items = await self.recipe_repository.count(**query)
+        return {
+            "items": items,
+            "total": total_items,
+            "page": page,
+            "page_size": page_size,
+        }
+
+
+@dataclass
+class AsyncIterRecipesUseCase:
+    """Stream recipe summaries from the event loop (public read)"""
+
+    recipe_repository: AsyncRecipeRepository
+
+    async def __call__(
+        self,
+        search: str = None,
+        tags: list[str] | None = None,
+        ingredient: str | None = None,
+        sort_by: str | None = None,
+        sort_dir: str = "asc",
+        min_rating: float | None = None,
+        prefix: str | None = None,
+    ) -> AsyncIterator[RecipeSummary]:
+        """Yield the summaries of ReadRecipesUseCase (same filters and sort) one by one"""
+        filters = _stream_filters(
+            search, tags, ingredient, sort_by, sort_dir, min_rating, prefix
+        )
+        async for document in self.recipe_repository.iter_read(**filters):
+            yield _summary(document)
+
+
+@dataclass
+class AsyncGetTagsUseCase:
+    """Return the sorted list of tags used across recipes (from the tag catalog)"""
+
+    catalog_repository: AsyncCatalogRepository
+
+    async def __call__(self) -> list[str]:
+        return _names(
+            await self.catalog_repository.read(kind="tag", _sort=CATALOG_SORT)
+        )
+
+
+@dataclass
+class AsyncReadRecipeByIdUseCase:
+    """Retrieve a recipe by ID from the event loop (public read)"""
+
+    recipe_repository: AsyncRecipeRepository
+
+    async def __call__(self, recipe_id: str) -> Recipe | None:
+        """Get recipe by ID"""
+        recipes = await self.recipe_repository.read(id=recipe_id)
+        return recipes[0] if recipes else None
+
+
+@dataclass
+class AsyncReadRecipesByIdsUseCase:
+    """Retrieve several recipes by ID at once from the event loop (public read)"""
+
+    recipe_repository: AsyncRecipeRepository
+
+    async def __call__(self, recipe_ids: list[str]) -> dict:
+        """Get recipes in the order of recipe_ids and report the missing ones"""
+        recipes = await self.recipe_repository.read_many(recipe_ids)
+        return _batch_result(recipe_ids, recipes)
+
+
+@dataclass
+class AsyncCreateRecipeUseCase:
+    """Create a new recipe owned by the authenticated user from the event loop"""
+
+    recipe_repository: AsyncRecipeRepository
+    catalog_repository: AsyncCatalogRepository | None = None
+
+    async def __call__(self, recipe_data: Recipe, user_id: str) -> Recipe:
+        """Create recipe with automatic author_id association"""
+        recipe_data = _new_recipe(recipe_data, user_id)
+        created = await self.recipe_repository.create(recipe_data)
+        await _update_catalogs_async(self.catalog_repository, None, recipe_data)
+        return created
+
+
+@dataclass
+class AsyncUpdateRecipeUseCase:
+    """Update a recipe with author ownership verification from the event loop"""
+
+    recipe_repository: AsyncRecipeRepository
+    catalog_repository: AsyncCatalogRepository | None = None
+
+    async def __call__(
+        self, recipe_id: str, recipe_data: Recipe, user_id: str
+    ) -> Recipe:
+        """Update recipe if authored by user, raise AccessDeniedError otherwise"""
+        existing_recipes = await self.recipe_repository.read(id=recipe_id)
+        recipe = _authored_recipe(existing_recipes, user_id, "update")
+        updated = await self.recipe_repository.update(
+            recipe_id, **_update_fields(recipe_data)
         )
-        recipe.reviews = recipe.reviews or []
-        recipe.reviews.append(rev)
-        # persist
-        self.recipe_repository.update(
-            recipe_id,
-            **recipe.model_dump(exclude_unset=True, exclude={"id", "author_id"})
+        await _update_catalogs_async(
+            self.catalog_repository, recipe, _updated_recipe(recipe, recipe_data)
         )
-        # return the newly created review
+        return updated
+
+
+@dataclass
+class AsyncDeleteRecipeUseCase:
+    """Delete a recipe with author ownership verification from the event loop"""
+
+    recipe_repository: AsyncRecipeRepository
+    catalog_repository: AsyncCatalogRepository | None = None
+
+    async def __call__(self, recipe_id: str, user_id: str) -> None:
+        """Delete recipe if authored by user, raise AccessDeniedError otherwise"""
+        existing_recipes = await self.recipe_repository.read(id=recipe_id)
+        recipe = _authored_recipe(existing_recipes, user_id, "delete")
+        await self.recipe_repository.delete(recipe)
+        await _update_catalogs_async(self.catalog_repository, recipe, None)
+
+
+@dataclass
+class AsyncGetIngredientNamesUseCase:
+    """Return the sorted list of ingredient names used across recipes (from the catalog)"""
+
+    catalog_repository: AsyncCatalogRepository
+
+    async def __call__(self) -> list[str]:
+        return _names(
+            await self.catalog_repository.read(kind="ingredient", _sort=CATALOG_SORT)
+        )
+
+
+@dataclass
+class AsyncAddReviewUseCase:
+    """Add a review to a recipe from the event loop"""
+
+    recipe_repository: AsyncRecipeRepository
+    review_repository: AsyncReviewRepository
+
+    async def __call__(
+        self,
+        recipe_id: str,
+        user_id: str,
+        username: str,
+        rating: int,
+        comment: str | None,
+    ) -> Review:
+        rev = await self.review_repository.create(
+            _new_review(recipe_id, user_id, username, rating, comment)
+        )
+        if not await self.recipe_repository.add_review(recipe_id, rev):
+            await self.review_repository.delete(rev)
+            raise ValueError(NOT_FOUND)
         return rev
+
+
+@dataclass
+class AsyncReadRecipeReviewsUseCase:
+    """List the reviews of a recipe, newest first, from the event loop"""
+
+    review_repository: AsyncReviewRepository
+
+    async def __call__(
+        self, recipe_id: str, cursor: str | None = None, limit: int = 20
+    ) -> dict:
+        """Return a page of reviews and the `next_cursor` to pass for the next page"""
+        reviews = await self.review_repository.read(
+            **_review_filters(recipe_id, cursor, limit)
+        )
+        return _review_page(reviews, limit)
@@ -1,93 +1,31 @@
 import { useEffect, useState } from 'react';
-import type { Meal, GroceryList } from '../../utils/constants/types';
-import type { IRecipe } from '../Recipes/types';
-import { formatQtyUnit, normalizeQtyToBase } from '../../utils/quantities';
+import type { GroceryList } from '../../utils/constants/types';
+import { formatQtyUnit } from '../../utils/quantities';
 
 import { Button, Card, Checkbox, Progress } from '@soilhat/react-components';
 import { callApi } from '../../services/api';
 
-type Props = {
-  meals: Meal[];
-};
-
-export default function GroceryPeriod({ meals }: Readonly<Props>) {
+export default function GroceryPeriod() {
   const [periodStart, setPeriodStart] = useState<string>(() => {
     const d = new Date(); d.setDate(1); return `${d.getFullYear()}-${(d.getMonth() + 1).toString().padStart(2, '0')}-${d.getDate().toString().padStart(2, '0')}`;
   });
   const [periodEnd, setPeriodEnd] = useState<string>(() => {
     const d = new Date(); d.setMonth(d.getMonth() + 1); d.setDate(0); return `${d.getFullYear()}-${(d.getMonth() + 1).toString().padStart(2, '0')}-${d.getDate().toString().padStart(2, '0')}`;
   });
-  const [grocery, setGrocery] = useState<Record<string, { qty?: number; unit?: string; entries: string[] }>>({});
+  const [generated, setGenerated] = useState<GroceryList | null>(null);
   const [loading, setLoading] = useState(false);
   const [savedLists, setSavedLists] = useState<GroceryList[]>([]);
 
-  async function fetchRecipesByIds(ids: string[]): Promise<Record<string, IRecipe | undefined>> {
-    const out: Record<string, IRecipe | undefined> = {};
-    await Promise.all(ids.map(async (rid) => {
-      try {
-        const rres = await callApi<IRecipe>(`/recipes/${rid}`);
-        out[rid] = rres.data;
-      } catch (e) {
-        console.error(`Failed to fetch recipe ${rid}`, e);
-      }
-    }));
-    return out;
-  }
-  function aggregateIngredients(selectedMeals: Meal[], recipesById: Record<string, IRecipe | undefined>) {
-    const agg: Record<string, { qty?: number; unit?: string; entries: string[] }> = {};
-    for (const m of selectedMeals) {
-      for (const it of m.items || []) {
-        const rid = it.recipe_id ?? undefined;
-        if (!rid) continue;
-        const recipe = recipesById[rid];
-        const servings = it.servings ?? 1;
-        if (!recipe) continue;
-        addIngredientsFromRecipe(recipe, servings, agg);
-      }
-    }
-    return agg;
-  }
-  function addIngredientsFromRecipe(recipe: IRecipe | undefined, servings: number, agg: Record<string, { qty?: number; unit?: string; entries: string[] }>) {
-    if (!recipe) return;
-    for (const ing of recipe.ingredients || []) {
-      const name = ing.name;
-      const qtyRaw = String(ing.quantity ?? '');
-      const exec = /^\s*(\d*\.?\d+)\s*(.*)$/u.exec(qtyRaw);
-      if (exec) {
-        const v = Number.parseFloat(exec[1]) * servings;
-        const unit = (exec[2] || '').trim();
-        const normalized = normalizeQtyToBase(v, unit);
-        const key = `${name}::${normalized.unit}`;
-        if (!agg[key]) agg[key] = { qty: 0, unit: normalized.unit, entries: [] };
-        agg[key].qty = (agg[key].qty ?? 0) + (normalized.qty ?? 0);
-        agg[key].entries.push(`${recipe.title} ×${servings}: ${qtyRaw}`);
-      } else {
-        const normalized = normalizeQtyToBase(undefined, '');
-        const key = `${name}::${normalized.unit}`;
-        if (!agg[key]) agg[key] = { entries: [] };
-        agg[key].entries.push(`${recipe.title} ×${servings}: ${qtyRaw || '—'}`);
-      }
-    }
-  }
-
+  // the API aggregates the ingredients of the planned recipes and saves the list in one request
   const generate = async () => {
     setLoading(true);
     try {
-      const start = periodStart;
-      const end = periodEnd;
-      const selectedMeals = meals.filter(m => m.date >= start && m.date <= end);
-      const recipeIds = new Set<string>();
-      for (const m of selectedMeals) {
-        for (const it of m.items || []) {
-          if (it.recipe_id) recipeIds.add(it.recipe_id);
-        }
-      }
-      const recipesById = await fetchRecipesByIds(Array.from(recipeIds));
-      const agg = aggregateIngredients(selectedMeals, recipesById);
-      setGrocery(agg);
+      const res = await callApi<GroceryList>(`/groceries/generate?start=${periodStart}&end=${periodEnd}`, 'POST');
+      setGenerated(res.data);
+      setSavedLists(prev => [res.data, ...prev]);
     } catch (err) {
       console.error('Failed to generate grocery list', err);
-      setGrocery({});
+      setGenerated(null);
     } finally {
       setLoading(false);
     }
@@ -106,31 +44,6 @@ export default function GroceryPeriod({ meals }: Readonly<Props>) {
     return () => { mounted = false; };
   }, []);
 
-  async function saveGrocery() {
-    const items = Object.entries(grocery).map(([key, val]) => {
-      const [name, unit] = key.split('::');
-      return {
-        name,
-        qty: val.qty,
-        unit: unit || "",
-        entries: val.entries,
-        bought: false,
-      };
-    });
-    const payload = {
-      title: `Grocery ${periodStart} — ${periodEnd}`,
-      period_start: periodStart,
-      period_end: periodEnd,
-      items,
-    };
-    try {
-      const res = await callApi<GroceryList>(`/groceries`, 'POST', undefined, payload);
-      setSavedLists(prev => [res.data, ...prev]);
-    } catch (err) {
-      console.error('Failed to save grocery list', err);
-    }
-  }
-
   async function toggleItemStatus(listId: string, itemId: string, newVal: boolean) {
     try {
       const url = `/groceries/${listId}/items/${itemId}?bought=${newVal}`;
@@ -171,32 +84,18 @@ export default function GroceryPeriod({ meals }: Readonly<Props>) {
       <div className="mt-4">
         {loading ? <div>Generating…</div> : (
           <ul className="grid grid-cols-1 sm:grid-cols-2 gap-3">
-            {Object.entries(grocery).map(([key, val]) => {
-              const [name, unit] = key.split('::');
-              let qtyDisplay: string | undefined = undefined;
-              if (val.qty !== undefined) {
-                qtyDisplay = formatQtyUnit(val.qty, unit);
-              }
-              return (
-                <li key={key} className="p-2 sm:p-3 rounded border dark:border-gray-700">
-                  <div className="font-medium text-base sm:text-lg break-words">{name}{qtyDisplay ? ` — ${qtyDisplay}` : ''}</div>
-                  <div className="text-sm text-gray-600 dark:text-gray-300 mt-1 space-y-1">{val.entries.map(e => <div key={e} className="break-words">{e}</div>)}</div>
-                </li>
-              );
-            })}
+            {(generated?.items || []).map((it) => (
+              <li key={it.id ?? `${it.name}::${it.unit}`} className="p-2 sm:p-3 rounded border dark:border-gray-700">
+                <div className="font-medium text-base sm:text-lg break-words">{it.name}{it.qty != null ? ` — ${formatQtyUnit(it.qty, it.unit)}` : ''}</div>
+                <div className="text-sm text-gray-600 dark:text-gray-300 mt-1 space-y-1">{(it.entries || []).map(e => <div key={e} className="break-words">{e}</div>)}</div>
+              </li>
+            ))}
           </ul>
         )}
-        {(!loading && Object.keys(grocery).length === 0) && (
+        {(!loading && generated && !generated.items?.length) && (
           <div className="mt-2 text-sm text-gray-600 dark:text-gray-400">No ingredients found for the selected period.</div>
         )}
       </div>
-      <div className="mt-4">
-        {Object.keys(grocery).length > 0 && (
-          <div className="flex gap-2 mt-3">
-            <Button onClick={saveGrocery} className="px-3 py-1">Save grocery list</Button>
-          </div>
-        )}
-      </div>
 
       <div className="mt-6">
         <h2 className="text-lg font-medium mb-3">Saved grocery lists</h2>
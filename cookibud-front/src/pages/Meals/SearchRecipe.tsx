@@ -1,7 +1,7 @@
 import React, { useEffect, useRef, useState } from 'react';
 import { Button } from '@soilhat/react-components';
 import { callApi } from '../../services/api';
-import type { IRecipe } from '../Recipes/types';
+import type { IRecipeSummary } from '../Recipes/types';
 
 type Props = {
   onSelect: (recipeId: string | undefined, title?: string) => void;
@@ -11,7 +11,7 @@ type Props = {
 
 export default function SearchRecipe({ onSelect, placeholder = 'Search recipes...', allowFreeText = true }: Readonly<Props>) {
   const [term, setTerm] = useState('');
-  const [suggestions, setSuggestions] = useState<IRecipe[]>([]);
+  const [suggestions, setSuggestions] = useState<IRecipeSummary[]>([]);
   const [loading, setLoading] = useState(false);
   const [focused, setFocused] = useState(-1);
   const inputRef = useRef<HTMLInputElement | null>(null);
@@ -22,15 +22,16 @@ export default function SearchRecipe({ onSelect, placeholder = 'Search recipes..
     if (!term || term.length < 2) { setSuggestions([]); setFocused(-1); return; }
     setLoading(true);
     const t = setTimeout(() => {
-      callApi<IRecipe[]>(`/recipes?search=${encodeURIComponent(term)}`)
-        .then(res => setSuggestions(res.data))
+      // prefix matches partial words, search only whole ones
+      callApi<{ items: IRecipeSummary[], next_cursor: string | null }>(`/recipes?prefix=${encodeURIComponent(term)}&sort_by=title&limit=10`)
+        .then(res => setSuggestions(res.data.items))
         .catch(() => setSuggestions([]))
         .finally(() => setLoading(false));
     }, 250);
     return () => clearTimeout(t);
   }, [term]);
 
-  const pick = (s: IRecipe) => {
+  const pick = (s: IRecipeSummary) => {
     onSelect(s?.id, s?.title);
     setTerm(s?.title ?? '');
     setSuggestions([]);
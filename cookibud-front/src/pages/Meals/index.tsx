@@ -4,10 +4,17 @@ import SearchRecipe from './SearchRecipe';
 import GroceryPeriod from './GroceryPeriod';
 import { callApi } from "../../services/api";
 import { useNavigate } from 'react-router-dom';
-import type { Meal, MealRecipe } from '../../utils/constants/types';
+import type { Meal, MealDaySummary, MealRecipe } from '../../utils/constants/types';
 
 function pad(n: number) { return n < 10 ? `0${n}` : `${n}` }
 function toISODate(d: Date) { return `${d.getFullYear()}-${pad(d.getMonth()+1)}-${pad(d.getDate())}` }
+// titles of the planned days of the displayed month only, full meals are read when edited
+function monthSummaryUrl(year: number, month: number) {
+  return `/meals/summary?month=${year}-${pad(month + 1)}`;
+}
+function toCalendarMeals(days: MealDaySummary[]): Meal[] {
+  return days.map(d => ({ id: d.meal_id, date: d.date, items: d.titles.map(title => ({ title, servings: 1 })) }));
+}
 
 export default function MealsPage() {
   const today = new Date();
@@ -26,9 +33,9 @@ export default function MealsPage() {
   const navigate = useNavigate();
 
   useEffect(() => {
-    // load meals and recipes
-    callApi<Meal[]>("/meals").then(res => setMeals(res.data || [])).catch(() => {});
-  }, []);
+    // load the meals of the displayed month
+    callApi<MealDaySummary[]>(monthSummaryUrl(year, month)).then(res => setMeals(toCalendarMeals(res.data || []))).catch(() => {});
+  }, [year, month]);
 
   const mealsByDate = meals.reduce<Record<string, Meal[]>>((acc, m) => {
     acc[m.date] ??= [];
@@ -36,7 +43,7 @@ export default function MealsPage() {
     return acc;
   }, {} as Record<string, Meal[]>);
 
-  const openPlan = (d: Date) => {
+  const openPlan = async (d: Date) => {
     setSelectedDate(toISODate(d));
     setSelectedRecipeId(undefined);
     setPlannedRecipes([]);
@@ -45,11 +52,16 @@ export default function MealsPage() {
     const iso = toISODate(d);
     const dayMeals = mealsByDate[iso] ?? [];
     if (dayMeals.length > 0) {
-      // pick the first meal to edit
-      const meal = dayMeals[0];
-      setEditingMealId(meal.id ?? null);
+      // pick the first meal to edit, the calendar only has its titles
+      const mealId = dayMeals[0].id ?? null;
+      setEditingMealId(mealId);
+      let items: MealRecipe[] = [];
+      try {
+        items = mealId ? (await callApi<Meal>(`/meals/${mealId}`)).data.items ?? [] : [];
+      } catch (err) {
+        console.error("Failed to load meal", err);
+      }
       // map backend items/recipes to local plannedRecipes
-      const items = meal.items ?? [];
       const mapped: MealRecipe[] = items.map(it => ({ recipe_id: it.recipe_id, title: it.title ?? it.recipe_id, servings: it.servings ?? 1 }));
       setPlannedRecipes(mapped);
     } else {
@@ -86,8 +98,8 @@ export default function MealsPage() {
         await callApi("/meals", "POST", undefined, payload);
       }
       // refresh meals
-      const res = await callApi<Meal[]>("/meals");
-      setMeals(res.data || []);
+      const res = await callApi<MealDaySummary[]>(monthSummaryUrl(year, month));
+      setMeals(toCalendarMeals(res.data || []));
       setModalOpen(false);
     } catch (err) {
       console.error("Failed to save meal", err);
@@ -161,7 +173,7 @@ export default function MealsPage() {
       </Modal>
       <Modal open={groceryModalOpen} onClose={() => setGroceryModalOpen(false)}>
         <div className="max-w-2xl mx-auto p-4 max-h-[calc(100vh-4rem)] overflow-auto z-50">
-          <GroceryPeriod meals={meals} />
+          <GroceryPeriod />
         </div>
       </Modal>
     </Container>
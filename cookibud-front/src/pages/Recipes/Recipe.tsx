@@ -10,11 +10,21 @@ import type { IRecipe, IIngredient, IReview } from "./types";
 import type { MealRecipe, Meal } from "../../utils/constants/types";
 
 
+// upcoming meals only: the payload does not grow with the meal history
+function upcomingMealsUrl() {
+  const d = new Date();
+  const pad = (n: number) => n.toString().padStart(2, '0');
+  return `/meals?from=${d.getFullYear()}-${pad(d.getMonth() + 1)}-${pad(d.getDate())}`;
+}
+
 export default function Recipe() {
   const [recipe, setRecipe] = useState<IRecipe>({});
   const [ingredientNames, setIngredientNames] = useState<string[]>([]);
   const [userMeals, setUserMeals] = useState<Meal[]>([]);
   const [planning, setPlanning] = useState(false);
+  // every review, newest first, loaded page by page on demand
+  const [allReviews, setAllReviews] = useState<IReview[] | null>(null);
+  const [reviewsCursor, setReviewsCursor] = useState<string | null>(null);
   const [allTags, setAllTags] = useState<string[]>([]);
   const { user } = useAuth();
   const [isUploading, setIsUploading] = useState(false);
@@ -24,13 +34,25 @@ export default function Recipe() {
   const { t } = useTranslation("translation", { keyPrefix: "pages.recipe" });
   const navigate = useNavigate();
 
+  const loadReviews = (cursor?: string | null) => {
+    const qs = cursor ? `?cursor=${encodeURIComponent(cursor)}` : '';
+    callApi<{ items: IReview[], next_cursor: string | null }>(`/recipes/${recipeId}/reviews${qs}`)
+      .then((res) => {
+        setAllReviews((prev) => [...(cursor ? prev || [] : []), ...res.data.items]);
+        setReviewsCursor(res.data.next_cursor);
+      })
+      .catch(console.error);
+  };
+  const shownReviews = allReviews ?? recipe.reviews ?? [];
+  const loadUserMeals = () => callApi<Meal[]>(upcomingMealsUrl()).then(r => setUserMeals(r.data || []));
+
   useEffect(() => {
     if (recipeId && recipeId != "new") {
       callApi<IRecipe>(`/recipes/${recipeId}`)
         .then((res) => { setRecipe(res.data); setIsEditing(false); })
         .catch((error) => console.error("Error fetching recipe:", error));
-      // load user's meals to find where this recipe is planned
-      callApi<Meal[]>(`/meals`).then(r => setUserMeals(r.data || [])).catch(() => setUserMeals([]));
+      // load user's upcoming meals to find where this recipe is planned
+      loadUserMeals().catch(() => setUserMeals([]));
     }
     // fetch existing ingredient names for datalist
     callApi<string[]>(`/recipes/ingredient-names`)
@@ -216,8 +238,8 @@ export default function Recipe() {
           <Card className="p-4 mt-4">
             <h3 className="text-lg font-medium">Reviews</h3>
             <div className="mt-3 space-y-3">
-              {(recipe.reviews || []).length === 0 && <div className="text-sm text-gray-600">No reviews yet.</div>}
-              {(recipe.reviews || []).map((r) => (
+              {shownReviews.length === 0 && <div className="text-sm text-gray-600">No reviews yet.</div>}
+              {shownReviews.map((r) => (
                 <div key={r.id} className="border rounded p-3">
                   <div className="flex items-center justify-between">
                     <div className="font-medium">{r.username || 'User'}</div>
@@ -227,9 +249,18 @@ export default function Recipe() {
                   {r.comment && <div className="mt-2">{r.comment}</div>}
                 </div>
               ))}
+              {allReviews === null && (recipe.rating_count ?? 0) > (recipe.reviews || []).length && (
+                <Button onClick={() => loadReviews()} className="px-3 py-1">Show all {recipe.rating_count} reviews</Button>
+              )}
+              {allReviews !== null && reviewsCursor && (
+                <Button onClick={() => loadReviews(reviewsCursor)} className="px-3 py-1">Load more reviews</Button>
+              )}
             </div>
 
-            <ReviewForm recipeId={recipeId!} onAdded={(rev) => setRecipe((prev) => ({ ...prev, reviews: [...(prev.reviews || []), rev] }))} />
+            <ReviewForm recipeId={recipeId!} onAdded={(rev) => {
+              setRecipe((prev) => ({ ...prev, reviews: [...(prev.reviews || []), rev], rating_count: (prev.rating_count ?? 0) + 1 }));
+              setAllReviews((prev) => prev && [rev, ...prev]);
+            }} />
             <div className="mt-4">
               {user ? (
                 <Button onClick={() => setPlanning(true)} className="px-3 py-1">Plan this recipe</Button>
@@ -237,7 +268,7 @@ export default function Recipe() {
                 <div className="text-sm text-gray-600">Please log in to plan this recipe.</div>
               )}
             </div>
-            <PlanModal open={planning} onClose={() => setPlanning(false)} recipeId={recipeId!} recipeTitle={recipe.title || ''} onPlanned={() => { callApi<Meal[]>(`/meals`).then(r => setUserMeals(r.data || [])).catch(() => { }); setPlanning(false); }} />
+            <PlanModal open={planning} onClose={() => setPlanning(false)} recipeId={recipeId!} recipeTitle={recipe.title || ''} onPlanned={() => { loadUserMeals().catch(() => { }); setPlanning(false); }} />
 
             <div className="mt-4">
               <h4 className="font-medium">Planned in</h4>
@@ -249,7 +280,7 @@ export default function Recipe() {
                       color_name="danger"
                       onClick={() => {
                         callApi<void>(`/meals/${m.id}/items/${recipeId}`, 'DELETE')
-                          .then(() => callApi<Meal[]>(`/meals`).then(r => setUserMeals(r.data || [])).catch(() => { }))
+                          .then(() => loadUserMeals().catch(() => { }))
                           .catch(console.error);
                       }}>Remove</Button>
                   </div>
@@ -2,17 +2,19 @@ import { Container, Heading, StackedList, Card, Button, Input, Select, type Opti
 import { useEffect, useState } from "react";
 import { useNavigate } from "react-router-dom";
 import { callApi, getApiUrl } from "../../services/api";
-import type { IRecipe } from "./types";
+import type { IRecipeSummary } from "./types";
 
 export default function Recipes() {
-  const [recipes, setRecipes] = useState<IRecipe[]>([]);
+  const [recipes, setRecipes] = useState<IRecipeSummary[]>([]);
   const [query, setQuery] = useState<string>('');
   const [selectedTags, setSelectedTags] = useState<string[]>([]);
   const [availableTags, setAvailableTags] = useState<string[]>([]);
   const navigate = useNavigate();
   const [page, setPage] = useState<number>(1);
   const [pageSize, setPageSize] = useState<number>(12);
-  const [total, setTotal] = useState<number | null>(null);
+  // cursor of each visited page (null for the first one) and of the page after the current one
+  const [cursors, setCursors] = useState<(string | null)[]>([null]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
 
   const sortOptions = [
     { value: '', label: 'Default'},
@@ -20,6 +22,7 @@ export default function Recipes() {
     { value: 'title:desc', label: 'Title (Z → A)'},
     { value: 'prep_time:asc', label: 'Prep time ↑'},
     { value: 'prep_time:desc', label: 'Prep time ↓'},
+    { value: 'rating_avg:desc', label: 'Best rated'},
   ];
   const [sortValue, setSortValue] = useState<Option>(sortOptions[0]);
 
@@ -34,26 +37,33 @@ export default function Recipes() {
       const qs = [] as string[];
       if (query) qs.push(`search=${encodeURIComponent(query)}`);
       if (selectedTags?.length) qs.push(`tags=${encodeURIComponent(selectedTags.join(','))}`);
-      if (page) qs.push(`page=${page}`);
-      if (pageSize) qs.push(`page_size=${pageSize}`);
+      if (pageSize) qs.push(`limit=${pageSize}`);
+      const cursor = cursors[page - 1];
+      if (cursor) qs.push(`cursor=${encodeURIComponent(cursor)}`);
       
-      if (sortValue) {
-        const [field, dir] = sortValue.label.split(':');
+      if (sortValue?.value) {
+        const [field, dir] = String(sortValue.value).split(':');
         qs.push(`sort_by=${encodeURIComponent(field)}`);
         qs.push(`sort_dir=${encodeURIComponent(dir)}`);
       }
 
       const qstr = qs.length ? `?${qs.join('&')}` : '';
-      callApi<{items:IRecipe[], total: number, page: number, page_size: number}>(`/recipes${qstr}`)
+      callApi<{items: IRecipeSummary[], next_cursor: string | null}>(`/recipes${qstr}`)
         .then(r => {
           const data = r.data;
           setRecipes(data.items || []);
-          setTotal(data.total ?? null);
+          setNextCursor(data.next_cursor ?? null);
         })
         .catch(console.error);
     }, 300);
     return () => clearTimeout(t);
-  }, [query, selectedTags, page, pageSize, sortValue]);
+  }, [query, selectedTags, page, cursors, pageSize, sortValue]);
+
+  const goToNextPage = () => {
+    if (!nextCursor) return;
+    setCursors(prev => [...prev.slice(0, page), nextCursor]);
+    setPage(p => p + 1);
+  };
 
   return (
     <Container>
@@ -127,8 +137,12 @@ export default function Recipes() {
                 <h3 className="font-bold text-text-primary dark:text-text-primary-dark">
                   {recipe.title}
                 </h3>
-                <p className="text-sm text-text-secondary line-clamp-2">
-                  {recipe.description || "No description available."}
+                <p className="text-sm text-text-secondary">
+                  {[
+                    recipe.prep_time ? `Prep ${recipe.prep_time} min` : null,
+                    recipe.cook_time ? `Cook ${recipe.cook_time} min` : null,
+                    recipe.rating ? `★ ${recipe.rating} (${recipe.rating_count})` : null,
+                  ].filter(Boolean).join(" · ") || (recipe.tags ?? []).join(", ")}
                 </p>
               </Card.Body>
             </Card>
@@ -136,10 +150,10 @@ export default function Recipes() {
         </StackedList>
       </div>
 
-      {total !== null && (
+      {(page > 1 || nextCursor) && (
         <div className="mt-12 pt-6 border-t border-border dark:border-border-dark flex flex-col sm:flex-row items-center justify-between gap-4">
           <p className="text-sm text-text-secondary">
-            Showing page <strong>{page}</strong> — total <strong>{total}</strong> recipes
+            Showing page <strong>{page}</strong>
           </p>
           <div className="flex items-center gap-4">
             <div className="flex items-center gap-1">
@@ -154,8 +168,8 @@ export default function Recipes() {
               <Button 
                 color_name="light" 
                 size="small"
-                onClick={() => setPage(p => p + 1)} 
-                disabled={recipes.length < pageSize}
+                onClick={goToNextPage} 
+                disabled={!nextCursor}
               >
                 Next
               </Button>
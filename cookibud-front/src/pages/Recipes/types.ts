@@ -11,5 +11,19 @@ export interface IRecipe {
   image_url?: string;
   author_id?: string;
   tags?: string[];
-  reviews?: IReview[];
+  reviews?: IReview[]; // latest reviews only, see /recipes/{id}/reviews
+  rating_count?: number;
+  rating_avg?: number;
+}
+
+// Lightweight recipe returned by list endpoints
+export interface IRecipeSummary {
+  id?: string;
+  title?: string;
+  tags?: string[];
+  image_url?: string;
+  prep_time?: number;
+  cook_time?: number;
+  rating?: number;
+  rating_count?: number;
 }
\ No newline at end of file
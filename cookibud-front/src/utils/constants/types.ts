@@ -7,5 +7,6 @@ export type LoginData = { username: string; password: string };
 
 export type MealRecipe = { recipe_id?: string; title?: string; servings: number };
 export type Meal = { id?: string; date: string; items: MealRecipe[] };
+export type MealDaySummary = { date: string; meal_id: string; count: number; titles: string[] };
 export type GroceryItem = { id?: string; name: string; qty?: number; unit?: string; entries?: string[]; bought?: boolean };
 export type GroceryList = { id?: string; title?: string; period_start?: string; period_end?: string; created_at?: string; items?: GroceryItem[]; user_id?: string };
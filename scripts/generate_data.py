@@ -0,0 +1,82 @@
+"""Generate a deterministic synthetic dataset and write it to NDJSON or MongoDB.
+
+Run with:
+  python scripts/generate_data.py ndjson data/ --recipes 100000 --users 1000
+  python scripts/generate_data.py mongodb --mongo-uri mongodb://localhost:27017/ \
+      --recipes 1000000 --users 10000 --workers 8
+
+Users, recipes (ingredients, tags, sub-recipes in `children`, latest reviews and
+rating aggregates), reviews, meal plans, grocery lists and catalogs are generated
+from --seed: the same options always produce the same documents. Popularity of
+authors, planners, recipes, ingredients and tags follows a power law of exponent
+--skew (0 for uniform). Every user has the password "synthetic".
+
+`ndjson` writes one extended JSON file per collection, for `mongoimport`. `mongodb`
+drops the generated collections of the database of --mongo-uri, loads them with
+parallel workers and builds the declared indexes.
+"""
+
+import argparse
+import sys
+import time
+from datetime import date
+
+from benchmarks.loader import load_mongodb, write_ndjson
+from benchmarks.synthetic import PASSWORD, GeneratorConfig, SyntheticData
+from drivers.dependencies import pwd_context
+
+
+def _config(args) -> GeneratorConfig:
+    return GeneratorConfig(
+        users=args.users,
+        recipes=args.recipes,
+        seed=args.seed,
+        skew=args.skew,
+        start=args.start,
+        days=args.days,
+        reviews_per_recipe=args.reviews_per_recipe,
+        plan_rate=args.plan_rate,
+        password_hash=pwd_context.hash(PASSWORD),
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("target", choices=["ndjson", "mongodb"])
+    parser.add_argument("directory", nargs="?", help="output directory (ndjson)")
+    parser.add_argument("--mongo-uri", help="server whose collections are replaced (mongodb)")
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--recipes", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--skew", type=float, default=1.0, help="power-law exponent")
+    parser.add_argument("--start", type=date.fromisoformat, default=date(2025, 1, 1))
+    parser.add_argument("--days", type=int, default=365, help="days of planned meals")
+    parser.add_argument("--reviews-per-recipe", type=float, default=2.0)
+    parser.add_argument("--plan-rate", type=float, default=0.1, help="fraction of days planned")
+    parser.add_argument("--workers", type=int, help="loading processes (default: CPUs)")
+    args = parser.parse_args()
+    if args.target == "ndjson" and not args.directory:
+        parser.error("the output directory is required with ndjson")
+    if args.target == "mongodb" and not args.mongo_uri:
+        parser.error("--mongo-uri is required with mongodb: its collections are replaced")
+
+    data = SyntheticData(_config(args))
+    started = time.perf_counter()
+    if args.target == "ndjson":
+        counts = write_ndjson(data, args.directory)
+    else:
+        total = args.recipes
+
+        def progress(counts):
+            print(f"\r{counts['recipe']}/{total} recipes", end="", file=sys.stderr)
+
+        counts = load_mongodb(data, args.mongo_uri, args.workers, progress=progress)
+        print(file=sys.stderr)
+    for name, count in sorted(counts.items()):
+        print(f"{name}: {count}")
+    print(f"Generated in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
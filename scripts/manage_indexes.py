@@ -0,0 +1,43 @@
+"""Create the declared MongoDB indexes or report drift from the declarations.
+
+Run with:
+  python scripts/manage_indexes.py ensure
+  python scripts/manage_indexes.py report
+
+Indexes are declared on each MongoDB repository (`indexes` attribute) and are
+created at API startup unless MONGO_ENSURE_INDEXES is false. `report` lists, per
+collection, the declared indexes that are missing or whose definition changed, and
+the extra indexes that are not declared; it exits with status 1 when drift is found.
+"""
+
+import argparse
+import json
+import sys
+
+from adapters.mongodb.indexes import (
+    ensure_indexes,
+    has_drift,
+    index_report,
+    mongo_repositories,
+)
+from drivers.config import settings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=["ensure", "report"])
+    args = parser.parse_args()
+
+    repositories = mongo_repositories(settings.mongo_uri, settings.recipe_search_language)
+    if args.command == "ensure":
+        for collection, names in ensure_indexes(repositories).items():
+            print(f"{collection}: {', '.join(names) or 'no declared index'}")
+        return 0
+
+    report = index_report(repositories)
+    print(json.dumps(report, indent=2))
+    return 1 if has_drift(report) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,28 @@
+"""Migration script to store the lowercased title of existing recipes.
+
+Run with:
+  python scripts/migrations/add_recipe_title_keys.py
+
+Typeaheads match the start of the lowercased title_lower field, which the recipe
+repository writes along with the title. This script sets it with a single pipeline
+update on recipes created before it existed; running it again is safe.
+
+Create the title_lower index afterwards with `python scripts/manage_indexes.py ensure`.
+"""
+
+from adapters.mongodb.db import Collection
+from drivers.config import settings
+
+# Recipes created before the lowercased title existed
+MISSING_TITLE_KEY = {"title_lower": {"$exists": False}, "title": {"$type": "string"}}
+TITLE_KEY = [{"$set": {"title_lower": {"$toLower": "$title"}}}]
+
+
+def migrate(uri: str):
+    with Collection(uri, "Recipes") as recipes:
+        result = recipes.update_many(MISSING_TITLE_KEY, TITLE_KEY)
+        print(f"Stored the lowercased title of {result.modified_count} recipes")
+
+
+if __name__ == "__main__":
+    migrate(settings.mongo_uri)
@@ -0,0 +1,48 @@
+"""Migration script to compute rating aggregates of existing recipes.
+
+Run with:
+  python scripts/migrations/backfill_recipe_ratings.py
+
+Recipes carry rating_count, rating_sum and rating_avg, maintained when a review is
+added. This script computes them from the embedded reviews with a single pipeline
+update, for recipes reviewed before the aggregates existed.
+
+Recipes that already have aggregates are left alone: since reviews moved to their
+own collection (see move_reviews_out.py), recipes only embed their latest reviews,
+which would undercount the others. Running the script again is therefore safe.
+"""
+
+from adapters.mongodb.db import Collection
+from drivers.config import settings
+
+# Recipes reviewed before the aggregates existed
+MISSING_AGGREGATES = {"rating_count": {"$exists": False}}
+AGGREGATES = [
+    {
+        "$set": {
+            "rating_count": {"$size": {"$ifNull": ["$reviews", []]}},
+            "rating_sum": {"$sum": {"$ifNull": ["$reviews.rating", []]}},
+        }
+    },
+    {
+        "$set": {
+            "rating_avg": {
+                "$cond": [
+                    {"$gt": ["$rating_count", 0]},
+                    {"$divide": ["$rating_sum", "$rating_count"]},
+                    None,
+                ]
+            }
+        }
+    },
+]
+
+
+def migrate(uri: str):
+    with Collection(uri, "Recipes") as recipes:
+        result = recipes.update_many(MISSING_AGGREGATES, AGGREGATES)
+        print(f"Computed rating aggregates of {result.modified_count} recipes")
+
+
+if __name__ == "__main__":
+    migrate(settings.mongo_uri)
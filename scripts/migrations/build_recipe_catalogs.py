@@ -0,0 +1,50 @@
+"""Migration script to (re)build the tag and ingredient name catalogs.
+
+Run with:
+  python scripts/migrations/build_recipe_catalogs.py
+
+Catalogs are maintained incrementally when recipes are created, updated or deleted.
+This script computes them from scratch with an aggregation over the Recipes
+collection: use it once to backfill existing recipes, or to repair drift.
+
+Catalogs drift when writes to the same recipe race: the use cases compute the
+count changes from the recipe read before writing it, so two concurrent updates
+(or deletes) of one recipe both apply changes from the same stale recipe. Counts
+then stay off, and names may linger or go missing, until this script runs again;
+schedule it (e.g. nightly) where recipes are edited concurrently.
+"""
+
+from adapters.mongodb.db import Collection
+from drivers.config import settings
+
+# Each recipe counts once per tag / ingredient name it uses
+PIPELINES = {
+    "tag": [
+        {"$project": {"names": {"$setUnion": [{"$ifNull": ["$tags", []]}, []]}}},
+        {"$unwind": "$names"},
+        {"$group": {"_id": "$names", "count": {"$sum": 1}}},
+    ],
+    "ingredient": [
+        {"$project": {"names": {"$setUnion": [{"$ifNull": ["$ingredients.name", []]}, []]}}},
+        {"$unwind": "$names"},
+        {"$group": {"_id": "$names", "count": {"$sum": 1}}},
+    ],
+}
+
+
+def migrate(uri: str):
+    with Collection(uri, "Recipes") as recipes, Collection(uri, "Catalogs") as catalogs:
+        for kind, pipeline in PIPELINES.items():
+            entries = [
+                {"kind": kind, "name": row["_id"], "count": row["count"]}
+                for row in recipes.aggregate(pipeline)
+                if row["_id"]
+            ]
+            catalogs.delete_many({"kind": kind})
+            if entries:
+                catalogs.insert_many(entries)
+            print(f"Rebuilt {kind} catalog with {len(entries)} entries")
+
+
+if __name__ == "__main__":
+    migrate(settings.mongo_uri)
@@ -0,0 +1,47 @@
+"""Migration script to store meal dates as native dates.
+
+Run with:
+  python scripts/migrations/convert_meal_dates.py
+
+Meal dates used to be ISO strings ("YYYY-MM-DD"). They are now stored as BSON dates
+(midnight UTC) so that period queries are range scans on the (user_id, date) index.
+This script converts the remaining string dates with a single pipeline update; values
+that are not valid dates are left untouched and reported.
+
+Run merge_duplicate_meals.py first: the unique (user_id, date) index rejects the
+conversion of a meal whose date is already taken.
+"""
+
+from adapters.mongodb.db import Collection
+from drivers.config import settings
+
+STRING_DATES = {"date": {"$type": "string"}}
+
+TO_DATE = [
+    {
+        "$set": {
+            "date": {
+                "$dateFromString": {
+                    # drop any time part of the string
+                    "dateString": {"$substrCP": ["$date", 0, 10]},
+                    "format": "%Y-%m-%d",
+                    "timezone": "UTC",
+                    "onError": "$date",
+                }
+            }
+        }
+    }
+]
+
+
+def migrate(uri: str):
+    with Collection(uri, "Meals") as meals:
+        result = meals.update_many(STRING_DATES, TO_DATE)
+        print(f"Converted the date of {result.modified_count} meals")
+        invalid = meals.count_documents(STRING_DATES)
+        if invalid:
+            print(f"{invalid} meals have a date that is not YYYY-MM-DD, left as is")
+
+
+if __name__ == "__main__":
+    migrate(settings.mongo_uri)
@@ -0,0 +1,55 @@
+"""Migration script to merge meals planned twice on the same date.
+
+Run with:
+  python scripts/migrations/merge_duplicate_meals.py
+
+Meals are unique per (user_id, date) since planning upserts on that key. This
+script merges the items of duplicate meals into the oldest one, deletes the
+others, then replaces the former non-unique `user_date` index by the unique one.
+"""
+
+from pymongo.errors import OperationFailure
+
+from adapters.mongodb.db import Collection
+from adapters.mongodb.meal_repository import MEAL_INDEXES
+from drivers.config import settings
+
+DUPLICATES = [
+    {"$sort": {"_id": 1}},
+    {
+        "$group": {
+            "_id": {"user_id": "$user_id", "date": "$date"},
+            "ids": {"$push": "$_id"},
+            "items": {"$push": {"$ifNull": ["$items", []]}},
+            "count": {"$sum": 1},
+        }
+    },
+    {"$match": {"count": {"$gt": 1}}},
+]
+
+
+def migrate(uri: str):
+    with Collection(uri, "Meals") as meals:
+        merged = 0
+        for group in meals.aggregate(DUPLICATES):
+            keep, *duplicates = group["ids"]
+            items = [item for items in group["items"] for item in items]
+            meals.update_one({"_id": keep}, {"$set": {"items": items}})
+            meals.delete_many({"_id": {"$in": duplicates}})
+            merged += len(duplicates)
+        print(f"Merged {merged} duplicate meals")
+
+        index = MEAL_INDEXES[0].document
+        existing = meals.index_information().get(index["name"])
+        if existing and not existing.get("unique"):
+            meals.drop_index(index["name"])
+        try:
+            meals.create_indexes(MEAL_INDEXES)
+        except OperationFailure as exc:
+            print(f"Could not create the unique meal index: {exc}")
+            raise
+        print(f"Ensured unique index {index['name']}")
+
+
+if __name__ == "__main__":
+    migrate(settings.mongo_uri)
@@ -0,0 +1,60 @@
+"""Migration script to move embedded recipe reviews to the Reviews collection.
+
+Run once with:
+  python scripts/migrations/move_reviews_out.py
+
+Reviews used to be embedded in recipe documents without limit. They are now stored
+in the Reviews collection, and recipes only keep their rating aggregates and latest
+reviews. This script copies every embedded review in bulk (server side, with $merge),
+computes the rating aggregates of each recipe, then trims its embedded reviews.
+It refuses to run when the Reviews collection is not empty.
+"""
+
+import sys
+
+from adapters.mongodb.db import Collection
+from adapters.mongodb.recipe_repository import LATEST_REVIEWS
+from drivers.config import settings
+
+MOVE_REVIEWS = [
+    {"$match": {"reviews.0": {"$exists": True}}},
+    {"$unwind": "$reviews"},
+    {
+        "$project": {
+            "_id": 0,
+            "recipe_id": {"$toString": "$_id"},
+            "user_id": "$reviews.user_id",
+            "username": "$reviews.username",
+            "rating": "$reviews.rating",
+            "comment": "$reviews.comment",
+            "created_at": "$reviews.created_at",
+        }
+    },
+    {"$merge": {"into": "Reviews", "whenNotMatched": "insert"}},
+]
+
+TRIM_RECIPES = [
+    {
+        "$set": {
+            "rating_count": {"$size": "$reviews"},
+            "rating_sum": {"$sum": "$reviews.rating"},
+            "reviews": {"$slice": ["$reviews", -LATEST_REVIEWS]},
+        }
+    },
+    {"$set": {"rating_avg": {"$divide": ["$rating_sum", "$rating_count"]}}},
+]
+
+
+def migrate(uri: str):
+    with Collection(uri, "Recipes") as recipes, Collection(uri, "Reviews") as reviews:
+        if reviews.estimated_document_count():
+            print("Reviews collection is not empty: reviews were already moved")
+            sys.exit(1)
+        recipes.aggregate(MOVE_REVIEWS)
+        print(f"Moved {reviews.count_documents({})} reviews")
+        result = recipes.update_many({"reviews.0": {"$exists": True}}, TRIM_RECIPES)
+        print(f"Kept the latest {LATEST_REVIEWS} reviews of {result.modified_count} recipes")
+
+
+if __name__ == "__main__":
+    migrate(settings.mongo_uri)